@@ -0,0 +1,414 @@
+"""
+Client benchmarks against the local stand-in server (see server.py).
+
+    python benchmarks/run.py                    # everything
+    python benchmarks/run.py --quick            # fewer and smaller calls
+    python benchmarks/run.py --only endpoints,encoding
+    python benchmarks/run.py --save baseline.json
+    python benchmarks/run.py --compare baseline.json --tolerance 0.25
+
+Every benchmark produces named results made of metrics, e.g. the latency
+percentiles of Mesh.CreateFromBrep for a 10k vertex mesh. --compare exits
+with status 1 if a metric got worse than the saved one by more than the
+tolerance, so client regressions show up before a release. Timings depend
+on the machine; only compare results measured on the same one.
+
+Benchmarks:
+    endpoints    latency percentiles, throughput, allocated blocks and peak
+                 memory of representative calls across payload sizes
+    concurrency  throughput of compute_rhino3d.map at several concurrencies
+    pooling      latency and connections opened by calls over pooled
+                 connections against a new connection per call
+    encoding     encoding 1M points given as rhino3dm.Point3d and NumPy, and a
+                 mesh and a brep with and without the cached encoder, per
+                 JSON backend
+    compression  size and time of mesh and brep request bodies compressed at
+                 several levels per encoding
+    streaming    calls with request bodies streamed (Util.streamRequests)
+                 against bodies built in memory
+    wire         JSON against msgpack calls (requires msgpack)
+    importtime   time to import the package and a generated module
+"""
+import argparse
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+import time
+import tracemalloc
+
+root = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, root)
+
+import rhino3dm  # noqa: E402
+
+import compute_rhino3d  # noqa: E402
+from compute_rhino3d import Brep, Grasshopper, Intersection, Mesh, Util  # noqa: E402
+from server import StandInProcess, StandInServer  # noqa: E402
+
+# metrics where higher is better; lower is better for all others
+_higherIsBetter = ('callsPerSecond',)
+_timings = ('p50', 'p90', 'p99', 'seconds')
+# timing changes smaller than this many seconds are noise, not regressions
+_timingNoise = 0.001
+
+
+def GridMesh(count):
+    """Get a flat quad mesh with about `count` vertices"""
+    n = max(2, int(count ** 0.5))
+    mesh = rhino3dm.Mesh()
+    for j in range(n):
+        for i in range(n):
+            mesh.Vertices.Add(i, j, 0)
+    for j in range(n - 1):
+        for i in range(n - 1):
+            mesh.Faces.AddFace(j * n + i, j * n + i + 1, (j + 1) * n + i + 1, (j + 1) * n + i)
+    return mesh
+
+
+def GridBrep(count):
+    """Get a brep of one NURBS surface with about `count` control points"""
+    n = max(4, int(count ** 0.5))
+    surface = rhino3dm.NurbsSurface.Create(3, False, 4, 4, n, n)
+    for i in range(n):
+        for j in range(n):
+            surface.Points[i, j] = rhino3dm.Point4d(i, j, (i * j) % 7, 1)
+    surface.KnotsU.CreateUniformKnots(1.0)
+    surface.KnotsV.CreateUniformKnots(1.0)
+    return rhino3dm.Brep.CreateFromSurface(surface)
+
+
+def Points(count):
+    return [rhino3dm.Point3d(i, i % 7, 0) for i in range(count)]
+
+
+def Percentile(values, fraction):
+    values = sorted(values)
+    position = (len(values) - 1) * fraction
+    low = int(position)
+    high = min(low + 1, len(values) - 1)
+    return values[low] + (values[high] - values[low]) * (position - low)
+
+
+def Best(func, repeat):
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def MeasureCalls(func, count):
+    """
+    Call func `count` times and measure latency, throughput, the memory
+    blocks still allocated for the last result and the peak memory of a call
+    """
+    func()
+    latencies = []
+    started = time.perf_counter()
+    for _ in range(count):
+        t = time.perf_counter()
+        func()
+        latencies.append(time.perf_counter() - t)
+    elapsed = time.perf_counter() - started
+    blocks = sys.getallocatedblocks()
+    result = func()
+    blocks = sys.getallocatedblocks() - blocks
+    del result
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {
+        'p50': Percentile(latencies, 0.5),
+        'p90': Percentile(latencies, 0.9),
+        'p99': Percentile(latencies, 0.99),
+        'callsPerSecond': count / elapsed,
+        'allocatedBlocks': blocks,
+        'peakBytes': peak,
+    }
+
+
+def BenchEndpoints(options, server):
+    sizes = (100, 10000) if options.quick else (100, 10000, 100000)
+    results = {}
+    for size in sizes:
+        count = max(3, min(100, 200000 // (size * (4 if options.quick else 1))))
+        mesh = GridMesh(size)
+        points = Points(size)
+        tree = Grasshopper.DataTree('RH_IN:points')
+        tree.Append([0], [json.dumps(p.Encode()) for p in points])
+        definition = 'x' * (size * 10)
+        calls = {
+            'Mesh.CreateFromBrep': lambda: Mesh.CreateFromBrep(mesh),
+            'Brep.CreateBooleanUnion': lambda: Brep.CreateBooleanUnion([mesh, mesh], 0.01),
+            'Intersection.ProjectPointsToMeshes': lambda: Intersection.ProjectPointsToMeshes(
+                [mesh], points, rhino3dm.Vector3d(0, 0, 1), 0.01),
+            'Grasshopper.EvaluateDefinition': lambda: Grasshopper.EvaluateDefinition(
+                definition, [tree]),
+        }
+        for name, func in calls.items():
+            results['{} {}'.format(name, size)] = MeasureCalls(func, count)
+    return results
+
+
+def BenchConcurrency(options, server):
+    # a server taking 5ms per request, to show the effect of overlapping
+    # calls
+    slow = StandInProcess(delay=0.005).Start()
+    Util.url = slow.url
+    calls = 200 if options.quick else 1000
+    mesh = GridMesh(100)
+    points = [rhino3dm.Point3d(i, 0, 0) for i in range(calls)]
+    results = {}
+    try:
+        for concurrency in (1, 8, 32):
+            Util.poolMaxsize = concurrency
+            Util.SetSession(None)
+            items = ((mesh, point) for point in points)
+            started = time.perf_counter()
+            for _ in compute_rhino3d.map(Mesh.ClosestPoint, items, concurrency=concurrency,
+                                         chunk_size=1):
+                pass
+            elapsed = time.perf_counter() - started
+            results['map concurrency={}'.format(concurrency)] = {'callsPerSecond': calls / elapsed}
+    finally:
+        slow.Stop()
+        Util.url = server.url
+        Util.poolMaxsize = 10
+        Util.SetSession(None)
+    return results
+
+
+def BenchPooling(options, server):
+    # a server on this thread, to count the connections the calls open
+    local = StandInServer().Start()
+    Util.url = local.url
+    calls = 100 if options.quick else 500
+    mesh = GridMesh(100)
+    point = rhino3dm.Point3d(1, 2, 3)
+
+    def pooled():
+        Mesh.ClosestPoint(mesh, point)
+
+    def unpooled():
+        Util.SetSession(None)
+        Mesh.ClosestPoint(mesh, point)
+
+    results = {}
+    try:
+        for name, func in (('pooled', pooled), ('new connection per call', unpooled)):
+            func()
+            connections = local.connectionCount
+            latencies = []
+            started = time.perf_counter()
+            for _ in range(calls):
+                t = time.perf_counter()
+                func()
+                latencies.append(time.perf_counter() - t)
+            elapsed = time.perf_counter() - started
+            results['pooling ' + name] = {
+                'p50': Percentile(latencies, 0.5),
+                'p90': Percentile(latencies, 0.9),
+                'callsPerSecond': calls / elapsed,
+                'connections': local.connectionCount - connections,
+            }
+    finally:
+        Util.SetSession(None)
+        Util.url = server.url
+        local.Stop()
+    return results
+
+
+def BenchEncoding(options, server):
+    import numpy
+    count = 100000 if options.quick else 1000000
+    array = numpy.random.rand(count, 3)
+    points = [rhino3dm.Point3d(*p) for p in array.tolist()]
+    size = 10000 if options.quick else 100000
+    geometry = (('mesh', [GridMesh(size)]), ('brep', [GridBrep(size)]))
+    results = {}
+    backend = Util.jsonBackend
+    try:
+        for name in ('json', 'orjson', 'ujson'):
+            if name != 'json' and importlib.util.find_spec(name) is None:
+                continue
+            Util.jsonBackend = name
+            results['encode {} Point3d {}'.format(count, name)] = {
+                'seconds': Best(lambda: Util.EncodeArgs([points]), 3)}
+            results['encode {} numpy {}'.format(count, name)] = {
+                'seconds': Best(lambda: Util.EncodeArgs([array]), 3)}
+            for kind, args in geometry:
+                # hoisted: the encoder cached per backend, as EncodeArgs
+                # uses it. Unhoisted: an encoder built for every body
+                results['encode {} {} hoisted'.format(kind, name)] = {
+                    'seconds': Best(lambda: Util.EncodeArgs(args), 3)}
+                results['encode {} {} unhoisted'.format(kind, name)] = {
+                    'seconds': Best(lambda: Util._JsonBackend(name)[0](args), 3)}
+    finally:
+        Util.jsonBackend = backend
+    if importlib.util.find_spec('msgpack') is not None:
+        from compute_rhino3d import Msgpack
+        results['encode {} numpy msgpack'.format(count)] = {
+            'seconds': Best(lambda: Msgpack.Dumps([array]), 3)}
+    return results
+
+
+# compression levels compared per encoding, fastest to smallest
+_compressionLevels = {'gzip': (1, 6, 9), 'deflate': (1, 6, 9), 'br': (1, 5, 11)}
+
+
+def BenchCompression(options, server):
+    size = 10000 if options.quick else 100000
+    results = {}
+    for name, geometry in (('mesh', GridMesh(size)), ('brep', GridBrep(size))):
+        body = Util._ToBytes(Util.EncodeArgs([geometry]))
+        results['compression {} none'.format(name)] = {'bytes': len(body)}
+        for encoding in Util._CompressionEncodings():
+            for level in _compressionLevels[encoding]:
+                seconds = Best(lambda: Util.Compress(body, encoding, level), 3)
+                results['compression {} {} level={}'.format(name, encoding, level)] = {
+                    'bytes': len(Util.Compress(body, encoding, level)), 'seconds': seconds}
+    return results
+
+
+def BenchStreaming(options, server):
+    count = 20000 if options.quick else 200000
+    mesh = GridMesh(100)
+    points = Points(count)
+    vector = rhino3dm.Vector3d(0, 0, 1)
+    results = {}
+    try:
+        for name, stream, compression in (('buffered', False, None), ('streamed', True, None),
+                                          ('streamed gzip', True, 'gzip')):
+            Util.streamRequests = stream
+            Util.compression = compression
+
+            def call():
+                return Intersection.ProjectPointsToMeshes([mesh], points, vector, 0.01)
+            seconds = Best(call, 3)
+            tracemalloc.start()
+            call()
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            results['request body {} {} points'.format(name, count)] = {
+                'seconds': seconds, 'peakBytes': peak}
+    finally:
+        Util.streamRequests = False
+        Util.compression = None
+    return results
+
+
+def BenchWire(options, server):
+    if importlib.util.find_spec('msgpack') is None:
+        return {}
+    import numpy
+    count = 20000 if options.quick else 200000
+    mesh = rhino3dm.Mesh()
+    points = numpy.random.rand(count, 3)
+    results = {}
+    try:
+        for wire in ('json', 'msgpack'):
+            Util.wireFormat = wire
+            for numpyResults in (False, True):
+                Util.decodeToNumpy = numpyResults
+                size = len(Util._EncodeBody([mesh, points], None))
+                seconds = Best(lambda: Mesh.PullPointsToMesh(mesh, points), 3)
+                name = 'wire {} {} results'.format(wire, 'numpy' if numpyResults else 'rhino3dm')
+                results[name] = {'seconds': seconds, 'requestBytes': size}
+    finally:
+        Util.wireFormat = 'json'
+        Util.decodeToNumpy = False
+    return results
+
+
+def BenchImportTime(options, server):
+    code = ('import time; t = time.perf_counter(); import compute_rhino3d; '
+            'compute_rhino3d.Mesh; print(time.perf_counter() - t)')
+
+    def measure():
+        output = subprocess.check_output([sys.executable, '-c', code], cwd=root)
+        return float(output)
+    return {'import compute_rhino3d.Mesh': {'seconds': min(measure() for _ in range(5))}}
+
+
+benchmarks = {
+    'endpoints': BenchEndpoints,
+    'concurrency': BenchConcurrency,
+    'pooling': BenchPooling,
+    'encoding': BenchEncoding,
+    'compression': BenchCompression,
+    'streaming': BenchStreaming,
+    'wire': BenchWire,
+    'importtime': BenchImportTime,
+}
+
+
+def _Format(metric, value):
+    if metric in _timings:
+        return '{}={:.2f}ms'.format(metric, value * 1000)
+    if metric.endswith('Bytes') or metric == 'bytes':
+        return '{}={:.2f}MB'.format(metric, value / 1e6)
+    if isinstance(value, float):
+        return '{}={:.1f}'.format(metric, value)
+    return '{}={}'.format(metric, value)
+
+
+def Compare(results, baseline, tolerance):
+    """Get descriptions of the metrics that got worse than in baseline"""
+    regressions = []
+    for name, metrics in results.items():
+        for metric, value in metrics.items():
+            old = baseline.get(name, {}).get(metric)
+            if not old:
+                continue
+            if metric in _higherIsBetter:
+                worse = value < old * (1 - tolerance)
+            else:
+                worse = value > old * (1 + tolerance)
+                if metric in _timings and value - old < _timingNoise:
+                    worse = False
+            if worse:
+                regressions.append('{}: {} {} -> {}'.format(
+                    name, metric, _Format(metric, old), _Format(metric, value)))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='compute_rhino3d client benchmarks')
+    parser.add_argument('--quick', action='store_true', help='fewer and smaller calls')
+    parser.add_argument('--only', help='comma separated benchmarks to run: ' + ', '.join(benchmarks))
+    parser.add_argument('--save', help='write the results to this JSON file')
+    parser.add_argument('--compare', help='JSON file of earlier results to compare with')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='relative change of a metric reported as regression')
+    options = parser.parse_args()
+    names = options.only.split(',') if options.only else list(benchmarks)
+    server = StandInProcess().Start()
+    Util.url = server.url
+    results = {}
+    try:
+        for name in names:
+            for result, metrics in benchmarks[name](options, server).items():
+                print('{:48} {}'.format(result, '  '.join(_Format(*item) for item in metrics.items())))
+                sys.stdout.flush()
+                results[result] = metrics
+    finally:
+        server.Stop()
+    if options.save:
+        with open(options.save, 'w') as f:
+            json.dump(results, f, indent=2)
+    if options.compare:
+        with open(options.compare) as f:
+            regressions = Compare(results, json.load(f), options.tolerance)
+        for regression in regressions:
+            print('REGRESSION', regression)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,314 @@
+"""
+Local stand-in for a compute server, for benchmarks and manual testing.
+
+It answers a few representative endpoints with results computed from the
+request (echoed points, boolean unions returning their input) or canned
+geometry, in JSON or msgpack depending on the Accept header (unless started
+as JSON-only), and handles
+multiple=true requests and compressed or chunked request bodies like the real
+server.
+
+The grasshopper endpoint answers a pointer for every definition and accepts
+it in place of the definition later, like compute does.
+
+It also implements geometry handles (see Util.Upload): POST handles stores
+the encoded object of the body and answers {"handle": <sha256 of its
+archive>}; {"handle": ...} maps in the arguments of later calls are replaced
+by the stored objects, and calls with unknown handles are answered with 409
+and a Compute-Missing-Handles header listing them.
+
+    python benchmarks/server.py --port 8081
+
+or from Python, on a thread or (to keep it off the GIL of the client) in a
+child process
+
+    >>> server = StandInServer().Start()
+    >>> server = StandInProcess().Start()
+    >>> Util.url = server.url
+    >>> ...
+    >>> server.Stop()
+"""
+import argparse
+import base64
+import gzip
+import hashlib
+import http.server
+import json
+import os
+import struct
+import subprocess
+import sys
+import threading
+import time
+import zlib
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from compute_rhino3d import Msgpack, Util  # noqa: E402
+
+
+def _Echo(index):
+    def handler(args):
+        return args[index]
+    return handler
+
+
+def _CannedMesh():
+    import rhino3dm
+    mesh = rhino3dm.Mesh()
+    for x, y in ((0, 0), (1, 0), (1, 1), (0, 1)):
+        mesh.Vertices.Add(x, y, 0)
+    mesh.Faces.AddFace(0, 1, 2, 3)
+    return mesh.Encode()
+
+
+def _CreateFromBrep(args):
+    return [_CannedMesh()]
+
+
+class _HTTPError(Exception):
+    def __init__(self, status, message):
+        Exception.__init__(self, message)
+        self.status = status
+
+
+# definitions sent to the grasshopper endpoint, by the pointer answered
+_definitions = {}
+
+
+def _EvaluateDefinition(args):
+    # like compute, answer a pointer for every definition received and accept
+    # it in place of the definition later
+    if args.get('algo'):
+        pointer = 'md5_' + hashlib.md5(args['algo'].encode('utf-8')).hexdigest().upper()
+        _definitions[pointer] = args['algo']
+    else:
+        pointer = args.get('pointer')
+        if pointer not in _definitions and not pointer.startswith(('http:', 'https:')):
+            raise _HTTPError(500, 'Unable to find definition in cache')
+    value = json.dumps(_CannedMesh())
+    return {'pointer': pointer, 'values': [{'ParamName': 'RH_OUT:mesh', 'InnerTree': {
+        '{0}': [{'type': 'Rhino.Geometry.Mesh', 'data': value}]}}]}
+
+
+def _Closest(args):
+    return args[1]
+
+
+# endpoint (without query) -> function of the argument list
+handlers = {
+    'rhino/geometry/mesh/createfrombrep-brep': _CreateFromBrep,
+    'rhino/geometry/brep/createbooleanunion-breparray_double': _Echo(0),
+    'rhino/geometry/mesh/pullpointstomesh-mesh_point3darray': _Echo(1),
+    'rhino/geometry/intersect/intersection/projectpointstomeshes-mesharray_point3darray_vector3d_double': _Echo(1),
+    'rhino/geometry/mesh/closestpoint-mesh_point3d': _Closest,
+    'grasshopper': _EvaluateDefinition,
+}
+
+
+def _HandleOf(encoded):
+    data = encoded['data']
+    if isinstance(data, str):
+        data = base64.b64decode(data)
+    return hashlib.sha256(data).hexdigest()
+
+
+def _Resolve(value, store, missing):
+    # replace {"handle": ...} maps by the stored objects
+    if isinstance(value, dict):
+        if value.keys() == {'handle'}:
+            stored = store.get(value['handle'])
+            if stored is None: missing.append(value['handle'])
+            return stored
+        return {key: _Resolve(item, store, missing) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_Resolve(item, store, missing) for item in value]
+    return value
+
+
+def _IsPointList(value):
+    return (isinstance(value, list) and len(value) > 0 and isinstance(value[0], dict)
+            and value[0].keys() == {'X', 'Y', 'Z'})
+
+
+def _PackPoints(value):
+    # point lists go out as packed float64 extension types in msgpack
+    # responses
+    if isinstance(value, Util.PackedPoints):
+        return value
+    if _IsPointList(value):
+        data = struct.pack('<{}d'.format(3 * len(value)),
+                           *[c for p in value for c in (p['X'], p['Y'], p['Z'])])
+        return Util.PackedPoints(data)
+    if isinstance(value, list):
+        return [_PackPoints(item) for item in value]
+    return value
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        server = self.server.standIn
+        if 'chunked' in self.headers.get('Transfer-Encoding', '').lower():
+            body = self._ReadChunked()
+        else:
+            body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        encoding = self.headers.get('Content-Encoding')
+        if encoding == 'gzip':
+            body = gzip.decompress(body)
+        elif encoding == 'deflate':
+            body = zlib.decompress(body)
+        endpoint, _, query = self.path.lstrip('/').partition('?')
+        handler = handlers.get(endpoint)
+        if handler is None and endpoint != 'handles':
+            return self._Send(404, b'unknown endpoint ' + endpoint.encode('utf-8'), 'text/plain')
+        if self.headers.get('Content-Type', '').startswith(Msgpack.contentType):
+            if not server.msgpack:
+                server.rejectedCount += 1
+                return self._Send(415, b'unsupported media type', 'text/plain')
+            args = Msgpack.Loads(body)
+        else:
+            args = json.loads(body)
+        if endpoint == 'handles':
+            handle = _HandleOf(args)
+            server.handles[handle] = args
+            server.uploadCount += 1
+            return self._Reply({'handle': handle})
+        missing = []
+        args = _Resolve(args, server.handles, missing)
+        if missing:
+            self.send_response(409)
+            self.send_header('Compute-Missing-Handles', ','.join(missing))
+            self.send_header('Content-Length', '0')
+            return self.end_headers()
+        if server.delay:
+            time.sleep(server.delay)
+        try:
+            if 'multiple=true' in query:
+                result = [handler(row) for row in args]
+            else:
+                result = handler(args)
+        except _HTTPError as e:
+            return self._Send(e.status, str(e).encode('utf-8'), 'text/plain')
+        server.requestCount += 1
+        self._Reply(result)
+
+    def _ReadChunked(self):
+        # a body sent with Transfer-Encoding: chunked, as with
+        # Util.streamRequests
+        chunks = []
+        while True:
+            size = int(self.rfile.readline().split(b';')[0], 16)
+            if size == 0:
+                break
+            chunks.append(self.rfile.read(size))
+            self.rfile.readline()
+        # trailers end with an empty line
+        while self.rfile.readline().strip():
+            pass
+        return b''.join(chunks)
+
+    def _Reply(self, result):
+        if self.server.standIn.msgpack and Msgpack.contentType in self.headers.get('Accept', ''):
+            self._Send(200, Msgpack.Dumps(_PackPoints(result)), Msgpack.contentType)
+        else:
+            self._Send(200, Util._ToBytes(Util.JsonDumps(result)), 'application/json')
+
+    def _Send(self, status, content, contentType):
+        self.send_response(status)
+        self.send_header('Content-Type', contentType)
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+
+class _Server(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+
+    def process_request(self, request, client_address):
+        # called on the serving thread once per accepted connection
+        self.standIn.connectionCount += 1
+        http.server.ThreadingHTTPServer.process_request(self, request, client_address)
+
+
+class StandInServer:
+    """
+    A stand-in compute server running on a background thread
+    """
+    def __init__(self, port=0, delay=0.0, msgpack=True):
+        """
+        Args:
+            port (int): port to listen on. 0 picks a free one
+            delay (float): seconds every request takes, to simulate server
+                           time
+            msgpack (bool): False answers msgpack requests with 415, like a
+                            server that only speaks JSON
+        """
+        self.delay = delay
+        self.msgpack = msgpack
+        self.requestCount = 0
+        # accepted connections, one per TCP handshake
+        self.connectionCount = 0
+        self.uploadCount = 0
+        # msgpack requests answered with 415
+        self.rejectedCount = 0
+        # uploaded objects by handle. Clear it to simulate a server restart
+        self.handles = {}
+        self._server = _Server(('127.0.0.1', port), _Handler)
+        self._server.standIn = self
+        self._thread = None
+
+    @property
+    def url(self):
+        return 'http://127.0.0.1:{}/'.format(self._server.server_address[1])
+
+    def Start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def Stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class StandInProcess:
+    """
+    A stand-in compute server running in a child process
+    """
+    def __init__(self, delay=0.0):
+        """
+        Args:
+            delay (float): seconds every request takes
+        """
+        self.delay = delay
+        self.url = None
+        self._process = None
+
+    def Start(self):
+        self._process = subprocess.Popen(
+            [sys.executable, os.path.abspath(__file__), '--port', '0', '--delay', str(self.delay)],
+            stdout=subprocess.PIPE, universal_newlines=True)
+        self.url = self._process.stdout.readline().split()[-1]
+        return self
+
+    def Stop(self):
+        self._process.terminate()
+        self._process.wait()
+        self._process.stdout.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--port', type=int, default=8081, help='0 picks a free port')
+    parser.add_argument('--delay', type=float, default=0.0)
+    parser.add_argument('--json-only', action='store_true', help='reject msgpack requests')
+    options = parser.parse_args()
+    server = StandInServer(options.port, options.delay, not options.json_only)
+    print('serving on', server.url, flush=True)
+    server._server.serve_forever()
@@ -1,6 +1,7 @@
 from . import Util
 
 
+@Util.Endpoint("rhino/geometry/areamassproperties/compute-curve")
 def Compute(closedPlanarCurve, multiple=False):
     """
     Computes an AreaMassProperties for a closed planar curve.
@@ -11,14 +12,9 @@ def Compute(closedPlanarCurve, multiple=False):
     Returns:
         AreaMassProperties: The AreaMassProperties for the given curve or None on failure.
     """
-    url = "rhino/geometry/areamassproperties/compute-curve"
-    if multiple: url += "?multiple=true"
-    args = [closedPlanarCurve]
-    if multiple: args = [[item] for item in closedPlanarCurve]
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/areamassproperties/compute-curve_double")
 def Compute1(closedPlanarCurve, planarTolerance, multiple=False):
     """
     Computes an AreaMassProperties for a closed planar curve.
@@ -30,14 +26,9 @@ def Compute1(closedPlanarCurve, planarTolerance, multiple=False):
     Returns:
         AreaMassProperties: The AreaMassProperties for the given curve or None on failure.
     """
-    url = "rhino/geometry/areamassproperties/compute-curve_double"
-    if multiple: url += "?multiple=true"
-    args = [closedPlanarCurve, planarTolerance]
-    if multiple: args = zip(closedPlanarCurve, planarTolerance)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/areamassproperties/compute-hatch")
 def Compute2(hatch, multiple=False):
     """
     Computes an AreaMassProperties for a hatch.
@@ -48,14 +39,9 @@ def Compute2(hatch, multiple=False):
     Returns:
         AreaMassProperties: The AreaMassProperties for the given hatch or None on failure.
     """
-    url = "rhino/geometry/areamassproperties/compute-hatch"
-    if multiple: url += "?multiple=true"
-    args = [hatch]
-    if multiple: args = [[item] for item in hatch]
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/areamassproperties/compute-mesh")
 def Compute3(mesh, multiple=False):
     """
     Computes an AreaMassProperties for a mesh.
@@ -66,14 +52,9 @@ def Compute3(mesh, multiple=False):
     Returns:
         AreaMassProperties: The AreaMassProperties for the given Mesh or None on failure.
     """
-    url = "rhino/geometry/areamassproperties/compute-mesh"
-    if multiple: url += "?multiple=true"
-    args = [mesh]
-    if multiple: args = [[item] for item in mesh]
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/areamassproperties/compute-mesh_bool_bool_bool_bool")
 def Compute4(mesh, area, firstMoments, secondMoments, productMoments, multiple=False):
     """
     Compute the AreaMassProperties for a single Mesh.
@@ -88,14 +69,9 @@ def Compute4(mesh, area, firstMoments, secondMoments, productMoments, multiple=F
     Returns:
         AreaMassProperties: The AreaMassProperties for the given Mesh or None on failure.
     """
-    url = "rhino/geometry/areamassproperties/compute-mesh_bool_bool_bool_bool"
-    if multiple: url += "?multiple=true"
-    args = [mesh, area, firstMoments, secondMoments, productMoments]
-    if multiple: args = zip(mesh, area, firstMoments, secondMoments, productMoments)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/areamassproperties/compute-brep")
 def Compute5(brep, multiple=False):
     """
     Computes an AreaMassProperties for a brep.
@@ -106,14 +82,9 @@ def Compute5(brep, multiple=False):
     Returns:
         AreaMassProperties: The AreaMassProperties for the given Brep or None on failure.
     """
-    url = "rhino/geometry/areamassproperties/compute-brep"
-    if multiple: url += "?multiple=true"
-    args = [brep]
-    if multiple: args = [[item] for item in brep]
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/areamassproperties/compute-brep_bool_bool_bool_bool")
 def Compute6(brep, area, firstMoments, secondMoments, productMoments, multiple=False):
     """
     Compute the AreaMassProperties for a single Brep.
@@ -128,14 +99,9 @@ def Compute6(brep, area, firstMoments, secondMoments, productMoments, multiple=F
     Returns:
         AreaMassProperties: The AreaMassProperties for the given Brep or None on failure.
     """
-    url = "rhino/geometry/areamassproperties/compute-brep_bool_bool_bool_bool"
-    if multiple: url += "?multiple=true"
-    args = [brep, area, firstMoments, secondMoments, productMoments]
-    if multiple: args = zip(brep, area, firstMoments, secondMoments, productMoments)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/areamassproperties/compute-surface")
 def Compute7(surface, multiple=False):
     """
     Computes an AreaMassProperties for a surface.
@@ -146,14 +112,9 @@ def Compute7(surface, multiple=False):
     Returns:
         AreaMassProperties: The AreaMassProperties for the given Surface or None on failure.
     """
-    url = "rhino/geometry/areamassproperties/compute-surface"
-    if multiple: url += "?multiple=true"
-    args = [surface]
-    if multiple: args = [[item] for item in surface]
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/areamassproperties/compute-surface_bool_bool_bool_bool")
 def Compute8(surface, area, firstMoments, secondMoments, productMoments, multiple=False):
     """
     Compute the AreaMassProperties for a single Surface.
@@ -168,14 +129,9 @@ def Compute8(surface, area, firstMoments, secondMoments, productMoments, multipl
     Returns:
         AreaMassProperties: The AreaMassProperties for the given Surface or None on failure.
     """
-    url = "rhino/geometry/areamassproperties/compute-surface_bool_bool_bool_bool"
-    if multiple: url += "?multiple=true"
-    args = [surface, area, firstMoments, secondMoments, productMoments]
-    if multiple: args = zip(surface, area, firstMoments, secondMoments, productMoments)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/areamassproperties/compute-geometrybasearray")
 def Compute9(geometry, multiple=False):
     """
     Computes the Area properties for a collection of geometric objects.
@@ -187,14 +143,9 @@ def Compute9(geometry, multiple=False):
     Returns:
         AreaMassProperties: The Area properties for the entire collection or None on failure.
     """
-    url = "rhino/geometry/areamassproperties/compute-geometrybasearray"
-    if multiple: url += "?multiple=true"
-    args = [geometry]
-    if multiple: args = [[item] for item in geometry]
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/areamassproperties/compute-geometrybasearray_bool_bool_bool_bool")
 def Compute10(geometry, area, firstMoments, secondMoments, productMoments, multiple=False):
     """
     Computes the AreaMassProperties for a collection of geometric objects.
@@ -210,11 +161,5 @@ def Compute10(geometry, area, firstMoments, secondMoments, productMoments, multi
     Returns:
         AreaMassProperties: The AreaMassProperties for the entire collection or None on failure.
     """
-    url = "rhino/geometry/areamassproperties/compute-geometrybasearray_bool_bool_bool_bool"
-    if multiple: url += "?multiple=true"
-    args = [geometry, area, firstMoments, secondMoments, productMoments]
-    if multiple: args = zip(geometry, area, firstMoments, secondMoments, productMoments)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
@@ -0,0 +1,65 @@
+"""
+Asynchronous versions of the compute_rhino3d wrapper functions.
+
+Every generated module is available as an attribute of this module and every
+function of it as a coroutine function taking the same arguments. Requires
+the aiohttp package.
+
+    >>> from compute_rhino3d import Async
+    >>> meshes = await Async.Mesh.CreateFromBrep(brep)
+"""
+import functools
+import inspect
+from . import Util
+from .Client import _ImportModule
+
+
+class AsyncModule:
+    """
+    Exposes the functions of a generated module as coroutine functions.
+    """
+    def __init__(self, module, client=None):
+        self._module = module
+        self._client = client
+
+    def __getattr__(self, name):
+        func = getattr(self._module, name)
+        if not inspect.isfunction(func):
+            return func
+        client = self._client
+
+        @functools.wraps(func)
+        async def call(*args, **kwargs):
+            with Util.UseClient(client):
+                pending = Util.Deferred(func, *args, **kwargs)
+            return await pending.FetchAsync()
+        setattr(self, name, call)
+        return call
+
+    def __dir__(self):
+        return [name for name in dir(self._module) if not name.startswith('_')]
+
+
+class AsyncModules:
+    """
+    Exposes the generated modules as AsyncModules bound to a ComputeClient.
+    """
+    def __init__(self, client=None):
+        self._client = client
+        self._modules = {}
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        module = self._modules.get(name)
+        if module is None:
+            module = AsyncModule(_ImportModule(name), self._client)
+            module = self._modules.setdefault(name, module)
+        return module
+
+
+_default = AsyncModules()
+
+
+def __getattr__(name):
+    return getattr(_default, name)
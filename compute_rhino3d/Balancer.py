@@ -0,0 +1,148 @@
+"""
+Client-side load balancing over several compute servers.
+
+    >>> Util.url = NodePool(['http://node1:8081/', 'http://node2:8081/'])
+    >>> client = ComputeClient(['http://node1:8081/', 'http://node2:8081/'])
+"""
+import hashlib
+import random
+import threading
+import time
+from . import Util
+
+
+class Node:
+    """
+    A compute server in a NodePool along with its request statistics
+    """
+    def __init__(self, pool, url):
+        self.pool = pool
+        self.url = url
+        self.outstanding = 0
+        self.latency = None
+        self.failures = 0
+        self.ejectedUntil = 0.0
+        self.requestCount = 0
+        self.failureCount = 0
+
+    def __repr__(self):
+        return 'Node({!r})'.format(self.url)
+
+    def Done(self, started, error=None):
+        """
+        Record the end of a request sent to this node
+
+        Args:
+            started (float): time.monotonic() when the request was sent
+            error (Util.ComputeError): the failure, if the request failed
+        """
+        self.pool._Done(self, time.monotonic() - started, error)
+
+
+class NodePool:
+    """
+    Spreads requests over several compute servers.
+
+    Every request goes to the healthy node with the fewest outstanding
+    requests ('least-outstanding') or with the lowest expected latency,
+    the moving average of its response times scaled by its outstanding
+    requests ('latency'). Nodes failing `eject_after` requests in a row,
+    with a connection error, a timeout or a 5xx response, are left out for
+    `eject_time` seconds. Request bodies of at least `affinity_threshold`
+    bytes always go to the same healthy node, so servers can reuse work
+    for large inputs that are sent repeatedly.
+    """
+    def __init__(self, urls, strategy='least-outstanding', eject_after=3,
+                 eject_time=30.0, affinity_threshold=1024 * 1024, decay=0.3):
+        """
+        Args:
+            urls (iter): base urls of the compute servers
+            strategy (str): 'least-outstanding' or 'latency'
+            eject_after (int): consecutive failures before a node is ejected
+            eject_time (float): seconds an ejected node is left out
+            affinity_threshold (int): minimum body size in bytes for requests
+                                      that stick to a node. None disables
+                                      affinity
+            decay (float): weight of the newest response time in the moving
+                           average latency
+        """
+        if strategy not in ('least-outstanding', 'latency'):
+            raise ValueError('unknown strategy {}'.format(strategy))
+        self.nodes = [Node(self, url) for url in urls]
+        if not self.nodes:
+            raise ValueError('NodePool requires at least one url')
+        self.strategy = strategy
+        self.ejectAfter = eject_after
+        self.ejectTime = eject_time
+        self.affinityThreshold = affinity_threshold
+        self.decay = decay
+        self._lock = threading.Lock()
+
+    def Healthy(self):
+        """Get the nodes that are not ejected"""
+        now = time.monotonic()
+        return [node for node in self.nodes if node.ejectedUntil <= now]
+
+    def Acquire(self, body=None):
+        """
+        Pick the node for a request and count the request as outstanding on
+        it. Every call must be matched by a call to Node.Done.
+
+        Args:
+            body (bytes): the request body, used for affinity
+        """
+        with self._lock:
+            nodes = self.Healthy()
+            if not nodes:
+                # all nodes failed recently; try the one returning first
+                nodes = [min(self.nodes, key=lambda node: node.ejectedUntil)]
+            node = None
+            if (self.affinityThreshold is not None and isinstance(body, (str, bytes))
+                    and len(body) >= self.affinityThreshold):
+                node = self._Affinity(nodes, body)
+            if node is None:
+                node = self._Pick(nodes)
+            node.outstanding += 1
+            node.requestCount += 1
+            return node
+
+    def _Pick(self, nodes):
+        if self.strategy == 'latency':
+            known = [node.latency for node in nodes if node.latency is not None]
+            default = min(known) if known else 0.0
+
+            def cost(node):
+                latency = default if node.latency is None else node.latency
+                return latency * (node.outstanding + 1)
+        else:
+            def cost(node):
+                return node.outstanding
+        best = min(cost(node) for node in nodes)
+        return random.choice([node for node in nodes if cost(node) == best])
+
+    def _Affinity(self, nodes, body):
+        # rendezvous hashing keeps most keys on their node when nodes come
+        # and go
+        key = hashlib.sha1(Util._ToBytes(body)).digest()
+        return max(nodes, key=lambda node: hashlib.sha1(key + node.url.encode('utf-8')).digest())
+
+    def _Done(self, node, elapsed, error):
+        with self._lock:
+            node.outstanding -= 1
+            if error is None or not _IsNodeFailure(error):
+                node.failures = 0
+                if error is None:
+                    if node.latency is None: node.latency = elapsed
+                    else: node.latency += self.decay * (elapsed - node.latency)
+                return
+            node.failures += 1
+            node.failureCount += 1
+            if node.failures >= self.ejectAfter:
+                node.ejectedUntil = time.monotonic() + self.ejectTime
+                node.failures = 0
+
+
+def _IsNodeFailure(error):
+    if isinstance(error, Util.ComputeHTTPError):
+        return error.status >= 500
+    return isinstance(error, Util.ComputeConnectionError)
@@ -0,0 +1,144 @@
+"""
+Automatic coalescing of single calls into multiple=true requests.
+
+Enable it for the module level functions with
+
+    >>> Util.batcher = RequestBatcher(window=0.005, max_size=100)
+
+or per client with ComputeClient(batcher=RequestBatcher()). Calls to the same
+endpoint made from different threads (or asyncio tasks) within `window`
+seconds are then sent as one batch and every caller gets its own result back.
+"""
+import asyncio
+import concurrent.futures
+import threading
+import time
+from . import Util
+
+
+class _Batch:
+    def __init__(self):
+        self.rows = []
+        self.future = None
+
+
+class RequestBatcher:
+    """
+    Collects calls to the same endpoint and sends them as one multiple=true
+    request once `window` seconds have passed since the first call or
+    `max_size` calls have been collected, whichever comes first.
+    """
+    def __init__(self, window=0.005, max_size=100, endpoints=('rhino/geometry/',)):
+        """
+        Args:
+            window (float): seconds to wait for more calls after the first
+            max_size (int): maximum number of calls sent in one request
+            endpoints (iter): only endpoints starting with one of these
+                              prefixes are batched
+        """
+        self.window = window
+        self.maxSize = max_size
+        self.endpoints = tuple(endpoints)
+        self.requestCount = 0
+        self.callCount = 0
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._tasks = set()
+
+    def Accepts(self, endpoint, arglist):
+        """Return True if a call can be batched"""
+        return (isinstance(arglist, list) and '?' not in endpoint and
+                endpoint.startswith(self.endpoints))
+
+    def ComputeFetch(self, endpoint, arglist, client=None):
+        """
+        Add a call to the batch for its endpoint and block until the batch
+        has been sent. Returns the response for this call.
+        """
+        key = (client, endpoint)
+        with self._lock:
+            batch = self._pending.get(key)
+            leader = batch is None
+            if leader:
+                batch = self._pending[key] = _Batch()
+                batch.future = concurrent.futures.Future()
+            index = len(batch.rows)
+            batch.rows.append(arglist)
+            full = len(batch.rows) >= self.maxSize
+            if full: del self._pending[key]
+        if leader and not full:
+            time.sleep(self.window)
+            with self._lock:
+                full = self._pending.get(key) is batch
+                if full: del self._pending[key]
+        if full:
+            self._Send(batch, endpoint, client)
+        return batch.future.result()[index]
+
+    def _Send(self, batch, endpoint, client):
+        self._Count(batch)
+        try:
+            response = Util._ComputeFetch(endpoint + '?multiple=true', batch.rows, client)
+            _CheckResponse(response, batch)
+        except Exception as e:
+            batch.future.set_exception(e)
+        else:
+            batch.future.set_result(response)
+
+    async def ComputeFetchAsync(self, endpoint, arglist, client=None):
+        """
+        Asynchronous version of ComputeFetch for calls made on an event loop
+        """
+        loop = asyncio.get_running_loop()
+        key = (loop, client, endpoint)
+        with self._lock:
+            batch = self._pending.get(key)
+            leader = batch is None
+            if leader:
+                batch = self._pending[key] = _Batch()
+                batch.future = loop.create_future()
+            index = len(batch.rows)
+            batch.rows.append(arglist)
+            full = len(batch.rows) >= self.maxSize
+            if full: del self._pending[key]
+        if full:
+            self._SendAsync(batch, endpoint, client)
+        elif leader:
+            loop.call_later(self.window, self._FlushAsync, key, batch)
+        response = await asyncio.shield(batch.future)
+        return response[index]
+
+    def _FlushAsync(self, key, batch):
+        with self._lock:
+            if self._pending.get(key) is not batch: return
+            del self._pending[key]
+        self._SendAsync(batch, key[2], key[1])
+
+    def _SendAsync(self, batch, endpoint, client):
+        async def send():
+            try:
+                response = await Util._ComputeFetchAsync(endpoint + '?multiple=true',
+                                                         batch.rows, client)
+                _CheckResponse(response, batch)
+            except Exception as e:
+                batch.future.set_exception(e)
+            else:
+                batch.future.set_result(response)
+            finally:
+                self._tasks.discard(task)
+        self._Count(batch)
+        task = asyncio.ensure_future(send())
+        self._tasks.add(task)
+
+    def _Count(self, batch):
+        with self._lock:
+            self.requestCount += 1
+            self.callCount += len(batch.rows)
+
+
+def _CheckResponse(response, batch):
+    # msgpack responses hold the points of all calls as one PackedPoints
+    isList = isinstance(response, (list, Util.PackedPoints))
+    if not isList or len(response) != len(batch.rows):
+        raise ValueError('batched request returned {} results for {} calls'.format(
+            len(response) if isList else 'no', len(batch.rows)))
@@ -1,6 +1,7 @@
 from . import Util
 
 
+@Util.Endpoint("rhino/geometry/beziercurve/createcubicbeziers-curve_double_double")
 def CreateCubicBeziers(sourceCurve, distanceTolerance, kinkTolerance, multiple=False):
     """
     Constructs an array of cubic, non-rational beziers that fit a curve to a tolerance.
@@ -15,14 +16,9 @@ def CreateCubicBeziers(sourceCurve, distanceTolerance, kinkTolerance, multiple=F
     Returns:
         BezierCurve[]: A new array of bezier curves. The array can be empty and might contain None items.
     """
-    url = "rhino/geometry/beziercurve/createcubicbeziers-curve_double_double"
-    if multiple: url += "?multiple=true"
-    args = [sourceCurve, distanceTolerance, kinkTolerance]
-    if multiple: args = zip(sourceCurve, distanceTolerance, kinkTolerance)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/beziercurve/createbeziers-curve")
 def CreateBeziers(sourceCurve, multiple=False):
     """
     Create an array of Bezier curves that fit to an existing curve. Please note, these
@@ -34,10 +30,4 @@ def CreateBeziers(sourceCurve, multiple=False):
     Returns:
         BezierCurve[]: A new array of Bezier curves
     """
-    url = "rhino/geometry/beziercurve/createbeziers-curve"
-    if multiple: url += "?multiple=true"
-    args = [sourceCurve]
-    if multiple: args = [[item] for item in sourceCurve]
-    response = Util.ComputeFetch(url, args)
-    return response
 
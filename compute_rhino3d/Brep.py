@@ -1,6 +1,7 @@
 from . import Util
 
 
+@Util.Endpoint("rhino/geometry/brep/changeseam-brepface_int_double_double", Util.DecodeToCommonObject)
 def ChangeSeam(face, direction, parameter, tolerance, multiple=False):
     """
     Change the seam of a closed trimmed surface.
@@ -14,15 +15,9 @@ def ChangeSeam(face, direction, parameter, tolerance, multiple=False):
     Returns:
         Brep: A new Brep that has the same geoemtry as the face with a relocated seam if successful, or None on failure.
     """
-    url = "rhino/geometry/brep/changeseam-brepface_int_double_double"
-    if multiple: url += "?multiple=true"
-    args = [face, direction, parameter, tolerance]
-    if multiple: args = zip(face, direction, parameter, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/copytrimcurves-brepface_surface_double", Util.DecodeToCommonObject)
 def CopyTrimCurves(trimSource, surfaceSource, tolerance, multiple=False):
     """
     Copy all trims from a Brep face onto a surface.
@@ -35,15 +30,9 @@ def CopyTrimCurves(trimSource, surfaceSource, tolerance, multiple=False):
     Returns:
         Brep: A brep with the shape of surfaceSource and the trims of trimSource or None on failure.
     """
-    url = "rhino/geometry/brep/copytrimcurves-brepface_surface_double"
-    if multiple: url += "?multiple=true"
-    args = [trimSource, surfaceSource, tolerance]
-    if multiple: args = zip(trimSource, surfaceSource, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/createbaseballsphere-point3d_double_double", Util.DecodeToCommonObject)
 def CreateBaseballSphere(center, radius, tolerance, multiple=False):
     """
     Creates a brep representation of the sphere with two similar trimmed NURBS surfaces, and no singularities.
@@ -57,15 +46,9 @@ def CreateBaseballSphere(center, radius, tolerance, multiple=False):
     Returns:
         Brep: A new brep, or None on error.
     """
-    url = "rhino/geometry/brep/createbaseballsphere-point3d_double_double"
-    if multiple: url += "?multiple=true"
-    args = [center, radius, tolerance]
-    if multiple: args = zip(center, radius, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/createdevelopableloft-curve_curve_bool_bool_int", Util.DecodeToCommonObject)
 def CreateDevelopableLoft(crv0, crv1, reverse0, reverse1, density, multiple=False):
     """
     Creates a single developable surface between two curves.
@@ -80,15 +63,9 @@ def CreateDevelopableLoft(crv0, crv1, reverse0, reverse1, density, multiple=Fals
     Returns:
         Brep[]: The output Breps if successful, otherwise an empty array.
     """
-    url = "rhino/geometry/brep/createdevelopableloft-curve_curve_bool_bool_int"
-    if multiple: url += "?multiple=true"
-    args = [crv0, crv1, reverse0, reverse1, density]
-    if multiple: args = zip(crv0, crv1, reverse0, reverse1, density)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/createdevelopableloft-nurbscurve_nurbscurve_point2darray", Util.DecodeToCommonObject)
 def CreateDevelopableLoft1(rail0, rail1, fixedRulings, multiple=False):
     """
     Creates a single developable surface between two curves.
@@ -103,15 +80,9 @@ def CreateDevelopableLoft1(rail0, rail1, fixedRulings, multiple=False):
     Returns:
         Brep[]: The output Breps if successful, otherwise an empty array.
     """
-    url = "rhino/geometry/brep/createdevelopableloft-nurbscurve_nurbscurve_point2darray"
-    if multiple: url += "?multiple=true"
-    args = [rail0, rail1, fixedRulings]
-    if multiple: args = zip(rail0, rail1, fixedRulings)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/createplanarbreps-curvearray", Util.DecodeToCommonObject)
 def CreatePlanarBreps(inputLoops, multiple=False):
     """
     Constructs a set of planar breps as outlines by the loops.
@@ -122,15 +93,9 @@ def CreatePlanarBreps(inputLoops, multiple=False):
     Returns:
         Brep[]: An array of Planar Breps.
     """
-    url = "rhino/geometry/brep/createplanarbreps-curvearray"
-    if multiple: url += "?multiple=true"
-    args = [inputLoops]
-    if multiple: args = [[item] for item in inputLoops]
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/createplanarbreps-curvearray_double", Util.DecodeToCommonObject)
 def CreatePlanarBreps1(inputLoops, tolerance, multiple=False):
     """
     Constructs a set of planar breps as outlines by the loops.
@@ -141,15 +106,9 @@ def CreatePlanarBreps1(inputLoops, tolerance, multiple=False):
     Returns:
         Brep[]: An array of Planar Breps.
     """
-    url = "rhino/geometry/brep/createplanarbreps-curvearray_double"
-    if multiple: url += "?multiple=true"
-    args = [inputLoops, tolerance]
-    if multiple: args = zip(inputLoops, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/createplanarbreps-curve", Util.DecodeToCommonObject)
 def CreatePlanarBreps2(inputLoop, multiple=False):
     """
     Constructs a set of planar breps as outlines by the loops.
@@ -160,15 +119,9 @@ def CreatePlanarBreps2(inputLoop, multiple=False):
     Returns:
         Brep[]: An array of Planar Breps.
     """
-    url = "rhino/geometry/brep/createplanarbreps-curve"
-    if multiple: url += "?multiple=true"
-    args = [inputLoop]
-    if multiple: args = [[item] for item in inputLoop]
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/createplanarbreps-curve_double", Util.DecodeToCommonObject)
 def CreatePlanarBreps3(inputLoop, tolerance, multiple=False):
     """
     Constructs a set of planar breps as outlines by the loops.
@@ -179,15 +132,9 @@ def CreatePlanarBreps3(inputLoop, tolerance, multiple=False):
     Returns:
         Brep[]: An array of Planar Breps.
     """
-    url = "rhino/geometry/brep/createplanarbreps-curve_double"
-    if multiple: url += "?multiple=true"
-    args = [inputLoop, tolerance]
-    if multiple: args = zip(inputLoop, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/createtrimmedsurface-brepface_surface", Util.DecodeToCommonObject)
 def CreateTrimmedSurface(trimSource, surfaceSource, multiple=False):
     """
     Constructs a Brep using the trimming information of a brep face and a surface.
@@ -200,15 +147,9 @@ def CreateTrimmedSurface(trimSource, surfaceSource, multiple=False):
     Returns:
         Brep: A brep with the shape of surfaceSource and the trims of trimSource or None on failure.
     """
-    url = "rhino/geometry/brep/createtrimmedsurface-brepface_surface"
-    if multiple: url += "?multiple=true"
-    args = [trimSource, surfaceSource]
-    if multiple: args = zip(trimSource, surfaceSource)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/createtrimmedsurface-brepface_surface_double", Util.DecodeToCommonObject)
 def CreateTrimmedSurface1(trimSource, surfaceSource, tolerance, multiple=False):
     """
     Constructs a Brep using the trimming information of a brep face and a surface.
@@ -221,15 +162,9 @@ def CreateTrimmedSurface1(trimSource, surfaceSource, tolerance, multiple=False):
     Returns:
         Brep: A brep with the shape of surfaceSource and the trims of trimSource or None on failure.
     """
-    url = "rhino/geometry/brep/createtrimmedsurface-brepface_surface_double"
-    if multiple: url += "?multiple=true"
-    args = [trimSource, surfaceSource, tolerance]
-    if multiple: args = zip(trimSource, surfaceSource, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/createfromcornerpoints-point3d_point3d_point3d_double", Util.DecodeToCommonObject)
 def CreateFromCornerPoints(corner1, corner2, corner3, tolerance, multiple=False):
     """
     Makes a brep with one face.
@@ -243,15 +178,9 @@ def CreateFromCornerPoints(corner1, corner2, corner3, tolerance, multiple=False)
     Returns:
         Brep: A boundary representation, or None on error.
     """
-    url = "rhino/geometry/brep/createfromcornerpoints-point3d_point3d_point3d_double"
-    if multiple: url += "?multiple=true"
-    args = [corner1, corner2, corner3, tolerance]
-    if multiple: args = zip(corner1, corner2, corner3, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/createfromcornerpoints-point3d_point3d_point3d_point3d_double", Util.DecodeToCommonObject)
 def CreateFromCornerPoints1(corner1, corner2, corner3, corner4, tolerance, multiple=False):
     """
     make a Brep with one face.
@@ -266,15 +195,9 @@ def CreateFromCornerPoints1(corner1, corner2, corner3, corner4, tolerance, multi
     Returns:
         Brep: A boundary representation, or None on error.
     """
-    url = "rhino/geometry/brep/createfromcornerpoints-point3d_point3d_point3d_point3d_double"
-    if multiple: url += "?multiple=true"
-    args = [corner1, corner2, corner3, corner4, tolerance]
-    if multiple: args = zip(corner1, corner2, corner3, corner4, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/createedgesurface-curvearray", Util.DecodeToCommonObject)
 def CreateEdgeSurface(curves, multiple=False):
     """
     Constructs a coons patch from 2, 3, or 4 curves.
@@ -285,15 +208,9 @@ def CreateEdgeSurface(curves, multiple=False):
     Returns:
         Brep: resulting brep or None on failure.
     """
-    url = "rhino/geometry/brep/createedgesurface-curvearray"
-    if multiple: url += "?multiple=true"
-    args = [curves]
-    if multiple: args = [[item] for item in curves]
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/createplanarbreps-rhino.collections.curvelist", Util.DecodeToCommonObject)
 def CreatePlanarBreps4(inputLoops, multiple=False):
     """
     Constructs a set of planar Breps as outlines by the loops.
@@ -304,15 +221,9 @@ def CreatePlanarBreps4(inputLoops, multiple=False):
     Returns:
         Brep[]: An array of Planar Breps or None on error.
     """
-    url = "rhino/geometry/brep/createplanarbreps-rhino.collections.curvelist"
-    if multiple: url += "?multiple=true"
-    args = [inputLoops]
-    if multiple: args = [[item] for item in inputLoops]
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/createplanarbreps-rhino.collections.curvelist_double", Util.DecodeToCommonObject)
 def CreatePlanarBreps5(inputLoops, tolerance, multiple=False):
     """
     Constructs a set of planar Breps as outlines by the loops.
@@ -323,15 +234,9 @@ def CreatePlanarBreps5(inputLoops, tolerance, multiple=False):
     Returns:
         Brep[]: An array of Planar Breps.
     """
-    url = "rhino/geometry/brep/createplanarbreps-rhino.collections.curvelist_double"
-    if multiple: url += "?multiple=true"
-    args = [inputLoops, tolerance]
-    if multiple: args = zip(inputLoops, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/createfromoffsetface-brepface_double_double_bool_bool", Util.DecodeToCommonObject)
 def CreateFromOffsetFace(face, offsetDistance, offsetTolerance, bothSides, createSolid, multiple=False):
     """
     Offsets a face including trim information to create a new brep.
@@ -348,15 +253,9 @@ def CreateFromOffsetFace(face, offsetDistance, offsetTolerance, bothSides, creat
         or if createSolid is True and connecting the offsets with side surfaces fails.
         None if unsuccessful.
     """
-    url = "rhino/geometry/brep/createfromoffsetface-brepface_double_double_bool_bool"
-    if multiple: url += "?multiple=true"
-    args = [face, offsetDistance, offsetTolerance, bothSides, createSolid]
-    if multiple: args = zip(face, offsetDistance, offsetTolerance, bothSides, createSolid)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/createsolid-breparray_double", Util.DecodeToCommonObject)
 def CreateSolid(breps, tolerance, multiple=False):
     """
     Constructs closed polysurfaces from surfaces and polysurfaces that bound a region in space.
@@ -368,15 +267,9 @@ def CreateSolid(breps, tolerance, multiple=False):
     Returns:
         Brep[]: The resulting polysurfaces on success or None on failure.
     """
-    url = "rhino/geometry/brep/createsolid-breparray_double"
-    if multiple: url += "?multiple=true"
-    args = [breps, tolerance]
-    if multiple: args = zip(breps, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/mergesurfaces-surface_surface_double_double", Util.DecodeToCommonObject)
 def MergeSurfaces(surface0, surface1, tolerance, angleToleranceRadians, multiple=False):
     """
     Merges two surfaces into one surface at untrimmed edges.
@@ -390,15 +283,9 @@ def MergeSurfaces(surface0, surface1, tolerance, angleToleranceRadians, multiple
     Returns:
         Brep: The merged surfaces as a Brep if successful, None if not successful.
     """
-    url = "rhino/geometry/brep/mergesurfaces-surface_surface_double_double"
-    if multiple: url += "?multiple=true"
-    args = [surface0, surface1, tolerance, angleToleranceRadians]
-    if multiple: args = zip(surface0, surface1, tolerance, angleToleranceRadians)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/mergesurfaces-brep_brep_double_double", Util.DecodeToCommonObject)
 def MergeSurfaces1(brep0, brep1, tolerance, angleToleranceRadians, multiple=False):
     """
     Merges two surfaces into one surface at untrimmed edges. Both surfaces must be untrimmed and share an edge.
@@ -412,15 +299,9 @@ def MergeSurfaces1(brep0, brep1, tolerance, angleToleranceRadians, multiple=Fals
     Returns:
         Brep: The merged Brep if successful, None if not successful.
     """
-    url = "rhino/geometry/brep/mergesurfaces-brep_brep_double_double"
-    if multiple: url += "?multiple=true"
-    args = [brep0, brep1, tolerance, angleToleranceRadians]
-    if multiple: args = zip(brep0, brep1, tolerance, angleToleranceRadians)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/mergesurfaces-brep_brep_double_double_point2d_point2d_double_bool", Util.DecodeToCommonObject)
 def MergeSurfaces2(brep0, brep1, tolerance, angleToleranceRadians, point0, point1, roundness, smooth, multiple=False):
     """
     Merges two surfaces into one surface at untrimmed edges. Both surfaces must be untrimmed and share an edge.
@@ -438,15 +319,9 @@ def MergeSurfaces2(brep0, brep1, tolerance, angleToleranceRadians, point0, point
     Returns:
         Brep: The merged Brep if successful, None if not successful.
     """
-    url = "rhino/geometry/brep/mergesurfaces-brep_brep_double_double_point2d_point2d_double_bool"
-    if multiple: url += "?multiple=true"
-    args = [brep0, brep1, tolerance, angleToleranceRadians, point0, point1, roundness, smooth]
-    if multiple: args = zip(brep0, brep1, tolerance, angleToleranceRadians, point0, point1, roundness, smooth)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/createpatch-geometrybasearray_surface_double", Util.DecodeToCommonObject)
 def CreatePatch(geometry, startingSurface, tolerance, multiple=False):
     """
     Constructs a brep patch.
@@ -462,15 +337,9 @@ def CreatePatch(geometry, startingSurface, tolerance, multiple=False):
     Returns:
         Brep: Brep fit through input on success, or None on error.
     """
-    url = "rhino/geometry/brep/createpatch-geometrybasearray_surface_double"
-    if multiple: url += "?multiple=true"
-    args = [geometry, startingSurface, tolerance]
-    if multiple: args = zip(geometry, startingSurface, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/createpatch-geometrybasearray_int_int_double", Util.DecodeToCommonObject)
 def CreatePatch1(geometry, uSpans, vSpans, tolerance, multiple=False):
     """
     Constructs a brep patch.
@@ -490,15 +359,9 @@ def CreatePatch1(geometry, uSpans, vSpans, tolerance, multiple=False):
     Returns:
         Brep: A brep fit through input on success, or None on error.
     """
-    url = "rhino/geometry/brep/createpatch-geometrybasearray_int_int_double"
-    if multiple: url += "?multiple=true"
-    args = [geometry, uSpans, vSpans, tolerance]
-    if multiple: args = zip(geometry, uSpans, vSpans, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/createpatch-geometrybasearray_surface_int_int_bool_bool_double_double_double_boolarray_double", Util.DecodeToCommonObject)
 def CreatePatch2(geometry, startingSurface, uSpans, vSpans, trim, tangency, pointSpacing, flexibility, surfacePull, fixEdges, tolerance, multiple=False):
     """
     Constructs a brep patch using all controls
@@ -533,15 +396,9 @@ def CreatePatch2(geometry, startingSurface, uSpans, vSpans, trim, tangency, poin
     Returns:
         Brep: A brep fit through input on success, or None on error.
     """
-    url = "rhino/geometry/brep/createpatch-geometrybasearray_surface_int_int_bool_bool_double_double_double_boolarray_double"
-    if multiple: url += "?multiple=true"
-    args = [geometry, startingSurface, uSpans, vSpans, trim, tangency, pointSpacing, flexibility, surfacePull, fixEdges, tolerance]
-    if multiple: args = zip(geometry, startingSurface, uSpans, vSpans, trim, tangency, pointSpacing, flexibility, surfacePull, fixEdges, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/createpipe-curve_double_bool_pipecapmode_bool_double_double", Util.DecodeToCommonObject)
 def CreatePipe(rail, radius, localBlending, cap, fitRail, absoluteTolerance, angleToleranceRadians, multiple=False):
     """
     Creates a single walled pipe
@@ -560,15 +417,9 @@ def CreatePipe(rail, radius, localBlending, cap, fitRail, absoluteTolerance, ang
     Returns:
         Brep[]: Array of created pipes on success
     """
-    url = "rhino/geometry/brep/createpipe-curve_double_bool_pipecapmode_bool_double_double"
-    if multiple: url += "?multiple=true"
-    args = [rail, radius, localBlending, cap, fitRail, absoluteTolerance, angleToleranceRadians]
-    if multiple: args = zip(rail, radius, localBlending, cap, fitRail, absoluteTolerance, angleToleranceRadians)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/createpipe-curve_doublearray_doublearray_bool_pipecapmode_bool_double_double", Util.DecodeToCommonObject)
 def CreatePipe1(rail, railRadiiParameters, radii, localBlending, cap, fitRail, absoluteTolerance, angleToleranceRadians, multiple=False):
     """
     Creates a single walled pipe
@@ -589,15 +440,9 @@ def CreatePipe1(rail, railRadiiParameters, radii, localBlending, cap, fitRail, a
     Returns:
         Brep[]: Array of created pipes on success
     """
-    url = "rhino/geometry/brep/createpipe-curve_doublearray_doublearray_bool_pipecapmode_bool_double_double"
-    if multiple: url += "?multiple=true"
-    args = [rail, railRadiiParameters, radii, localBlending, cap, fitRail, absoluteTolerance, angleToleranceRadians]
-    if multiple: args = zip(rail, railRadiiParameters, radii, localBlending, cap, fitRail, absoluteTolerance, angleToleranceRadians)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/createfromsweep-curve_curve_bool_double", Util.DecodeToCommonObject)
 def CreateFromSweep(rail, shape, closed, tolerance, multiple=False):
     """
     Sweep1 function that fits a surface through a profile curve that define the surface cross-sections
@@ -612,15 +457,9 @@ def CreateFromSweep(rail, shape, closed, tolerance, multiple=False):
     Returns:
         Brep[]: Array of Brep sweep results
     """
-    url = "rhino/geometry/brep/createfromsweep-curve_curve_bool_double"
-    if multiple: url += "?multiple=true"
-    args = [rail, shape, closed, tolerance]
-    if multiple: args = zip(rail, shape, closed, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/createfromsweep-curve_curvearray_bool_double", Util.DecodeToCommonObject)
 def CreateFromSweep1(rail, shapes, closed, tolerance, multiple=False):
     """
     Sweep1 function that fits a surface through profile curves that define the surface cross-sections
@@ -635,15 +474,9 @@ def CreateFromSweep1(rail, shapes, closed, tolerance, multiple=False):
     Returns:
         Brep[]: Array of Brep sweep results
     """
-    url = "rhino/geometry/brep/createfromsweep-curve_curvearray_bool_double"
-    if multiple: url += "?multiple=true"
-    args = [rail, shapes, closed, tolerance]
-    if multiple: args = zip(rail, shapes, closed, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/createfromsweepsegmented-curve_curve_bool_double", Util.DecodeToCommonObject)
 def CreateFromSweepSegmented(rail, shape, closed, tolerance, multiple=False):
     """
     Sweep1 function that fits a surface through a profile curve that define the surface cross-sections
@@ -659,15 +492,9 @@ def CreateFromSweepSegmented(rail, shape, closed, tolerance, multiple=False):
     Returns:
         Brep[]: Array of Brep sweep results
     """
-    url = "rhino/geometry/brep/createfromsweepsegmented-curve_curve_bool_double"
-    if multiple: url += "?multiple=true"
-    args = [rail, shape, closed, tolerance]
-    if multiple: args = zip(rail, shape, closed, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/createfromsweepsegmented-curve_curvearray_bool_double", Util.DecodeToCommonObject)
 def CreateFromSweepSegmented1(rail, shapes, closed, tolerance, multiple=False):
     """
     Sweep1 function that fits a surface through a series of profile curves that define the surface cross-sections
@@ -683,15 +510,9 @@ def CreateFromSweepSegmented1(rail, shapes, closed, tolerance, multiple=False):
     Returns:
         Brep[]: Array of Brep sweep results
     """
-    url = "rhino/geometry/brep/createfromsweepsegmented-curve_curvearray_bool_double"
-    if multiple: url += "?multiple=true"
-    args = [rail, shapes, closed, tolerance]
-    if multiple: args = zip(rail, shapes, closed, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/createfromsweep-curve_curve_curve_bool_double", Util.DecodeToCommonObject)
 def CreateFromSweep2(rail1, rail2, shape, closed, tolerance, multiple=False):
     """
     General 2 rail sweep. If you are not producing the sweep results that you are after, then
@@ -707,15 +528,9 @@ def CreateFromSweep2(rail1, rail2, shape, closed, tolerance, multiple=False):
     Returns:
         Brep[]: Array of Brep sweep results
     """
-    url = "rhino/geometry/brep/createfromsweep-curve_curve_curve_bool_double"
-    if multiple: url += "?multiple=true"
-    args = [rail1, rail2, shape, closed, tolerance]
-    if multiple: args = zip(rail1, rail2, shape, closed, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/createfromsweep-curve_curve_curvearray_bool_double", Util.DecodeToCommonObject)
 def CreateFromSweep3(rail1, rail2, shapes, closed, tolerance, multiple=False):
     """
     General 2 rail sweep. If you are not producing the sweep results that you are after, then
@@ -731,15 +546,9 @@ def CreateFromSweep3(rail1, rail2, shapes, closed, tolerance, multiple=False):
     Returns:
         Brep[]: Array of Brep sweep results
     """
-    url = "rhino/geometry/brep/createfromsweep-curve_curve_curvearray_bool_double"
-    if multiple: url += "?multiple=true"
-    args = [rail1, rail2, shapes, closed, tolerance]
-    if multiple: args = zip(rail1, rail2, shapes, closed, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/createfromsweep-curve_curve_curvearray_point3d_point3d_bool_double_sweeprebuild_int_double_bool", Util.DecodeToCommonObject)
 def CreateFromSweep4(rail1, rail2, shapes, start, end, closed, tolerance, rebuild, rebuildPointCount, refitTolerance, preserveHeight, multiple=False):
     """
     Sweep2 function that fits a surface through profile curves that define the surface cross-sections
@@ -761,15 +570,9 @@ def CreateFromSweep4(rail1, rail2, shapes, start, end, closed, tolerance, rebuil
     Returns:
         Brep[]: Array of Brep sweep results
     """
-    url = "rhino/geometry/brep/createfromsweep-curve_curve_curvearray_point3d_point3d_bool_double_sweeprebuild_int_double_bool"
-    if multiple: url += "?multiple=true"
-    args = [rail1, rail2, shapes, start, end, closed, tolerance, rebuild, rebuildPointCount, refitTolerance, preserveHeight]
-    if multiple: args = zip(rail1, rail2, shapes, start, end, closed, tolerance, rebuild, rebuildPointCount, refitTolerance, preserveHeight)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/createfromsweepinparts-curve_curve_curvearray_point2darray_bool_double", Util.DecodeToCommonObject)
 def CreateFromSweepInParts(rail1, rail2, shapes, rail_params, closed, tolerance, multiple=False):
     """
     Makes a 2 rail sweep. Like CreateFromSweep but the result is split where parameterization along a rail changes abruptly.
@@ -785,15 +588,9 @@ def CreateFromSweepInParts(rail1, rail2, shapes, rail_params, closed, tolerance,
     Returns:
         Brep[]: Array of Brep sweep results
     """
-    url = "rhino/geometry/brep/createfromsweepinparts-curve_curve_curvearray_point2darray_bool_double"
-    if multiple: url += "?multiple=true"
-    args = [rail1, rail2, shapes, rail_params, closed, tolerance]
-    if multiple: args = zip(rail1, rail2, shapes, rail_params, closed, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/createfromtaperedextrude-curve_double_vector3d_point3d_double_extrudecornertype_double_double", Util.DecodeToCommonObject)
 def CreateFromTaperedExtrude(curveToExtrude, distance, direction, basePoint, draftAngleRadians, cornerType, tolerance, angleToleranceRadians, multiple=False):
     """
     Extrude a curve to a taper making a brep (potentially more than 1)
@@ -810,15 +607,9 @@ def CreateFromTaperedExtrude(curveToExtrude, distance, direction, basePoint, dra
     Returns:
         Brep[]: array of breps on success
     """
-    url = "rhino/geometry/brep/createfromtaperedextrude-curve_double_vector3d_point3d_double_extrudecornertype_double_double"
-    if multiple: url += "?multiple=true"
-    args = [curveToExtrude, distance, direction, basePoint, draftAngleRadians, cornerType, tolerance, angleToleranceRadians]
-    if multiple: args = zip(curveToExtrude, distance, direction, basePoint, draftAngleRadians, cornerType, tolerance, angleToleranceRadians)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/createfromtaperedextrude-curve_double_vector3d_point3d_double_extrudecornertype", Util.DecodeToCommonObject)
 def CreateFromTaperedExtrude1(curveToExtrude, distance, direction, basePoint, draftAngleRadians, cornerType, multiple=False):
     """
     Extrude a curve to a taper making a brep (potentially more than 1)
@@ -833,15 +624,9 @@ def CreateFromTaperedExtrude1(curveToExtrude, distance, direction, basePoint, dr
     Returns:
         Brep[]: array of breps on success
     """
-    url = "rhino/geometry/brep/createfromtaperedextrude-curve_double_vector3d_point3d_double_extrudecornertype"
-    if multiple: url += "?multiple=true"
-    args = [curveToExtrude, distance, direction, basePoint, draftAngleRadians, cornerType]
-    if multiple: args = zip(curveToExtrude, distance, direction, basePoint, draftAngleRadians, cornerType)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/createfromtaperedextrudewithref-curve_vector3d_double_double_plane_double", Util.DecodeToCommonObject)
 def CreateFromTaperedExtrudeWithRef(curve, direction, distance, draftAngle, plane, tolerance, multiple=False):
     """
     Creates one or more Breps by extruding a curve a distance along an axis with draft angle.
@@ -860,15 +645,9 @@ def CreateFromTaperedExtrudeWithRef(curve, direction, distance, draftAngle, plan
     Returns:
         Brep[]: An array of Breps if successful.
     """
-    url = "rhino/geometry/brep/createfromtaperedextrudewithref-curve_vector3d_double_double_plane_double"
-    if multiple: url += "?multiple=true"
-    args = [curve, direction, distance, draftAngle, plane, tolerance]
-    if multiple: args = zip(curve, direction, distance, draftAngle, plane, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/createblendsurface-brepface_brepedge_interval_bool_blendcontinuity_brepface_brepedge_interval_bool_blendcontinuity", Util.DecodeToCommonObject)
 def CreateBlendSurface(face0, edge0, domain0, rev0, continuity0, face1, edge1, domain1, rev1, continuity1, multiple=False):
     """
     Makes a surface blend between two surface edges.
@@ -888,15 +667,9 @@ def CreateBlendSurface(face0, edge0, domain0, rev0, continuity0, face1, edge1, d
     Returns:
         Brep[]: Array of Breps if successful.
     """
-    url = "rhino/geometry/brep/createblendsurface-brepface_brepedge_interval_bool_blendcontinuity_brepface_brepedge_interval_bool_blendcontinuity"
-    if multiple: url += "?multiple=true"
-    args = [face0, edge0, domain0, rev0, continuity0, face1, edge1, domain1, rev1, continuity1]
-    if multiple: args = zip(face0, edge0, domain0, rev0, continuity0, face1, edge1, domain1, rev1, continuity1)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/createblendshape-brepface_brepedge_double_bool_blendcontinuity_brepface_brepedge_double_bool_blendcontinuity", Util.DecodeToCommonObject)
 def CreateBlendShape(face0, edge0, t0, rev0, continuity0, face1, edge1, t1, rev1, continuity1, multiple=False):
     """
     Makes a curve blend between points on two surface edges. The blend will be tangent to the surfaces and perpendicular to the edges.
@@ -916,15 +689,9 @@ def CreateBlendShape(face0, edge0, t0, rev0, continuity0, face1, edge1, t1, rev1
     Returns:
         Curve: The blend curve on success. None on failure
     """
-    url = "rhino/geometry/brep/createblendshape-brepface_brepedge_double_bool_blendcontinuity_brepface_brepedge_double_bool_blendcontinuity"
-    if multiple: url += "?multiple=true"
-    args = [face0, edge0, t0, rev0, continuity0, face1, edge1, t1, rev1, continuity1]
-    if multiple: args = zip(face0, edge0, t0, rev0, continuity0, face1, edge1, t1, rev1, continuity1)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/createfilletsurface-brepface_point2d_brepface_point2d_double_bool_double", Util.DecodeToCommonObject)
 def CreateFilletSurface(face0, uv0, face1, uv1, radius, extend, tolerance, multiple=False):
     """
     Creates a constant-radius round surface between two surfaces.
@@ -941,15 +708,9 @@ def CreateFilletSurface(face0, uv0, face1, uv1, radius, extend, tolerance, multi
     Returns:
         Brep[]: Array of Breps if successful.
     """
-    url = "rhino/geometry/brep/createfilletsurface-brepface_point2d_brepface_point2d_double_bool_double"
-    if multiple: url += "?multiple=true"
-    args = [face0, uv0, face1, uv1, radius, extend, tolerance]
-    if multiple: args = zip(face0, uv0, face1, uv1, radius, extend, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/createfilletsurface-brepface_point2d_brepface_point2d_double_bool_bool_double_breparray_breparray")
 def CreateFilletSurface1(face0, uv0, face1, uv1, radius, trim, extend, tolerance, multiple=False):
     """
     Creates a constant-radius round surface between two surfaces.
@@ -969,14 +730,9 @@ def CreateFilletSurface1(face0, uv0, face1, uv1, radius, trim, extend, tolerance
         outBreps0 (Brep[]): The trim or split results of the Brep owned by face0.
         outBreps1 (Brep[]): The trim or split results of the Brep owned by face1.
     """
-    url = "rhino/geometry/brep/createfilletsurface-brepface_point2d_brepface_point2d_double_bool_bool_double_breparray_breparray"
-    if multiple: url += "?multiple=true"
-    args = [face0, uv0, face1, uv1, radius, trim, extend, tolerance]
-    if multiple: args = zip(face0, uv0, face1, uv1, radius, trim, extend, tolerance)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/createchamfersurface-brepface_point2d_double_brepface_point2d_double_bool_double", Util.DecodeToCommonObject)
 def CreateChamferSurface(face0, uv0, radius0, face1, uv1, radius1, extend, tolerance, multiple=False):
     """
     Creates a ruled surface as a bevel between two input surface edges.
@@ -994,15 +750,9 @@ def CreateChamferSurface(face0, uv0, radius0, face1, uv1, radius1, extend, toler
     Returns:
         Brep[]: Array of Breps if successful.
     """
-    url = "rhino/geometry/brep/createchamfersurface-brepface_point2d_double_brepface_point2d_double_bool_double"
-    if multiple: url += "?multiple=true"
-    args = [face0, uv0, radius0, face1, uv1, radius1, extend, tolerance]
-    if multiple: args = zip(face0, uv0, radius0, face1, uv1, radius1, extend, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/createchamfersurface-brepface_point2d_double_brepface_point2d_double_bool_bool_double_breparray_breparray")
 def CreateChamferSurface1(face0, uv0, radius0, face1, uv1, radius1, trim, extend, tolerance, multiple=False):
     """
     Creates a ruled surface as a bevel between two input surface edges.
@@ -1023,14 +773,9 @@ def CreateChamferSurface1(face0, uv0, radius0, face1, uv1, radius1, trim, extend
         outBreps0 (Brep[]): The trim or split results of the Brep owned by face0.
         outBreps1 (Brep[]): The trim or split results of the Brep owned by face1.
     """
-    url = "rhino/geometry/brep/createchamfersurface-brepface_point2d_double_brepface_point2d_double_bool_bool_double_breparray_breparray"
-    if multiple: url += "?multiple=true"
-    args = [face0, uv0, radius0, face1, uv1, radius1, trim, extend, tolerance]
-    if multiple: args = zip(face0, uv0, radius0, face1, uv1, radius1, trim, extend, tolerance)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/createfilletedges-brep_intarray_doublearray_doublearray_blendtype_railtype_double", Util.DecodeToCommonObject)
 def CreateFilletEdges(brep, edgeIndices, startRadii, endRadii, blendType, railType, tolerance, multiple=False):
     """
     Fillets, chamfers, or blends the edges of a brep.
@@ -1047,15 +792,9 @@ def CreateFilletEdges(brep, edgeIndices, startRadii, endRadii, blendType, railTy
     Returns:
         Brep[]: Array of Breps if successful.
     """
-    url = "rhino/geometry/brep/createfilletedges-brep_intarray_doublearray_doublearray_blendtype_railtype_double"
-    if multiple: url += "?multiple=true"
-    args = [brep, edgeIndices, startRadii, endRadii, blendType, railType, tolerance]
-    if multiple: args = zip(brep, edgeIndices, startRadii, endRadii, blendType, railType, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/createoffsetbrep-brep_double_bool_bool_double_breparray_breparray")
 def CreateOffsetBrep(brep, distance, solid, extend, tolerance, multiple=False):
     """
     Offsets a Brep.
@@ -1081,14 +820,9 @@ def CreateOffsetBrep(brep, distance, solid, extend, tolerance, multiple=False):
         outBlends (Brep[]): The results of the calculation.
         outWalls (Brep[]): The results of the calculation.
     """
-    url = "rhino/geometry/brep/createoffsetbrep-brep_double_bool_bool_double_breparray_breparray"
-    if multiple: url += "?multiple=true"
-    args = [brep, distance, solid, extend, tolerance]
-    if multiple: args = zip(brep, distance, solid, extend, tolerance)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/createfromjoinededges-brep_int_brep_int_double", Util.DecodeToCommonObject)
 def CreateFromJoinedEdges(brep0, edgeIndex0, brep1, edgeIndex1, joinTolerance, multiple=False):
     """
     Joins two naked edges, or edges that are coincident or close together, from two Breps.
@@ -1103,15 +837,9 @@ def CreateFromJoinedEdges(brep0, edgeIndex0, brep1, edgeIndex1, joinTolerance, m
     Returns:
         Brep: The resulting Brep if successful, None on failure.
     """
-    url = "rhino/geometry/brep/createfromjoinededges-brep_int_brep_int_double"
-    if multiple: url += "?multiple=true"
-    args = [brep0, edgeIndex0, brep1, edgeIndex1, joinTolerance]
-    if multiple: args = zip(brep0, edgeIndex0, brep1, edgeIndex1, joinTolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/createfromloft-curvearray_point3d_point3d_lofttype_bool", Util.DecodeToCommonObject)
 def CreateFromLoft(curves, start, end, loftType, closed, multiple=False):
     """
     Constructs one or more Breps by lofting through a set of curves.
@@ -1131,15 +859,9 @@ def CreateFromLoft(curves, start, end, loftType, closed, multiple=False):
         Brep[]: Constructs a closed surface, continuing the surface past the last curve around to the
         first curve. Available when you have selected three shape curves.
     """
-    url = "rhino/geometry/brep/createfromloft-curvearray_point3d_point3d_lofttype_bool"
-    if multiple: url += "?multiple=true"
-    args = [curves, start, end, loftType, closed]
-    if multiple: args = zip(curves, start, end, loftType, closed)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/createfromloftrebuild-curvearray_point3d_point3d_lofttype_bool_int", Util.DecodeToCommonObject)
 def CreateFromLoftRebuild(curves, start, end, loftType, closed, rebuildPointCount, multiple=False):
     """
     Constructs one or more Breps by lofting through a set of curves. Input for the loft is simplified by
@@ -1161,15 +883,9 @@ def CreateFromLoftRebuild(curves, start, end, loftType, closed, rebuildPointCoun
         Brep[]: Constructs a closed surface, continuing the surface past the last curve around to the
         first curve. Available when you have selected three shape curves.
     """
-    url = "rhino/geometry/brep/createfromloftrebuild-curvearray_point3d_point3d_lofttype_bool_int"
-    if multiple: url += "?multiple=true"
-    args = [curves, start, end, loftType, closed, rebuildPointCount]
-    if multiple: args = zip(curves, start, end, loftType, closed, rebuildPointCount)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/createfromloftrefit-curvearray_point3d_point3d_lofttype_bool_double", Util.DecodeToCommonObject)
 def CreateFromLoftRefit(curves, start, end, loftType, closed, refitTolerance, multiple=False):
     """
     Constructs one or more Breps by lofting through a set of curves. Input for the loft is simplified by
@@ -1191,15 +907,9 @@ def CreateFromLoftRefit(curves, start, end, loftType, closed, refitTolerance, mu
         Brep[]: Constructs a closed surface, continuing the surface past the last curve around to the
         first curve. Available when you have selected three shape curves.
     """
-    url = "rhino/geometry/brep/createfromloftrefit-curvearray_point3d_point3d_lofttype_bool_double"
-    if multiple: url += "?multiple=true"
-    args = [curves, start, end, loftType, closed, refitTolerance]
-    if multiple: args = zip(curves, start, end, loftType, closed, refitTolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/createbooleanunion-breparray_double", Util.DecodeToCommonObject)
 def CreateBooleanUnion(breps, tolerance, multiple=False):
     """
     Compute the Boolean Union of a set of Breps.
@@ -1211,15 +921,9 @@ def CreateBooleanUnion(breps, tolerance, multiple=False):
     Returns:
         Brep[]: An array of Brep results or None on failure.
     """
-    url = "rhino/geometry/brep/createbooleanunion-breparray_double"
-    if multiple: url += "?multiple=true"
-    args = [breps, tolerance]
-    if multiple: args = zip(breps, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/createbooleanunion-breparray_double_bool", Util.DecodeToCommonObject)
 def CreateBooleanUnion1(breps, tolerance, manifoldOnly, multiple=False):
     """
     Compute the Boolean Union of a set of Breps.
@@ -1232,15 +936,9 @@ def CreateBooleanUnion1(breps, tolerance, manifoldOnly, multiple=False):
     Returns:
         Brep[]: An array of Brep results or None on failure.
     """
-    url = "rhino/geometry/brep/createbooleanunion-breparray_double_bool"
-    if multiple: url += "?multiple=true"
-    args = [breps, tolerance, manifoldOnly]
-    if multiple: args = zip(breps, tolerance, manifoldOnly)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/createbooleanintersection-breparray_breparray_double", Util.DecodeToCommonObject)
 def CreateBooleanIntersection(firstSet, secondSet, tolerance, multiple=False):
     """
     Compute the Solid Intersection of two sets of Breps.
@@ -1253,15 +951,9 @@ def CreateBooleanIntersection(firstSet, secondSet, tolerance, multiple=False):
     Returns:
         Brep[]: An array of Brep results or None on failure.
     """
-    url = "rhino/geometry/brep/createbooleanintersection-breparray_breparray_double"
-    if multiple: url += "?multiple=true"
-    args = [firstSet, secondSet, tolerance]
-    if multiple: args = zip(firstSet, secondSet, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/createbooleanintersection-breparray_breparray_double_bool", Util.DecodeToCommonObject)
 def CreateBooleanIntersection1(firstSet, secondSet, tolerance, manifoldOnly, multiple=False):
     """
     Compute the Solid Intersection of two sets of Breps.
@@ -1275,15 +967,9 @@ def CreateBooleanIntersection1(firstSet, secondSet, tolerance, manifoldOnly, mul
     Returns:
         Brep[]: An array of Brep results or None on failure.
     """
-    url = "rhino/geometry/brep/createbooleanintersection-breparray_breparray_double_bool"
-    if multiple: url += "?multiple=true"
-    args = [firstSet, secondSet, tolerance, manifoldOnly]
-    if multiple: args = zip(firstSet, secondSet, tolerance, manifoldOnly)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/createbooleanintersection-brep_brep_double", Util.DecodeToCommonObject)
 def CreateBooleanIntersection2(firstBrep, secondBrep, tolerance, multiple=False):
     """
     Compute the Solid Intersection of two Breps.
@@ -1296,15 +982,9 @@ def CreateBooleanIntersection2(firstBrep, secondBrep, tolerance, multiple=False)
     Returns:
         Brep[]: An array of Brep results or None on failure.
     """
-    url = "rhino/geometry/brep/createbooleanintersection-brep_brep_double"
-    if multiple: url += "?multiple=true"
-    args = [firstBrep, secondBrep, tolerance]
-    if multiple: args = zip(firstBrep, secondBrep, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/createbooleanintersection-brep_brep_double_bool", Util.DecodeToCommonObject)
 def CreateBooleanIntersection3(firstBrep, secondBrep, tolerance, manifoldOnly, multiple=False):
     """
     Compute the Solid Intersection of two Breps.
@@ -1318,15 +998,9 @@ def CreateBooleanIntersection3(firstBrep, secondBrep, tolerance, manifoldOnly, m
     Returns:
         Brep[]: An array of Brep results or None on failure.
     """
-    url = "rhino/geometry/brep/createbooleanintersection-brep_brep_double_bool"
-    if multiple: url += "?multiple=true"
-    args = [firstBrep, secondBrep, tolerance, manifoldOnly]
-    if multiple: args = zip(firstBrep, secondBrep, tolerance, manifoldOnly)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/createbooleandifference-breparray_breparray_double", Util.DecodeToCommonObject)
 def CreateBooleanDifference(firstSet, secondSet, tolerance, multiple=False):
     """
     Compute the Solid Difference of two sets of Breps.
@@ -1339,15 +1013,9 @@ def CreateBooleanDifference(firstSet, secondSet, tolerance, multiple=False):
     Returns:
         Brep[]: An array of Brep results or None on failure.
     """
-    url = "rhino/geometry/brep/createbooleandifference-breparray_breparray_double"
-    if multiple: url += "?multiple=true"
-    args = [firstSet, secondSet, tolerance]
-    if multiple: args = zip(firstSet, secondSet, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/createbooleandifference-breparray_breparray_double_bool", Util.DecodeToCommonObject)
 def CreateBooleanDifference1(firstSet, secondSet, tolerance, manifoldOnly, multiple=False):
     """
     Compute the Solid Difference of two sets of Breps.
@@ -1361,15 +1029,9 @@ def CreateBooleanDifference1(firstSet, secondSet, tolerance, manifoldOnly, multi
     Returns:
         Brep[]: An array of Brep results or None on failure.
     """
-    url = "rhino/geometry/brep/createbooleandifference-breparray_breparray_double_bool"
-    if multiple: url += "?multiple=true"
-    args = [firstSet, secondSet, tolerance, manifoldOnly]
-    if multiple: args = zip(firstSet, secondSet, tolerance, manifoldOnly)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/createbooleandifference-brep_brep_double", Util.DecodeToCommonObject)
 def CreateBooleanDifference2(firstBrep, secondBrep, tolerance, multiple=False):
     """
     Compute the Solid Difference of two Breps.
@@ -1382,15 +1044,9 @@ def CreateBooleanDifference2(firstBrep, secondBrep, tolerance, multiple=False):
     Returns:
         Brep[]: An array of Brep results or None on failure.
     """
-    url = "rhino/geometry/brep/createbooleandifference-brep_brep_double"
-    if multiple: url += "?multiple=true"
-    args = [firstBrep, secondBrep, tolerance]
-    if multiple: args = zip(firstBrep, secondBrep, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/createbooleandifference-brep_brep_double_bool", Util.DecodeToCommonObject)
 def CreateBooleanDifference3(firstBrep, secondBrep, tolerance, manifoldOnly, multiple=False):
     """
     Compute the Solid Difference of two Breps.
@@ -1404,15 +1060,9 @@ def CreateBooleanDifference3(firstBrep, secondBrep, tolerance, manifoldOnly, mul
     Returns:
         Brep[]: An array of Brep results or None on failure.
     """
-    url = "rhino/geometry/brep/createbooleandifference-brep_brep_double_bool"
-    if multiple: url += "?multiple=true"
-    args = [firstBrep, secondBrep, tolerance, manifoldOnly]
-    if multiple: args = zip(firstBrep, secondBrep, tolerance, manifoldOnly)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/createbooleansplit-brep_brep_double", Util.DecodeToCommonObject)
 def CreateBooleanSplit(firstBrep, secondBrep, tolerance, multiple=False):
     """
     Splits shared areas of Breps and creates separate Breps from the shared and unshared parts.
@@ -1425,15 +1075,9 @@ def CreateBooleanSplit(firstBrep, secondBrep, tolerance, multiple=False):
     Returns:
         Brep[]: An array of Brep if successful, an empty array on failure.
     """
-    url = "rhino/geometry/brep/createbooleansplit-brep_brep_double"
-    if multiple: url += "?multiple=true"
-    args = [firstBrep, secondBrep, tolerance]
-    if multiple: args = zip(firstBrep, secondBrep, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/createbooleansplit-breparray_breparray_double", Util.DecodeToCommonObject)
 def CreateBooleanSplit1(firstSet, secondSet, tolerance, multiple=False):
     """
     Splits shared areas of Breps and creates separate Breps from the shared and unshared parts.
@@ -1446,15 +1090,9 @@ def CreateBooleanSplit1(firstSet, secondSet, tolerance, multiple=False):
     Returns:
         Brep[]: An array of Brep if successful, an empty array on failure.
     """
-    url = "rhino/geometry/brep/createbooleansplit-breparray_breparray_double"
-    if multiple: url += "?multiple=true"
-    args = [firstSet, secondSet, tolerance]
-    if multiple: args = zip(firstSet, secondSet, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/createshell-brep_intarray_double_double", Util.DecodeToCommonObject)
 def CreateShell(brep, facesToRemove, distance, tolerance, multiple=False):
     """
     Creates a hollowed out shell from a solid Brep. Function only operates on simple, solid, manifold Breps.
@@ -1468,15 +1106,9 @@ def CreateShell(brep, facesToRemove, distance, tolerance, multiple=False):
     Returns:
         Brep[]: An array of Brep results or None on failure.
     """
-    url = "rhino/geometry/brep/createshell-brep_intarray_double_double"
-    if multiple: url += "?multiple=true"
-    args = [brep, facesToRemove, distance, tolerance]
-    if multiple: args = zip(brep, facesToRemove, distance, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/joinbreps-breparray_double", Util.DecodeToCommonObject)
 def JoinBreps(brepsToJoin, tolerance, multiple=False):
     """
     Joins the breps in the input array at any overlapping edges to form
@@ -1489,15 +1121,9 @@ def JoinBreps(brepsToJoin, tolerance, multiple=False):
     Returns:
         Brep[]: new joined breps on success, None on failure.
     """
-    url = "rhino/geometry/brep/joinbreps-breparray_double"
-    if multiple: url += "?multiple=true"
-    args = [brepsToJoin, tolerance]
-    if multiple: args = zip(brepsToJoin, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/mergebreps-breparray_double", Util.DecodeToCommonObject)
 def MergeBreps(brepsToMerge, tolerance, multiple=False):
     """
     Combines two or more breps into one. A merge is like a boolean union that keeps the inside pieces. This
@@ -1511,15 +1137,9 @@ def MergeBreps(brepsToMerge, tolerance, multiple=False):
     Returns:
         Brep: Single merged Brep on success. Null on error.
     """
-    url = "rhino/geometry/brep/mergebreps-breparray_double"
-    if multiple: url += "?multiple=true"
-    args = [brepsToMerge, tolerance]
-    if multiple: args = zip(brepsToMerge, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/createcontourcurves-brep_point3d_point3d_double", Util.DecodeToCommonObject)
 def CreateContourCurves(brepToContour, contourStart, contourEnd, interval, multiple=False):
     """
     Constructs the contour curves for a brep at a specified interval.
@@ -1533,15 +1153,9 @@ def CreateContourCurves(brepToContour, contourStart, contourEnd, interval, multi
     Returns:
         Curve[]: An array with intersected curves. This array can be empty.
     """
-    url = "rhino/geometry/brep/createcontourcurves-brep_point3d_point3d_double"
-    if multiple: url += "?multiple=true"
-    args = [brepToContour, contourStart, contourEnd, interval]
-    if multiple: args = zip(brepToContour, contourStart, contourEnd, interval)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/createcontourcurves-brep_plane", Util.DecodeToCommonObject)
 def CreateContourCurves1(brepToContour, sectionPlane, multiple=False):
     """
     Constructs the contour curves for a brep, using a slicing plane.
@@ -1553,15 +1167,9 @@ def CreateContourCurves1(brepToContour, sectionPlane, multiple=False):
     Returns:
         Curve[]: An array with intersected curves. This array can be empty.
     """
-    url = "rhino/geometry/brep/createcontourcurves-brep_plane"
-    if multiple: url += "?multiple=true"
-    args = [brepToContour, sectionPlane]
-    if multiple: args = zip(brepToContour, sectionPlane)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/createcurvatureanalysismesh-brep_rhino.applicationsettings.curvatureanalysissettingsstate", Util.DecodeToCommonObject)
 def CreateCurvatureAnalysisMesh(brep, state, multiple=False):
     """
     Create an array of analysis meshes for the brep using the specified settings.
@@ -1573,15 +1181,9 @@ def CreateCurvatureAnalysisMesh(brep, state, multiple=False):
     Returns:
         Mesh[]: True if meshes were created
     """
-    url = "rhino/geometry/brep/createcurvatureanalysismesh-brep_rhino.applicationsettings.curvatureanalysissettingsstate"
-    if multiple: url += "?multiple=true"
-    args = [brep, state]
-    if multiple: args = zip(brep, state)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/getregions-brep")
 def GetRegions(thisBrep, multiple=False):
     """
     Gets an array containing all regions in this brep.
@@ -1589,14 +1191,9 @@ def GetRegions(thisBrep, multiple=False):
     Returns:
         BrepRegion[]: An array of regions in this brep. This array can be empty, but not null.
     """
-    url = "rhino/geometry/brep/getregions-brep"
-    if multiple: url += "?multiple=true"
-    args = [thisBrep]
-    if multiple: args = [[item] for item in thisBrep]
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/getwireframe-brep_int", Util.DecodeToCommonObject)
 def GetWireframe(thisBrep, density, multiple=False):
     """
     Constructs all the Wireframe curves for this Brep.
@@ -1607,15 +1204,9 @@ def GetWireframe(thisBrep, density, multiple=False):
     Returns:
         Curve[]: An array of Wireframe curves or None on failure.
     """
-    url = "rhino/geometry/brep/getwireframe-brep_int"
-    if multiple: url += "?multiple=true"
-    args = [thisBrep, density]
-    if multiple: args = zip(thisBrep, density)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/closestpoint-brep_point3d", Util.DecodeToPoint3d)
 def ClosestPoint(thisBrep, testPoint, multiple=False):
     """
     Finds a point on the brep that is closest to testPoint.
@@ -1626,15 +1217,9 @@ def ClosestPoint(thisBrep, testPoint, multiple=False):
     Returns:
         Point3d: The point on the Brep closest to testPoint or Point3d.Unset if the operation failed.
     """
-    url = "rhino/geometry/brep/closestpoint-brep_point3d"
-    if multiple: url += "?multiple=true"
-    args = [thisBrep, testPoint]
-    if multiple: args = zip(thisBrep, testPoint)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToPoint3d(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/ispointinside-brep_point3d_double_bool")
 def IsPointInside(thisBrep, point, tolerance, strictlyIn, multiple=False):
     """
     Determines if point is inside a Brep.  This question only makes sense when
@@ -1654,14 +1239,9 @@ def IsPointInside(thisBrep, point, tolerance, strictlyIn, multiple=False):
     Returns:
         bool: True if point is in, False if not.
     """
-    url = "rhino/geometry/brep/ispointinside-brep_point3d_double_bool"
-    if multiple: url += "?multiple=true"
-    args = [thisBrep, point, tolerance, strictlyIn]
-    if multiple: args = zip(thisBrep, point, tolerance, strictlyIn)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/getpointinside-brep_double_point3d")
 def GetPointInside(thisBrep, tolerance, multiple=False):
     """
     Finds a point inside of a solid Brep.
@@ -1675,14 +1255,9 @@ def GetPointInside(thisBrep, tolerance, multiple=False):
         or if no point could be found due to ray shooting or other errors. Otherwise, True is returned.
         point (Point3d): A point inside the solid Brep.
     """
-    url = "rhino/geometry/brep/getpointinside-brep_double_point3d"
-    if multiple: url += "?multiple=true"
-    args = [thisBrep, tolerance]
-    if multiple: args = zip(thisBrep, tolerance)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/capplanarholes-brep_double", Util.DecodeToCommonObject)
 def CapPlanarHoles(thisBrep, tolerance, multiple=False):
     """
     Returns a new Brep that is equivalent to this Brep with all planar holes capped.
@@ -1693,15 +1268,9 @@ def CapPlanarHoles(thisBrep, tolerance, multiple=False):
     Returns:
         Brep: New brep on success. None on error.
     """
-    url = "rhino/geometry/brep/capplanarholes-brep_double"
-    if multiple: url += "?multiple=true"
-    args = [thisBrep, tolerance]
-    if multiple: args = zip(thisBrep, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/join-brep_brep_double_bool")
 def Join(thisBrep, otherBrep, tolerance, compact, multiple=False):
     """
     If any edges of this brep overlap edges of otherBrep, merge a copy of otherBrep into this
@@ -1715,14 +1284,9 @@ def Join(thisBrep, otherBrep, tolerance, compact, multiple=False):
     Returns:
         bool: True if any edges were joined.
     """
-    url = "rhino/geometry/brep/join-brep_brep_double_bool"
-    if multiple: url += "?multiple=true"
-    args = [thisBrep, otherBrep, tolerance, compact]
-    if multiple: args = zip(thisBrep, otherBrep, tolerance, compact)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/joinnakededges-brep_double")
 def JoinNakedEdges(thisBrep, tolerance, multiple=False):
     """
     Joins naked edge pairs within the same brep that overlap within tolerance.
@@ -1733,14 +1297,9 @@ def JoinNakedEdges(thisBrep, tolerance, multiple=False):
     Returns:
         int: number of joins made.
     """
-    url = "rhino/geometry/brep/joinnakededges-brep_double"
-    if multiple: url += "?multiple=true"
-    args = [thisBrep, tolerance]
-    if multiple: args = zip(thisBrep, tolerance)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/mergecoplanarfaces-brep_double")
 def MergeCoplanarFaces(thisBrep, tolerance, multiple=False):
     """
     Merges adjacent coplanar faces into single faces.
@@ -1752,14 +1311,9 @@ def MergeCoplanarFaces(thisBrep, tolerance, multiple=False):
     Returns:
         bool: True if faces were merged, False if no faces were merged.
     """
-    url = "rhino/geometry/brep/mergecoplanarfaces-brep_double"
-    if multiple: url += "?multiple=true"
-    args = [thisBrep, tolerance]
-    if multiple: args = zip(thisBrep, tolerance)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/mergecoplanarfaces-brep_double_double")
 def MergeCoplanarFaces1(thisBrep, tolerance, angleTolerance, multiple=False):
     """
     Merges adjacent coplanar faces into single faces.
@@ -1773,14 +1327,9 @@ def MergeCoplanarFaces1(thisBrep, tolerance, angleTolerance, multiple=False):
     Returns:
         bool: True if faces were merged, False if no faces were merged.
     """
-    url = "rhino/geometry/brep/mergecoplanarfaces-brep_double_double"
-    if multiple: url += "?multiple=true"
-    args = [thisBrep, tolerance, angleTolerance]
-    if multiple: args = zip(thisBrep, tolerance, angleTolerance)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/split-brep_brep_double", Util.DecodeToCommonObject)
 def Split(thisBrep, cutter, intersectionTolerance, multiple=False):
     """
     Splits a Brep into pieces using a Brep as a cutter.
@@ -1792,15 +1341,9 @@ def Split(thisBrep, cutter, intersectionTolerance, multiple=False):
     Returns:
         Brep[]: A new array of Breps. This array can be empty.
     """
-    url = "rhino/geometry/brep/split-brep_brep_double"
-    if multiple: url += "?multiple=true"
-    args = [thisBrep, cutter, intersectionTolerance]
-    if multiple: args = zip(thisBrep, cutter, intersectionTolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/split-brep_brep_double_bool")
 def Split1(thisBrep, cutter, intersectionTolerance, multiple=False):
     """
     Splits a Brep into pieces using a Brep as a cutter.
@@ -1814,14 +1357,9 @@ def Split1(thisBrep, cutter, intersectionTolerance, multiple=False):
         toleranceWasRaised (bool): Set to True if the split failed at intersectionTolerance but succeeded
             when the tolerance was increased to twice intersectionTolerance.
     """
-    url = "rhino/geometry/brep/split-brep_brep_double_bool"
-    if multiple: url += "?multiple=true"
-    args = [thisBrep, cutter, intersectionTolerance]
-    if multiple: args = zip(thisBrep, cutter, intersectionTolerance)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/split-brep_breparray_double", Util.DecodeToCommonObject)
 def Split2(thisBrep, cutters, intersectionTolerance, multiple=False):
     """
     Splits a Brep into pieces using Breps as cutters.
@@ -1833,15 +1371,9 @@ def Split2(thisBrep, cutters, intersectionTolerance, multiple=False):
     Returns:
         Brep[]: A new array of Breps. This array can be empty.
     """
-    url = "rhino/geometry/brep/split-brep_breparray_double"
-    if multiple: url += "?multiple=true"
-    args = [thisBrep, cutters, intersectionTolerance]
-    if multiple: args = zip(thisBrep, cutters, intersectionTolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/split-brep_curvearray_double", Util.DecodeToCommonObject)
 def Split3(thisBrep, cutters, intersectionTolerance, multiple=False):
     """
     Splits a Brep into pieces using curves, at least partially on the Brep, as cutters.
@@ -1853,15 +1385,9 @@ def Split3(thisBrep, cutters, intersectionTolerance, multiple=False):
     Returns:
         Brep[]: A new array of Breps. This array can be empty.
     """
-    url = "rhino/geometry/brep/split-brep_curvearray_double"
-    if multiple: url += "?multiple=true"
-    args = [thisBrep, cutters, intersectionTolerance]
-    if multiple: args = zip(thisBrep, cutters, intersectionTolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/split-brep_geometrybasearray_vector3d_bool_double", Util.DecodeToCommonObject)
 def Split4(thisBrep, cutters, normal, planView, intersectionTolerance, multiple=False):
     """
     Splits a Brep into pieces using a combination of curves, to be extruded, and Breps as cutters.
@@ -1875,15 +1401,9 @@ def Split4(thisBrep, cutters, normal, planView, intersectionTolerance, multiple=
     Returns:
         Brep[]: A new array of Breps. This array can be empty.
     """
-    url = "rhino/geometry/brep/split-brep_geometrybasearray_vector3d_bool_double"
-    if multiple: url += "?multiple=true"
-    args = [thisBrep, cutters, normal, planView, intersectionTolerance]
-    if multiple: args = zip(thisBrep, cutters, normal, planView, intersectionTolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/trim-brep_brep_double", Util.DecodeToCommonObject)
 def Trim(thisBrep, cutter, intersectionTolerance, multiple=False):
     """
     Trims a brep with an oriented cutter. The parts of the brep that lie inside
@@ -1901,15 +1421,9 @@ def Trim(thisBrep, cutter, intersectionTolerance, multiple=False):
     Returns:
         Brep[]: This Brep is not modified, the trim results are returned in an array.
     """
-    url = "rhino/geometry/brep/trim-brep_brep_double"
-    if multiple: url += "?multiple=true"
-    args = [thisBrep, cutter, intersectionTolerance]
-    if multiple: args = zip(thisBrep, cutter, intersectionTolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/trim-brep_plane_double", Util.DecodeToCommonObject)
 def Trim1(thisBrep, cutter, intersectionTolerance, multiple=False):
     """
     Trims a Brep with an oriented cutter.  The parts of Brep that lie inside
@@ -1927,15 +1441,9 @@ def Trim1(thisBrep, cutter, intersectionTolerance, multiple=False):
     Returns:
         Brep[]: This Brep is not modified, the trim results are returned in an array.
     """
-    url = "rhino/geometry/brep/trim-brep_plane_double"
-    if multiple: url += "?multiple=true"
-    args = [thisBrep, cutter, intersectionTolerance]
-    if multiple: args = zip(thisBrep, cutter, intersectionTolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/unjoinedges-brep_intarray", Util.DecodeToCommonObject)
 def UnjoinEdges(thisBrep, edgesToUnjoin, multiple=False):
     """
     Unjoins, or separates, edges within the Brep. Note, seams in closed surfaces will not separate.
@@ -1946,15 +1454,9 @@ def UnjoinEdges(thisBrep, edgesToUnjoin, multiple=False):
     Returns:
         Brep[]: This Brep is not modified, the trim results are returned in an array.
     """
-    url = "rhino/geometry/brep/unjoinedges-brep_intarray"
-    if multiple: url += "?multiple=true"
-    args = [thisBrep, edgesToUnjoin]
-    if multiple: args = zip(thisBrep, edgesToUnjoin)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/joinedges-brep_int_int_double_bool")
 def JoinEdges(thisBrep, edgeIndex0, edgeIndex1, joinTolerance, compact, multiple=False):
     """
     Joins two naked edges, or edges that are coincident or close together.
@@ -1969,14 +1471,9 @@ def JoinEdges(thisBrep, edgeIndex0, edgeIndex1, joinTolerance, compact, multiple
     Returns:
         bool: True if successful, False otherwise.
     """
-    url = "rhino/geometry/brep/joinedges-brep_int_int_double_bool"
-    if multiple: url += "?multiple=true"
-    args = [thisBrep, edgeIndex0, edgeIndex1, joinTolerance, compact]
-    if multiple: args = zip(thisBrep, edgeIndex0, edgeIndex1, joinTolerance, compact)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/transformcomponent-brep_componentindexarray_transform_double_double_bool")
 def TransformComponent(thisBrep, components, xform, tolerance, timeLimit, useMultipleThreads, multiple=False):
     """
     Transform an array of Brep components, bend neighbors to match, and leave the rest fixed.
@@ -1992,14 +1489,9 @@ def TransformComponent(thisBrep, components, xform, tolerance, timeLimit, useMul
     Returns:
         bool: True if successful, False otherwise.
     """
-    url = "rhino/geometry/brep/transformcomponent-brep_componentindexarray_transform_double_double_bool"
-    if multiple: url += "?multiple=true"
-    args = [thisBrep, components, xform, tolerance, timeLimit, useMultipleThreads]
-    if multiple: args = zip(thisBrep, components, xform, tolerance, timeLimit, useMultipleThreads)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/getarea-brep")
 def GetArea(thisBrep, multiple=False):
     """
     Compute the Area of the Brep. If you want proper Area data with moments
@@ -2008,14 +1500,9 @@ def GetArea(thisBrep, multiple=False):
     Returns:
         double: The area of the Brep.
     """
-    url = "rhino/geometry/brep/getarea-brep"
-    if multiple: url += "?multiple=true"
-    args = [thisBrep]
-    if multiple: args = [[item] for item in thisBrep]
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/getarea-brep_double_double")
 def GetArea1(thisBrep, relativeTolerance, absoluteTolerance, multiple=False):
     """
     Compute the Area of the Brep. If you want proper Area data with moments
@@ -2028,14 +1515,9 @@ def GetArea1(thisBrep, relativeTolerance, absoluteTolerance, multiple=False):
     Returns:
         double: The area of the Brep.
     """
-    url = "rhino/geometry/brep/getarea-brep_double_double"
-    if multiple: url += "?multiple=true"
-    args = [thisBrep, relativeTolerance, absoluteTolerance]
-    if multiple: args = zip(thisBrep, relativeTolerance, absoluteTolerance)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/getvolume-brep")
 def GetVolume(thisBrep, multiple=False):
     """
     Compute the Volume of the Brep. If you want proper Volume data with moments
@@ -2044,14 +1526,9 @@ def GetVolume(thisBrep, multiple=False):
     Returns:
         double: The volume of the Brep.
     """
-    url = "rhino/geometry/brep/getvolume-brep"
-    if multiple: url += "?multiple=true"
-    args = [thisBrep]
-    if multiple: args = [[item] for item in thisBrep]
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/getvolume-brep_double_double")
 def GetVolume1(thisBrep, relativeTolerance, absoluteTolerance, multiple=False):
     """
     Compute the Volume of the Brep. If you want proper Volume data with moments
@@ -2064,14 +1541,9 @@ def GetVolume1(thisBrep, relativeTolerance, absoluteTolerance, multiple=False):
     Returns:
         double: The volume of the Brep.
     """
-    url = "rhino/geometry/brep/getvolume-brep_double_double"
-    if multiple: url += "?multiple=true"
-    args = [thisBrep, relativeTolerance, absoluteTolerance]
-    if multiple: args = zip(thisBrep, relativeTolerance, absoluteTolerance)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/rebuildtrimsforv2-brep_brepface_nurbssurface")
 def RebuildTrimsForV2(thisBrep, face, nurbsSurface, multiple=False):
     """
     No support is available for this function.
@@ -2084,27 +1556,17 @@ def RebuildTrimsForV2(thisBrep, face, nurbsSurface, multiple=False):
             from its NURBS form.
         nurbsSurface (NurbsSurface): NURBS form of the face's underlying surface.
     """
-    url = "rhino/geometry/brep/rebuildtrimsforv2-brep_brepface_nurbssurface"
-    if multiple: url += "?multiple=true"
-    args = [thisBrep, face, nurbsSurface]
-    if multiple: args = zip(thisBrep, face, nurbsSurface)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/makevalidforv2-brep")
 def MakeValidForV2(thisBrep, multiple=False):
     """
     No support is available for this function.
     Expert user function that converts all geometry in brep to nurbs form.
     """
-    url = "rhino/geometry/brep/makevalidforv2-brep"
-    if multiple: url += "?multiple=true"
-    args = [thisBrep]
-    if multiple: args = [[item] for item in thisBrep]
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/repair-brep_double")
 def Repair(thisBrep, tolerance, multiple=False):
     """
     Fills in missing or fixes incorrect component information from a Brep.
@@ -2117,14 +1579,9 @@ def Repair(thisBrep, tolerance, multiple=False):
     Returns:
         bool: True on success.
     """
-    url = "rhino/geometry/brep/repair-brep_double"
-    if multiple: url += "?multiple=true"
-    args = [thisBrep, tolerance]
-    if multiple: args = zip(thisBrep, tolerance)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/removeholes-brep_double", Util.DecodeToCommonObject)
 def RemoveHoles(thisBrep, tolerance, multiple=False):
     """
     Remove all inner loops, or holes, in a Brep.
@@ -2135,15 +1592,9 @@ def RemoveHoles(thisBrep, tolerance, multiple=False):
     Returns:
         Brep: The Brep without holes if successful, None otherwise.
     """
-    url = "rhino/geometry/brep/removeholes-brep_double"
-    if multiple: url += "?multiple=true"
-    args = [thisBrep, tolerance]
-    if multiple: args = zip(thisBrep, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brep/removeholes-brep_componentindexarray_double", Util.DecodeToCommonObject)
 def RemoveHoles1(thisBrep, loops, tolerance, multiple=False):
     """
     Removes inner loops, or holes, in a Brep.
@@ -2155,11 +1606,4 @@ def RemoveHoles1(thisBrep, loops, tolerance, multiple=False):
     Returns:
         Brep: The Brep without holes if successful, None otherwise.
     """
-    url = "rhino/geometry/brep/removeholes-brep_componentindexarray_double"
-    if multiple: url += "?multiple=true"
-    args = [thisBrep, loops, tolerance]
-    if multiple: args = zip(thisBrep, loops, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
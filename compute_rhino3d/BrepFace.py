@@ -1,6 +1,7 @@
 from . import Util
 
 
+@Util.Endpoint("rhino/geometry/brepface/pullpointstoface-brepface_point3darray_double", Util.DecodeToPoint3d)
 def PullPointsToFace(thisBrepFace, points, tolerance, multiple=False):
     """
     Pulls one or more points to a brep face.
@@ -12,15 +13,9 @@ def PullPointsToFace(thisBrepFace, points, tolerance, multiple=False):
     Returns:
         Point3d[]: An array of pulled points.
     """
-    url = "rhino/geometry/brepface/pullpointstoface-brepface_point3darray_double"
-    if multiple: url += "?multiple=true"
-    args = [thisBrepFace, points, tolerance]
-    if multiple: args = zip(thisBrepFace, points, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToPoint3d(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brepface/draftanglepoint-brepface_point2d_double_vector3d_bool_point3d_double")
 def DraftAnglePoint(thisBrepFace, testPoint, testAngle, pullDirection, edge, multiple=False):
     """
     Returns the surface draft angle and point at a parameter.
@@ -36,27 +31,16 @@ def DraftAnglePoint(thisBrepFace, testPoint, testAngle, pullDirection, edge, mul
         draftPoint (Point3d): The draft angle point.
         draftAngle (double): The draft angle in radians.
     """
-    url = "rhino/geometry/brepface/draftanglepoint-brepface_point2d_double_vector3d_bool_point3d_double"
-    if multiple: url += "?multiple=true"
-    args = [thisBrepFace, testPoint, testAngle, pullDirection, edge]
-    if multiple: args = zip(thisBrepFace, testPoint, testAngle, pullDirection, edge)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brepface/removeholes-brepface_double", Util.DecodeToCommonObject)
 def RemoveHoles(thisBrepFace, tolerance, multiple=False):
     """
     Remove all inner loops, or holes, from a Brep face.
     """
-    url = "rhino/geometry/brepface/removeholes-brepface_double"
-    if multiple: url += "?multiple=true"
-    args = [thisBrepFace, tolerance]
-    if multiple: args = zip(thisBrepFace, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brepface/shrinksurfacetoedge-brepface")
 def ShrinkSurfaceToEdge(thisBrepFace, multiple=False):
     """
     Shrinks the underlying untrimmed surface of this Brep face right to the trimming boundaries.
@@ -67,14 +51,9 @@ def ShrinkSurfaceToEdge(thisBrepFace, multiple=False):
     Returns:
         bool: True on success, False on failure.
     """
-    url = "rhino/geometry/brepface/shrinksurfacetoedge-brepface"
-    if multiple: url += "?multiple=true"
-    args = [thisBrepFace]
-    if multiple: args = [[item] for item in thisBrepFace]
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brepface/split-brepface_curvearray_double", Util.DecodeToCommonObject)
 def Split(thisBrepFace, curves, tolerance, multiple=False):
     """
     Split this face using 3D trimming curves.
@@ -86,15 +65,9 @@ def Split(thisBrepFace, curves, tolerance, multiple=False):
     Returns:
         Brep: A brep consisting of all the split fragments, or None on failure.
     """
-    url = "rhino/geometry/brepface/split-brepface_curvearray_double"
-    if multiple: url += "?multiple=true"
-    args = [thisBrepFace, curves, tolerance]
-    if multiple: args = zip(thisBrepFace, curves, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brepface/ispointonface-brepface_double_double")
 def IsPointOnFace(thisBrepFace, u, v, multiple=False):
     """
     Tests if a parameter space point is on the interior of a trimmed face.
@@ -106,14 +79,9 @@ def IsPointOnFace(thisBrepFace, u, v, multiple=False):
     Returns:
         PointFaceRelation: A value describing the spatial relationship between the point and the face.
     """
-    url = "rhino/geometry/brepface/ispointonface-brepface_double_double"
-    if multiple: url += "?multiple=true"
-    args = [thisBrepFace, u, v]
-    if multiple: args = zip(thisBrepFace, u, v)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brepface/trimawareisointervals-brepface_int_double")
 def TrimAwareIsoIntervals(thisBrepFace, direction, constantParameter, multiple=False):
     """
     Gets intervals where the iso curve exists on a BrepFace (trimmed surface)
@@ -129,14 +97,9 @@ def TrimAwareIsoIntervals(thisBrepFace, direction, constantParameter, multiple=F
         If direction = 1, the parameter space iso interval connects the 2d points
         (iso_constant,intervals[i][0]) and (iso_constant,intervals[i][1]).
     """
-    url = "rhino/geometry/brepface/trimawareisointervals-brepface_int_double"
-    if multiple: url += "?multiple=true"
-    args = [thisBrepFace, direction, constantParameter]
-    if multiple: args = zip(thisBrepFace, direction, constantParameter)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brepface/trimawareisocurve-brepface_int_double", Util.DecodeToCommonObject)
 def TrimAwareIsoCurve(thisBrepFace, direction, constantParameter, multiple=False):
     """
     Similar to IsoCurve function, except this function pays attention to trims on faces
@@ -150,15 +113,9 @@ def TrimAwareIsoCurve(thisBrepFace, direction, constantParameter, multiple=False
     Returns:
         Curve[]: Isoparametric curves connecting all points with the constantParameter value.
     """
-    url = "rhino/geometry/brepface/trimawareisocurve-brepface_int_double"
-    if multiple: url += "?multiple=true"
-    args = [thisBrepFace, direction, constantParameter]
-    if multiple: args = zip(thisBrepFace, direction, constantParameter)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brepface/changesurface-brepface_int")
 def ChangeSurface(thisBrepFace, surfaceIndex, multiple=False):
     """
     Expert user tool that replaces the 3d surface geometry use by the face.
@@ -169,14 +126,9 @@ def ChangeSurface(thisBrepFace, surfaceIndex, multiple=False):
     Returns:
         bool: True if successful.
     """
-    url = "rhino/geometry/brepface/changesurface-brepface_int"
-    if multiple: url += "?multiple=true"
-    args = [thisBrepFace, surfaceIndex]
-    if multiple: args = zip(thisBrepFace, surfaceIndex)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/brepface/rebuildedges-brepface_double_bool_bool")
 def RebuildEdges(thisBrepFace, tolerance, rebuildSharedEdges, rebuildVertices, multiple=False):
     """
     Rebuild the edges used by a face so they lie on the surface.
@@ -190,10 +142,4 @@ def RebuildEdges(thisBrepFace, tolerance, rebuildSharedEdges, rebuildVertices, m
     Returns:
         bool: True on success.
     """
-    url = "rhino/geometry/brepface/rebuildedges-brepface_double_bool_bool"
-    if multiple: url += "?multiple=true"
-    args = [thisBrepFace, tolerance, rebuildSharedEdges, rebuildVertices]
-    if multiple: args = zip(thisBrepFace, tolerance, rebuildSharedEdges, rebuildVertices)
-    response = Util.ComputeFetch(url, args)
-    return response
 
@@ -0,0 +1,181 @@
+"""
+Caches for responses of deterministic compute calls.
+
+A response is stored under a key made of the endpoint and a hash of the
+encoded arguments, so calling a function again with equal input returns the
+cached result without a request to the server.
+
+    >>> Util.cache = MemoryCache(max_bytes=256 * 1024 * 1024)
+    >>> Util.cache = SqliteCache('compute_cache.db', ttl=24 * 3600)
+"""
+import collections
+import hashlib
+import sqlite3
+import threading
+import time
+
+
+class _CacheBase:
+    """
+    Shared behaviour of the cache backends. Subclasses implement _Get, _Set
+    and _Clear.
+    """
+    def __init__(self, ttl=None, endpoints=('rhino/geometry/',)):
+        """
+        Args:
+            ttl (float): seconds an entry stays valid. None keeps entries
+                         until they are evicted
+            endpoints (iter): only endpoints starting with one of these
+                              prefixes are cached
+        """
+        self.ttl = ttl
+        self.endpoints = tuple(endpoints)
+        self.hits = 0
+        self.misses = 0
+        self._statsLock = threading.Lock()
+
+    def Accepts(self, endpoint, arglist):
+        """Return True if the response of a call can be cached"""
+        return endpoint.startswith(self.endpoints)
+
+    def Key(self, endpoint, postdata):
+        """
+        Get the key of a call from its endpoint and encoded arguments
+        """
+        h = hashlib.sha256(endpoint.encode('utf-8'))
+        h.update(b'\0')
+        h.update(postdata.encode('utf-8') if isinstance(postdata, str) else postdata)
+        return h.hexdigest()
+
+    def Get(self, key):
+        """
+        Get the cached response for a key, or None
+        """
+        value = self._Get(key, time.time())
+        with self._statsLock:
+            if value is None: self.misses += 1
+            else: self.hits += 1
+        return value
+
+    def Set(self, key, value, ttl=None):
+        """
+        Store a response
+
+        Args:
+            key (str): key from Key()
+            value (bytes): the JSON encoded response
+            ttl (float): seconds the entry stays valid. Defaults to the ttl of
+                         the cache
+        """
+        if ttl is None: ttl = self.ttl
+        expires = None if ttl is None else time.time() + ttl
+        self._Set(key, value, expires)
+
+    def Clear(self):
+        """Remove all entries and reset the hit and miss counters"""
+        self._Clear()
+        with self._statsLock:
+            self.hits = 0
+            self.misses = 0
+
+
+class MemoryCache(_CacheBase):
+    """
+    In-memory least recently used cache bounded by the total size of the
+    stored responses.
+    """
+    def __init__(self, max_bytes=256 * 1024 * 1024, ttl=None, endpoints=('rhino/geometry/',)):
+        """
+        Args:
+            max_bytes (int): least recently used entries are evicted once the
+                             stored responses exceed this size
+            ttl, endpoints: see _CacheBase
+        """
+        _CacheBase.__init__(self, ttl, endpoints)
+        self.maxBytes = max_bytes
+        self.size = 0
+        self.evictions = 0
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _Get(self, key, now):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires = entry
+            if expires is not None and expires < now:
+                del self._entries[key]
+                self.size -= len(value)
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def _Set(self, key, value, expires):
+        if len(value) > self.maxBytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.size -= len(old[0])
+            self._entries[key] = (value, expires)
+            self.size += len(value)
+            while self.size > self.maxBytes:
+                _, (evicted, _) = self._entries.popitem(last=False)
+                self.size -= len(evicted)
+                self.evictions += 1
+
+    def _Clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+
+class SqliteCache(_CacheBase):
+    """
+    On-disk cache stored in a SQLite database, shared between processes and
+    kept across runs.
+    """
+    def __init__(self, path, ttl=None, endpoints=('rhino/geometry/',)):
+        """
+        Args:
+            path (str): database file, created if it does not exist
+            ttl, endpoints: see _CacheBase
+        """
+        _CacheBase.__init__(self, ttl, endpoints)
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._db:
+            self._db.execute('CREATE TABLE IF NOT EXISTS responses '
+                             '(key TEXT PRIMARY KEY, value BLOB, expires REAL)')
+
+    def _Get(self, key, now):
+        with self._lock:
+            row = self._db.execute('SELECT value, expires FROM responses WHERE key = ?',
+                                   (key,)).fetchone()
+        if row is None:
+            return None
+        value, expires = row
+        if expires is not None and expires < now:
+            with self._lock, self._db:
+                self._db.execute('DELETE FROM responses WHERE key = ?', (key,))
+            return None
+        return bytes(value)
+
+    def _Set(self, key, value, expires):
+        with self._lock, self._db:
+            self._db.execute('INSERT OR REPLACE INTO responses VALUES (?, ?, ?)',
+                             (key, value, expires))
+
+    def _Clear(self):
+        with self._lock, self._db:
+            self._db.execute('DELETE FROM responses')
+
+    def Close(self):
+        """Close the database"""
+        with self._lock:
+            self._db.close()
@@ -0,0 +1,177 @@
+import functools
+import importlib
+import inspect
+import weakref
+from . import Util
+
+
+class ComputeClient:
+    """
+    A connection to a compute server with its own base url, auth token,
+    timeout and connection pool. Clients are independent of each other and of
+    the module level settings in Util, so one process can talk to several
+    servers at once.
+
+    Every generated module is available as an attribute of the client:
+
+        >>> client = ComputeClient('http://localhost:8081/', authToken=token)
+        >>> meshes = client.Mesh.CreateFromBrep(brep)
+        >>> meshes = await client.Async.Mesh.CreateFromBrep(brep)
+    """
+    def __init__(self, url='https://compute.rhino3d.com/', authToken='',
+                 stopat=0, timeout=None, pool_connections=None,
+                 pool_maxsize=None, pool_block=None, async_limit=None,
+                 async_limit_per_host=None, batcher=None,
+                 cache=None, stream_requests=False, compression=None,
+                 compression_level=6, compression_threshold=16 * 1024,
+                 retry=None, decode_to_numpy=False, wire_format='json',
+                 instrumentation=None):
+        """
+        Args:
+            url (str): base url of the compute server. A list of urls or a
+                       Balancer.NodePool spreads calls over several servers
+            authToken (str): token sent as the Authorization bearer
+            stopat (int): debugging aid passed to the server
+            timeout (float): seconds to wait for the server, or a (connect,
+                             read) tuple. None waits forever
+            pool_connections, pool_maxsize, pool_block: see Util.CreateSession
+            async_limit (int): maximum simultaneous connections for async calls.
+                               Defaults to Util.asyncLimit
+            async_limit_per_host (int): maximum simultaneous connections per
+                               host for async calls. Defaults to
+                               Util.asyncLimitPerHost
+            batcher (Batching.RequestBatcher): coalesces single calls into
+                               multiple=true requests. None sends every call
+                               on its own
+            cache (Cache.MemoryCache): cache for responses of deterministic
+                               calls. None disables caching
+            stream_requests (bool): send request bodies with chunked transfer
+                               encoding while they are encoded
+            compression (str): compress request bodies with 'gzip', 'deflate'
+                               or 'br'. None sends them uncompressed
+            compression_level (int): compression level
+            compression_threshold (int): bodies smaller than this many bytes
+                               are sent uncompressed
+            retry (Retry.RetryPolicy): policy for sending failed calls
+                               again. None raises on the first failure
+            decode_to_numpy (bool): decode points, vectors and lines to NumPy
+                               arrays. See Util.DecodeToNumpy
+            wire_format (str): 'json' or 'msgpack'. See the Msgpack module
+            instrumentation (function): called with an Instrumentation.CallEvent
+                               after every call. See the Instrumentation module
+        """
+        if isinstance(url, (list, tuple)):
+            from .Balancer import NodePool
+            url = NodePool(url)
+        self.url = url
+        self.authToken = authToken
+        self.stopat = stopat
+        self.timeout = timeout
+        self.batcher = batcher
+        self.cache = cache
+        self.streamRequests = stream_requests
+        self.compression = compression
+        self.compressionLevel = compression_level
+        self.compressionThreshold = compression_threshold
+        self.retry = retry
+        self.decodeToNumpy = decode_to_numpy
+        self.wireFormat = wire_format
+        self.instrumentation = instrumentation
+        self.session = Util.CreateSession(pool_connections, pool_maxsize, pool_block)
+        if async_limit is None: async_limit = Util.asyncLimit
+        if async_limit_per_host is None: async_limit_per_host = Util.asyncLimitPerHost
+        self.asyncLimit = async_limit
+        self.asyncLimitPerHost = async_limit_per_host
+        self._asyncSessions = weakref.WeakKeyDictionary()
+        self._modules = {}
+        self._async = None
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        module = self._modules.get(name)
+        if module is None:
+            module = ClientModule(self, _ImportModule(name))
+            module = self._modules.setdefault(name, module)
+        return module
+
+    @property
+    def Async(self):
+        """Coroutine versions of the generated modules, bound to this client"""
+        if self._async is None:
+            from . import Async
+            self._async = Async.AsyncModules(self)
+        return self._async
+
+    def ComputeFetch(self, endpoint, arglist):
+        with Util.UseClient(self):
+            return Util.ComputeFetch(endpoint, arglist)
+
+    async def ComputeFetchAsync(self, endpoint, arglist):
+        return await Util.ComputeFetchAsync(endpoint, arglist, self)
+
+    def Upload(self, geometry):
+        """Store geometry on the server of this client. See Util.Upload"""
+        with Util.UseClient(self):
+            return Util.Upload(geometry)
+
+    async def UploadAsync(self, geometry):
+        return await Util.UploadAsync(geometry, self)
+
+    def GetAsyncSession(self):
+        """
+        Get the aiohttp.ClientSession this client uses on the running event loop
+        """
+        return Util._GetAsyncSession(self._asyncSessions, self.asyncLimit,
+                                     self.asyncLimitPerHost)
+
+    def Close(self):
+        """Close the pooled connections of this client"""
+        self.session.close()
+
+    async def CloseAsync(self):
+        """Close the pooled connections of this client on the running event loop"""
+        import asyncio
+        session = self._asyncSessions.pop(asyncio.get_running_loop(), None)
+        if session is not None:
+            await session.close()
+
+
+class ClientModule:
+    """
+    Exposes the functions of a generated module, calling them through a
+    ComputeClient.
+    """
+    def __init__(self, client, module):
+        self._client = client
+        self._module = module
+
+    def __getattr__(self, name):
+        func = getattr(self._module, name)
+        if not inspect.isfunction(func):
+            # classes like Grasshopper.DataTree and other attributes are
+            # returned as they are
+            return func
+        client = self._client
+
+        @functools.wraps(func)
+        def call(*args, **kwargs):
+            with Util.UseClient(client):
+                return func(*args, **kwargs)
+        setattr(self, name, call)
+        return call
+
+    def __dir__(self):
+        return [name for name in dir(self._module) if not name.startswith('_')]
+
+
+def _ImportModule(name):
+    if name in ('Util', 'Client', 'Async', 'Batching', 'Cache', 'Retry', 'Balancer', 'Parallel',
+                'Msgpack', 'Instrumentation'):
+        raise AttributeError(name)
+    fullname = __package__ + '.' + name
+    try:
+        return importlib.import_module(fullname)
+    except ModuleNotFoundError as e:
+        if e.name != fullname: raise
+        raise AttributeError(name)
@@ -1,18 +1,14 @@
 from . import Util
 
 
+@Util.Endpoint("rhino/geometry/curve/getconicsectiontype-curve")
 def GetConicSectionType(thisCurve, multiple=False):
     """
     Returns the type of conic section based on the curve's shape.
     """
-    url = "rhino/geometry/curve/getconicsectiontype-curve"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve]
-    if multiple: args = [[item] for item in thisCurve]
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/createinterpolatedcurve-point3darray_int", Util.DecodeToCommonObject)
 def CreateInterpolatedCurve(points, degree, multiple=False):
     """
     Interpolates a sequence of points. Used by InterpCurve Command
@@ -25,15 +21,9 @@ def CreateInterpolatedCurve(points, degree, multiple=False):
     Returns:
         Curve: interpolated curve on success. None on failure.
     """
-    url = "rhino/geometry/curve/createinterpolatedcurve-point3darray_int"
-    if multiple: url += "?multiple=true"
-    args = [points, degree]
-    if multiple: args = zip(points, degree)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/createinterpolatedcurve-point3darray_int_curveknotstyle", Util.DecodeToCommonObject)
 def CreateInterpolatedCurve1(points, degree, knots, multiple=False):
     """
     Interpolates a sequence of points. Used by InterpCurve Command
@@ -48,15 +38,9 @@ def CreateInterpolatedCurve1(points, degree, knots, multiple=False):
     Returns:
         Curve: interpolated curve on success. None on failure.
     """
-    url = "rhino/geometry/curve/createinterpolatedcurve-point3darray_int_curveknotstyle"
-    if multiple: url += "?multiple=true"
-    args = [points, degree, knots]
-    if multiple: args = zip(points, degree, knots)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/createinterpolatedcurve-point3darray_int_curveknotstyle_vector3d_vector3d", Util.DecodeToCommonObject)
 def CreateInterpolatedCurve2(points, degree, knots, startTangent, endTangent, multiple=False):
     """
     Interpolates a sequence of points. Used by InterpCurve Command
@@ -73,15 +57,9 @@ def CreateInterpolatedCurve2(points, degree, knots, startTangent, endTangent, mu
     Returns:
         Curve: interpolated curve on success. None on failure.
     """
-    url = "rhino/geometry/curve/createinterpolatedcurve-point3darray_int_curveknotstyle_vector3d_vector3d"
-    if multiple: url += "?multiple=true"
-    args = [points, degree, knots, startTangent, endTangent]
-    if multiple: args = zip(points, degree, knots, startTangent, endTangent)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/createsofteditcurve-curve_double_vector3d_double_bool", Util.DecodeToCommonObject)
 def CreateSoftEditCurve(curve, t, delta, length, fixEnds, multiple=False):
     """
     Creates a soft edited curve from an exising curve using a smooth field of influence.
@@ -97,15 +75,9 @@ def CreateSoftEditCurve(curve, t, delta, length, fixEnds, multiple=False):
     Returns:
         Curve: The soft edited curve if successful. None on failure.
     """
-    url = "rhino/geometry/curve/createsofteditcurve-curve_double_vector3d_double_bool"
-    if multiple: url += "?multiple=true"
-    args = [curve, t, delta, length, fixEnds]
-    if multiple: args = zip(curve, t, delta, length, fixEnds)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/createfilletcornerscurve-curve_double_double_double", Util.DecodeToCommonObject)
 def CreateFilletCornersCurve(curve, radius, tolerance, angleTolerance, multiple=False):
     """
     Rounds the corners of a kinked curve with arcs of a single, specified radius.
@@ -119,15 +91,9 @@ def CreateFilletCornersCurve(curve, radius, tolerance, angleTolerance, multiple=
     Returns:
         Curve: The filleted curve if successful. None on failure.
     """
-    url = "rhino/geometry/curve/createfilletcornerscurve-curve_double_double_double"
-    if multiple: url += "?multiple=true"
-    args = [curve, radius, tolerance, angleTolerance]
-    if multiple: args = zip(curve, radius, tolerance, angleTolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/createarcblend-point3d_vector3d_point3d_vector3d_double", Util.DecodeToCommonObject)
 def CreateArcBlend(startPt, startDir, endPt, endDir, controlPointLengthRatio, multiple=False):
     """
     Creates a polycurve consisting of two tangent arc segments that connect two points and two directions.
@@ -143,15 +109,9 @@ def CreateArcBlend(startPt, startDir, endPt, endDir, controlPointLengthRatio, mu
     Returns:
         Curve: The arc blend curve, or None on error.
     """
-    url = "rhino/geometry/curve/createarcblend-point3d_vector3d_point3d_vector3d_double"
-    if multiple: url += "?multiple=true"
-    args = [startPt, startDir, endPt, endDir, controlPointLengthRatio]
-    if multiple: args = zip(startPt, startDir, endPt, endDir, controlPointLengthRatio)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/createmeancurve-curve_curve_double", Util.DecodeToCommonObject)
 def CreateMeanCurve(curveA, curveB, angleToleranceRadians, multiple=False):
     """
     Constructs a mean, or average, curve from two curves.
@@ -167,15 +127,9 @@ def CreateMeanCurve(curveA, curveB, angleToleranceRadians, multiple=False):
     Returns:
         Curve: The average curve, or None on error.
     """
-    url = "rhino/geometry/curve/createmeancurve-curve_curve_double"
-    if multiple: url += "?multiple=true"
-    args = [curveA, curveB, angleToleranceRadians]
-    if multiple: args = zip(curveA, curveB, angleToleranceRadians)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/createmeancurve-curve_curve", Util.DecodeToCommonObject)
 def CreateMeanCurve1(curveA, curveB, multiple=False):
     """
     Constructs a mean, or average, curve from two curves.
@@ -187,15 +141,9 @@ def CreateMeanCurve1(curveA, curveB, multiple=False):
     Returns:
         Curve: The average curve, or None on error.
     """
-    url = "rhino/geometry/curve/createmeancurve-curve_curve"
-    if multiple: url += "?multiple=true"
-    args = [curveA, curveB]
-    if multiple: args = zip(curveA, curveB)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/createblendcurve-curve_curve_blendcontinuity", Util.DecodeToCommonObject)
 def CreateBlendCurve(curveA, curveB, continuity, multiple=False):
     """
     Create a Blend curve between two existing curves.
@@ -208,15 +156,9 @@ def CreateBlendCurve(curveA, curveB, continuity, multiple=False):
     Returns:
         Curve: A curve representing the blend between A and B or None on failure.
     """
-    url = "rhino/geometry/curve/createblendcurve-curve_curve_blendcontinuity"
-    if multiple: url += "?multiple=true"
-    args = [curveA, curveB, continuity]
-    if multiple: args = zip(curveA, curveB, continuity)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/createblendcurve-curve_curve_blendcontinuity_double_double", Util.DecodeToCommonObject)
 def CreateBlendCurve1(curveA, curveB, continuity, bulgeA, bulgeB, multiple=False):
     """
     Create a Blend curve between two existing curves.
@@ -231,15 +173,9 @@ def CreateBlendCurve1(curveA, curveB, continuity, bulgeA, bulgeB, multiple=False
     Returns:
         Curve: A curve representing the blend between A and B or None on failure.
     """
-    url = "rhino/geometry/curve/createblendcurve-curve_curve_blendcontinuity_double_double"
-    if multiple: url += "?multiple=true"
-    args = [curveA, curveB, continuity, bulgeA, bulgeB]
-    if multiple: args = zip(curveA, curveB, continuity, bulgeA, bulgeB)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/createblendcurve-curve_double_bool_blendcontinuity_curve_double_bool_blendcontinuity", Util.DecodeToCommonObject)
 def CreateBlendCurve2(curve0, t0, reverse0, continuity0, curve1, t1, reverse1, continuity1, multiple=False):
     """
     Makes a curve blend between 2 curves at the parameters specified
@@ -260,15 +196,9 @@ def CreateBlendCurve2(curve0, t0, reverse0, continuity0, curve1, t1, reverse1, c
     Returns:
         Curve: The blend curve on success. None on failure
     """
-    url = "rhino/geometry/curve/createblendcurve-curve_double_bool_blendcontinuity_curve_double_bool_blendcontinuity"
-    if multiple: url += "?multiple=true"
-    args = [curve0, t0, reverse0, continuity0, curve1, t1, reverse1, continuity1]
-    if multiple: args = zip(curve0, t0, reverse0, continuity0, curve1, t1, reverse1, continuity1)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/createtweencurves-curve_curve_int", Util.DecodeToCommonObject)
 def CreateTweenCurves(curve0, curve1, numCurves, multiple=False):
     """
     Creates curves between two open or closed input curves. Uses the control points of the curves for finding tween curves.
@@ -283,15 +213,9 @@ def CreateTweenCurves(curve0, curve1, numCurves, multiple=False):
     Returns:
         Curve[]: An array of joint curves. This array can be empty.
     """
-    url = "rhino/geometry/curve/createtweencurves-curve_curve_int"
-    if multiple: url += "?multiple=true"
-    args = [curve0, curve1, numCurves]
-    if multiple: args = zip(curve0, curve1, numCurves)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/createtweencurves-curve_curve_int_double", Util.DecodeToCommonObject)
 def CreateTweenCurves1(curve0, curve1, numCurves, tolerance, multiple=False):
     """
     Creates curves between two open or closed input curves. Uses the control points of the curves for finding tween curves.
@@ -306,15 +230,9 @@ def CreateTweenCurves1(curve0, curve1, numCurves, tolerance, multiple=False):
     Returns:
         Curve[]: An array of joint curves. This array can be empty.
     """
-    url = "rhino/geometry/curve/createtweencurves-curve_curve_int_double"
-    if multiple: url += "?multiple=true"
-    args = [curve0, curve1, numCurves, tolerance]
-    if multiple: args = zip(curve0, curve1, numCurves, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/createtweencurveswithmatching-curve_curve_int", Util.DecodeToCommonObject)
 def CreateTweenCurvesWithMatching(curve0, curve1, numCurves, multiple=False):
     """
     Creates curves between two open or closed input curves. Make the structure of input curves compatible if needed.
@@ -330,15 +248,9 @@ def CreateTweenCurvesWithMatching(curve0, curve1, numCurves, multiple=False):
     Returns:
         Curve[]: An array of joint curves. This array can be empty.
     """
-    url = "rhino/geometry/curve/createtweencurveswithmatching-curve_curve_int"
-    if multiple: url += "?multiple=true"
-    args = [curve0, curve1, numCurves]
-    if multiple: args = zip(curve0, curve1, numCurves)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/createtweencurveswithmatching-curve_curve_int_double", Util.DecodeToCommonObject)
 def CreateTweenCurvesWithMatching1(curve0, curve1, numCurves, tolerance, multiple=False):
     """
     Creates curves between two open or closed input curves. Make the structure of input curves compatible if needed.
@@ -354,15 +266,9 @@ def CreateTweenCurvesWithMatching1(curve0, curve1, numCurves, tolerance, multipl
     Returns:
         Curve[]: An array of joint curves. This array can be empty.
     """
-    url = "rhino/geometry/curve/createtweencurveswithmatching-curve_curve_int_double"
-    if multiple: url += "?multiple=true"
-    args = [curve0, curve1, numCurves, tolerance]
-    if multiple: args = zip(curve0, curve1, numCurves, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/createtweencurveswithsampling-curve_curve_int_int", Util.DecodeToCommonObject)
 def CreateTweenCurvesWithSampling(curve0, curve1, numCurves, numSamples, multiple=False):
     """
     Creates curves between two open or closed input curves. Use sample points method to make curves compatible.
@@ -379,15 +285,9 @@ def CreateTweenCurvesWithSampling(curve0, curve1, numCurves, numSamples, multipl
     Returns:
         Curve[]: >An array of joint curves. This array can be empty.
     """
-    url = "rhino/geometry/curve/createtweencurveswithsampling-curve_curve_int_int"
-    if multiple: url += "?multiple=true"
-    args = [curve0, curve1, numCurves, numSamples]
-    if multiple: args = zip(curve0, curve1, numCurves, numSamples)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/createtweencurveswithsampling-curve_curve_int_int_double", Util.DecodeToCommonObject)
 def CreateTweenCurvesWithSampling1(curve0, curve1, numCurves, numSamples, tolerance, multiple=False):
     """
     Creates curves between two open or closed input curves. Use sample points method to make curves compatible.
@@ -404,15 +304,9 @@ def CreateTweenCurvesWithSampling1(curve0, curve1, numCurves, numSamples, tolera
     Returns:
         Curve[]: >An array of joint curves. This array can be empty.
     """
-    url = "rhino/geometry/curve/createtweencurveswithsampling-curve_curve_int_int_double"
-    if multiple: url += "?multiple=true"
-    args = [curve0, curve1, numCurves, numSamples, tolerance]
-    if multiple: args = zip(curve0, curve1, numCurves, numSamples, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/joincurves-curvearray", Util.DecodeToCommonObject)
 def JoinCurves(inputCurves, multiple=False):
     """
     Joins a collection of curve segments together.
@@ -423,15 +317,9 @@ def JoinCurves(inputCurves, multiple=False):
     Returns:
         Curve[]: An array of curves which contains.
     """
-    url = "rhino/geometry/curve/joincurves-curvearray"
-    if multiple: url += "?multiple=true"
-    args = [inputCurves]
-    if multiple: args = [[item] for item in inputCurves]
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/joincurves-curvearray_double", Util.DecodeToCommonObject)
 def JoinCurves1(inputCurves, joinTolerance, multiple=False):
     """
     Joins a collection of curve segments together.
@@ -444,15 +332,9 @@ def JoinCurves1(inputCurves, joinTolerance, multiple=False):
     Returns:
         Curve[]: An array of joint curves. This array can be empty.
     """
-    url = "rhino/geometry/curve/joincurves-curvearray_double"
-    if multiple: url += "?multiple=true"
-    args = [inputCurves, joinTolerance]
-    if multiple: args = zip(inputCurves, joinTolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/joincurves-curvearray_double_bool", Util.DecodeToCommonObject)
 def JoinCurves2(inputCurves, joinTolerance, preserveDirection, multiple=False):
     """
     Joins a collection of curve segments together.
@@ -466,15 +348,9 @@ def JoinCurves2(inputCurves, joinTolerance, preserveDirection, multiple=False):
     Returns:
         Curve[]: An array of joint curves. This array can be empty.
     """
-    url = "rhino/geometry/curve/joincurves-curvearray_double_bool"
-    if multiple: url += "?multiple=true"
-    args = [inputCurves, joinTolerance, preserveDirection]
-    if multiple: args = zip(inputCurves, joinTolerance, preserveDirection)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/makeendsmeet-curve_bool_curve_bool")
 def MakeEndsMeet(curveA, adjustStartCurveA, curveB, adjustStartCurveB, multiple=False):
     """
     Makes adjustments to the ends of one or both input curves so that they meet at a point.
@@ -488,14 +364,9 @@ def MakeEndsMeet(curveA, adjustStartCurveA, curveB, adjustStartCurveB, multiple=
     Returns:
         bool: True on success.
     """
-    url = "rhino/geometry/curve/makeendsmeet-curve_bool_curve_bool"
-    if multiple: url += "?multiple=true"
-    args = [curveA, adjustStartCurveA, curveB, adjustStartCurveB]
-    if multiple: args = zip(curveA, adjustStartCurveA, curveB, adjustStartCurveB)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/createfillet-curve_curve_double_double_double")
 def CreateFillet(curve0, curve1, radius, t0Base, t1Base, multiple=False):
     """
     Computes the fillet arc for a curve filleting operation.
@@ -510,14 +381,9 @@ def CreateFillet(curve0, curve1, radius, t0Base, t1Base, multiple=False):
     Returns:
         Arc: The fillet arc on success, or Arc.Unset on failure.
     """
-    url = "rhino/geometry/curve/createfillet-curve_curve_double_double_double"
-    if multiple: url += "?multiple=true"
-    args = [curve0, curve1, radius, t0Base, t1Base]
-    if multiple: args = zip(curve0, curve1, radius, t0Base, t1Base)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/createfilletcurves-curve_point3d_curve_point3d_double_bool_bool_bool_double_double", Util.DecodeToCommonObject)
 def CreateFilletCurves(curve0, point0, curve1, point1, radius, join, trim, arcExtension, tolerance, angleTolerance, multiple=False):
     """
     Creates a tangent arc between two curves and trims or extends the curves to the arc.
@@ -550,15 +416,9 @@ def CreateFilletCurves(curve0, point0, curve1, point1, radius, join, trim, arcEx
         the fillet curve and trimmed copies of the input curves, will be returned.
         If both join and trim = false, then just the fillet curve is returned.
     """
-    url = "rhino/geometry/curve/createfilletcurves-curve_point3d_curve_point3d_double_bool_bool_bool_double_double"
-    if multiple: url += "?multiple=true"
-    args = [curve0, point0, curve1, point1, radius, join, trim, arcExtension, tolerance, angleTolerance]
-    if multiple: args = zip(curve0, point0, curve1, point1, radius, join, trim, arcExtension, tolerance, angleTolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/createbooleanunion-curvearray", Util.DecodeToCommonObject)
 def CreateBooleanUnion(curves, multiple=False):
     """
     Calculates the boolean union of two or more closed, planar curves.
@@ -570,15 +430,9 @@ def CreateBooleanUnion(curves, multiple=False):
     Returns:
         Curve[]: Result curves on success, empty array if no union could be calculated.
     """
-    url = "rhino/geometry/curve/createbooleanunion-curvearray"
-    if multiple: url += "?multiple=true"
-    args = [curves]
-    if multiple: args = [[item] for item in curves]
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/createbooleanunion-curvearray_double", Util.DecodeToCommonObject)
 def CreateBooleanUnion1(curves, tolerance, multiple=False):
     """
     Calculates the boolean union of two or more closed, planar curves.
@@ -590,15 +444,9 @@ def CreateBooleanUnion1(curves, tolerance, multiple=False):
     Returns:
         Curve[]: Result curves on success, empty array if no union could be calculated.
     """
-    url = "rhino/geometry/curve/createbooleanunion-curvearray_double"
-    if multiple: url += "?multiple=true"
-    args = [curves, tolerance]
-    if multiple: args = zip(curves, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/createbooleanintersection-curve_curve", Util.DecodeToCommonObject)
 def CreateBooleanIntersection(curveA, curveB, multiple=False):
     """
     Calculates the boolean intersection of two closed, planar curves.
@@ -611,15 +459,9 @@ def CreateBooleanIntersection(curveA, curveB, multiple=False):
     Returns:
         Curve[]: Result curves on success, empty array if no intersection could be calculated.
     """
-    url = "rhino/geometry/curve/createbooleanintersection-curve_curve"
-    if multiple: url += "?multiple=true"
-    args = [curveA, curveB]
-    if multiple: args = zip(curveA, curveB)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/createbooleanintersection-curve_curve_double", Util.DecodeToCommonObject)
 def CreateBooleanIntersection1(curveA, curveB, tolerance, multiple=False):
     """
     Calculates the boolean intersection of two closed, planar curves.
@@ -632,15 +474,9 @@ def CreateBooleanIntersection1(curveA, curveB, tolerance, multiple=False):
     Returns:
         Curve[]: Result curves on success, empty array if no intersection could be calculated.
     """
-    url = "rhino/geometry/curve/createbooleanintersection-curve_curve_double"
-    if multiple: url += "?multiple=true"
-    args = [curveA, curveB, tolerance]
-    if multiple: args = zip(curveA, curveB, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/createbooleandifference-curve_curve", Util.DecodeToCommonObject)
 def CreateBooleanDifference(curveA, curveB, multiple=False):
     """
     Calculates the boolean difference between two closed, planar curves.
@@ -653,15 +489,9 @@ def CreateBooleanDifference(curveA, curveB, multiple=False):
     Returns:
         Curve[]: Result curves on success, empty array if no difference could be calculated.
     """
-    url = "rhino/geometry/curve/createbooleandifference-curve_curve"
-    if multiple: url += "?multiple=true"
-    args = [curveA, curveB]
-    if multiple: args = zip(curveA, curveB)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/createbooleandifference-curve_curve_double", Util.DecodeToCommonObject)
 def CreateBooleanDifference1(curveA, curveB, tolerance, multiple=False):
     """
     Calculates the boolean difference between two closed, planar curves.
@@ -674,15 +504,9 @@ def CreateBooleanDifference1(curveA, curveB, tolerance, multiple=False):
     Returns:
         Curve[]: Result curves on success, empty array if no difference could be calculated.
     """
-    url = "rhino/geometry/curve/createbooleandifference-curve_curve_double"
-    if multiple: url += "?multiple=true"
-    args = [curveA, curveB, tolerance]
-    if multiple: args = zip(curveA, curveB, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/createbooleandifference-curve_curvearray", Util.DecodeToCommonObject)
 def CreateBooleanDifference2(curveA, subtractors, multiple=False):
     """
     Calculates the boolean difference between a closed planar curve, and a list of closed planar curves.
@@ -695,15 +519,9 @@ def CreateBooleanDifference2(curveA, subtractors, multiple=False):
     Returns:
         Curve[]: Result curves on success, empty array if no difference could be calculated.
     """
-    url = "rhino/geometry/curve/createbooleandifference-curve_curvearray"
-    if multiple: url += "?multiple=true"
-    args = [curveA, subtractors]
-    if multiple: args = zip(curveA, subtractors)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/createbooleandifference-curve_curvearray_double", Util.DecodeToCommonObject)
 def CreateBooleanDifference3(curveA, subtractors, tolerance, multiple=False):
     """
     Calculates the boolean difference between a closed planar curve, and a list of closed planar curves.
@@ -716,15 +534,9 @@ def CreateBooleanDifference3(curveA, subtractors, tolerance, multiple=False):
     Returns:
         Curve[]: Result curves on success, empty array if no difference could be calculated.
     """
-    url = "rhino/geometry/curve/createbooleandifference-curve_curvearray_double"
-    if multiple: url += "?multiple=true"
-    args = [curveA, subtractors, tolerance]
-    if multiple: args = zip(curveA, subtractors, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/createbooleanregions-curvearray_plane_point3darray_bool_double")
 def CreateBooleanRegions(curves, plane, points, combineRegions, tolerance, multiple=False):
     """
     Curve Boolean method, which trims and splits curves based on their overlapping regions.
@@ -739,14 +551,9 @@ def CreateBooleanRegions(curves, plane, points, combineRegions, tolerance, multi
     Returns:
         CurveBooleanRegions: The curve Boolean regions if successful, None of no successful.
     """
-    url = "rhino/geometry/curve/createbooleanregions-curvearray_plane_point3darray_bool_double"
-    if multiple: url += "?multiple=true"
-    args = [curves, plane, points, combineRegions, tolerance]
-    if multiple: args = zip(curves, plane, points, combineRegions, tolerance)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/createbooleanregions-curvearray_plane_bool_double")
 def CreateBooleanRegions1(curves, plane, combineRegions, tolerance, multiple=False):
     """
     Calculates curve Boolean regions, which trims and splits curves based on their overlapping regions.
@@ -760,14 +567,9 @@ def CreateBooleanRegions1(curves, plane, combineRegions, tolerance, multiple=Fal
     Returns:
         CurveBooleanRegions: The curve Boolean regions if successful, None of no successful.
     """
-    url = "rhino/geometry/curve/createbooleanregions-curvearray_plane_bool_double"
-    if multiple: url += "?multiple=true"
-    args = [curves, plane, combineRegions, tolerance]
-    if multiple: args = zip(curves, plane, combineRegions, tolerance)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/createtextoutlines-string_string_double_int_bool_plane_double_double", Util.DecodeToCommonObject)
 def CreateTextOutlines(text, font, textHeight, textStyle, closeLoops, plane, smallCapsScale, tolerance, multiple=False):
     """
     Creates outline curves created from a text string. The functionality is similar to what you find in Rhino's TextObject command or TextEntity.Explode() in RhinoCommon.
@@ -785,15 +587,9 @@ def CreateTextOutlines(text, font, textHeight, textStyle, closeLoops, plane, sma
     Returns:
         Curve[]: An array containing one or more curves if successful.
     """
-    url = "rhino/geometry/curve/createtextoutlines-string_string_double_int_bool_plane_double_double"
-    if multiple: url += "?multiple=true"
-    args = [text, font, textHeight, textStyle, closeLoops, plane, smallCapsScale, tolerance]
-    if multiple: args = zip(text, font, textHeight, textStyle, closeLoops, plane, smallCapsScale, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/createcurve2view-curve_curve_vector3d_vector3d_double_double", Util.DecodeToCommonObject)
 def CreateCurve2View(curveA, curveB, vectorA, vectorB, tolerance, angleTolerance, multiple=False):
     """
     Creates a third curve from two curves that are planar in different construction planes.
@@ -810,15 +606,9 @@ def CreateCurve2View(curveA, curveB, vectorA, vectorB, tolerance, angleTolerance
     Returns:
         Curve[]: An array containing one or more curves if successful.
     """
-    url = "rhino/geometry/curve/createcurve2view-curve_curve_vector3d_vector3d_double_double"
-    if multiple: url += "?multiple=true"
-    args = [curveA, curveB, vectorA, vectorB, tolerance, angleTolerance]
-    if multiple: args = zip(curveA, curveB, vectorA, vectorB, tolerance, angleTolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/dodirectionsmatch-curve_curve")
 def DoDirectionsMatch(curveA, curveB, multiple=False):
     """
     Determines whether two curves travel more or less in the same direction.
@@ -831,14 +621,9 @@ def DoDirectionsMatch(curveA, curveB, multiple=False):
         bool: True if both curves more or less point in the same direction,
         False if they point in the opposite directions.
     """
-    url = "rhino/geometry/curve/dodirectionsmatch-curve_curve"
-    if multiple: url += "?multiple=true"
-    args = [curveA, curveB]
-    if multiple: args = zip(curveA, curveB)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/projecttomesh-curve_mesh_vector3d_double", Util.DecodeToCommonObject)
 def ProjectToMesh(curve, mesh, direction, tolerance, multiple=False):
     """
     Projects a curve to a mesh using a direction and tolerance.
@@ -852,15 +637,9 @@ def ProjectToMesh(curve, mesh, direction, tolerance, multiple=False):
     Returns:
         Curve[]: A curve array.
     """
-    url = "rhino/geometry/curve/projecttomesh-curve_mesh_vector3d_double"
-    if multiple: url += "?multiple=true"
-    args = [curve, mesh, direction, tolerance]
-    if multiple: args = zip(curve, mesh, direction, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/projecttomesh-curve_mesharray_vector3d_double", Util.DecodeToCommonObject)
 def ProjectToMesh1(curve, meshes, direction, tolerance, multiple=False):
     """
     Projects a curve to a set of meshes using a direction and tolerance.
@@ -874,15 +653,9 @@ def ProjectToMesh1(curve, meshes, direction, tolerance, multiple=False):
     Returns:
         Curve[]: A curve array.
     """
-    url = "rhino/geometry/curve/projecttomesh-curve_mesharray_vector3d_double"
-    if multiple: url += "?multiple=true"
-    args = [curve, meshes, direction, tolerance]
-    if multiple: args = zip(curve, meshes, direction, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/projecttomesh-curvearray_mesharray_vector3d_double", Util.DecodeToCommonObject)
 def ProjectToMesh2(curves, meshes, direction, tolerance, multiple=False):
     """
     Projects a curve to a set of meshes using a direction and tolerance.
@@ -896,15 +669,9 @@ def ProjectToMesh2(curves, meshes, direction, tolerance, multiple=False):
     Returns:
         Curve[]: A curve array.
     """
-    url = "rhino/geometry/curve/projecttomesh-curvearray_mesharray_vector3d_double"
-    if multiple: url += "?multiple=true"
-    args = [curves, meshes, direction, tolerance]
-    if multiple: args = zip(curves, meshes, direction, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/projecttobrep-curve_brep_vector3d_double", Util.DecodeToCommonObject)
 def ProjectToBrep(curve, brep, direction, tolerance, multiple=False):
     """
     Projects a Curve onto a Brep along a given direction.
@@ -918,15 +685,9 @@ def ProjectToBrep(curve, brep, direction, tolerance, multiple=False):
     Returns:
         Curve[]: An array of projected curves or empty array if the projection set is empty.
     """
-    url = "rhino/geometry/curve/projecttobrep-curve_brep_vector3d_double"
-    if multiple: url += "?multiple=true"
-    args = [curve, brep, direction, tolerance]
-    if multiple: args = zip(curve, brep, direction, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/projecttobrep-curve_breparray_vector3d_double", Util.DecodeToCommonObject)
 def ProjectToBrep1(curve, breps, direction, tolerance, multiple=False):
     """
     Projects a Curve onto a collection of Breps along a given direction.
@@ -940,15 +701,9 @@ def ProjectToBrep1(curve, breps, direction, tolerance, multiple=False):
     Returns:
         Curve[]: An array of projected curves or empty array if the projection set is empty.
     """
-    url = "rhino/geometry/curve/projecttobrep-curve_breparray_vector3d_double"
-    if multiple: url += "?multiple=true"
-    args = [curve, breps, direction, tolerance]
-    if multiple: args = zip(curve, breps, direction, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/projecttobrep-curve_breparray_vector3d_double_intarray")
 def ProjectToBrep2(curve, breps, direction, tolerance, multiple=False):
     """
     Projects a Curve onto a collection of Breps along a given direction.
@@ -963,14 +718,9 @@ def ProjectToBrep2(curve, breps, direction, tolerance, multiple=False):
         Curve[]: An array of projected curves or None if the projection set is empty.
         brepIndices (int[]): (out) Integers that identify for each resulting curve which Brep it was projected onto.
     """
-    url = "rhino/geometry/curve/projecttobrep-curve_breparray_vector3d_double_intarray"
-    if multiple: url += "?multiple=true"
-    args = [curve, breps, direction, tolerance]
-    if multiple: args = zip(curve, breps, direction, tolerance)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/projecttobrep-curvearray_breparray_vector3d_double", Util.DecodeToCommonObject)
 def ProjectToBrep3(curves, breps, direction, tolerance, multiple=False):
     """
     Projects a collection of Curves onto a collection of Breps along a given direction.
@@ -984,15 +734,9 @@ def ProjectToBrep3(curves, breps, direction, tolerance, multiple=False):
     Returns:
         Curve[]: An array of projected curves or empty array if the projection set is empty.
     """
-    url = "rhino/geometry/curve/projecttobrep-curvearray_breparray_vector3d_double"
-    if multiple: url += "?multiple=true"
-    args = [curves, breps, direction, tolerance]
-    if multiple: args = zip(curves, breps, direction, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/projecttobrep-curvearray_breparray_vector3d_double_intarray_intarray")
 def ProjectToBrep4(curves, breps, direction, tolerance, multiple=False):
     """
     Projects a collection of Curves onto a collection of Breps along a given direction.
@@ -1008,14 +752,9 @@ def ProjectToBrep4(curves, breps, direction, tolerance, multiple=False):
         curveIndices (int[]): Index of which curve in the input list was the source for a curve in the return array.
         brepIndices (int[]): Index of which brep was used to generate a curve in the return array.
     """
-    url = "rhino/geometry/curve/projecttobrep-curvearray_breparray_vector3d_double_intarray_intarray"
-    if multiple: url += "?multiple=true"
-    args = [curves, breps, direction, tolerance]
-    if multiple: args = zip(curves, breps, direction, tolerance)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/projecttoplane-curve_plane", Util.DecodeToCommonObject)
 def ProjectToPlane(curve, plane, multiple=False):
     """
     Constructs a curve by projecting an existing curve to a plane.
@@ -1027,15 +766,9 @@ def ProjectToPlane(curve, plane, multiple=False):
     Returns:
         Curve: The projected curve on success; None on failure.
     """
-    url = "rhino/geometry/curve/projecttoplane-curve_plane"
-    if multiple: url += "?multiple=true"
-    args = [curve, plane]
-    if multiple: args = zip(curve, plane)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/pulltobrepface-curve_brepface_double", Util.DecodeToCommonObject)
 def PullToBrepFace(curve, face, tolerance, multiple=False):
     """
     Pull a curve to a BrepFace using closest point projection.
@@ -1048,15 +781,9 @@ def PullToBrepFace(curve, face, tolerance, multiple=False):
     Returns:
         Curve[]: An array of pulled curves, or an empty array on failure.
     """
-    url = "rhino/geometry/curve/pulltobrepface-curve_brepface_double"
-    if multiple: url += "?multiple=true"
-    args = [curve, face, tolerance]
-    if multiple: args = zip(curve, face, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/planarclosedcurverelationship-curve_curve_plane_double")
 def PlanarClosedCurveRelationship(curveA, curveB, testPlane, tolerance, multiple=False):
     """
     Determines whether two coplanar simple closed curves are disjoint or intersect;
@@ -1072,14 +799,9 @@ def PlanarClosedCurveRelationship(curveA, curveB, testPlane, tolerance, multiple
     Returns:
         RegionContainment: A value indicating the relationship between the first and the second curve.
     """
-    url = "rhino/geometry/curve/planarclosedcurverelationship-curve_curve_plane_double"
-    if multiple: url += "?multiple=true"
-    args = [curveA, curveB, testPlane, tolerance]
-    if multiple: args = zip(curveA, curveB, testPlane, tolerance)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/planarcurvecollision-curve_curve_plane_double")
 def PlanarCurveCollision(curveA, curveB, testPlane, tolerance, multiple=False):
     """
     Determines if two coplanar curves collide (intersect).
@@ -1093,14 +815,9 @@ def PlanarCurveCollision(curveA, curveB, testPlane, tolerance, multiple=False):
     Returns:
         bool: True if the curves intersect, otherwise false
     """
-    url = "rhino/geometry/curve/planarcurvecollision-curve_curve_plane_double"
-    if multiple: url += "?multiple=true"
-    args = [curveA, curveB, testPlane, tolerance]
-    if multiple: args = zip(curveA, curveB, testPlane, tolerance)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/duplicatesegments-curve", Util.DecodeToCommonObject)
 def DuplicateSegments(thisCurve, multiple=False):
     """
     Polylines will be exploded into line segments. ExplodeCurves will
@@ -1109,15 +826,9 @@ def DuplicateSegments(thisCurve, multiple=False):
     Returns:
         Curve[]: An array of all the segments that make up this curve.
     """
-    url = "rhino/geometry/curve/duplicatesegments-curve"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve]
-    if multiple: args = [[item] for item in thisCurve]
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/smooth-curve_double_bool_bool_bool_bool_smoothingcoordinatesystem", Util.DecodeToCommonObject)
 def Smooth(thisCurve, smoothFactor, bXSmooth, bYSmooth, bZSmooth, bFixBoundaries, coordinateSystem, multiple=False):
     """
     Smooths a curve by averaging the positions of control points in a specified region.
@@ -1133,15 +844,9 @@ def Smooth(thisCurve, smoothFactor, bXSmooth, bYSmooth, bZSmooth, bFixBoundaries
     Returns:
         Curve: The smoothed curve if successful, None otherwise.
     """
-    url = "rhino/geometry/curve/smooth-curve_double_bool_bool_bool_bool_smoothingcoordinatesystem"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, smoothFactor, bXSmooth, bYSmooth, bZSmooth, bFixBoundaries, coordinateSystem]
-    if multiple: args = zip(thisCurve, smoothFactor, bXSmooth, bYSmooth, bZSmooth, bFixBoundaries, coordinateSystem)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/smooth-curve_double_bool_bool_bool_bool_smoothingcoordinatesystem_plane", Util.DecodeToCommonObject)
 def Smooth1(thisCurve, smoothFactor, bXSmooth, bYSmooth, bZSmooth, bFixBoundaries, coordinateSystem, plane, multiple=False):
     """
     Smooths a curve by averaging the positions of control points in a specified region.
@@ -1158,15 +863,9 @@ def Smooth1(thisCurve, smoothFactor, bXSmooth, bYSmooth, bZSmooth, bFixBoundarie
     Returns:
         Curve: The smoothed curve if successful, None otherwise.
     """
-    url = "rhino/geometry/curve/smooth-curve_double_bool_bool_bool_bool_smoothingcoordinatesystem_plane"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, smoothFactor, bXSmooth, bYSmooth, bZSmooth, bFixBoundaries, coordinateSystem, plane]
-    if multiple: args = zip(thisCurve, smoothFactor, bXSmooth, bYSmooth, bZSmooth, bFixBoundaries, coordinateSystem, plane)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/getlocalperppoint-curve_point3d_double_double")
 def GetLocalPerpPoint(thisCurve, testPoint, seedParmameter, multiple=False):
     """
     Search for a location on the curve, near seedParmameter, that is perpendicular to a test point.
@@ -1179,14 +878,9 @@ def GetLocalPerpPoint(thisCurve, testPoint, seedParmameter, multiple=False):
         bool: True if a solution is found, False otherwise.
         curveParameter (double): The parameter value at the perpendicular point
     """
-    url = "rhino/geometry/curve/getlocalperppoint-curve_point3d_double_double"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, testPoint, seedParmameter]
-    if multiple: args = zip(thisCurve, testPoint, seedParmameter)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/getlocalperppoint-curve_point3d_double_interval_double")
 def GetLocalPerpPoint1(thisCurve, testPoint, seedParmameter, subDomain, multiple=False):
     """
     Search for a location on the curve, near seedParmameter, that is perpendicular to a test point.
@@ -1200,14 +894,9 @@ def GetLocalPerpPoint1(thisCurve, testPoint, seedParmameter, subDomain, multiple
         bool: True if a solution is found, False otherwise.
         curveParameter (double): The parameter value at the perpendicular point
     """
-    url = "rhino/geometry/curve/getlocalperppoint-curve_point3d_double_interval_double"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, testPoint, seedParmameter, subDomain]
-    if multiple: args = zip(thisCurve, testPoint, seedParmameter, subDomain)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/getlocaltangentpoint-curve_point3d_double_double")
 def GetLocalTangentPoint(thisCurve, testPoint, seedParmameter, multiple=False):
     """
     Search for a location on the curve, near seedParmameter, that is tangent to a test point.
@@ -1220,14 +909,9 @@ def GetLocalTangentPoint(thisCurve, testPoint, seedParmameter, multiple=False):
         bool: True if a solution is found, False otherwise.
         curveParameter (double): The parameter value at the tangent point
     """
-    url = "rhino/geometry/curve/getlocaltangentpoint-curve_point3d_double_double"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, testPoint, seedParmameter]
-    if multiple: args = zip(thisCurve, testPoint, seedParmameter)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/getlocaltangentpoint-curve_point3d_double_interval_double")
 def GetLocalTangentPoint1(thisCurve, testPoint, seedParmameter, subDomain, multiple=False):
     """
     Search for a location on the curve, near seedParmameter, that is tangent to a test point.
@@ -1241,14 +925,9 @@ def GetLocalTangentPoint1(thisCurve, testPoint, seedParmameter, subDomain, multi
         bool: True if a solution is found, False otherwise.
         curveParameter (double): The parameter value at the tangent point
     """
-    url = "rhino/geometry/curve/getlocaltangentpoint-curve_point3d_double_interval_double"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, testPoint, seedParmameter, subDomain]
-    if multiple: args = zip(thisCurve, testPoint, seedParmameter, subDomain)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/inflectionpoints-curve", Util.DecodeToPoint3d)
 def InflectionPoints(thisCurve, multiple=False):
     """
     Returns a curve's inflection points. An inflection point is a location on
@@ -1258,15 +937,9 @@ def InflectionPoints(thisCurve, multiple=False):
     Returns:
         Point3d[]: An array of points if successful, None if not successful or on error.
     """
-    url = "rhino/geometry/curve/inflectionpoints-curve"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve]
-    if multiple: args = [[item] for item in thisCurve]
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToPoint3d(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/maxcurvaturepoints-curve", Util.DecodeToPoint3d)
 def MaxCurvaturePoints(thisCurve, multiple=False):
     """
     Returns a curve's maximum curvature points. The maximum curvature points identify
@@ -1275,15 +948,9 @@ def MaxCurvaturePoints(thisCurve, multiple=False):
     Returns:
         Point3d[]: An array of points if successful, None if not successful or on error.
     """
-    url = "rhino/geometry/curve/maxcurvaturepoints-curve"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve]
-    if multiple: args = [[item] for item in thisCurve]
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToPoint3d(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/makeclosed-curve_double")
 def MakeClosed(thisCurve, tolerance, multiple=False):
     """
     If IsClosed, just return true. Otherwise, decide if curve can be closed as
@@ -1298,14 +965,9 @@ def MakeClosed(thisCurve, tolerance, multiple=False):
     Returns:
         bool: True on success, False on failure.
     """
-    url = "rhino/geometry/curve/makeclosed-curve_double"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, tolerance]
-    if multiple: args = zip(thisCurve, tolerance)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/lcoalclosestpoint-curve_point3d_double_double")
 def LcoalClosestPoint(thisCurve, testPoint, seed, multiple=False):
     """
     Find parameter of the point on a curve that is locally closest to
@@ -1320,14 +982,9 @@ def LcoalClosestPoint(thisCurve, testPoint, seed, multiple=False):
         bool: True if the search is successful, False if the search fails.
         t (double): >Parameter of the curve that is closest to testPoint.
     """
-    url = "rhino/geometry/curve/lcoalclosestpoint-curve_point3d_double_double"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, testPoint, seed]
-    if multiple: args = zip(thisCurve, testPoint, seed)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/localclosestpoint-curve_point3d_double_double")
 def LocalClosestPoint(thisCurve, testPoint, seed, multiple=False):
     """
     Find parameter of the point on a curve that is locally closest to
@@ -1342,14 +999,9 @@ def LocalClosestPoint(thisCurve, testPoint, seed, multiple=False):
         bool: True if the search is successful, False if the search fails.
         t (double): >Parameter of the curve that is closest to testPoint.
     """
-    url = "rhino/geometry/curve/localclosestpoint-curve_point3d_double_double"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, testPoint, seed]
-    if multiple: args = zip(thisCurve, testPoint, seed)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/closestpoint-curve_point3d_double")
 def ClosestPoint(thisCurve, testPoint, multiple=False):
     """
     Finds parameter of the point on a curve that is closest to testPoint.
@@ -1364,14 +1016,9 @@ def ClosestPoint(thisCurve, testPoint, multiple=False):
         bool: True on success, False on failure.
         t (double): Parameter of local closest point.
     """
-    url = "rhino/geometry/curve/closestpoint-curve_point3d_double"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, testPoint]
-    if multiple: args = zip(thisCurve, testPoint)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/closestpoint-curve_point3d_double_double")
 def ClosestPoint1(thisCurve, testPoint, maximumDistance, multiple=False):
     """
     Finds the parameter of the point on a curve that is closest to testPoint.
@@ -1388,14 +1035,9 @@ def ClosestPoint1(thisCurve, testPoint, maximumDistance, multiple=False):
         bool: True on success, False on failure.
         t (double): parameter of local closest point returned here.
     """
-    url = "rhino/geometry/curve/closestpoint-curve_point3d_double_double"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, testPoint, maximumDistance]
-    if multiple: args = zip(thisCurve, testPoint, maximumDistance)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/closestpoints-curve_curve_point3d_point3d")
 def ClosestPoints(thisCurve, otherCurve, multiple=False):
     """
     Gets closest points between this and another curves.
@@ -1408,14 +1050,9 @@ def ClosestPoints(thisCurve, otherCurve, multiple=False):
         pointOnThisCurve (Point3d): The point on this curve. This out parameter is assigned during this call.
         pointOnOtherCurve (Point3d): The point on other curve. This out parameter is assigned during this call.
     """
-    url = "rhino/geometry/curve/closestpoints-curve_curve_point3d_point3d"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, otherCurve]
-    if multiple: args = zip(thisCurve, otherCurve)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/contains-curve_point3d")
 def Contains(thisCurve, testPoint, multiple=False):
     """
     Computes the relationship between a point and a closed curve region.
@@ -1428,14 +1065,9 @@ def Contains(thisCurve, testPoint, multiple=False):
     Returns:
         PointContainment: Relationship between point and curve region.
     """
-    url = "rhino/geometry/curve/contains-curve_point3d"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, testPoint]
-    if multiple: args = zip(thisCurve, testPoint)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/contains-curve_point3d_plane")
 def Contains1(thisCurve, testPoint, plane, multiple=False):
     """
     Computes the relationship between a point and a closed curve region.
@@ -1448,14 +1080,9 @@ def Contains1(thisCurve, testPoint, plane, multiple=False):
     Returns:
         PointContainment: Relationship between point and curve region.
     """
-    url = "rhino/geometry/curve/contains-curve_point3d_plane"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, testPoint, plane]
-    if multiple: args = zip(thisCurve, testPoint, plane)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/contains-curve_point3d_plane_double")
 def Contains2(thisCurve, testPoint, plane, tolerance, multiple=False):
     """
     Computes the relationship between a point and a closed curve region.
@@ -1469,14 +1096,9 @@ def Contains2(thisCurve, testPoint, plane, tolerance, multiple=False):
     Returns:
         PointContainment: Relationship between point and curve region.
     """
-    url = "rhino/geometry/curve/contains-curve_point3d_plane_double"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, testPoint, plane, tolerance]
-    if multiple: args = zip(thisCurve, testPoint, plane, tolerance)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/extremeparameters-curve_vector3d")
 def ExtremeParameters(thisCurve, direction, multiple=False):
     """
     Returns the parameter values of all local extrema.
@@ -1490,14 +1112,9 @@ def ExtremeParameters(thisCurve, direction, multiple=False):
     Returns:
         double[]: The parameter values of all local extrema.
     """
-    url = "rhino/geometry/curve/extremeparameters-curve_vector3d"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, direction]
-    if multiple: args = zip(thisCurve, direction)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/createperiodiccurve-curve", Util.DecodeToCommonObject)
 def CreatePeriodicCurve(curve, multiple=False):
     """
     Removes kinks from a curve. Periodic curves deform smoothly without kinks.
@@ -1508,15 +1125,9 @@ def CreatePeriodicCurve(curve, multiple=False):
     Returns:
         Curve: The resulting curve if successful, None otherwise.
     """
-    url = "rhino/geometry/curve/createperiodiccurve-curve"
-    if multiple: url += "?multiple=true"
-    args = [curve]
-    if multiple: args = [[item] for item in curve]
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/createperiodiccurve-curve_bool", Util.DecodeToCommonObject)
 def CreatePeriodicCurve1(curve, smooth, multiple=False):
     """
     Removes kinks from a curve. Periodic curves deform smoothly without kinks.
@@ -1529,15 +1140,9 @@ def CreatePeriodicCurve1(curve, smooth, multiple=False):
     Returns:
         Curve: The resulting curve if successful, None otherwise.
     """
-    url = "rhino/geometry/curve/createperiodiccurve-curve_bool"
-    if multiple: url += "?multiple=true"
-    args = [curve, smooth]
-    if multiple: args = zip(curve, smooth)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/pointatlength-curve_double", Util.DecodeToPoint3d)
 def PointAtLength(thisCurve, length, multiple=False):
     """
     Gets a point at a certain length along the curve. The length must be
@@ -1550,15 +1155,9 @@ def PointAtLength(thisCurve, length, multiple=False):
     Returns:
         Point3d: Point on the curve at the specified length from the start point or Poin3d.Unset on failure.
     """
-    url = "rhino/geometry/curve/pointatlength-curve_double"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, length]
-    if multiple: args = zip(thisCurve, length)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToPoint3d(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/pointatnormalizedlength-curve_double", Util.DecodeToPoint3d)
 def PointAtNormalizedLength(thisCurve, length, multiple=False):
     """
     Gets a point at a certain normalized length along the curve. The length must be
@@ -1571,15 +1170,9 @@ def PointAtNormalizedLength(thisCurve, length, multiple=False):
     Returns:
         Point3d: Point on the curve at the specified normalized length from the start point or Poin3d.Unset on failure.
     """
-    url = "rhino/geometry/curve/pointatnormalizedlength-curve_double"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, length]
-    if multiple: args = zip(thisCurve, length)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToPoint3d(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/perpendicularframeat-curve_double_plane")
 def PerpendicularFrameAt(thisCurve, t, multiple=False):
     """
     Return a 3d frame at a parameter. This is slightly different than FrameAt in
@@ -1593,14 +1186,9 @@ def PerpendicularFrameAt(thisCurve, t, multiple=False):
         bool: True on success, False on failure.
         plane (Plane): The frame is returned here.
     """
-    url = "rhino/geometry/curve/perpendicularframeat-curve_double_plane"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, t]
-    if multiple: args = zip(thisCurve, t)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/getperpendicularframes-curve_doublearray")
 def GetPerpendicularFrames(thisCurve, parameters, multiple=False):
     """
     Gets a collection of perpendicular frames along the curve. Perpendicular frames
@@ -1612,14 +1200,9 @@ def GetPerpendicularFrames(thisCurve, parameters, multiple=False):
     Returns:
         Plane[]: An array of perpendicular frames on success or None on failure.
     """
-    url = "rhino/geometry/curve/getperpendicularframes-curve_doublearray"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, parameters]
-    if multiple: args = zip(thisCurve, parameters)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/getlength-curve")
 def GetLength(thisCurve, multiple=False):
     """
     Gets the length of the curve with a fractional tolerance of 1.0e-8.
@@ -1627,14 +1210,9 @@ def GetLength(thisCurve, multiple=False):
     Returns:
         double: The length of the curve on success, or zero on failure.
     """
-    url = "rhino/geometry/curve/getlength-curve"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve]
-    if multiple: args = [[item] for item in thisCurve]
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/getlength-curve_double")
 def GetLength1(thisCurve, fractionalTolerance, multiple=False):
     """
     Get the length of the curve.
@@ -1646,14 +1224,9 @@ def GetLength1(thisCurve, fractionalTolerance, multiple=False):
     Returns:
         double: The length of the curve on success, or zero on failure.
     """
-    url = "rhino/geometry/curve/getlength-curve_double"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, fractionalTolerance]
-    if multiple: args = zip(thisCurve, fractionalTolerance)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/getlength-curve_interval")
 def GetLength2(thisCurve, subdomain, multiple=False):
     """
     Get the length of a sub-section of the curve with a fractional tolerance of 1e-8.
@@ -1664,14 +1237,9 @@ def GetLength2(thisCurve, subdomain, multiple=False):
     Returns:
         double: The length of the sub-curve on success, or zero on failure.
     """
-    url = "rhino/geometry/curve/getlength-curve_interval"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, subdomain]
-    if multiple: args = zip(thisCurve, subdomain)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/getlength-curve_double_interval")
 def GetLength3(thisCurve, fractionalTolerance, subdomain, multiple=False):
     """
     Get the length of a sub-section of the curve.
@@ -1684,14 +1252,9 @@ def GetLength3(thisCurve, fractionalTolerance, subdomain, multiple=False):
     Returns:
         double: The length of the sub-curve on success, or zero on failure.
     """
-    url = "rhino/geometry/curve/getlength-curve_double_interval"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, fractionalTolerance, subdomain]
-    if multiple: args = zip(thisCurve, fractionalTolerance, subdomain)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/isshort-curve_double")
 def IsShort(thisCurve, tolerance, multiple=False):
     """
     Used to quickly find short curves.
@@ -1702,14 +1265,9 @@ def IsShort(thisCurve, tolerance, multiple=False):
     Returns:
         bool: True if the length of the curve is <= tolerance.
     """
-    url = "rhino/geometry/curve/isshort-curve_double"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, tolerance]
-    if multiple: args = zip(thisCurve, tolerance)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/isshort-curve_double_interval")
 def IsShort1(thisCurve, tolerance, subdomain, multiple=False):
     """
     Used to quickly find short curves.
@@ -1721,14 +1279,9 @@ def IsShort1(thisCurve, tolerance, subdomain, multiple=False):
     Returns:
         bool: True if the length of the curve is <= tolerance.
     """
-    url = "rhino/geometry/curve/isshort-curve_double_interval"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, tolerance, subdomain]
-    if multiple: args = zip(thisCurve, tolerance, subdomain)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/removeshortsegments-curve_double")
 def RemoveShortSegments(thisCurve, tolerance, multiple=False):
     """
     Looks for segments that are shorter than tolerance that can be removed.
@@ -1741,14 +1294,9 @@ def RemoveShortSegments(thisCurve, tolerance, multiple=False):
         bool: True if removable short segments were found.
         False if no removable short segments were found.
     """
-    url = "rhino/geometry/curve/removeshortsegments-curve_double"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, tolerance]
-    if multiple: args = zip(thisCurve, tolerance)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/lengthparameter-curve_double_double")
 def LengthParameter(thisCurve, segmentLength, multiple=False):
     """
     Gets the parameter along the curve which coincides with a given length along the curve.
@@ -1761,14 +1309,9 @@ def LengthParameter(thisCurve, segmentLength, multiple=False):
         bool: True on success, False on failure.
         t (double): Parameter such that the length of the curve from the curve start point to t equals length.
     """
-    url = "rhino/geometry/curve/lengthparameter-curve_double_double"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, segmentLength]
-    if multiple: args = zip(thisCurve, segmentLength)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/lengthparameter-curve_double_double_double")
 def LengthParameter1(thisCurve, segmentLength, fractionalTolerance, multiple=False):
     """
     Gets the parameter along the curve which coincides with a given length along the curve.
@@ -1782,14 +1325,9 @@ def LengthParameter1(thisCurve, segmentLength, fractionalTolerance, multiple=Fal
         bool: True on success, False on failure.
         t (double): Parameter such that the length of the curve from the curve start point to t equals s.
     """
-    url = "rhino/geometry/curve/lengthparameter-curve_double_double_double"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, segmentLength, fractionalTolerance]
-    if multiple: args = zip(thisCurve, segmentLength, fractionalTolerance)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/lengthparameter-curve_double_double_interval")
 def LengthParameter2(thisCurve, segmentLength, subdomain, multiple=False):
     """
     Gets the parameter along the curve which coincides with a given length along the curve.
@@ -1803,14 +1341,9 @@ def LengthParameter2(thisCurve, segmentLength, subdomain, multiple=False):
         bool: True on success, False on failure.
         t (double): Parameter such that the length of the curve from the start of the subdomain to t is s.
     """
-    url = "rhino/geometry/curve/lengthparameter-curve_double_double_interval"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, segmentLength, subdomain]
-    if multiple: args = zip(thisCurve, segmentLength, subdomain)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/lengthparameter-curve_double_double_double_interval")
 def LengthParameter3(thisCurve, segmentLength, fractionalTolerance, subdomain, multiple=False):
     """
     Gets the parameter along the curve which coincides with a given length along the curve.
@@ -1825,14 +1358,9 @@ def LengthParameter3(thisCurve, segmentLength, fractionalTolerance, subdomain, m
         bool: True on success, False on failure.
         t (double): Parameter such that the length of the curve from the start of the subdomain to t is s.
     """
-    url = "rhino/geometry/curve/lengthparameter-curve_double_double_double_interval"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, segmentLength, fractionalTolerance, subdomain]
-    if multiple: args = zip(thisCurve, segmentLength, fractionalTolerance, subdomain)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/normalizedlengthparameter-curve_double_double")
 def NormalizedLengthParameter(thisCurve, s, multiple=False):
     """
     Input the parameter of the point on the curve that is a prescribed arc length from the start of the curve.
@@ -1846,14 +1374,9 @@ def NormalizedLengthParameter(thisCurve, s, multiple=False):
         bool: True on success, False on failure.
         t (double): Parameter such that the length of the curve from its start to t is arc_length.
     """
-    url = "rhino/geometry/curve/normalizedlengthparameter-curve_double_double"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, s]
-    if multiple: args = zip(thisCurve, s)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/normalizedlengthparameter-curve_double_double_double")
 def NormalizedLengthParameter1(thisCurve, s, fractionalTolerance, multiple=False):
     """
     Input the parameter of the point on the curve that is a prescribed arc length from the start of the curve.
@@ -1868,14 +1391,9 @@ def NormalizedLengthParameter1(thisCurve, s, fractionalTolerance, multiple=False
         bool: True on success, False on failure.
         t (double): Parameter such that the length of the curve from its start to t is arc_length.
     """
-    url = "rhino/geometry/curve/normalizedlengthparameter-curve_double_double_double"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, s, fractionalTolerance]
-    if multiple: args = zip(thisCurve, s, fractionalTolerance)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/normalizedlengthparameter-curve_double_double_interval")
 def NormalizedLengthParameter2(thisCurve, s, subdomain, multiple=False):
     """
     Input the parameter of the point on the curve that is a prescribed arc length from the start of the curve.
@@ -1890,14 +1408,9 @@ def NormalizedLengthParameter2(thisCurve, s, subdomain, multiple=False):
         bool: True on success, False on failure.
         t (double): Parameter such that the length of the curve from its start to t is arc_length.
     """
-    url = "rhino/geometry/curve/normalizedlengthparameter-curve_double_double_interval"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, s, subdomain]
-    if multiple: args = zip(thisCurve, s, subdomain)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/normalizedlengthparameter-curve_double_double_double_interval")
 def NormalizedLengthParameter3(thisCurve, s, fractionalTolerance, subdomain, multiple=False):
     """
     Input the parameter of the point on the curve that is a prescribed arc length from the start of the curve.
@@ -1913,14 +1426,9 @@ def NormalizedLengthParameter3(thisCurve, s, fractionalTolerance, subdomain, mul
         bool: True on success, False on failure.
         t (double): Parameter such that the length of the curve from its start to t is arc_length.
     """
-    url = "rhino/geometry/curve/normalizedlengthparameter-curve_double_double_double_interval"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, s, fractionalTolerance, subdomain]
-    if multiple: args = zip(thisCurve, s, fractionalTolerance, subdomain)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/normalizedlengthparameters-curve_doublearray_double")
 def NormalizedLengthParameters(thisCurve, s, absoluteTolerance, multiple=False):
     """
     Input the parameter of the point on the curve that is a prescribed arc length from the start of the curve.
@@ -1936,14 +1444,9 @@ def NormalizedLengthParameters(thisCurve, s, absoluteTolerance, multiple=False):
         double[]: If successful, array of curve parameters such that the length of the curve from its start to t[i] is s[i]*curve_length.
         Null on failure.
     """
-    url = "rhino/geometry/curve/normalizedlengthparameters-curve_doublearray_double"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, s, absoluteTolerance]
-    if multiple: args = zip(thisCurve, s, absoluteTolerance)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/normalizedlengthparameters-curve_doublearray_double_double")
 def NormalizedLengthParameters1(thisCurve, s, absoluteTolerance, fractionalTolerance, multiple=False):
     """
     Input the parameter of the point on the curve that is a prescribed arc length from the start of the curve.
@@ -1960,14 +1463,9 @@ def NormalizedLengthParameters1(thisCurve, s, absoluteTolerance, fractionalToler
         double[]: If successful, array of curve parameters such that the length of the curve from its start to t[i] is s[i]*curve_length.
         Null on failure.
     """
-    url = "rhino/geometry/curve/normalizedlengthparameters-curve_doublearray_double_double"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, s, absoluteTolerance, fractionalTolerance]
-    if multiple: args = zip(thisCurve, s, absoluteTolerance, fractionalTolerance)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/normalizedlengthparameters-curve_doublearray_double_interval")
 def NormalizedLengthParameters2(thisCurve, s, absoluteTolerance, subdomain, multiple=False):
     """
     Input the parameter of the point on the curve that is a prescribed arc length from the start of the curve.
@@ -1985,14 +1483,9 @@ def NormalizedLengthParameters2(thisCurve, s, absoluteTolerance, subdomain, mult
         double[]: If successful, array of curve parameters such that the length of the curve from its start to t[i] is s[i]*curve_length.
         Null on failure.
     """
-    url = "rhino/geometry/curve/normalizedlengthparameters-curve_doublearray_double_interval"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, s, absoluteTolerance, subdomain]
-    if multiple: args = zip(thisCurve, s, absoluteTolerance, subdomain)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/normalizedlengthparameters-curve_doublearray_double_double_interval")
 def NormalizedLengthParameters3(thisCurve, s, absoluteTolerance, fractionalTolerance, subdomain, multiple=False):
     """
     Input the parameter of the point on the curve that is a prescribed arc length from the start of the curve.
@@ -2011,14 +1504,9 @@ def NormalizedLengthParameters3(thisCurve, s, absoluteTolerance, fractionalToler
         double[]: If successful, array of curve parameters such that the length of the curve from its start to t[i] is s[i]*curve_length.
         Null on failure.
     """
-    url = "rhino/geometry/curve/normalizedlengthparameters-curve_doublearray_double_double_interval"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, s, absoluteTolerance, fractionalTolerance, subdomain]
-    if multiple: args = zip(thisCurve, s, absoluteTolerance, fractionalTolerance, subdomain)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/dividebycount-curve_int_bool")
 def DivideByCount(thisCurve, segmentCount, includeEnds, multiple=False):
     """
     Divide the curve into a number of equal-length segments.
@@ -2030,14 +1518,9 @@ def DivideByCount(thisCurve, segmentCount, includeEnds, multiple=False):
     Returns:
         double[]: List of curve parameters at the division points on success, None on failure.
     """
-    url = "rhino/geometry/curve/dividebycount-curve_int_bool"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, segmentCount, includeEnds]
-    if multiple: args = zip(thisCurve, segmentCount, includeEnds)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/dividebycount-curve_int_bool_point3darray")
 def DivideByCount1(thisCurve, segmentCount, includeEnds, multiple=False):
     """
     Divide the curve into a number of equal-length segments.
@@ -2050,14 +1533,9 @@ def DivideByCount1(thisCurve, segmentCount, includeEnds, multiple=False):
         double[]: Array containing division curve parameters on success, None on failure.
         points (Point3d[]): A list of division points. If the function returns successfully, this point-array will be filled in.
     """
-    url = "rhino/geometry/curve/dividebycount-curve_int_bool_point3darray"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, segmentCount, includeEnds]
-    if multiple: args = zip(thisCurve, segmentCount, includeEnds)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/dividebylength-curve_double_bool")
 def DivideByLength(thisCurve, segmentLength, includeEnds, multiple=False):
     """
     Divide the curve into specific length segments.
@@ -2069,14 +1547,9 @@ def DivideByLength(thisCurve, segmentLength, includeEnds, multiple=False):
     Returns:
         double[]: Array containing division curve parameters if successful, None on failure.
     """
-    url = "rhino/geometry/curve/dividebylength-curve_double_bool"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, segmentLength, includeEnds]
-    if multiple: args = zip(thisCurve, segmentLength, includeEnds)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/dividebylength-curve_double_bool_bool")
 def DivideByLength1(thisCurve, segmentLength, includeEnds, reverse, multiple=False):
     """
     Divide the curve into specific length segments.
@@ -2089,14 +1562,9 @@ def DivideByLength1(thisCurve, segmentLength, includeEnds, reverse, multiple=Fal
     Returns:
         double[]: Array containing division curve parameters if successful, None on failure.
     """
-    url = "rhino/geometry/curve/dividebylength-curve_double_bool_bool"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, segmentLength, includeEnds, reverse]
-    if multiple: args = zip(thisCurve, segmentLength, includeEnds, reverse)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/dividebylength-curve_double_bool_point3darray")
 def DivideByLength2(thisCurve, segmentLength, includeEnds, multiple=False):
     """
     Divide the curve into specific length segments.
@@ -2109,14 +1577,9 @@ def DivideByLength2(thisCurve, segmentLength, includeEnds, multiple=False):
         double[]: Array containing division curve parameters if successful, None on failure.
         points (Point3d[]): If function is successful, points at each parameter value are returned in points.
     """
-    url = "rhino/geometry/curve/dividebylength-curve_double_bool_point3darray"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, segmentLength, includeEnds]
-    if multiple: args = zip(thisCurve, segmentLength, includeEnds)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/dividebylength-curve_double_bool_bool_point3darray")
 def DivideByLength3(thisCurve, segmentLength, includeEnds, reverse, multiple=False):
     """
     Divide the curve into specific length segments.
@@ -2130,14 +1593,9 @@ def DivideByLength3(thisCurve, segmentLength, includeEnds, reverse, multiple=Fal
         double[]: Array containing division curve parameters if successful, None on failure.
         points (Point3d[]): If function is successful, points at each parameter value are returned in points.
     """
-    url = "rhino/geometry/curve/dividebylength-curve_double_bool_bool_point3darray"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, segmentLength, includeEnds, reverse]
-    if multiple: args = zip(thisCurve, segmentLength, includeEnds, reverse)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/divideequidistant-curve_double", Util.DecodeToPoint3d)
 def DivideEquidistant(thisCurve, distance, multiple=False):
     """
     Calculates 3d points on a curve where the linear distance between the points is equal.
@@ -2148,15 +1606,9 @@ def DivideEquidistant(thisCurve, distance, multiple=False):
     Returns:
         Point3d[]: An array of equidistant points, or None on error.
     """
-    url = "rhino/geometry/curve/divideequidistant-curve_double"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, distance]
-    if multiple: args = zip(thisCurve, distance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToPoint3d(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/divideascontour-curve_point3d_point3d_double", Util.DecodeToPoint3d)
 def DivideAsContour(thisCurve, contourStart, contourEnd, interval, multiple=False):
     """
     Divides this curve at fixed steps along a defined contour line.
@@ -2169,15 +1621,9 @@ def DivideAsContour(thisCurve, contourStart, contourEnd, interval, multiple=Fals
     Returns:
         Point3d[]: An array of points; or None on error.
     """
-    url = "rhino/geometry/curve/divideascontour-curve_point3d_point3d_double"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, contourStart, contourEnd, interval]
-    if multiple: args = zip(thisCurve, contourStart, contourEnd, interval)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToPoint3d(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/trim-curve_curveend_double", Util.DecodeToCommonObject)
 def Trim(thisCurve, side, length, multiple=False):
     """
     Shortens a curve by a given length
@@ -2185,15 +1631,9 @@ def Trim(thisCurve, side, length, multiple=False):
     Returns:
         Curve: Trimmed curve if successful, None on failure.
     """
-    url = "rhino/geometry/curve/trim-curve_curveend_double"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, side, length]
-    if multiple: args = zip(thisCurve, side, length)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/split-curve_brep_double", Util.DecodeToCommonObject)
 def Split(thisCurve, cutter, tolerance, multiple=False):
     """
     Splits a curve into pieces using a polysurface.
@@ -2205,15 +1645,9 @@ def Split(thisCurve, cutter, tolerance, multiple=False):
     Returns:
         Curve[]: An array of curves. This array can be empty.
     """
-    url = "rhino/geometry/curve/split-curve_brep_double"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, cutter, tolerance]
-    if multiple: args = zip(thisCurve, cutter, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/split-curve_brep_double_double", Util.DecodeToCommonObject)
 def Split1(thisCurve, cutter, tolerance, angleToleranceRadians, multiple=False):
     """
     Splits a curve into pieces using a polysurface.
@@ -2225,15 +1659,9 @@ def Split1(thisCurve, cutter, tolerance, angleToleranceRadians, multiple=False):
     Returns:
         Curve[]: An array of curves. This array can be empty.
     """
-    url = "rhino/geometry/curve/split-curve_brep_double_double"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, cutter, tolerance, angleToleranceRadians]
-    if multiple: args = zip(thisCurve, cutter, tolerance, angleToleranceRadians)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/split-curve_surface_double", Util.DecodeToCommonObject)
 def Split2(thisCurve, cutter, tolerance, multiple=False):
     """
     Splits a curve into pieces using a surface.
@@ -2245,15 +1673,9 @@ def Split2(thisCurve, cutter, tolerance, multiple=False):
     Returns:
         Curve[]: An array of curves. This array can be empty.
     """
-    url = "rhino/geometry/curve/split-curve_surface_double"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, cutter, tolerance]
-    if multiple: args = zip(thisCurve, cutter, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/split-curve_surface_double_double", Util.DecodeToCommonObject)
 def Split3(thisCurve, cutter, tolerance, angleToleranceRadians, multiple=False):
     """
     Splits a curve into pieces using a surface.
@@ -2265,15 +1687,9 @@ def Split3(thisCurve, cutter, tolerance, angleToleranceRadians, multiple=False):
     Returns:
         Curve[]: An array of curves. This array can be empty.
     """
-    url = "rhino/geometry/curve/split-curve_surface_double_double"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, cutter, tolerance, angleToleranceRadians]
-    if multiple: args = zip(thisCurve, cutter, tolerance, angleToleranceRadians)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/extend-curve_double_double", Util.DecodeToCommonObject)
 def Extend(thisCurve, t0, t1, multiple=False):
     """
     Where possible, analytically extends curve to include the given domain.
@@ -2289,15 +1705,9 @@ def Extend(thisCurve, t0, t1, multiple=False):
     Returns:
         Curve: Extended curve on success, None on failure.
     """
-    url = "rhino/geometry/curve/extend-curve_double_double"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, t0, t1]
-    if multiple: args = zip(thisCurve, t0, t1)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/extend-curve_interval", Util.DecodeToCommonObject)
 def Extend1(thisCurve, domain, multiple=False):
     """
     Where possible, analytically extends curve to include the given domain.
@@ -2310,15 +1720,9 @@ def Extend1(thisCurve, domain, multiple=False):
     Returns:
         Curve: Extended curve on success, None on failure.
     """
-    url = "rhino/geometry/curve/extend-curve_interval"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, domain]
-    if multiple: args = zip(thisCurve, domain)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/extend-curve_curveend_double_curveextensionstyle", Util.DecodeToCommonObject)
 def Extend2(thisCurve, side, length, style, multiple=False):
     """
     Extends a curve by a specific length.
@@ -2331,15 +1735,9 @@ def Extend2(thisCurve, side, length, style, multiple=False):
     Returns:
         Curve: A curve with extended ends or None on failure.
     """
-    url = "rhino/geometry/curve/extend-curve_curveend_double_curveextensionstyle"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, side, length, style]
-    if multiple: args = zip(thisCurve, side, length, style)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/extend-curve_curveend_curveextensionstyle_geometrybasearray", Util.DecodeToCommonObject)
 def Extend3(thisCurve, side, style, geometry, multiple=False):
     """
     Extends a curve until it intersects a collection of objects.
@@ -2352,15 +1750,9 @@ def Extend3(thisCurve, side, style, geometry, multiple=False):
     Returns:
         Curve: New extended curve result on success, None on failure.
     """
-    url = "rhino/geometry/curve/extend-curve_curveend_curveextensionstyle_geometrybasearray"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, side, style, geometry]
-    if multiple: args = zip(thisCurve, side, style, geometry)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/extend-curve_curveend_curveextensionstyle_point3d", Util.DecodeToCommonObject)
 def Extend4(thisCurve, side, style, endPoint, multiple=False):
     """
     Extends a curve to a point.
@@ -2373,15 +1765,9 @@ def Extend4(thisCurve, side, style, endPoint, multiple=False):
     Returns:
         Curve: New extended curve result on success, None on failure.
     """
-    url = "rhino/geometry/curve/extend-curve_curveend_curveextensionstyle_point3d"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, side, style, endPoint]
-    if multiple: args = zip(thisCurve, side, style, endPoint)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/extendonsurface-curve_curveend_surface", Util.DecodeToCommonObject)
 def ExtendOnSurface(thisCurve, side, surface, multiple=False):
     """
     Extends a curve on a surface.
@@ -2393,15 +1779,9 @@ def ExtendOnSurface(thisCurve, side, surface, multiple=False):
     Returns:
         Curve: New extended curve result on success, None on failure.
     """
-    url = "rhino/geometry/curve/extendonsurface-curve_curveend_surface"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, side, surface]
-    if multiple: args = zip(thisCurve, side, surface)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/extendonsurface-curve_curveend_brepface", Util.DecodeToCommonObject)
 def ExtendOnSurface1(thisCurve, side, face, multiple=False):
     """
     Extends a curve on a surface.
@@ -2413,15 +1793,9 @@ def ExtendOnSurface1(thisCurve, side, face, multiple=False):
     Returns:
         Curve: New extended curve result on success, None on failure.
     """
-    url = "rhino/geometry/curve/extendonsurface-curve_curveend_brepface"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, side, face]
-    if multiple: args = zip(thisCurve, side, face)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/extendbyline-curve_curveend_geometrybasearray", Util.DecodeToCommonObject)
 def ExtendByLine(thisCurve, side, geometry, multiple=False):
     """
     Extends a curve by a line until it intersects a collection of objects.
@@ -2433,15 +1807,9 @@ def ExtendByLine(thisCurve, side, geometry, multiple=False):
     Returns:
         Curve: New extended curve result on success, None on failure.
     """
-    url = "rhino/geometry/curve/extendbyline-curve_curveend_geometrybasearray"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, side, geometry]
-    if multiple: args = zip(thisCurve, side, geometry)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/extendbyarc-curve_curveend_geometrybasearray", Util.DecodeToCommonObject)
 def ExtendByArc(thisCurve, side, geometry, multiple=False):
     """
     Extends a curve by an Arc until it intersects a collection of objects.
@@ -2453,15 +1821,9 @@ def ExtendByArc(thisCurve, side, geometry, multiple=False):
     Returns:
         Curve: New extended curve result on success, None on failure.
     """
-    url = "rhino/geometry/curve/extendbyarc-curve_curveend_geometrybasearray"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, side, geometry]
-    if multiple: args = zip(thisCurve, side, geometry)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/simplify-curve_curvesimplifyoptions_double_double", Util.DecodeToCommonObject)
 def Simplify(thisCurve, options, distanceTolerance, angleToleranceRadians, multiple=False):
     """
     Returns a geometrically equivalent PolyCurve.
@@ -2488,15 +1850,9 @@ def Simplify(thisCurve, options, distanceTolerance, angleToleranceRadians, multi
     Returns:
         Curve: New simplified curve on success, None on failure.
     """
-    url = "rhino/geometry/curve/simplify-curve_curvesimplifyoptions_double_double"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, options, distanceTolerance, angleToleranceRadians]
-    if multiple: args = zip(thisCurve, options, distanceTolerance, angleToleranceRadians)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/simplifyend-curve_curveend_curvesimplifyoptions_double_double", Util.DecodeToCommonObject)
 def SimplifyEnd(thisCurve, end, options, distanceTolerance, angleToleranceRadians, multiple=False):
     """
     Same as SimplifyCurve, but simplifies only the last two segments at "side" end.
@@ -2511,15 +1867,9 @@ def SimplifyEnd(thisCurve, end, options, distanceTolerance, angleToleranceRadian
     Returns:
         Curve: New simplified curve on success, None on failure.
     """
-    url = "rhino/geometry/curve/simplifyend-curve_curveend_curvesimplifyoptions_double_double"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, end, options, distanceTolerance, angleToleranceRadians]
-    if multiple: args = zip(thisCurve, end, options, distanceTolerance, angleToleranceRadians)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/fair-curve_double_double_int_int_int", Util.DecodeToCommonObject)
 def Fair(thisCurve, distanceTolerance, angleTolerance, clampStart, clampEnd, iterations, multiple=False):
     """
     Fairs a curve object. Fair works best on degree 3 (cubic) curves. Attempts to
@@ -2537,15 +1887,9 @@ def Fair(thisCurve, distanceTolerance, angleTolerance, clampStart, clampEnd, ite
     Returns:
         Curve: Returns new faired Curve on success, None on failure.
     """
-    url = "rhino/geometry/curve/fair-curve_double_double_int_int_int"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, distanceTolerance, angleTolerance, clampStart, clampEnd, iterations]
-    if multiple: args = zip(thisCurve, distanceTolerance, angleTolerance, clampStart, clampEnd, iterations)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/fit-curve_int_double_double", Util.DecodeToCommonObject)
 def Fit(thisCurve, degree, fitTolerance, angleTolerance, multiple=False):
     """
     Fits a new curve through an existing curve.
@@ -2560,15 +1904,9 @@ def Fit(thisCurve, degree, fitTolerance, angleTolerance, multiple=False):
     Returns:
         Curve: Returns a new fitted Curve if successful, None on failure.
     """
-    url = "rhino/geometry/curve/fit-curve_int_double_double"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, degree, fitTolerance, angleTolerance]
-    if multiple: args = zip(thisCurve, degree, fitTolerance, angleTolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/rebuild-curve_int_int_bool", Util.DecodeToCommonObject)
 def Rebuild(thisCurve, pointCount, degree, preserveTangents, multiple=False):
     """
     Rebuild a curve with a specific point count.
@@ -2581,15 +1919,9 @@ def Rebuild(thisCurve, pointCount, degree, preserveTangents, multiple=False):
     Returns:
         NurbsCurve: A Nurbs curve on success or None on failure.
     """
-    url = "rhino/geometry/curve/rebuild-curve_int_int_bool"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, pointCount, degree, preserveTangents]
-    if multiple: args = zip(thisCurve, pointCount, degree, preserveTangents)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/topolyline-curve_int_int_double_double_double_double_double_double_bool")
 def ToPolyline(thisCurve, mainSegmentCount, subSegmentCount, maxAngleRadians, maxChordLengthRatio, maxAspectRatio, tolerance, minEdgeLength, maxEdgeLength, keepStartPoint, multiple=False):
     """
     Gets a polyline approximation of a curve.
@@ -2625,14 +1957,9 @@ def ToPolyline(thisCurve, mainSegmentCount, subSegmentCount, maxAngleRadians, ma
     Returns:
         PolylineCurve: PolylineCurve on success, None on error.
     """
-    url = "rhino/geometry/curve/topolyline-curve_int_int_double_double_double_double_double_double_bool"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, mainSegmentCount, subSegmentCount, maxAngleRadians, maxChordLengthRatio, maxAspectRatio, tolerance, minEdgeLength, maxEdgeLength, keepStartPoint]
-    if multiple: args = zip(thisCurve, mainSegmentCount, subSegmentCount, maxAngleRadians, maxChordLengthRatio, maxAspectRatio, tolerance, minEdgeLength, maxEdgeLength, keepStartPoint)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/topolyline-curve_int_int_double_double_double_double_double_double_bool_interval")
 def ToPolyline1(thisCurve, mainSegmentCount, subSegmentCount, maxAngleRadians, maxChordLengthRatio, maxAspectRatio, tolerance, minEdgeLength, maxEdgeLength, keepStartPoint, curveDomain, multiple=False):
     """
     Gets a polyline approximation of a curve.
@@ -2669,14 +1996,9 @@ def ToPolyline1(thisCurve, mainSegmentCount, subSegmentCount, maxAngleRadians, m
     Returns:
         PolylineCurve: PolylineCurve on success, None on error.
     """
-    url = "rhino/geometry/curve/topolyline-curve_int_int_double_double_double_double_double_double_bool_interval"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, mainSegmentCount, subSegmentCount, maxAngleRadians, maxChordLengthRatio, maxAspectRatio, tolerance, minEdgeLength, maxEdgeLength, keepStartPoint, curveDomain]
-    if multiple: args = zip(thisCurve, mainSegmentCount, subSegmentCount, maxAngleRadians, maxChordLengthRatio, maxAspectRatio, tolerance, minEdgeLength, maxEdgeLength, keepStartPoint, curveDomain)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/topolyline-curve_double_double_double_double")
 def ToPolyline2(thisCurve, tolerance, angleTolerance, minimumLength, maximumLength, multiple=False):
     """
     Gets a polyline approximation of a curve.
@@ -2690,14 +2012,9 @@ def ToPolyline2(thisCurve, tolerance, angleTolerance, minimumLength, maximumLeng
     Returns:
         PolylineCurve: PolyCurve on success, None on error.
     """
-    url = "rhino/geometry/curve/topolyline-curve_double_double_double_double"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, tolerance, angleTolerance, minimumLength, maximumLength]
-    if multiple: args = zip(thisCurve, tolerance, angleTolerance, minimumLength, maximumLength)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/toarcsandlines-curve_double_double_double_double")
 def ToArcsAndLines(thisCurve, tolerance, angleTolerance, minimumLength, maximumLength, multiple=False):
     """
     Converts a curve into polycurve consisting of arc segments. Sections of the input curves that are nearly straight are converted to straight-line segments.
@@ -2711,14 +2028,9 @@ def ToArcsAndLines(thisCurve, tolerance, angleTolerance, minimumLength, maximumL
     Returns:
         PolyCurve: PolyCurve on success, None on error.
     """
-    url = "rhino/geometry/curve/toarcsandlines-curve_double_double_double_double"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, tolerance, angleTolerance, minimumLength, maximumLength]
-    if multiple: args = zip(thisCurve, tolerance, angleTolerance, minimumLength, maximumLength)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/pulltomesh-curve_mesh_double")
 def PullToMesh(thisCurve, mesh, tolerance, multiple=False):
     """
     Makes a polyline approximation of the curve and gets the closest point on the mesh for each point on the curve.
@@ -2731,14 +2043,9 @@ def PullToMesh(thisCurve, mesh, tolerance, multiple=False):
     Returns:
         PolylineCurve: A polyline curve on success, None on failure.
     """
-    url = "rhino/geometry/curve/pulltomesh-curve_mesh_double"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, mesh, tolerance]
-    if multiple: args = zip(thisCurve, mesh, tolerance)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/offset-curve_plane_double_double_curveoffsetcornerstyle", Util.DecodeToCommonObject)
 def Offset(thisCurve, plane, distance, tolerance, cornerStyle, multiple=False):
     """
     Offsets this curve. If you have a nice offset, then there will be one entry in
@@ -2754,15 +2061,9 @@ def Offset(thisCurve, plane, distance, tolerance, cornerStyle, multiple=False):
     Returns:
         Curve[]: Offset curves on success, None on failure.
     """
-    url = "rhino/geometry/curve/offset-curve_plane_double_double_curveoffsetcornerstyle"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, plane, distance, tolerance, cornerStyle]
-    if multiple: args = zip(thisCurve, plane, distance, tolerance, cornerStyle)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/offset-curve_point3d_vector3d_double_double_curveoffsetcornerstyle", Util.DecodeToCommonObject)
 def Offset1(thisCurve, directionPoint, normal, distance, tolerance, cornerStyle, multiple=False):
     """
     Offsets this curve. If you have a nice offset, then there will be one entry in
@@ -2779,15 +2080,9 @@ def Offset1(thisCurve, directionPoint, normal, distance, tolerance, cornerStyle,
     Returns:
         Curve[]: Offset curves on success, None on failure.
     """
-    url = "rhino/geometry/curve/offset-curve_point3d_vector3d_double_double_curveoffsetcornerstyle"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, directionPoint, normal, distance, tolerance, cornerStyle]
-    if multiple: args = zip(thisCurve, directionPoint, normal, distance, tolerance, cornerStyle)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/ribbonoffset-curve_double_double_point3d_vector3d_double", Util.DecodeToCommonObject)
 def RibbonOffset(thisCurve, distance, blendRadius, directionPoint, normal, tolerance, multiple=False):
     """
     Offsets a closed curve in the following way: pProject the curve to a plane with given normal.
@@ -2808,15 +2103,9 @@ def RibbonOffset(thisCurve, distance, blendRadius, directionPoint, normal, toler
     Returns:
         Curve: The offset curve if successful.
     """
-    url = "rhino/geometry/curve/ribbonoffset-curve_double_double_point3d_vector3d_double"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, distance, blendRadius, directionPoint, normal, tolerance]
-    if multiple: args = zip(thisCurve, distance, blendRadius, directionPoint, normal, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/offsetonsurface-curve_brepface_double_double", Util.DecodeToCommonObject)
 def OffsetOnSurface(thisCurve, face, distance, fittingTolerance, multiple=False):
     """
     Offset this curve on a brep face surface. This curve must lie on the surface.
@@ -2829,15 +2118,9 @@ def OffsetOnSurface(thisCurve, face, distance, fittingTolerance, multiple=False)
     Returns:
         Curve[]: Offset curves on success, or None on failure.
     """
-    url = "rhino/geometry/curve/offsetonsurface-curve_brepface_double_double"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, face, distance, fittingTolerance]
-    if multiple: args = zip(thisCurve, face, distance, fittingTolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/offsetonsurface-curve_brepface_point2d_double", Util.DecodeToCommonObject)
 def OffsetOnSurface1(thisCurve, face, throughPoint, fittingTolerance, multiple=False):
     """
     Offset a curve on a brep face surface. This curve must lie on the surface.
@@ -2851,15 +2134,9 @@ def OffsetOnSurface1(thisCurve, face, throughPoint, fittingTolerance, multiple=F
     Returns:
         Curve[]: Offset curves on success, or None on failure.
     """
-    url = "rhino/geometry/curve/offsetonsurface-curve_brepface_point2d_double"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, face, throughPoint, fittingTolerance]
-    if multiple: args = zip(thisCurve, face, throughPoint, fittingTolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/offsetonsurface-curve_brepface_doublearray_doublearray_double", Util.DecodeToCommonObject)
 def OffsetOnSurface2(thisCurve, face, curveParameters, offsetDistances, fittingTolerance, multiple=False):
     """
     Offset a curve on a brep face surface. This curve must lie on the surface.
@@ -2874,15 +2151,9 @@ def OffsetOnSurface2(thisCurve, face, curveParameters, offsetDistances, fittingT
     Returns:
         Curve[]: Offset curves on success, or None on failure.
     """
-    url = "rhino/geometry/curve/offsetonsurface-curve_brepface_doublearray_doublearray_double"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, face, curveParameters, offsetDistances, fittingTolerance]
-    if multiple: args = zip(thisCurve, face, curveParameters, offsetDistances, fittingTolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/offsetonsurface-curve_surface_double_double", Util.DecodeToCommonObject)
 def OffsetOnSurface3(thisCurve, surface, distance, fittingTolerance, multiple=False):
     """
     Offset a curve on a surface. This curve must lie on the surface.
@@ -2895,15 +2166,9 @@ def OffsetOnSurface3(thisCurve, surface, distance, fittingTolerance, multiple=Fa
     Returns:
         Curve[]: Offset curves on success, or None on failure.
     """
-    url = "rhino/geometry/curve/offsetonsurface-curve_surface_double_double"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, surface, distance, fittingTolerance]
-    if multiple: args = zip(thisCurve, surface, distance, fittingTolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/offsetonsurface-curve_surface_point2d_double", Util.DecodeToCommonObject)
 def OffsetOnSurface4(thisCurve, surface, throughPoint, fittingTolerance, multiple=False):
     """
     Offset a curve on a surface. This curve must lie on the surface.
@@ -2917,15 +2182,9 @@ def OffsetOnSurface4(thisCurve, surface, throughPoint, fittingTolerance, multipl
     Returns:
         Curve[]: Offset curves on success, or None on failure.
     """
-    url = "rhino/geometry/curve/offsetonsurface-curve_surface_point2d_double"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, surface, throughPoint, fittingTolerance]
-    if multiple: args = zip(thisCurve, surface, throughPoint, fittingTolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/offsetonsurface-curve_surface_doublearray_doublearray_double", Util.DecodeToCommonObject)
 def OffsetOnSurface5(thisCurve, surface, curveParameters, offsetDistances, fittingTolerance, multiple=False):
     """
     Offset this curve on a surface. This curve must lie on the surface.
@@ -2940,15 +2199,9 @@ def OffsetOnSurface5(thisCurve, surface, curveParameters, offsetDistances, fitti
     Returns:
         Curve[]: Offset curves on success, or None on failure.
     """
-    url = "rhino/geometry/curve/offsetonsurface-curve_surface_doublearray_doublearray_double"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, surface, curveParameters, offsetDistances, fittingTolerance]
-    if multiple: args = zip(thisCurve, surface, curveParameters, offsetDistances, fittingTolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/pulltobrepface-curve_brepface_double", Util.DecodeToCommonObject)
 def PullToBrepFace1(thisCurve, face, tolerance, multiple=False):
     """
     Pulls this curve to a brep face and returns the result of that operation.
@@ -2960,15 +2213,9 @@ def PullToBrepFace1(thisCurve, face, tolerance, multiple=False):
     Returns:
         Curve[]: An array containing the resulting curves after pulling. This array could be empty.
     """
-    url = "rhino/geometry/curve/pulltobrepface-curve_brepface_double"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, face, tolerance]
-    if multiple: args = zip(thisCurve, face, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/curve/offsetnormaltosurface-curve_surface_double", Util.DecodeToCommonObject)
 def OffsetNormalToSurface(thisCurve, surface, height, multiple=False):
     """
     Finds a curve by offsetting an existing curve normal to a surface.
@@ -2983,11 +2230,4 @@ def OffsetNormalToSurface(thisCurve, surface, height, multiple=False):
         interpolated through a small number of points so if the surface is irregular
         or complicated, the result will not be a very accurate offset.
     """
-    url = "rhino/geometry/curve/offsetnormaltosurface-curve_surface_double"
-    if multiple: url += "?multiple=true"
-    args = [thisCurve, surface, height]
-    if multiple: args = zip(thisCurve, surface, height)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
@@ -1,6 +1,7 @@
 from . import Util
 
 
+@Util.Endpoint("rhino/geometry/extrusion/getwireframe-extrusion", Util.DecodeToCommonObject)
 def GetWireframe(thisExtrusion, multiple=False):
     """
     Constructs all the Wireframe curves for this Extrusion.
@@ -8,11 +9,4 @@ def GetWireframe(thisExtrusion, multiple=False):
     Returns:
         Curve[]: An array of Wireframe curves.
     """
-    url = "rhino/geometry/extrusion/getwireframe-extrusion"
-    if multiple: url += "?multiple=true"
-    args = [thisExtrusion]
-    if multiple: args = [[item] for item in thisExtrusion]
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
@@ -1,12 +1,51 @@
 from . import Util
 import base64
+import collections
+import collections.abc
+import hashlib
 import io
+import itertools
+import json
 import os
+import re
+import threading
+
+# number of encoded definition files kept in memory. Entries are keyed by
+# path, modification time and size, so an edited file is read again
+definitionCacheSize = 16
+
+_definitions = collections.OrderedDict()
+# the server's cache keys ('pointer' of responses) of definitions already
+# sent, by base url (or NodePool) of the server and sha256 of the encoded
+# definition
+_pointers = {}
+_lock = threading.Lock()
 
 
 class DataTree:
+    """
+    A named tree of items passed to EvaluateDefinition. Branches hold their
+    items as given (lists or NumPy arrays); they are converted to the
+    {'data': item} form compute expects only when the tree is encoded.
+
+    `data` is the {'ParamName': ..., 'InnerTree': ...} dict sent to compute.
+    Its InnerTree is a dict that can still be edited in place in the
+    {'data': item} form: reading a branch from it converts that branch, and
+    assigning one stores it as is.
+    """
     def __init__(self, name):
-        self.data = {'ParamName': name, 'InnerTree': {}}
+        innerTree = _InnerTree()
+        # path key ('0;1') -> items
+        self.branches = _Branches(innerTree)
+        self.data = {'ParamName': name, 'InnerTree': innerTree}
+
+    @property
+    def name(self):
+        return self.data['ParamName']
+
+    @name.setter
+    def name(self, name):
+        self.data['ParamName'] = name
 
     def Append(self, path, items):
         """
@@ -16,44 +55,491 @@ class DataTree:
             path (iter): a list of integers defining a path
             items (list): list of data to add to the tree
         """
-        key = ''
-        for item in path:
-            if len(key) == 0:
-                key = '{}'.format(item)
-                continue
-            key = '{};{}'.format(key, item)
+        self.branches[_PathKey(path)] = items
+
+    @classmethod
+    def FromDict(cls, name, branches):
+        """
+        Create a tree from a dict of branches
+
+        Args:
+            name (str): parameter name
+            branches (dict): items by path, a list of integers like (0, 1) or
+                             a string like '0;1'
+        """
+        tree = cls(name)
+        tree.branches.update((path if isinstance(path, str) else _PathKey(path), items)
+                             for path, items in branches.items())
+        return tree
+
+    @classmethod
+    def FromLists(cls, name, nested):
+        """
+        Create a tree from nested lists. A list of items becomes a branch and a
+        list of lists a level of the path: [[1, 2], [3]] has the branches 0
+        and 1 and [1, 2, 3] the branch 0.
+
+        Args:
+            name (str): parameter name
+            nested (list): items, lists of items, lists of lists of items...
+        """
+        tree = cls(name)
+        if _IsLeaf(nested):
+            tree.branches['0'] = nested
+        else:
+            _AddBranches(tree.branches, nested, '')
+        return tree
+
+    @classmethod
+    def FromNumpy(cls, name, array, points=False):
+        """
+        Create a tree from a NumPy array without copying it. The last axis
+        holds the items of a branch and the other axes make up the path:
+        shape (10,) is one branch of 10 numbers and (4, 10) 4 branches of 10
+        numbers. With points=True the last axis holds x, y and z: shape
+        (4, 10, 3) is 4 branches of 10 points.
+
+        Args:
+            name (str): parameter name
+            array (numpy.ndarray): numbers or points
+            points (bool): the last axis of array has length 3 and holds
+                           point coordinates, which must be finite
+        """
+        tree = cls(name)
+        itemAxes = 2 if points else 1
+        if points and array.shape[-1] != 3:
+            raise ValueError('points require an array of shape (..., 3)')
+        if points:
+            import numpy
+            # their coordinates are formatted into JSON, which has no NaN
+            if not numpy.isfinite(array).all():
+                raise ValueError('points must not have NaN or infinite coordinates')
+        if array.ndim == itemAxes:
+            tree.branches['0'] = _Points(array) if points else array
+            return tree
+        paths = array.shape[:-itemAxes]
+        if len(paths) == 1:
+            keys = map(str, range(paths[0]))
+        else:
+            keys = map(_PathKey, itertools.product(*map(range, paths)))
+        rows = array.reshape((-1,) + array.shape[-itemAxes:])
+        tree.branches.update(zip(keys, map(_Points, rows) if points else rows))
+        return tree
+
+
+def _PathKey(path):
+    return ';'.join(map(str, path))
+
+
+def _IsLeaf(items):
+    return not items or not all(isinstance(item, (list, tuple)) for item in items)
+
+
+def _AddBranches(branches, nested, prefix):
+    for i, items in enumerate(nested):
+        key = prefix + str(i)
+        if _IsLeaf(items):
+            branches[key] = items
+        else:
+            _AddBranches(branches, items, key + ';')
+
+
+class _Points:
+    # an (N, 3) array of points in a DataTree branch
+    __slots__ = ('array',)
+
+    def __init__(self, array):
+        self.array = array
+
+    def __len__(self):
+        return len(self.array)
+
+
+class _Branch:
+    # items of a DataTree branch as given, converted to the {'data': item}
+    # form by the JSON and msgpack encoders
+    __slots__ = ('items',)
+
+    def __init__(self, items):
+        self.items = items
+
+    def Encode(self):
+        return [{'data': item} for item in _BranchItems(self.items)]
+
+
+def _BranchItems(items):
+    if isinstance(items, _Points):
+        return ['{{"X":{!r},"Y":{!r},"Z":{!r}}}'.format(x, y, z)
+                for x, y, z in items.array.tolist()]
+    if Util._IsNumpy(items):
+        return items.tolist()
+    return items
+
+
+class _InnerTree(dict):
+    # the InnerTree of DataTree.data. Branches not read yet are stored as
+    # _Branch and converted by the encoders; reading them through the dict
+    # converts and keeps them, so they can be edited in place
+    def __getitem__(self, key):
+        items = dict.__getitem__(self, key)
+        if type(items) is _Branch:
+            items = items.Encode()
+            dict.__setitem__(self, key, items)
+        return items
+
+    def __iter__(self):
+        # overridden so dict(tree) and {**tree} read the branches through
+        # __getitem__ instead of copying them unconverted
+        return dict.__iter__(self)
+
+    def _Convert(self):
+        for key in self:
+            self[key]
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def items(self):
+        self._Convert()
+        return dict.items(self)
+
+    def values(self):
+        self._Convert()
+        return dict.values(self)
+
+    def pop(self, key, *default):
+        if key in self: self[key]
+        return dict.pop(self, key, *default)
+
+    def popitem(self):
+        self._Convert()
+        return dict.popitem(self)
+
+    def setdefault(self, key, default=None):
+        if key in self: return self[key]
+        return dict.setdefault(self, key, default)
+
+    def copy(self):
+        return dict(self)
+
+    def __eq__(self, other):
+        self._Convert()
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other):
+        self._Convert()
+        return dict.__ne__(self, other)
+
+    def __repr__(self):
+        self._Convert()
+        return dict.__repr__(self)
+
+
+class _Branches(collections.abc.MutableMapping):
+    # DataTree.branches: the items of every branch as given, stored in the
+    # InnerTree of DataTree.data
+    def __init__(self, innerTree):
+        self._innerTree = innerTree
+
+    def __getitem__(self, key):
+        items = dict.__getitem__(self._innerTree, key)
+        return items.items if type(items) is _Branch else items
+
+    def __setitem__(self, key, items):
+        dict.__setitem__(self._innerTree, key, _Branch(items))
+
+    def __delitem__(self, key):
+        dict.__delitem__(self._innerTree, key)
+
+    def __iter__(self):
+        return dict.__iter__(self._innerTree)
+
+    def __len__(self):
+        return len(self._innerTree)
 
-        self.data['InnerTree'][key] = [{'data': item} for item in items]
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+
+class Result(dict):
+    """
+    The response of EvaluateDefinition. It is the response dict itself, with
+    'values' and 'pointer' entries as sent by the server, and gives the
+    outputs by parameter name. Items are decoded a branch at a time when
+    first read, so outputs that are never read cost nothing to decode.
+
+        >>> result = EvaluateDefinition('definition.gh', trees)
+        >>> result.names
+        ['RH_OUT:mesh', 'RH_OUT:heights']
+        >>> result.Output('RH_OUT:mesh')['0']
+        [<rhino3dm._rhino3dm.Mesh object at ...>]
+        >>> result.Output('heights').ToNumpy()
+        array([1.5, 2.5, 3.5])
+    """
+    def __init__(self, response):
+        dict.__init__(self, response)
+        self._outputs = None
+
+    @property
+    def names(self):
+        """ParamName of every output, in the order the server sent them"""
+        return list(self._Outputs())
+
+    def Output(self, name):
+        """
+        Get an output by its ParamName. The 'RH_OUT:' prefix may be left out.
+
+        Args:
+            name (str): parameter name
+        Returns:
+            Output
+        """
+        outputs = self._Outputs()
+        output = outputs.get(name)
+        if output is None:
+            output = outputs.get('RH_OUT:' + name)
+        if output is None:
+            raise KeyError(name)
+        return output
+
+    def _Outputs(self):
+        if self._outputs is None:
+            self._outputs = {value['ParamName']: Output(value['ParamName'], value.get('InnerTree') or {})
+                             for value in self.get('values') or ()}
+        return self._outputs
+
+
+class Output(collections.abc.Mapping):
+    """
+    One output of a Result: a mapping of path ('0;1') to the decoded items of
+    the branch. Rhino.Geometry objects become rhino3dm objects, as do
+    points, vectors, lines, planes, intervals, bounding boxes and spheres.
+    Other value types (circles, arcs, boxes...) stay the dicts compute
+    sends, and numbers, booleans and strings become Python values.
+    """
+    def __init__(self, name, innerTree):
+        self.name = name
+        self.innerTree = innerTree
+        self._branches = {}
+
+    def __repr__(self):
+        return 'Output({!r}, {} branches)'.format(self.name, len(self.innerTree))
+
+    def __getitem__(self, path):
+        if not isinstance(path, str):
+            path = _PathKey(path)
+        branch = self._branches.get(path)
+        if branch is None:
+            branch = self._branches[path] = [_DecodeItem(item) for item in self._Items(path)]
+        return branch
+
+    def __iter__(self):
+        return (_OutputPath(key) for key in self.innerTree)
+
+    def __len__(self):
+        return len(self.innerTree)
+
+    def Values(self):
+        """Get the decoded items of all branches as one list"""
+        return [item for path in self for item in self[path]]
+
+    def ToNumpy(self, path=None):
+        """
+        Get numbers or points as a float64 NumPy array, without creating
+        Python objects per item. Numbers become an array of shape (N,) and
+        points or vectors one of shape (N, 3). Requires the numpy package.
+
+        Args:
+            path (str | iter): branch to get. Defaults to the items of all
+                               branches
+        Returns:
+            numpy.ndarray
+        """
+        import numpy
+        if path is None:
+            items = [item for key in self.innerTree for item in self.innerTree[key]]
+        else:
+            items = self._Items(path if isinstance(path, str) else _PathKey(path))
+        itemType = items[0].get('type', '') if items else ''
+        if itemType.endswith(('.Point3d', '.Vector3d')):
+            return Util.DecodeToNumpy([_Parse(item.get('data')) for item in items])
+        data = [item.get('data') for item in items]
+        try:
+            return numpy.fromiter(map(float, data), dtype=numpy.float64, count=len(data))
+        except (TypeError, ValueError):
+            return numpy.array([_Parse(x) for x in data], dtype=numpy.float64)
+
+    def _Items(self, path):
+        items = self.innerTree.get('{' + path + '}')
+        if items is None:
+            items = self.innerTree.get(path)
+        if items is None:
+            raise KeyError(path)
+        return items
+
+
+def _OutputPath(key):
+    # '{0;1}' -> '0;1'
+    return key[1:-1] if key.startswith('{') else key
+
+
+def _Parse(data):
+    if not isinstance(data, str):
+        return data
+    try:
+        return json.loads(data)
+    except ValueError:
+        # plain text of a string output
+        return data
+
+
+def _DecodeItem(item):
+    value = _Parse(item.get('data'))
+    itemType = item.get('type', '')
+    if not isinstance(value, dict) or not itemType.startswith('Rhino.Geometry.'):
+        return value
+    import rhino3dm
+    if 'archive3dm' in value:
+        return Util.DecodeToCommonObject(value)
+    typeName = itemType.rpartition('.')[2]
+    if typeName in ('Point3d', 'Vector3d'):
+        return Util._DecodeXYZ(value, getattr(rhino3dm, typeName))
+    if typeName == 'Line':
+        return Util._DecodeLine(value, rhino3dm)
+    if typeName in _decodableTypes:
+        return getattr(rhino3dm, typeName).Decode(value)
+    if typeName == 'Interval':
+        return rhino3dm.Interval(value['T0'], value['T1'])
+    # other value types (Circle, Arc, Box...) stay the parsed dict
+    return value
+
+
+# value types rhino3dm decodes from their JSON form
+_decodableTypes = ('Plane', 'BoundingBox', 'Sphere')
+
+
+def _Result(response):
+    if isinstance(response, Util.PendingFetch):
+        return response.Then(Result)
+    return Result(response)
 
 
 def EvaluateDefinition(definition, trees):
     """
     Evaluate a grasshopper definition on the compute server.
 
+    A definition that was sent before is referred to by the cache key the
+    server answered with, and only sent again if the server no longer has
+    it. Definition files are read and encoded once until they change.
+
     Args:
         definition (str): path to a grasshopper definition
         trees (iter): list of DataTree instances
     Returns:
+        Result
     """
     url = "grasshopper"
     args = {'algo': None, 'pointer': None, 'values': None}
+    args['values'] = [tree.data for tree in trees]
     if definition.startswith('http:') or definition.startswith('https:'):
         args['pointer'] = definition
-    else:
-        encoded = None
-        if os.path.isfile(definition):
-            if(definition.endswith('gh')):
-                with open(definition, 'rb') as gh:
-                    content_bytes = gh.read()
-                    encoded = base64.b64encode(content_bytes)
-            else:
-                with io.open(definition, 'r', encoding='utf-8-sig') as ghx:
-                    definition = ghx.read()
-        if not encoded:
-            encoded = base64.b64encode(definition.encode('utf-8'))
-        args['algo'] = str(encoded, 'utf-8')
+        return _Result(Util.ComputeFetch(url, args))
 
-    args['values'] = [tree.data for tree in trees]
+    algo, digest = _EncodeDefinition(definition)
+    key = (Util._Setting(Util._client.get(), 'url'), digest)
+    with _lock:
+        pointer = _pointers.get(key)
+    if pointer is not None:
+        args['pointer'] = pointer
+        try:
+            response = Util.ComputeFetch(url, args)
+        except Util.ComputeHTTPError as e:
+            if not _IsCacheMiss(e): raise
+            _ForgetPointer(key, pointer)
+            args['pointer'] = None
+        else:
+            if isinstance(response, Util.PendingFetch):
+                # async calls send the definition from the fallback
+                fullArgs = dict(args, algo=algo, pointer=None)
+                return (response.Otherwise(lambda e: _Resend(key, pointer, fullArgs, e))
+                        .Then(lambda r: Result(_RememberPointer(key, r))))
+            return Result(response)
+    args['algo'] = algo
     response = Util.ComputeFetch(url, args)
+    if isinstance(response, Util.PendingFetch):
+        return response.Then(lambda r: Result(_RememberPointer(key, r)))
+    return Result(_RememberPointer(key, response))
+
+
+def _EncodeDefinition(definition):
+    # get the base64 encoded definition and its hash
+    cacheKey = None
+    if os.path.isfile(definition):
+        stat = os.stat(definition)
+        cacheKey = (os.path.abspath(definition), stat.st_mtime_ns, stat.st_size)
+        with _lock:
+            entry = _definitions.get(cacheKey)
+            if entry is not None:
+                _definitions.move_to_end(cacheKey)
+                return entry
+        if(definition.endswith('gh')):
+            with open(definition, 'rb') as gh:
+                content_bytes = gh.read()
+        else:
+            with io.open(definition, 'r', encoding='utf-8-sig') as ghx:
+                content_bytes = ghx.read().encode('utf-8')
+    else:
+        content_bytes = definition.encode('utf-8')
+    encoded = str(base64.b64encode(content_bytes), 'utf-8')
+    entry = (encoded, hashlib.sha256(content_bytes).hexdigest())
+    if cacheKey is not None and definitionCacheSize > 0:
+        with _lock:
+            _definitions[cacheKey] = entry
+            while len(_definitions) > definitionCacheSize:
+                _definitions.popitem(last=False)
+    return entry
+
+
+# how compute answers a pointer it does not hold: a 500 with a message like
+# 'Unable to find definition in cache' or 'Unable to load grasshopper
+# definition'. Any other failure is reported as is, without sending the
+# definition again
+_cacheMiss = re.compile(r'unable to (find|load)\b.*\bdefinition', re.IGNORECASE)
+
+
+def _IsCacheMiss(e):
+    return e.status in (404, 410) or (e.status == 500 and _cacheMiss.search(e.body or '') is not None)
+
+
+def _ForgetPointer(key, pointer):
+    # the server dropped the definition from its cache, or never had it
+    # (another server of a NodePool)
+    with _lock:
+        if _pointers.get(key) == pointer:
+            del _pointers[key]
+
+
+def _Resend(key, pointer, fullArgs, e):
+    if not isinstance(e, Util.ComputeHTTPError) or not _IsCacheMiss(e):
+        return None
+    _ForgetPointer(key, pointer)
+    return fullArgs
+
+
+def _RememberPointer(key, response):
+    pointer = response.get('pointer') if isinstance(response, dict) else None
+    if isinstance(pointer, str) and pointer:
+        with _lock:
+            _pointers[key] = pointer
     return response
 
+
+def ClearDefinitionCache():
+    """
+    Forget the encoded definition files and the server cache keys, so every
+    definition is read and sent in full on its next evaluation
+    """
+    with _lock:
+        _definitions.clear()
+        _pointers.clear()
+
@@ -0,0 +1,171 @@
+"""
+Per-call timings and payload sizes of compute calls.
+
+Set a hook, any callable taking a CallEvent, for the module level functions
+or per client:
+
+    >>> Util.instrumentation = LogHook()
+    >>> client = ComputeClient(instrumentation=Combine(PrometheusHook(), OpenTelemetryHook()))
+
+The hook is called once every call has finished, from the thread or task
+that made it. Without a hook only a context variable lookup per call is
+spent on instrumentation.
+"""
+import logging
+import time
+
+
+class CallEvent:
+    """
+    Timings in seconds and sizes in bytes of one call. Values that were not
+    measured for a call are None, e.g. encodeTime of a streamed request or
+    decodeTime of a call made with Util.ComputeFetch directly.
+    """
+    __slots__ = ('endpoint', 'startTime', 'totalTime', 'encodeTime', 'requestBytes',
+                 'timeToFirstByte', 'serverTime', 'responseBytes', 'parseTime',
+                 'decodeTime', 'attempts', 'cached', 'status', 'error', '_started')
+
+    def __init__(self, endpoint):
+        self.endpoint = endpoint
+        # time.time() when the call was made
+        self.startTime = time.time()
+        self.totalTime = None
+        self.encodeTime = None
+        self.requestBytes = None
+        self.timeToFirstByte = None
+        # from the Server-Timing header of the response, if the server sent one
+        self.serverTime = None
+        self.responseBytes = None
+        self.parseTime = None
+        self.decodeTime = None
+        # number of requests sent, more than 1 when the call was retried
+        self.attempts = 0
+        # True if the response came from the response cache
+        self.cached = False
+        self.status = None
+        # the exception the call failed with
+        self.error = None
+        self._started = time.perf_counter()
+
+    def __repr__(self):
+        return 'CallEvent({!r}, {:.3f}s)'.format(self.endpoint, self.totalTime or 0.0)
+
+    def Finish(self, error=None):
+        self.totalTime = time.perf_counter() - self._started
+        self.error = error
+
+
+def Combine(*hooks):
+    """Get a hook calling every one of several hooks"""
+    def combined(event):
+        for hook in hooks:
+            hook(event)
+    return combined
+
+
+def _Milliseconds(seconds):
+    return '-' if seconds is None else '{:.1f}ms'.format(seconds * 1000)
+
+
+class LogHook:
+    """
+    Writes a line per call to a logging.Logger
+    """
+    def __init__(self, logger=None, level=logging.INFO):
+        """
+        Args:
+            logger (logging.Logger): defaults to the 'compute_rhino3d' logger
+            level (int): level of successful calls. Failed calls are logged as
+                         warnings
+        """
+        self.logger = logger or logging.getLogger('compute_rhino3d')
+        self.level = level
+
+    def __call__(self, event):
+        level = self.level if event.error is None else logging.WARNING
+        if not self.logger.isEnabledFor(level):
+            return
+        self.logger.log(level, '%s %s total=%s encode=%s sent=%s ttfb=%s server=%s '
+                        'received=%s parse=%s decode=%s attempts=%d%s',
+                        event.endpoint, 'failed: ' + str(event.error) if event.error else 'ok',
+                        _Milliseconds(event.totalTime), _Milliseconds(event.encodeTime),
+                        event.requestBytes, _Milliseconds(event.timeToFirstByte),
+                        _Milliseconds(event.serverTime), event.responseBytes,
+                        _Milliseconds(event.parseTime), _Milliseconds(event.decodeTime),
+                        event.attempts, ' cached' if event.cached else '')
+
+
+class PrometheusHook:
+    """
+    Counts calls, failures and bytes and records call durations in
+    prometheus_client metrics, labelled by endpoint. Requires the
+    prometheus_client package.
+    """
+    def __init__(self, registry=None, prefix='compute_rhino3d'):
+        """
+        Args:
+            registry (prometheus_client.CollectorRegistry): defaults to the
+                                                            global registry
+            prefix (str): prefix of the metric names
+        """
+        import prometheus_client
+        kwargs = {} if registry is None else {'registry': registry}
+        labels = ['endpoint']
+        self.calls = prometheus_client.Counter(
+            prefix + '_calls', 'Compute calls made', labels, **kwargs)
+        self.failures = prometheus_client.Counter(
+            prefix + '_failures', 'Compute calls that failed', labels, **kwargs)
+        self.cacheHits = prometheus_client.Counter(
+            prefix + '_cache_hits', 'Compute calls answered from the cache', labels, **kwargs)
+        self.requestBytes = prometheus_client.Counter(
+            prefix + '_request_bytes', 'Bytes of request bodies sent', labels, **kwargs)
+        self.responseBytes = prometheus_client.Counter(
+            prefix + '_response_bytes', 'Bytes of response bodies received', labels, **kwargs)
+        self.duration = prometheus_client.Histogram(
+            prefix + '_call_seconds', 'Duration of compute calls', labels, **kwargs)
+
+    def __call__(self, event):
+        endpoint = event.endpoint.partition('?')[0]
+        self.calls.labels(endpoint).inc()
+        if event.error is not None:
+            self.failures.labels(endpoint).inc()
+        if event.cached:
+            self.cacheHits.labels(endpoint).inc()
+        if event.requestBytes:
+            self.requestBytes.labels(endpoint).inc(event.requestBytes)
+        if event.responseBytes:
+            self.responseBytes.labels(endpoint).inc(event.responseBytes)
+        self.duration.labels(endpoint).observe(event.totalTime)
+
+
+class OpenTelemetryHook:
+    """
+    Records a span per call with the timings and sizes as attributes.
+    Requires the opentelemetry-api package.
+    """
+    def __init__(self, tracer=None):
+        """
+        Args:
+            tracer (opentelemetry.trace.Tracer): defaults to a tracer of the
+                                                 global tracer provider
+        """
+        from opentelemetry import trace
+        self._trace = trace
+        self.tracer = tracer or trace.get_tracer('compute_rhino3d')
+
+    def __call__(self, event):
+        attributes = {'compute.endpoint': event.endpoint, 'compute.attempts': event.attempts,
+                      'compute.cached': event.cached}
+        for name in ('encodeTime', 'requestBytes', 'timeToFirstByte', 'serverTime',
+                     'responseBytes', 'parseTime', 'decodeTime', 'status'):
+            value = getattr(event, name)
+            if value is not None:
+                attributes['compute.' + name] = value
+        start = int(event.startTime * 1e9)
+        span = self.tracer.start_span('compute ' + event.endpoint.partition('?')[0],
+                                      kind=self._trace.SpanKind.CLIENT,
+                                      start_time=start, attributes=attributes)
+        if event.error is not None:
+            span.record_exception(event.error)
+            span.set_status(self._trace.Status(self._trace.StatusCode.ERROR, str(event.error)))
+        span.end(end_time=start + int(event.totalTime * 1e9))
@@ -1,6 +1,7 @@
 from . import Util
 
 
+@Util.Endpoint("rhino/geometry/intersect/intersection/curveplane-curve_plane_double")
 def CurvePlane(curve, plane, tolerance, multiple=False):
     """
     Intersects a curve with an (infinite) plane.
@@ -13,14 +14,9 @@ def CurvePlane(curve, plane, tolerance, multiple=False):
     Returns:
         CurveIntersections: A list of intersection events or None if no intersections were recorded.
     """
-    url = "rhino/geometry/intersect/intersection/curveplane-curve_plane_double"
-    if multiple: url += "?multiple=true"
-    args = [curve, plane, tolerance]
-    if multiple: args = zip(curve, plane, tolerance)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/intersect/intersection/meshplane-mesh_plane")
 def MeshPlane(mesh, plane, multiple=False):
     """
     Intersects a mesh with an (infinite) plane.
@@ -32,14 +28,9 @@ def MeshPlane(mesh, plane, multiple=False):
     Returns:
         Polyline[]: An array of polylines describing the intersection loops or None (Nothing in Visual Basic) if no intersections could be found.
     """
-    url = "rhino/geometry/intersect/intersection/meshplane-mesh_plane"
-    if multiple: url += "?multiple=true"
-    args = [mesh, plane]
-    if multiple: args = zip(mesh, plane)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/intersect/intersection/meshplane-mesh_planearray")
 def MeshPlane1(mesh, planes, multiple=False):
     """
     Intersects a mesh with a collection of (infinite) planes.
@@ -51,14 +42,9 @@ def MeshPlane1(mesh, planes, multiple=False):
     Returns:
         Polyline[]: An array of polylines describing the intersection loops or None (Nothing in Visual Basic) if no intersections could be found.
     """
-    url = "rhino/geometry/intersect/intersection/meshplane-mesh_planearray"
-    if multiple: url += "?multiple=true"
-    args = [mesh, planes]
-    if multiple: args = zip(mesh, planes)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/intersect/intersection/brepplane-brep_plane_double_curvearray_point3darray")
 def BrepPlane(brep, plane, tolerance, multiple=False):
     """
     Intersects a Brep with an (infinite) plane.
@@ -73,14 +59,9 @@ def BrepPlane(brep, plane, tolerance, multiple=False):
         intersectionCurves (Curve[]): The intersection curves will be returned here.
         intersectionPoints (Point3d[]): The intersection points will be returned here.
     """
-    url = "rhino/geometry/intersect/intersection/brepplane-brep_plane_double_curvearray_point3darray"
-    if multiple: url += "?multiple=true"
-    args = [brep, plane, tolerance]
-    if multiple: args = zip(brep, plane, tolerance)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/intersect/intersection/curveself-curve_double")
 def CurveSelf(curve, tolerance, multiple=False):
     """
     Finds the places where a curve intersects itself.
@@ -93,14 +74,9 @@ def CurveSelf(curve, tolerance, multiple=False):
     Returns:
         CurveIntersections: A collection of intersection events.
     """
-    url = "rhino/geometry/intersect/intersection/curveself-curve_double"
-    if multiple: url += "?multiple=true"
-    args = [curve, tolerance]
-    if multiple: args = zip(curve, tolerance)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/intersect/intersection/curvecurve-curve_curve_double_double")
 def CurveCurve(curveA, curveB, tolerance, overlapTolerance, multiple=False):
     """
     Finds the intersections between two curves.
@@ -115,14 +91,9 @@ def CurveCurve(curveA, curveB, tolerance, overlapTolerance, multiple=False):
     Returns:
         CurveIntersections: A collection of intersection events.
     """
-    url = "rhino/geometry/intersect/intersection/curvecurve-curve_curve_double_double"
-    if multiple: url += "?multiple=true"
-    args = [curveA, curveB, tolerance, overlapTolerance]
-    if multiple: args = zip(curveA, curveB, tolerance, overlapTolerance)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/intersect/intersection/curveline-curve_line_double_double")
 def CurveLine(curve, line, tolerance, overlapTolerance, multiple=False):
     """
     Intersects a curve and an infinite line.
@@ -137,14 +108,9 @@ def CurveLine(curve, line, tolerance, overlapTolerance, multiple=False):
     Returns:
         CurveIntersections: A collection of intersection events.
     """
-    url = "rhino/geometry/intersect/intersection/curveline-curve_line_double_double"
-    if multiple: url += "?multiple=true"
-    args = [curve, line, tolerance, overlapTolerance]
-    if multiple: args = zip(curve, line, tolerance, overlapTolerance)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/intersect/intersection/curvesurface-curve_surface_double_double")
 def CurveSurface(curve, surface, tolerance, overlapTolerance, multiple=False):
     """
     Intersects a curve and a surface.
@@ -159,14 +125,9 @@ def CurveSurface(curve, surface, tolerance, overlapTolerance, multiple=False):
     Returns:
         CurveIntersections: A collection of intersection events.
     """
-    url = "rhino/geometry/intersect/intersection/curvesurface-curve_surface_double_double"
-    if multiple: url += "?multiple=true"
-    args = [curve, surface, tolerance, overlapTolerance]
-    if multiple: args = zip(curve, surface, tolerance, overlapTolerance)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/intersect/intersection/curvesurface-curve_interval_surface_double_double")
 def CurveSurface1(curve, curveDomain, surface, tolerance, overlapTolerance, multiple=False):
     """
     Intersects a (sub)curve and a surface.
@@ -182,14 +143,9 @@ def CurveSurface1(curve, curveDomain, surface, tolerance, overlapTolerance, mult
     Returns:
         CurveIntersections: A collection of intersection events.
     """
-    url = "rhino/geometry/intersect/intersection/curvesurface-curve_interval_surface_double_double"
-    if multiple: url += "?multiple=true"
-    args = [curve, curveDomain, surface, tolerance, overlapTolerance]
-    if multiple: args = zip(curve, curveDomain, surface, tolerance, overlapTolerance)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/intersect/intersection/curvebrep-curve_brep_double_curvearray_point3darray")
 def CurveBrep(curve, brep, tolerance, multiple=False):
     """
     Intersects a curve with a Brep. This function returns the 3D points of intersection
@@ -206,14 +162,9 @@ def CurveBrep(curve, brep, tolerance, multiple=False):
         overlapCurves (Curve[]): The overlap curves will be returned here.
         intersectionPoints (Point3d[]): The intersection points will be returned here.
     """
-    url = "rhino/geometry/intersect/intersection/curvebrep-curve_brep_double_curvearray_point3darray"
-    if multiple: url += "?multiple=true"
-    args = [curve, brep, tolerance]
-    if multiple: args = zip(curve, brep, tolerance)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/intersect/intersection/curvebrep-curve_brep_double_double_doublearray")
 def CurveBrep1(curve, brep, tolerance, angleTolerance, multiple=False):
     """
     Intersect a curve with a Brep. This function returns the intersection parameters on the curve.
@@ -228,14 +179,9 @@ def CurveBrep1(curve, brep, tolerance, angleTolerance, multiple=False):
         bool: True on success, False on failure.
         t (double[]): Curve parameters at intersections.
     """
-    url = "rhino/geometry/intersect/intersection/curvebrep-curve_brep_double_double_doublearray"
-    if multiple: url += "?multiple=true"
-    args = [curve, brep, tolerance, angleTolerance]
-    if multiple: args = zip(curve, brep, tolerance, angleTolerance)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/intersect/intersection/curvebrepface-curve_brepface_double_curvearray_point3darray")
 def CurveBrepFace(curve, face, tolerance, multiple=False):
     """
     Intersects a curve with a Brep face.
@@ -250,14 +196,9 @@ def CurveBrepFace(curve, face, tolerance, multiple=False):
         overlapCurves (Curve[]): A overlap curves array argument. This out reference is assigned during the call.
         intersectionPoints (Point3d[]): A points array argument. This out reference is assigned during the call.
     """
-    url = "rhino/geometry/intersect/intersection/curvebrepface-curve_brepface_double_curvearray_point3darray"
-    if multiple: url += "?multiple=true"
-    args = [curve, face, tolerance]
-    if multiple: args = zip(curve, face, tolerance)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/intersect/intersection/surfacesurface-surface_surface_double_curvearray_point3darray")
 def SurfaceSurface(surfaceA, surfaceB, tolerance, multiple=False):
     """
     Intersects two Surfaces.
@@ -272,14 +213,9 @@ def SurfaceSurface(surfaceA, surfaceB, tolerance, multiple=False):
         intersectionCurves (Curve[]): The intersection curves will be returned here.
         intersectionPoints (Point3d[]): The intersection points will be returned here.
     """
-    url = "rhino/geometry/intersect/intersection/surfacesurface-surface_surface_double_curvearray_point3darray"
-    if multiple: url += "?multiple=true"
-    args = [surfaceA, surfaceB, tolerance]
-    if multiple: args = zip(surfaceA, surfaceB, tolerance)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/intersect/intersection/brepbrep-brep_brep_double_curvearray_point3darray")
 def BrepBrep(brepA, brepB, tolerance, multiple=False):
     """
     Intersects two Breps.
@@ -294,14 +230,9 @@ def BrepBrep(brepA, brepB, tolerance, multiple=False):
         intersectionCurves (Curve[]): The intersection curves will be returned here.
         intersectionPoints (Point3d[]): The intersection points will be returned here.
     """
-    url = "rhino/geometry/intersect/intersection/brepbrep-brep_brep_double_curvearray_point3darray"
-    if multiple: url += "?multiple=true"
-    args = [brepA, brepB, tolerance]
-    if multiple: args = zip(brepA, brepB, tolerance)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/intersect/intersection/brepsurface-brep_surface_double_curvearray_point3darray")
 def BrepSurface(brep, surface, tolerance, multiple=False):
     """
     Intersects a Brep and a Surface.
@@ -316,14 +247,9 @@ def BrepSurface(brep, surface, tolerance, multiple=False):
         intersectionCurves (Curve[]): The intersection curves array argument. This out reference is assigned during the call.
         intersectionPoints (Point3d[]): The intersection points array argument. This out reference is assigned during the call.
     """
-    url = "rhino/geometry/intersect/intersection/brepsurface-brep_surface_double_curvearray_point3darray"
-    if multiple: url += "?multiple=true"
-    args = [brep, surface, tolerance]
-    if multiple: args = zip(brep, surface, tolerance)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/intersect/intersection/meshmeshfast-mesh_mesh", Util.DecodeToLine)
 def MeshMeshFast(meshA, meshB, multiple=False):
     """
     This is an old overload kept for compatibility. Overlaps and near misses are ignored.
@@ -335,15 +261,9 @@ def MeshMeshFast(meshA, meshB, multiple=False):
     Returns:
         Line[]: An array of intersection line segments, or null.
     """
-    url = "rhino/geometry/intersect/intersection/meshmeshfast-mesh_mesh"
-    if multiple: url += "?multiple=true"
-    args = [meshA, meshB]
-    if multiple: args = zip(meshA, meshB)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToLine(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/intersect/intersection/meshmesh-mesharray_double_bool_setscombinations_polylinearray_bool_polylinearray_fileio.textlog_system.threading.cancellationtoken_doublearray")
 def MeshMesh(meshes, tolerance, preprocessing, sets, overlaps, textLog, cancel, progress, multiple=False):
     """
     Intersects meshes. Overlaps and perforations are provided in the output list.
@@ -366,14 +286,9 @@ def MeshMesh(meshes, tolerance, preprocessing, sets, overlaps, textLog, cancel,
         intersections (Polyline[]): If true, overlaps are computed and returned.
         overlapsResult (Polyline[]): If requested, overlaps are returned here.
     """
-    url = "rhino/geometry/intersect/intersection/meshmesh-mesharray_double_bool_setscombinations_polylinearray_bool_polylinearray_fileio.textlog_system.threading.cancellationtoken_doublearray"
-    if multiple: url += "?multiple=true"
-    args = [meshes, tolerance, preprocessing, sets, overlaps, textLog, cancel, progress]
-    if multiple: args = zip(meshes, tolerance, preprocessing, sets, overlaps, textLog, cancel, progress)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/intersect/intersection/meshmesh-mesharray_double_bool_setscombinations_polylinearray_mesh_fileio.textlog_system.threading.cancellationtoken_doublearray")
 def MeshMesh1(meshes, tolerance, preprocessing, sets, textLog, cancel, progress, multiple=False):
     """
     Intersects meshes. Overlaps and perforations are provided in the output list.
@@ -395,14 +310,9 @@ def MeshMesh1(meshes, tolerance, preprocessing, sets, textLog, cancel, progress,
         intersections (Polyline[]): If true, overlaps are computed and returned.
         overlapsResult (Mesh): If requested, overlaps are returned here.
     """
-    url = "rhino/geometry/intersect/intersection/meshmesh-mesharray_double_bool_setscombinations_polylinearray_mesh_fileio.textlog_system.threading.cancellationtoken_doublearray"
-    if multiple: url += "?multiple=true"
-    args = [meshes, tolerance, preprocessing, sets, textLog, cancel, progress]
-    if multiple: args = zip(meshes, tolerance, preprocessing, sets, textLog, cancel, progress)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/intersect/intersection/meshmeshaccurate-mesh_mesh_double")
 def MeshMeshAccurate(meshA, meshB, tolerance, multiple=False):
     """
     Intersects two meshes. Overlaps and near misses are handled. This is an old method kept for compatibility.
@@ -416,14 +326,9 @@ def MeshMeshAccurate(meshA, meshB, tolerance, multiple=False):
     Returns:
         Polyline[]: An array of intersection and overlaps polylines.
     """
-    url = "rhino/geometry/intersect/intersection/meshmeshaccurate-mesh_mesh_double"
-    if multiple: url += "?multiple=true"
-    args = [meshA, meshB, tolerance]
-    if multiple: args = zip(meshA, meshB, tolerance)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/intersect/intersection/meshray-mesh_ray3d")
 def MeshRay(mesh, ray, multiple=False):
     """
     Finds the first intersection of a ray with a mesh.
@@ -436,14 +341,9 @@ def MeshRay(mesh, ray, multiple=False):
         double: >= 0.0 parameter along ray if successful.
         < 0.0 if no intersection found.
     """
-    url = "rhino/geometry/intersect/intersection/meshray-mesh_ray3d"
-    if multiple: url += "?multiple=true"
-    args = [mesh, ray]
-    if multiple: args = zip(mesh, ray)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/intersect/intersection/meshray-mesh_ray3d_intarray")
 def MeshRay1(mesh, ray, multiple=False):
     """
     Finds the first intersection of a ray with a mesh.
@@ -457,14 +357,9 @@ def MeshRay1(mesh, ray, multiple=False):
         < 0.0 if no intersection found.
         meshFaceIndices (int[]): faces on mesh that ray intersects.
     """
-    url = "rhino/geometry/intersect/intersection/meshray-mesh_ray3d_intarray"
-    if multiple: url += "?multiple=true"
-    args = [mesh, ray]
-    if multiple: args = zip(mesh, ray)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/intersect/intersection/meshpolyline-mesh_polylinecurve_intarray")
 def MeshPolyline(mesh, curve, multiple=False):
     """
     Finds the intersection of a mesh and a polyline.
@@ -477,14 +372,9 @@ def MeshPolyline(mesh, curve, multiple=False):
         Point3d[]: An array of points: one for each face that was passed by the faceIds out reference.
         faceIds (int[]): The indices of the intersecting faces. This out reference is assigned during the call.
     """
-    url = "rhino/geometry/intersect/intersection/meshpolyline-mesh_polylinecurve_intarray"
-    if multiple: url += "?multiple=true"
-    args = [mesh, curve]
-    if multiple: args = zip(mesh, curve)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/intersect/intersection/meshline-mesh_line_intarray")
 def MeshLine(mesh, line, multiple=False):
     """
     Finds the intersection of a mesh and a line
@@ -497,14 +387,9 @@ def MeshLine(mesh, line, multiple=False):
         Point3d[]: An array of points: one for each face that was passed by the faceIds out reference.
         faceIds (int[]): The indices of the intersecting faces. This out reference is assigned during the call.
     """
-    url = "rhino/geometry/intersect/intersection/meshline-mesh_line_intarray"
-    if multiple: url += "?multiple=true"
-    args = [mesh, line]
-    if multiple: args = zip(mesh, line)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/intersect/intersection/rayshoot-ray3d_geometrybasearray_int", Util.DecodeToPoint3d)
 def RayShoot(ray, geometry, maxReflections, multiple=False):
     """
     Computes point intersections that occur when shooting a ray to a collection of surfaces.
@@ -517,15 +402,9 @@ def RayShoot(ray, geometry, maxReflections, multiple=False):
     Returns:
         Point3d[]: An array of points: one for each face that was passed by the faceIds out reference.
     """
-    url = "rhino/geometry/intersect/intersection/rayshoot-ray3d_geometrybasearray_int"
-    if multiple: url += "?multiple=true"
-    args = [ray, geometry, maxReflections]
-    if multiple: args = zip(ray, geometry, maxReflections)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToPoint3d(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/intersect/intersection/projectpointstomeshes-mesharray_point3darray_vector3d_double", Util.DecodeToPoint3d)
 def ProjectPointsToMeshes(meshes, points, direction, tolerance, multiple=False):
     """
     Projects points onto meshes.
@@ -539,15 +418,9 @@ def ProjectPointsToMeshes(meshes, points, direction, tolerance, multiple=False):
     Returns:
         Point3d[]: Array of projected points, or None in case of any error or invalid input.
     """
-    url = "rhino/geometry/intersect/intersection/projectpointstomeshes-mesharray_point3darray_vector3d_double"
-    if multiple: url += "?multiple=true"
-    args = [meshes, points, direction, tolerance]
-    if multiple: args = zip(meshes, points, direction, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToPoint3d(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/intersect/intersection/projectpointstomeshesex-mesharray_point3darray_vector3d_double_intarray")
 def ProjectPointsToMeshesEx(meshes, points, direction, tolerance, multiple=False):
     """
     Projects points onto meshes.
@@ -562,14 +435,9 @@ def ProjectPointsToMeshesEx(meshes, points, direction, tolerance, multiple=False
         Point3d[]: Array of projected points, or None in case of any error or invalid input.
         indices (int[]): Return points[i] is a projection of points[indices[i]]
     """
-    url = "rhino/geometry/intersect/intersection/projectpointstomeshesex-mesharray_point3darray_vector3d_double_intarray"
-    if multiple: url += "?multiple=true"
-    args = [meshes, points, direction, tolerance]
-    if multiple: args = zip(meshes, points, direction, tolerance)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/intersect/intersection/projectpointstobreps-breparray_point3darray_vector3d_double", Util.DecodeToPoint3d)
 def ProjectPointsToBreps(breps, points, direction, tolerance, multiple=False):
     """
     Projects points onto breps.
@@ -583,15 +451,9 @@ def ProjectPointsToBreps(breps, points, direction, tolerance, multiple=False):
     Returns:
         Point3d[]: Array of projected points, or None in case of any error or invalid input.
     """
-    url = "rhino/geometry/intersect/intersection/projectpointstobreps-breparray_point3darray_vector3d_double"
-    if multiple: url += "?multiple=true"
-    args = [breps, points, direction, tolerance]
-    if multiple: args = zip(breps, points, direction, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToPoint3d(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/intersect/intersection/projectpointstobrepsex-breparray_point3darray_vector3d_double_intarray")
 def ProjectPointsToBrepsEx(breps, points, direction, tolerance, multiple=False):
     """
     Projects points onto breps.
@@ -606,10 +468,4 @@ def ProjectPointsToBrepsEx(breps, points, direction, tolerance, multiple=False):
         Point3d[]: Array of projected points, or None in case of any error or invalid input.
         indices (int[]): Return points[i] is a projection of points[indices[i]]
     """
-    url = "rhino/geometry/intersect/intersection/projectpointstobrepsex-breparray_point3darray_vector3d_double_intarray"
-    if multiple: url += "?multiple=true"
-    args = [breps, points, direction, tolerance]
-    if multiple: args = zip(breps, points, direction, tolerance)
-    response = Util.ComputeFetch(url, args)
-    return response
 
@@ -1,6 +1,7 @@
 from . import Util
 
 
+@Util.Endpoint("rhino/geometry/mesh/createfromplane-plane_interval_interval_int_int", Util.DecodeToCommonObject)
 def CreateFromPlane(plane, xInterval, yInterval, xCount, yCount, multiple=False):
     """
     Constructs a planar mesh grid.
@@ -12,15 +13,9 @@ def CreateFromPlane(plane, xInterval, yInterval, xCount, yCount, multiple=False)
         xCount (int): Number of faces in x-direction.
         yCount (int): Number of faces in y-direction.
     """
-    url = "rhino/geometry/mesh/createfromplane-plane_interval_interval_int_int"
-    if multiple: url += "?multiple=true"
-    args = [plane, xInterval, yInterval, xCount, yCount]
-    if multiple: args = zip(plane, xInterval, yInterval, xCount, yCount)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/createfrombox-boundingbox_int_int_int", Util.DecodeToCommonObject)
 def CreateFromBox(box, xCount, yCount, zCount, multiple=False):
     """
     Constructs new mesh that matches a bounding box.
@@ -34,15 +29,9 @@ def CreateFromBox(box, xCount, yCount, zCount, multiple=False):
     Returns:
         Mesh: A new brep, or None on failure.
     """
-    url = "rhino/geometry/mesh/createfrombox-boundingbox_int_int_int"
-    if multiple: url += "?multiple=true"
-    args = [box, xCount, yCount, zCount]
-    if multiple: args = zip(box, xCount, yCount, zCount)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/createfrombox-box_int_int_int", Util.DecodeToCommonObject)
 def CreateFromBox1(box, xCount, yCount, zCount, multiple=False):
     """
     Constructs new mesh that matches an aligned box.
@@ -53,15 +42,9 @@ def CreateFromBox1(box, xCount, yCount, zCount, multiple=False):
         yCount (int): Number of faces in y-direction.
         zCount (int): Number of faces in z-direction.
     """
-    url = "rhino/geometry/mesh/createfrombox-box_int_int_int"
-    if multiple: url += "?multiple=true"
-    args = [box, xCount, yCount, zCount]
-    if multiple: args = zip(box, xCount, yCount, zCount)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/createfrombox-point3darray_int_int_int", Util.DecodeToCommonObject)
 def CreateFromBox2(corners, xCount, yCount, zCount, multiple=False):
     """
     Constructs new mesh from 8 corner points.
@@ -79,15 +62,9 @@ def CreateFromBox2(corners, xCount, yCount, zCount, multiple=False):
     Returns:
         Mesh: A new box mesh, on None on error.
     """
-    url = "rhino/geometry/mesh/createfrombox-point3darray_int_int_int"
-    if multiple: url += "?multiple=true"
-    args = [corners, xCount, yCount, zCount]
-    if multiple: args = zip(corners, xCount, yCount, zCount)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/createfromsphere-sphere_int_int", Util.DecodeToCommonObject)
 def CreateFromSphere(sphere, xCount, yCount, multiple=False):
     """
     Constructs a mesh sphere.
@@ -97,15 +74,9 @@ def CreateFromSphere(sphere, xCount, yCount, multiple=False):
         xCount (int): Number of faces in the around direction.
         yCount (int): Number of faces in the top-to-bottom direction.
     """
-    url = "rhino/geometry/mesh/createfromsphere-sphere_int_int"
-    if multiple: url += "?multiple=true"
-    args = [sphere, xCount, yCount]
-    if multiple: args = zip(sphere, xCount, yCount)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/createicosphere-sphere_int", Util.DecodeToCommonObject)
 def CreateIcoSphere(sphere, subdivisions, multiple=False):
     """
     Constructs a icospherical mesh. A mesh icosphere differs from a standard
@@ -122,15 +93,9 @@ def CreateIcoSphere(sphere, subdivisions, multiple=False):
     Returns:
         Mesh: A welded mesh icosphere if successful, or None on failure.
     """
-    url = "rhino/geometry/mesh/createicosphere-sphere_int"
-    if multiple: url += "?multiple=true"
-    args = [sphere, subdivisions]
-    if multiple: args = zip(sphere, subdivisions)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/createquadsphere-sphere_int", Util.DecodeToCommonObject)
 def CreateQuadSphere(sphere, subdivisions, multiple=False):
     """
     Constructs a quad mesh sphere. A quad mesh sphere differs from a standard
@@ -147,15 +112,9 @@ def CreateQuadSphere(sphere, subdivisions, multiple=False):
     Returns:
         Mesh: A welded quad mesh sphere if successful, or None on failure.
     """
-    url = "rhino/geometry/mesh/createquadsphere-sphere_int"
-    if multiple: url += "?multiple=true"
-    args = [sphere, subdivisions]
-    if multiple: args = zip(sphere, subdivisions)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/createfromcylinder-cylinder_int_int", Util.DecodeToCommonObject)
 def CreateFromCylinder(cylinder, vertical, around, multiple=False):
     """
     Constructs a capped mesh cylinder.
@@ -167,15 +126,9 @@ def CreateFromCylinder(cylinder, vertical, around, multiple=False):
     Returns:
         Mesh: Returns a mesh cylinder if successful, None otherwise.
     """
-    url = "rhino/geometry/mesh/createfromcylinder-cylinder_int_int"
-    if multiple: url += "?multiple=true"
-    args = [cylinder, vertical, around]
-    if multiple: args = zip(cylinder, vertical, around)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/createfromcylinder-cylinder_int_int_bool_bool", Util.DecodeToCommonObject)
 def CreateFromCylinder1(cylinder, vertical, around, capBottom, capTop, multiple=False):
     """
     Constructs a mesh cylinder.
@@ -189,15 +142,9 @@ def CreateFromCylinder1(cylinder, vertical, around, capBottom, capTop, multiple=
     Returns:
         Mesh: Returns a mesh cylinder if successful, None otherwise.
     """
-    url = "rhino/geometry/mesh/createfromcylinder-cylinder_int_int_bool_bool"
-    if multiple: url += "?multiple=true"
-    args = [cylinder, vertical, around, capBottom, capTop]
-    if multiple: args = zip(cylinder, vertical, around, capBottom, capTop)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/createfromcylinder-cylinder_int_int_bool_bool_bool", Util.DecodeToCommonObject)
 def CreateFromCylinder2(cylinder, vertical, around, capBottom, capTop, quadCaps, multiple=False):
     """
     Constructs a mesh cylinder.
@@ -212,15 +159,9 @@ def CreateFromCylinder2(cylinder, vertical, around, capBottom, capTop, quadCaps,
     Returns:
         Mesh: Returns a mesh cylinder if successful, None otherwise.
     """
-    url = "rhino/geometry/mesh/createfromcylinder-cylinder_int_int_bool_bool_bool"
-    if multiple: url += "?multiple=true"
-    args = [cylinder, vertical, around, capBottom, capTop, quadCaps]
-    if multiple: args = zip(cylinder, vertical, around, capBottom, capTop, quadCaps)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/createfromcone-cone_int_int", Util.DecodeToCommonObject)
 def CreateFromCone(cone, vertical, around, multiple=False):
     """
     Constructs a solid mesh cone.
@@ -232,15 +173,9 @@ def CreateFromCone(cone, vertical, around, multiple=False):
     Returns:
         Mesh: A valid mesh if successful.
     """
-    url = "rhino/geometry/mesh/createfromcone-cone_int_int"
-    if multiple: url += "?multiple=true"
-    args = [cone, vertical, around]
-    if multiple: args = zip(cone, vertical, around)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/createfromcone-cone_int_int_bool", Util.DecodeToCommonObject)
 def CreateFromCone1(cone, vertical, around, solid, multiple=False):
     """
     Constructs a mesh cone.
@@ -253,15 +188,9 @@ def CreateFromCone1(cone, vertical, around, solid, multiple=False):
     Returns:
         Mesh: A valid mesh if successful.
     """
-    url = "rhino/geometry/mesh/createfromcone-cone_int_int_bool"
-    if multiple: url += "?multiple=true"
-    args = [cone, vertical, around, solid]
-    if multiple: args = zip(cone, vertical, around, solid)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/createfromcone-cone_int_int_bool_bool", Util.DecodeToCommonObject)
 def CreateFromCone2(cone, vertical, around, solid, quadCaps, multiple=False):
     """
     Constructs a mesh cone.
@@ -275,15 +204,9 @@ def CreateFromCone2(cone, vertical, around, solid, quadCaps, multiple=False):
     Returns:
         Mesh: A valid mesh if successful.
     """
-    url = "rhino/geometry/mesh/createfromcone-cone_int_int_bool_bool"
-    if multiple: url += "?multiple=true"
-    args = [cone, vertical, around, solid, quadCaps]
-    if multiple: args = zip(cone, vertical, around, solid, quadCaps)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/createfromtorus-torus_int_int", Util.DecodeToCommonObject)
 def CreateFromTorus(torus, vertical, around, multiple=False):
     """
     Constructs a mesh torus.
@@ -296,15 +219,9 @@ def CreateFromTorus(torus, vertical, around, multiple=False):
     Returns:
         Mesh: Returns a mesh torus if successful, None otherwise.
     """
-    url = "rhino/geometry/mesh/createfromtorus-torus_int_int"
-    if multiple: url += "?multiple=true"
-    args = [torus, vertical, around]
-    if multiple: args = zip(torus, vertical, around)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/createfromplanarboundary-curve_meshingparameters", Util.DecodeToCommonObject)
 def CreateFromPlanarBoundary(boundary, parameters, multiple=False):
     """
     Do not use this overload. Use version that takes a tolerance parameter instead.
@@ -316,15 +233,9 @@ def CreateFromPlanarBoundary(boundary, parameters, multiple=False):
     Returns:
         Mesh: Do not use.
     """
-    url = "rhino/geometry/mesh/createfromplanarboundary-curve_meshingparameters"
-    if multiple: url += "?multiple=true"
-    args = [boundary, parameters]
-    if multiple: args = zip(boundary, parameters)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/createfromplanarboundary-curve_meshingparameters_double", Util.DecodeToCommonObject)
 def CreateFromPlanarBoundary1(boundary, parameters, tolerance, multiple=False):
     """
     Attempts to construct a mesh from a closed planar curve.RhinoMakePlanarMeshes
@@ -337,15 +248,9 @@ def CreateFromPlanarBoundary1(boundary, parameters, tolerance, multiple=False):
     Returns:
         Mesh: New mesh on success or None on failure.
     """
-    url = "rhino/geometry/mesh/createfromplanarboundary-curve_meshingparameters_double"
-    if multiple: url += "?multiple=true"
-    args = [boundary, parameters, tolerance]
-    if multiple: args = zip(boundary, parameters, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/createfromclosedpolyline-polyline", Util.DecodeToCommonObject)
 def CreateFromClosedPolyline(polyline, multiple=False):
     """
     Attempts to create a Mesh that is a triangulation of a closed polyline.
@@ -356,15 +261,9 @@ def CreateFromClosedPolyline(polyline, multiple=False):
     Returns:
         Mesh: New mesh on success or None on failure.
     """
-    url = "rhino/geometry/mesh/createfromclosedpolyline-polyline"
-    if multiple: url += "?multiple=true"
-    args = [polyline]
-    if multiple: args = [[item] for item in polyline]
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/createfromtessellation-point3darray_ienumerable<point3d>array_plane_bool", Util.DecodeToCommonObject)
 def CreateFromTessellation(points, edges, plane, allowNewVertices, multiple=False):
     """
     Attempts to create a mesh that is a triangulation of a list of points, projected on a plane,
@@ -381,15 +280,9 @@ def CreateFromTessellation(points, edges, plane, allowNewVertices, multiple=Fals
     Returns:
         Mesh: A new mesh, or None if not successful.
     """
-    url = "rhino/geometry/mesh/createfromtessellation-point3darray_ienumerable<point3d>array_plane_bool"
-    if multiple: url += "?multiple=true"
-    args = [points, edges, plane, allowNewVertices]
-    if multiple: args = zip(points, edges, plane, allowNewVertices)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/createfrombrep-brep", Util.DecodeToCommonObject)
 def CreateFromBrep(brep, multiple=False):
     """
     Constructs a mesh from a brep.
@@ -400,15 +293,9 @@ def CreateFromBrep(brep, multiple=False):
     Returns:
         Mesh[]: An array of meshes.
     """
-    url = "rhino/geometry/mesh/createfrombrep-brep"
-    if multiple: url += "?multiple=true"
-    args = [brep]
-    if multiple: args = [[item] for item in brep]
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/createfrombrep-brep_meshingparameters", Util.DecodeToCommonObject)
 def CreateFromBrep1(brep, meshingParameters, multiple=False):
     """
     Constructs a mesh from a brep.
@@ -420,15 +307,9 @@ def CreateFromBrep1(brep, meshingParameters, multiple=False):
     Returns:
         Mesh[]: An array of meshes.
     """
-    url = "rhino/geometry/mesh/createfrombrep-brep_meshingparameters"
-    if multiple: url += "?multiple=true"
-    args = [brep, meshingParameters]
-    if multiple: args = zip(brep, meshingParameters)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/createfromsurface-surface", Util.DecodeToCommonObject)
 def CreateFromSurface(surface, multiple=False):
     """
     Constructs a mesh from a surface
@@ -439,15 +320,9 @@ def CreateFromSurface(surface, multiple=False):
     Returns:
         Mesh: New mesh representing the surface
     """
-    url = "rhino/geometry/mesh/createfromsurface-surface"
-    if multiple: url += "?multiple=true"
-    args = [surface]
-    if multiple: args = [[item] for item in surface]
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/createfromsurface-surface_meshingparameters", Util.DecodeToCommonObject)
 def CreateFromSurface1(surface, meshingParameters, multiple=False):
     """
     Constructs a mesh from a surface
@@ -459,41 +334,23 @@ def CreateFromSurface1(surface, meshingParameters, multiple=False):
     Returns:
         Mesh: New mesh representing the surface
     """
-    url = "rhino/geometry/mesh/createfromsurface-surface_meshingparameters"
-    if multiple: url += "?multiple=true"
-    args = [surface, meshingParameters]
-    if multiple: args = zip(surface, meshingParameters)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/createfromsubd-subd_int", Util.DecodeToCommonObject)
 def CreateFromSubD(subd, displayDensity, multiple=False):
     """
     Create a mesh from a SubD limit surface
     """
-    url = "rhino/geometry/mesh/createfromsubd-subd_int"
-    if multiple: url += "?multiple=true"
-    args = [subd, displayDensity]
-    if multiple: args = zip(subd, displayDensity)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/createfromsubdcontrolnet-subd", Util.DecodeToCommonObject)
 def CreateFromSubDControlNet(subd, multiple=False):
     """
     Create a mesh from a SubD control net
     """
-    url = "rhino/geometry/mesh/createfromsubdcontrolnet-subd"
-    if multiple: url += "?multiple=true"
-    args = [subd]
-    if multiple: args = [[item] for item in subd]
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/createpatch-polyline_double_surface_curvearray_curvearray_point3darray_bool_int", Util.DecodeToCommonObject)
 def CreatePatch(outerBoundary, angleToleranceRadians, pullbackSurface, innerBoundaryCurves, innerBothSideCurves, innerPoints, trimback, divisions, multiple=False):
     """
     Construct a mesh patch from a variety of input geometry.
@@ -538,15 +395,9 @@ def CreatePatch(outerBoundary, angleToleranceRadians, pullbackSurface, innerBoun
     Returns:
         Mesh: mesh on success; None on failure
     """
-    url = "rhino/geometry/mesh/createpatch-polyline_double_surface_curvearray_curvearray_point3darray_bool_int"
-    if multiple: url += "?multiple=true"
-    args = [outerBoundary, angleToleranceRadians, pullbackSurface, innerBoundaryCurves, innerBothSideCurves, innerPoints, trimback, divisions]
-    if multiple: args = zip(outerBoundary, angleToleranceRadians, pullbackSurface, innerBoundaryCurves, innerBothSideCurves, innerPoints, trimback, divisions)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/createbooleanunion-mesharray", Util.DecodeToCommonObject)
 def CreateBooleanUnion(meshes, multiple=False):
     """
     Computes the solid union of a set of meshes.
@@ -557,15 +408,9 @@ def CreateBooleanUnion(meshes, multiple=False):
     Returns:
         Mesh[]: An array of Mesh results or None on failure.
     """
-    url = "rhino/geometry/mesh/createbooleanunion-mesharray"
-    if multiple: url += "?multiple=true"
-    args = [meshes]
-    if multiple: args = [[item] for item in meshes]
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/createbooleandifference-mesharray_mesharray", Util.DecodeToCommonObject)
 def CreateBooleanDifference(firstSet, secondSet, multiple=False):
     """
     Computes the solid difference of two sets of Meshes.
@@ -577,15 +422,9 @@ def CreateBooleanDifference(firstSet, secondSet, multiple=False):
     Returns:
         Mesh[]: An array of Mesh results or None on failure.
     """
-    url = "rhino/geometry/mesh/createbooleandifference-mesharray_mesharray"
-    if multiple: url += "?multiple=true"
-    args = [firstSet, secondSet]
-    if multiple: args = zip(firstSet, secondSet)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/createbooleanintersection-mesharray_mesharray", Util.DecodeToCommonObject)
 def CreateBooleanIntersection(firstSet, secondSet, multiple=False):
     """
     Computes the solid intersection of two sets of meshes.
@@ -597,15 +436,9 @@ def CreateBooleanIntersection(firstSet, secondSet, multiple=False):
     Returns:
         Mesh[]: An array of Mesh results or None on failure.
     """
-    url = "rhino/geometry/mesh/createbooleanintersection-mesharray_mesharray"
-    if multiple: url += "?multiple=true"
-    args = [firstSet, secondSet]
-    if multiple: args = zip(firstSet, secondSet)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/createbooleansplit-mesharray_mesharray", Util.DecodeToCommonObject)
 def CreateBooleanSplit(meshesToSplit, meshSplitters, multiple=False):
     """
     Splits a set of meshes with another set.
@@ -617,15 +450,9 @@ def CreateBooleanSplit(meshesToSplit, meshSplitters, multiple=False):
     Returns:
         Mesh[]: A new mesh array, or None on error.
     """
-    url = "rhino/geometry/mesh/createbooleansplit-mesharray_mesharray"
-    if multiple: url += "?multiple=true"
-    args = [meshesToSplit, meshSplitters]
-    if multiple: args = zip(meshesToSplit, meshSplitters)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/createfromcurvepipe-curve_double_int_int_meshpipecapstyle_bool_intervalarray", Util.DecodeToCommonObject)
 def CreateFromCurvePipe(curve, radius, segments, accuracy, capType, faceted, intervals, multiple=False):
     """
     Constructs a new mesh pipe from a curve.
@@ -642,15 +469,9 @@ def CreateFromCurvePipe(curve, radius, segments, accuracy, capType, faceted, int
     Returns:
         Mesh: A new mesh, or None on failure.
     """
-    url = "rhino/geometry/mesh/createfromcurvepipe-curve_double_int_int_meshpipecapstyle_bool_intervalarray"
-    if multiple: url += "?multiple=true"
-    args = [curve, radius, segments, accuracy, capType, faceted, intervals]
-    if multiple: args = zip(curve, radius, segments, accuracy, capType, faceted, intervals)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/createfromcurveextrusion-curve_vector3d_meshingparameters_boundingbox", Util.DecodeToCommonObject)
 def CreateFromCurveExtrusion(curve, direction, parameters, boundingBox, multiple=False):
     """
     Constructs a new extrusion from a curve.
@@ -664,15 +485,9 @@ def CreateFromCurveExtrusion(curve, direction, parameters, boundingBox, multiple
     Returns:
         Mesh: A new mesh, or None on failure.
     """
-    url = "rhino/geometry/mesh/createfromcurveextrusion-curve_vector3d_meshingparameters_boundingbox"
-    if multiple: url += "?multiple=true"
-    args = [curve, direction, parameters, boundingBox]
-    if multiple: args = zip(curve, direction, parameters, boundingBox)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/createfrommesharraycleanup-mesharray_double_bool", Util.DecodeToCommonObject)
 def CreateFromMeshArrayCleanUp(meshes, tolerance, mendSinglePrecisionVertexJump, multiple=False):
     """
     Repairs meshes with vertices that are too near, using a tolerance value.
@@ -685,15 +500,9 @@ def CreateFromMeshArrayCleanUp(meshes, tolerance, mendSinglePrecisionVertexJump,
     Returns:
         Mesh[]: A valid meshes array if successful. If no change was required, some meshes can be null. Otherwise, null, when no changes were done.
     """
-    url = "rhino/geometry/mesh/createfrommesharraycleanup-mesharray_double_bool"
-    if multiple: url += "?multiple=true"
-    args = [meshes, tolerance, mendSinglePrecisionVertexJump]
-    if multiple: args = zip(meshes, tolerance, mendSinglePrecisionVertexJump)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/volume-mesh")
 def Volume(thisMesh, multiple=False):
     """
     Compute volume of the mesh.
@@ -701,14 +510,9 @@ def Volume(thisMesh, multiple=False):
     Returns:
         double: Volume of the mesh.
     """
-    url = "rhino/geometry/mesh/volume-mesh"
-    if multiple: url += "?multiple=true"
-    args = [thisMesh]
-    if multiple: args = [[item] for item in thisMesh]
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/smooth-mesh_double_bool_bool_bool_bool_smoothingcoordinatesystem")
 def Smooth(thisMesh, smoothFactor, bXSmooth, bYSmooth, bZSmooth, bFixBoundaries, coordinateSystem, multiple=False):
     """
     Smooths a mesh by averaging the positions of mesh vertices in a specified region.
@@ -724,14 +528,9 @@ def Smooth(thisMesh, smoothFactor, bXSmooth, bYSmooth, bZSmooth, bFixBoundaries,
     Returns:
         bool: True if successful, False otherwise.
     """
-    url = "rhino/geometry/mesh/smooth-mesh_double_bool_bool_bool_bool_smoothingcoordinatesystem"
-    if multiple: url += "?multiple=true"
-    args = [thisMesh, smoothFactor, bXSmooth, bYSmooth, bZSmooth, bFixBoundaries, coordinateSystem]
-    if multiple: args = zip(thisMesh, smoothFactor, bXSmooth, bYSmooth, bZSmooth, bFixBoundaries, coordinateSystem)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/smooth-mesh_double_bool_bool_bool_bool_smoothingcoordinatesystem_plane")
 def Smooth1(thisMesh, smoothFactor, bXSmooth, bYSmooth, bZSmooth, bFixBoundaries, coordinateSystem, plane, multiple=False):
     """
     Smooths a mesh by averaging the positions of mesh vertices in a specified region.
@@ -748,14 +547,9 @@ def Smooth1(thisMesh, smoothFactor, bXSmooth, bYSmooth, bZSmooth, bFixBoundaries
     Returns:
         bool: True if successful, False otherwise.
     """
-    url = "rhino/geometry/mesh/smooth-mesh_double_bool_bool_bool_bool_smoothingcoordinatesystem_plane"
-    if multiple: url += "?multiple=true"
-    args = [thisMesh, smoothFactor, bXSmooth, bYSmooth, bZSmooth, bFixBoundaries, coordinateSystem, plane]
-    if multiple: args = zip(thisMesh, smoothFactor, bXSmooth, bYSmooth, bZSmooth, bFixBoundaries, coordinateSystem, plane)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/smooth-mesh_intarray_double_bool_bool_bool_bool_smoothingcoordinatesystem_plane")
 def Smooth2(thisMesh, vertexIndices, smoothFactor, bXSmooth, bYSmooth, bZSmooth, bFixBoundaries, coordinateSystem, plane, multiple=False):
     """
     Smooths part of a mesh by averaging the positions of mesh vertices in a specified region.
@@ -773,14 +567,9 @@ def Smooth2(thisMesh, vertexIndices, smoothFactor, bXSmooth, bYSmooth, bZSmooth,
     Returns:
         bool: True if successful, False otherwise.
     """
-    url = "rhino/geometry/mesh/smooth-mesh_intarray_double_bool_bool_bool_bool_smoothingcoordinatesystem_plane"
-    if multiple: url += "?multiple=true"
-    args = [thisMesh, vertexIndices, smoothFactor, bXSmooth, bYSmooth, bZSmooth, bFixBoundaries, coordinateSystem, plane]
-    if multiple: args = zip(thisMesh, vertexIndices, smoothFactor, bXSmooth, bYSmooth, bZSmooth, bFixBoundaries, coordinateSystem, plane)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/unweld-mesh_double_bool")
 def Unweld(thisMesh, angleToleranceRadians, modifyNormals, multiple=False):
     """
     Makes sure that faces sharing an edge and having a difference of normal greater
@@ -792,14 +581,9 @@ def Unweld(thisMesh, angleToleranceRadians, modifyNormals, multiple=False):
         modifyNormals (bool): Determines whether new vertex normals will have the same vertex normal as the original (false)
             or vertex normals made from the corrsponding face normals (true)
     """
-    url = "rhino/geometry/mesh/unweld-mesh_double_bool"
-    if multiple: url += "?multiple=true"
-    args = [thisMesh, angleToleranceRadians, modifyNormals]
-    if multiple: args = zip(thisMesh, angleToleranceRadians, modifyNormals)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/unweldedge-mesh_intarray_bool")
 def UnweldEdge(thisMesh, edgeIndices, modifyNormals, multiple=False):
     """
     Adds creases to a smooth mesh by creating coincident vertices along selected edges.
@@ -812,14 +596,9 @@ def UnweldEdge(thisMesh, edgeIndices, modifyNormals, multiple=False):
     Returns:
         bool: True if successful, False otherwise.
     """
-    url = "rhino/geometry/mesh/unweldedge-mesh_intarray_bool"
-    if multiple: url += "?multiple=true"
-    args = [thisMesh, edgeIndices, modifyNormals]
-    if multiple: args = zip(thisMesh, edgeIndices, modifyNormals)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/weld-mesh_double")
 def Weld(thisMesh, angleToleranceRadians, multiple=False):
     """
     Makes sure that faces sharing an edge and having a difference of normal greater
@@ -829,27 +608,17 @@ def Weld(thisMesh, angleToleranceRadians, multiple=False):
     Args:
         angleToleranceRadians (double): Angle at which to weld vertices.
     """
-    url = "rhino/geometry/mesh/weld-mesh_double"
-    if multiple: url += "?multiple=true"
-    args = [thisMesh, angleToleranceRadians]
-    if multiple: args = zip(thisMesh, angleToleranceRadians)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/rebuildnormals-mesh")
 def RebuildNormals(thisMesh, multiple=False):
     """
     Removes mesh normals and reconstructs the face and vertex normals based
     on the orientation of the faces.
     """
-    url = "rhino/geometry/mesh/rebuildnormals-mesh"
-    if multiple: url += "?multiple=true"
-    args = [thisMesh]
-    if multiple: args = [[item] for item in thisMesh]
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/extractnonmanifoldedges-mesh_bool", Util.DecodeToCommonObject)
 def ExtractNonManifoldEdges(thisMesh, selective, multiple=False):
     """
     Extracts, or removes, non-manifold mesh edges.
@@ -860,15 +629,9 @@ def ExtractNonManifoldEdges(thisMesh, selective, multiple=False):
     Returns:
         Mesh: A mesh containing the extracted non-manifold parts if successful, None otherwise.
     """
-    url = "rhino/geometry/mesh/extractnonmanifoldedges-mesh_bool"
-    if multiple: url += "?multiple=true"
-    args = [thisMesh, selective]
-    if multiple: args = zip(thisMesh, selective)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/healnakededges-mesh_double")
 def HealNakedEdges(thisMesh, distance, multiple=False):
     """
     Attempts to "heal" naked edges in a mesh based on a given distance.
@@ -883,14 +646,9 @@ def HealNakedEdges(thisMesh, distance, multiple=False):
     Returns:
         bool: True if successful, False otherwise.
     """
-    url = "rhino/geometry/mesh/healnakededges-mesh_double"
-    if multiple: url += "?multiple=true"
-    args = [thisMesh, distance]
-    if multiple: args = zip(thisMesh, distance)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/fillholes-mesh")
 def FillHoles(thisMesh, multiple=False):
     """
     Attempts to determine "holes" in the mesh by chaining naked edges together.
@@ -899,14 +657,9 @@ def FillHoles(thisMesh, multiple=False):
     Returns:
         bool: True if successful, False otherwise.
     """
-    url = "rhino/geometry/mesh/fillholes-mesh"
-    if multiple: url += "?multiple=true"
-    args = [thisMesh]
-    if multiple: args = [[item] for item in thisMesh]
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/filehole-mesh_int")
 def FileHole(thisMesh, topologyEdgeIndex, multiple=False):
     """
     Given a starting "naked" edge index, this function attempts to determine a "hole"
@@ -919,14 +672,9 @@ def FileHole(thisMesh, topologyEdgeIndex, multiple=False):
     Returns:
         bool: True if successful, False otherwise.
     """
-    url = "rhino/geometry/mesh/filehole-mesh_int"
-    if multiple: url += "?multiple=true"
-    args = [thisMesh, topologyEdgeIndex]
-    if multiple: args = zip(thisMesh, topologyEdgeIndex)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/unifynormals-mesh")
 def UnifyNormals(thisMesh, multiple=False):
     """
     Attempts to fix inconsistencies in the directions of mesh faces in a mesh. This function
@@ -937,14 +685,9 @@ def UnifyNormals(thisMesh, multiple=False):
     Returns:
         int: number of faces that were modified.
     """
-    url = "rhino/geometry/mesh/unifynormals-mesh"
-    if multiple: url += "?multiple=true"
-    args = [thisMesh]
-    if multiple: args = [[item] for item in thisMesh]
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/unifynormals-mesh_bool")
 def UnifyNormals1(thisMesh, countOnly, multiple=False):
     """
     Attempts to fix inconsistencies in the directions of mesh faces in a mesh. This function
@@ -958,14 +701,9 @@ def UnifyNormals1(thisMesh, countOnly, multiple=False):
     Returns:
         int: If countOnly=false, the number of faces that were modified. If countOnly=true, the number of faces that would be modified.
     """
-    url = "rhino/geometry/mesh/unifynormals-mesh_bool"
-    if multiple: url += "?multiple=true"
-    args = [thisMesh, countOnly]
-    if multiple: args = zip(thisMesh, countOnly)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/splitdisjointpieces-mesh", Util.DecodeToCommonObject)
 def SplitDisjointPieces(thisMesh, multiple=False):
     """
     Splits up the mesh into its unconnected pieces.
@@ -973,15 +711,9 @@ def SplitDisjointPieces(thisMesh, multiple=False):
     Returns:
         Mesh[]: An array containing all the disjoint pieces that make up this Mesh.
     """
-    url = "rhino/geometry/mesh/splitdisjointpieces-mesh"
-    if multiple: url += "?multiple=true"
-    args = [thisMesh]
-    if multiple: args = [[item] for item in thisMesh]
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/split-mesh_plane", Util.DecodeToCommonObject)
 def Split(thisMesh, plane, multiple=False):
     """
     Split a mesh by an infinite plane.
@@ -992,15 +724,9 @@ def Split(thisMesh, plane, multiple=False):
     Returns:
         Mesh[]: A new mesh array with the split result. This can be None if no result was found.
     """
-    url = "rhino/geometry/mesh/split-mesh_plane"
-    if multiple: url += "?multiple=true"
-    args = [thisMesh, plane]
-    if multiple: args = zip(thisMesh, plane)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/split-mesh_mesh", Util.DecodeToCommonObject)
 def Split1(thisMesh, mesh, multiple=False):
     """
     Split a mesh with another mesh.
@@ -1011,15 +737,9 @@ def Split1(thisMesh, mesh, multiple=False):
     Returns:
         Mesh[]: An array of mesh segments representing the split result.
     """
-    url = "rhino/geometry/mesh/split-mesh_mesh"
-    if multiple: url += "?multiple=true"
-    args = [thisMesh, mesh]
-    if multiple: args = zip(thisMesh, mesh)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/split-mesh_mesharray", Util.DecodeToCommonObject)
 def Split2(thisMesh, meshes, multiple=False):
     """
     Split a mesh with a collection of meshes.
@@ -1030,15 +750,9 @@ def Split2(thisMesh, meshes, multiple=False):
     Returns:
         Mesh[]: An array of mesh segments representing the split result.
     """
-    url = "rhino/geometry/mesh/split-mesh_mesharray"
-    if multiple: url += "?multiple=true"
-    args = [thisMesh, meshes]
-    if multiple: args = zip(thisMesh, meshes)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/split-mesh_mesharray_double_bool_textlog_cancellationtoken_doublearray", Util.DecodeToCommonObject)
 def Split3(thisMesh, meshes, tolerance, preprocessing, textLog, cancel, progress, multiple=False):
     """
     Split a mesh with a collection of meshes.
@@ -1057,15 +771,9 @@ def Split3(thisMesh, meshes, tolerance, preprocessing, textLog, cancel, progress
     Returns:
         Mesh[]: An array of mesh parts representing the split result, or null: when no mesh intersected, or if a cancel stopped the computation.
     """
-    url = "rhino/geometry/mesh/split-mesh_mesharray_double_bool_textlog_cancellationtoken_doublearray"
-    if multiple: url += "?multiple=true"
-    args = [thisMesh, meshes, tolerance, preprocessing, textLog, cancel, progress]
-    if multiple: args = zip(thisMesh, meshes, tolerance, preprocessing, textLog, cancel, progress)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/getoutlines-mesh_plane")
 def GetOutlines(thisMesh, plane, multiple=False):
     """
     Constructs the outlines of a mesh projected against a plane.
@@ -1076,14 +784,9 @@ def GetOutlines(thisMesh, plane, multiple=False):
     Returns:
         Polyline[]: An array of polylines, or None on error.
     """
-    url = "rhino/geometry/mesh/getoutlines-mesh_plane"
-    if multiple: url += "?multiple=true"
-    args = [thisMesh, plane]
-    if multiple: args = zip(thisMesh, plane)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/getoutlines-mesh_display.rhinoviewport")
 def GetOutlines1(thisMesh, viewport, multiple=False):
     """
     Constructs the outlines of a mesh. The projection information in the
@@ -1095,14 +798,9 @@ def GetOutlines1(thisMesh, viewport, multiple=False):
     Returns:
         Polyline[]: An array of polylines, or None on error.
     """
-    url = "rhino/geometry/mesh/getoutlines-mesh_display.rhinoviewport"
-    if multiple: url += "?multiple=true"
-    args = [thisMesh, viewport]
-    if multiple: args = zip(thisMesh, viewport)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/getoutlines-mesh_viewportinfo_plane")
 def GetOutlines2(thisMesh, viewportInfo, plane, multiple=False):
     """
     Constructs the outlines of a mesh.
@@ -1114,14 +812,9 @@ def GetOutlines2(thisMesh, viewportInfo, plane, multiple=False):
     Returns:
         Polyline[]: An array of polylines, or None on error.
     """
-    url = "rhino/geometry/mesh/getoutlines-mesh_viewportinfo_plane"
-    if multiple: url += "?multiple=true"
-    args = [thisMesh, viewportInfo, plane]
-    if multiple: args = zip(thisMesh, viewportInfo, plane)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/getnakededges-mesh")
 def GetNakedEdges(thisMesh, multiple=False):
     """
     Returns all edges of a mesh that are considered "naked" in the
@@ -1130,14 +823,9 @@ def GetNakedEdges(thisMesh, multiple=False):
     Returns:
         Polyline[]: An array of polylines, or None on error.
     """
-    url = "rhino/geometry/mesh/getnakededges-mesh"
-    if multiple: url += "?multiple=true"
-    args = [thisMesh]
-    if multiple: args = [[item] for item in thisMesh]
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/explodeatunweldededges-mesh", Util.DecodeToCommonObject)
 def ExplodeAtUnweldedEdges(thisMesh, multiple=False):
     """
     Explode the mesh into submeshes where a submesh is a collection of faces that are contained
@@ -1148,15 +836,9 @@ def ExplodeAtUnweldedEdges(thisMesh, multiple=False):
         Mesh[]: Array of submeshes on success; None on error. If the count in the returned array is 1, then
         nothing happened and the ouput is essentially a copy of the input.
     """
-    url = "rhino/geometry/mesh/explodeatunweldededges-mesh"
-    if multiple: url += "?multiple=true"
-    args = [thisMesh]
-    if multiple: args = [[item] for item in thisMesh]
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/closestpoint-mesh_point3d", Util.DecodeToPoint3d)
 def ClosestPoint(thisMesh, testPoint, multiple=False):
     """
     Gets the point on the mesh that is closest to a given test point.
@@ -1167,15 +849,9 @@ def ClosestPoint(thisMesh, testPoint, multiple=False):
     Returns:
         Point3d: The point on the mesh closest to testPoint, or Point3d.Unset on failure.
     """
-    url = "rhino/geometry/mesh/closestpoint-mesh_point3d"
-    if multiple: url += "?multiple=true"
-    args = [thisMesh, testPoint]
-    if multiple: args = zip(thisMesh, testPoint)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToPoint3d(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/closestmeshpoint-mesh_point3d_double")
 def ClosestMeshPoint(thisMesh, testPoint, maximumDistance, multiple=False):
     """
     Gets the point on the mesh that is closest to a given test point. Similar to the
@@ -1193,14 +869,9 @@ def ClosestMeshPoint(thisMesh, testPoint, maximumDistance, multiple=False):
     Returns:
         MeshPoint: closest point information on success. None on failure.
     """
-    url = "rhino/geometry/mesh/closestmeshpoint-mesh_point3d_double"
-    if multiple: url += "?multiple=true"
-    args = [thisMesh, testPoint, maximumDistance]
-    if multiple: args = zip(thisMesh, testPoint, maximumDistance)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/closestpoint-mesh_point3d_point3d_double")
 def ClosestPoint1(thisMesh, testPoint, maximumDistance, multiple=False):
     """
     Gets the point on the mesh that is closest to a given test point.
@@ -1218,14 +889,9 @@ def ClosestPoint1(thisMesh, testPoint, maximumDistance, multiple=False):
         -1 if not successful; the value of pointOnMesh is undefined.
         pointOnMesh (Point3d): Point on the mesh closest to testPoint.
     """
-    url = "rhino/geometry/mesh/closestpoint-mesh_point3d_point3d_double"
-    if multiple: url += "?multiple=true"
-    args = [thisMesh, testPoint, maximumDistance]
-    if multiple: args = zip(thisMesh, testPoint, maximumDistance)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/closestpoint-mesh_point3d_point3d_vector3d_double")
 def ClosestPoint2(thisMesh, testPoint, maximumDistance, multiple=False):
     """
     Gets the point on the mesh that is closest to a given test point.
@@ -1244,14 +910,9 @@ def ClosestPoint2(thisMesh, testPoint, maximumDistance, multiple=False):
         pointOnMesh (Point3d): Point on the mesh closest to testPoint.
         normalAtPoint (Vector3d): The normal vector of the mesh at the closest point.
     """
-    url = "rhino/geometry/mesh/closestpoint-mesh_point3d_point3d_vector3d_double"
-    if multiple: url += "?multiple=true"
-    args = [thisMesh, testPoint, maximumDistance]
-    if multiple: args = zip(thisMesh, testPoint, maximumDistance)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/pointat-mesh_meshpoint", Util.DecodeToPoint3d)
 def PointAt(thisMesh, meshPoint, multiple=False):
     """
     Evaluate a mesh at a set of barycentric coordinates.
@@ -1262,15 +923,9 @@ def PointAt(thisMesh, meshPoint, multiple=False):
     Returns:
         Point3d: A Point on the mesh or Point3d.Unset if the faceIndex is not valid or if the barycentric coordinates could not be evaluated.
     """
-    url = "rhino/geometry/mesh/pointat-mesh_meshpoint"
-    if multiple: url += "?multiple=true"
-    args = [thisMesh, meshPoint]
-    if multiple: args = zip(thisMesh, meshPoint)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToPoint3d(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/pointat-mesh_int_double_double_double_double", Util.DecodeToPoint3d)
 def PointAt1(thisMesh, faceIndex, t0, t1, t2, t3, multiple=False):
     """
     Evaluates a mesh at a set of barycentric coordinates. Barycentric coordinates must
@@ -1286,15 +941,9 @@ def PointAt1(thisMesh, faceIndex, t0, t1, t2, t3, multiple=False):
     Returns:
         Point3d: A Point on the mesh or Point3d.Unset if the faceIndex is not valid or if the barycentric coordinates could not be evaluated.
     """
-    url = "rhino/geometry/mesh/pointat-mesh_int_double_double_double_double"
-    if multiple: url += "?multiple=true"
-    args = [thisMesh, faceIndex, t0, t1, t2, t3]
-    if multiple: args = zip(thisMesh, faceIndex, t0, t1, t2, t3)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToPoint3d(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/normalat-mesh_meshpoint")
 def NormalAt(thisMesh, meshPoint, multiple=False):
     """
     Evaluate a mesh normal at a set of barycentric coordinates.
@@ -1305,14 +954,9 @@ def NormalAt(thisMesh, meshPoint, multiple=False):
     Returns:
         Vector3d: A Normal vector to the mesh or Vector3d.Unset if the faceIndex is not valid or if the barycentric coordinates could not be evaluated.
     """
-    url = "rhino/geometry/mesh/normalat-mesh_meshpoint"
-    if multiple: url += "?multiple=true"
-    args = [thisMesh, meshPoint]
-    if multiple: args = zip(thisMesh, meshPoint)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/normalat-mesh_int_double_double_double_double")
 def NormalAt1(thisMesh, faceIndex, t0, t1, t2, t3, multiple=False):
     """
     Evaluate a mesh normal at a set of barycentric coordinates. Barycentric coordinates must
@@ -1328,14 +972,9 @@ def NormalAt1(thisMesh, faceIndex, t0, t1, t2, t3, multiple=False):
     Returns:
         Vector3d: A Normal vector to the mesh or Vector3d.Unset if the faceIndex is not valid or if the barycentric coordinates could not be evaluated.
     """
-    url = "rhino/geometry/mesh/normalat-mesh_int_double_double_double_double"
-    if multiple: url += "?multiple=true"
-    args = [thisMesh, faceIndex, t0, t1, t2, t3]
-    if multiple: args = zip(thisMesh, faceIndex, t0, t1, t2, t3)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/colorat-mesh_meshpoint")
 def ColorAt(thisMesh, meshPoint, multiple=False):
     """
     Evaluate a mesh color at a set of barycentric coordinates.
@@ -1347,14 +986,9 @@ def ColorAt(thisMesh, meshPoint, multiple=False):
         Color: The interpolated vertex color on the mesh or Color.Transparent if the faceIndex is not valid,
         if the barycentric coordinates could not be evaluated, or if there are no colors defined on the mesh.
     """
-    url = "rhino/geometry/mesh/colorat-mesh_meshpoint"
-    if multiple: url += "?multiple=true"
-    args = [thisMesh, meshPoint]
-    if multiple: args = zip(thisMesh, meshPoint)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/colorat-mesh_int_double_double_double_double")
 def ColorAt1(thisMesh, faceIndex, t0, t1, t2, t3, multiple=False):
     """
     Evaluate a mesh normal at a set of barycentric coordinates. Barycentric coordinates must
@@ -1371,14 +1005,9 @@ def ColorAt1(thisMesh, faceIndex, t0, t1, t2, t3, multiple=False):
         Color: The interpolated vertex color on the mesh or Color.Transparent if the faceIndex is not valid,
         if the barycentric coordinates could not be evaluated, or if there are no colors defined on the mesh.
     """
-    url = "rhino/geometry/mesh/colorat-mesh_int_double_double_double_double"
-    if multiple: url += "?multiple=true"
-    args = [thisMesh, faceIndex, t0, t1, t2, t3]
-    if multiple: args = zip(thisMesh, faceIndex, t0, t1, t2, t3)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/pullpointstomesh-mesh_point3darray", Util.DecodeToPoint3d)
 def PullPointsToMesh(thisMesh, points, multiple=False):
     """
     Pulls a collection of points to a mesh.
@@ -1389,15 +1018,9 @@ def PullPointsToMesh(thisMesh, points, multiple=False):
     Returns:
         Point3d[]: An array of points. This can be empty.
     """
-    url = "rhino/geometry/mesh/pullpointstomesh-mesh_point3darray"
-    if multiple: url += "?multiple=true"
-    args = [thisMesh, points]
-    if multiple: args = zip(thisMesh, points)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToPoint3d(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/pullcurve-mesh_curve_double")
 def PullCurve(thisMesh, curve, tolerance, multiple=False):
     """
     Gets a polyline approximation of the input curve and then moves its control points to the closest point on the mesh.
@@ -1410,14 +1033,9 @@ def PullCurve(thisMesh, curve, tolerance, multiple=False):
     Returns:
         PolylineCurve: A polyline curve, or None if none could be constructed.
     """
-    url = "rhino/geometry/mesh/pullcurve-mesh_curve_double"
-    if multiple: url += "?multiple=true"
-    args = [thisMesh, curve, tolerance]
-    if multiple: args = zip(thisMesh, curve, tolerance)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/splitwithprojectedpolylines-mesh_polylinecurvearray_double", Util.DecodeToCommonObject)
 def SplitWithProjectedPolylines(thisMesh, curves, tolerance, multiple=False):
     """
     Splits a mesh by adding edges in correspondance with input polylines, and divides the mesh at partitioned areas.
@@ -1430,15 +1048,9 @@ def SplitWithProjectedPolylines(thisMesh, curves, tolerance, multiple=False):
     Returns:
         Mesh[]: An array of meshes, or None if no change would happen.
     """
-    url = "rhino/geometry/mesh/splitwithprojectedpolylines-mesh_polylinecurvearray_double"
-    if multiple: url += "?multiple=true"
-    args = [thisMesh, curves, tolerance]
-    if multiple: args = zip(thisMesh, curves, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/splitwithprojectedpolylines-mesh_polylinecurvearray_double_textlog_cancellationtoken_doublearray", Util.DecodeToCommonObject)
 def SplitWithProjectedPolylines1(thisMesh, curves, tolerance, textLog, cancel, progress, multiple=False):
     """
     Splits a mesh by adding edges in correspondance with input polylines, and divides the mesh at partitioned areas.
@@ -1454,15 +1066,9 @@ def SplitWithProjectedPolylines1(thisMesh, curves, tolerance, textLog, cancel, p
     Returns:
         Mesh[]: An array of meshes, or None if no change would happen.
     """
-    url = "rhino/geometry/mesh/splitwithprojectedpolylines-mesh_polylinecurvearray_double_textlog_cancellationtoken_doublearray"
-    if multiple: url += "?multiple=true"
-    args = [thisMesh, curves, tolerance, textLog, cancel, progress]
-    if multiple: args = zip(thisMesh, curves, tolerance, textLog, cancel, progress)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/offset-mesh_double", Util.DecodeToCommonObject)
 def Offset(thisMesh, distance, multiple=False):
     """
     Makes a new mesh with vertices offset a distance in the opposite direction of the existing vertex normals.
@@ -1474,15 +1080,9 @@ def Offset(thisMesh, distance, multiple=False):
     Returns:
         Mesh: A new mesh on success, or None on failure.
     """
-    url = "rhino/geometry/mesh/offset-mesh_double"
-    if multiple: url += "?multiple=true"
-    args = [thisMesh, distance]
-    if multiple: args = zip(thisMesh, distance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/offset-mesh_double_bool", Util.DecodeToCommonObject)
 def Offset1(thisMesh, distance, solidify, multiple=False):
     """
     Makes a new mesh with vertices offset a distance in the opposite direction of the existing vertex normals.
@@ -1496,15 +1096,9 @@ def Offset1(thisMesh, distance, solidify, multiple=False):
     Returns:
         Mesh: A new mesh on success, or None on failure.
     """
-    url = "rhino/geometry/mesh/offset-mesh_double_bool"
-    if multiple: url += "?multiple=true"
-    args = [thisMesh, distance, solidify]
-    if multiple: args = zip(thisMesh, distance, solidify)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/offset-mesh_double_bool_vector3d", Util.DecodeToCommonObject)
 def Offset2(thisMesh, distance, solidify, direction, multiple=False):
     """
     Makes a new mesh with vertices offset a distance along the direction parameter.
@@ -1519,15 +1113,9 @@ def Offset2(thisMesh, distance, solidify, direction, multiple=False):
     Returns:
         Mesh: A new mesh on success, or None on failure.
     """
-    url = "rhino/geometry/mesh/offset-mesh_double_bool_vector3d"
-    if multiple: url += "?multiple=true"
-    args = [thisMesh, distance, solidify, direction]
-    if multiple: args = zip(thisMesh, distance, solidify, direction)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/offset-mesh_double_bool_vector3d_intarray")
 def Offset3(thisMesh, distance, solidify, direction, multiple=False):
     """
     Makes a new mesh with vertices offset a distance along the direction parameter.
@@ -1544,14 +1132,9 @@ def Offset3(thisMesh, distance, solidify, direction, multiple=False):
         Mesh: A new mesh on success, or None on failure.
         wallFacesOut (List<int>): Returns list of wall faces.
     """
-    url = "rhino/geometry/mesh/offset-mesh_double_bool_vector3d_intarray"
-    if multiple: url += "?multiple=true"
-    args = [thisMesh, distance, solidify, direction]
-    if multiple: args = zip(thisMesh, distance, solidify, direction)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/collapsefacesbyedgelength-mesh_bool_double")
 def CollapseFacesByEdgeLength(thisMesh, bGreaterThan, edgeLength, multiple=False):
     """
     Collapses multiple mesh faces, with greater/less than edge length, based on the principles
@@ -1565,14 +1148,9 @@ def CollapseFacesByEdgeLength(thisMesh, bGreaterThan, edgeLength, multiple=False
     Returns:
         int: Number of edges (faces) that were collapsed.
     """
-    url = "rhino/geometry/mesh/collapsefacesbyedgelength-mesh_bool_double"
-    if multiple: url += "?multiple=true"
-    args = [thisMesh, bGreaterThan, edgeLength]
-    if multiple: args = zip(thisMesh, bGreaterThan, edgeLength)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/collapsefacesbyarea-mesh_double_double")
 def CollapseFacesByArea(thisMesh, lessThanArea, greaterThanArea, multiple=False):
     """
     Collapses multiple mesh faces, with areas less than LessThanArea and greater than GreaterThanArea,
@@ -1586,14 +1164,9 @@ def CollapseFacesByArea(thisMesh, lessThanArea, greaterThanArea, multiple=False)
     Returns:
         int: Number of faces that were collapsed in the process.
     """
-    url = "rhino/geometry/mesh/collapsefacesbyarea-mesh_double_double"
-    if multiple: url += "?multiple=true"
-    args = [thisMesh, lessThanArea, greaterThanArea]
-    if multiple: args = zip(thisMesh, lessThanArea, greaterThanArea)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/collapsefacesbybyaspectratio-mesh_double")
 def CollapseFacesByByAspectRatio(thisMesh, aspectRatio, multiple=False):
     """
     Collapses a multiple mesh faces, determined by face aspect ratio, based on criteria found in Stan Melax's polygon reduction,
@@ -1605,14 +1178,9 @@ def CollapseFacesByByAspectRatio(thisMesh, aspectRatio, multiple=False):
     Returns:
         int: Number of faces that were collapsed in the process.
     """
-    url = "rhino/geometry/mesh/collapsefacesbybyaspectratio-mesh_double"
-    if multiple: url += "?multiple=true"
-    args = [thisMesh, aspectRatio]
-    if multiple: args = zip(thisMesh, aspectRatio)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/getunsafelock-mesh_bool")
 def GetUnsafeLock(thisMesh, writable, multiple=False):
     """
     Allows to obtain unsafe pointers to the underlying unmanaged data structures of the mesh.
@@ -1623,14 +1191,9 @@ def GetUnsafeLock(thisMesh, writable, multiple=False):
     Returns:
         MeshUnsafeLock: A lock that needs to be released.
     """
-    url = "rhino/geometry/mesh/getunsafelock-mesh_bool"
-    if multiple: url += "?multiple=true"
-    args = [thisMesh, writable]
-    if multiple: args = zip(thisMesh, writable)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/releaseunsafelock-mesh_meshunsafelock")
 def ReleaseUnsafeLock(thisMesh, meshData, multiple=False):
     """
     Updates the Mesh data with the information that was stored via the .
@@ -1638,14 +1201,9 @@ def ReleaseUnsafeLock(thisMesh, meshData, multiple=False):
     Args:
         meshData (MeshUnsafeLock): The data that will be unlocked.
     """
-    url = "rhino/geometry/mesh/releaseunsafelock-mesh_meshunsafelock"
-    if multiple: url += "?multiple=true"
-    args = [thisMesh, meshData]
-    if multiple: args = zip(thisMesh, meshData)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/withshutlining-mesh_bool_double_shutliningcurveinfoarray", Util.DecodeToCommonObject)
 def WithShutLining(thisMesh, faceted, tolerance, curves, multiple=False):
     """
     Constructs new mesh from the current one, with shut lining applied to it.
@@ -1658,15 +1216,9 @@ def WithShutLining(thisMesh, faceted, tolerance, curves, multiple=False):
     Returns:
         Mesh: A new mesh with shutlining. Null on failure.
     """
-    url = "rhino/geometry/mesh/withshutlining-mesh_bool_double_shutliningcurveinfoarray"
-    if multiple: url += "?multiple=true"
-    args = [thisMesh, faceted, tolerance, curves]
-    if multiple: args = zip(thisMesh, faceted, tolerance, curves)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/withdisplacement-mesh_meshdisplacementinfo", Util.DecodeToCommonObject)
 def WithDisplacement(thisMesh, displacement, multiple=False):
     """
     Constructs new mesh from the current one, with displacement applied to it.
@@ -1677,15 +1229,9 @@ def WithDisplacement(thisMesh, displacement, multiple=False):
     Returns:
         Mesh: A new mesh with shutlining.
     """
-    url = "rhino/geometry/mesh/withdisplacement-mesh_meshdisplacementinfo"
-    if multiple: url += "?multiple=true"
-    args = [thisMesh, displacement]
-    if multiple: args = zip(thisMesh, displacement)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/withedgesoftening-mesh_double_bool_bool_bool_double", Util.DecodeToCommonObject)
 def WithEdgeSoftening(thisMesh, softeningRadius, chamfer, faceted, force, angleThreshold, multiple=False):
     """
     Constructs new mesh from the current one, with edge softening applied to it.
@@ -1701,29 +1247,17 @@ def WithEdgeSoftening(thisMesh, softeningRadius, chamfer, faceted, force, angleT
     Returns:
         Mesh: A new mesh with soft edges.
     """
-    url = "rhino/geometry/mesh/withedgesoftening-mesh_double_bool_bool_bool_double"
-    if multiple: url += "?multiple=true"
-    args = [thisMesh, softeningRadius, chamfer, faceted, force, angleThreshold]
-    if multiple: args = zip(thisMesh, softeningRadius, chamfer, faceted, force, angleThreshold)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/quadremeshbrep-brep_quadremeshparameters", Util.DecodeToCommonObject)
 def QuadRemeshBrep(brep, parameters, multiple=False):
     """
     Create QuadRemesh from a Brep
     Set Brep Face Mode by setting QuadRemeshParameters.PreserveMeshArrayEdgesMode
     """
-    url = "rhino/geometry/mesh/quadremeshbrep-brep_quadremeshparameters"
-    if multiple: url += "?multiple=true"
-    args = [brep, parameters]
-    if multiple: args = zip(brep, parameters)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/quadremeshbrep-brep_quadremeshparameters_curvearray", Util.DecodeToCommonObject)
 def QuadRemeshBrep1(brep, parameters, guideCurves, multiple=False):
     """
     Create Quad Remesh from a Brep
@@ -1734,15 +1268,9 @@ def QuadRemeshBrep1(brep, parameters, guideCurves, multiple=False):
             The curves should touch the input mesh
             Set Guide Curve Influence by using QuadRemeshParameters.GuideCurveInfluence
     """
-    url = "rhino/geometry/mesh/quadremeshbrep-brep_quadremeshparameters_curvearray"
-    if multiple: url += "?multiple=true"
-    args = [brep, parameters, guideCurves]
-    if multiple: args = zip(brep, parameters, guideCurves)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/quadremeshbrepasync-brep_quadremeshparameters_intarray_cancellationtoken")
 def QuadRemeshBrepAsync(brep, parameters, progress, cancelToken, multiple=False):
     """
     Quad remesh this brep async
@@ -1750,14 +1278,9 @@ def QuadRemeshBrepAsync(brep, parameters, progress, cancelToken, multiple=False)
     Args:
         brep (Brep): Set Brep Face Mode by setting QuadRemeshParameters.PreserveMeshArrayEdgesMode
     """
-    url = "rhino/geometry/mesh/quadremeshbrepasync-brep_quadremeshparameters_intarray_cancellationtoken"
-    if multiple: url += "?multiple=true"
-    args = [brep, parameters, progress, cancelToken]
-    if multiple: args = zip(brep, parameters, progress, cancelToken)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/quadremeshbrepasync-brep_quadremeshparameters_curvearray_intarray_cancellationtoken")
 def QuadRemeshBrepAsync1(brep, parameters, guideCurves, progress, cancelToken, multiple=False):
     """
     Quad remesh this brep async
@@ -1768,27 +1291,16 @@ def QuadRemeshBrepAsync1(brep, parameters, guideCurves, progress, cancelToken, m
             The curves should touch the input mesh
             Set Guide Curve Influence by using QuadRemeshParameters.GuideCurveInfluence
     """
-    url = "rhino/geometry/mesh/quadremeshbrepasync-brep_quadremeshparameters_curvearray_intarray_cancellationtoken"
-    if multiple: url += "?multiple=true"
-    args = [brep, parameters, guideCurves, progress, cancelToken]
-    if multiple: args = zip(brep, parameters, guideCurves, progress, cancelToken)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/quadremesh-mesh_quadremeshparameters", Util.DecodeToCommonObject)
 def QuadRemesh(thisMesh, parameters, multiple=False):
     """
     Quad remesh this mesh
     """
-    url = "rhino/geometry/mesh/quadremesh-mesh_quadremeshparameters"
-    if multiple: url += "?multiple=true"
-    args = [thisMesh, parameters]
-    if multiple: args = zip(thisMesh, parameters)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/quadremesh-mesh_quadremeshparameters_curvearray", Util.DecodeToCommonObject)
 def QuadRemesh1(thisMesh, parameters, guideCurves, multiple=False):
     """
     Quad remesh this mesh
@@ -1798,27 +1310,16 @@ def QuadRemesh1(thisMesh, parameters, guideCurves, multiple=False):
             The curves should touch the input mesh
             Set Guide Curve Influence by using QuadRemeshParameters.GuideCurveInfluence
     """
-    url = "rhino/geometry/mesh/quadremesh-mesh_quadremeshparameters_curvearray"
-    if multiple: url += "?multiple=true"
-    args = [thisMesh, parameters, guideCurves]
-    if multiple: args = zip(thisMesh, parameters, guideCurves)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/quadremeshasync-mesh_quadremeshparameters_intarray_cancellationtoken")
 def QuadRemeshAsync(thisMesh, parameters, progress, cancelToken, multiple=False):
     """
     Quad remesh this mesh async
     """
-    url = "rhino/geometry/mesh/quadremeshasync-mesh_quadremeshparameters_intarray_cancellationtoken"
-    if multiple: url += "?multiple=true"
-    args = [thisMesh, parameters, progress, cancelToken]
-    if multiple: args = zip(thisMesh, parameters, progress, cancelToken)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/quadremeshasync-mesh_quadremeshparameters_curvearray_intarray_cancellationtoken")
 def QuadRemeshAsync1(thisMesh, parameters, guideCurves, progress, cancelToken, multiple=False):
     """
     Quad remesh this mesh async
@@ -1828,14 +1329,9 @@ def QuadRemeshAsync1(thisMesh, parameters, guideCurves, progress, cancelToken, m
             The curves should touch the input mesh
             Set Guide Curve Influence by using QuadRemeshParameters.GuideCurveInfluence
     """
-    url = "rhino/geometry/mesh/quadremeshasync-mesh_quadremeshparameters_curvearray_intarray_cancellationtoken"
-    if multiple: url += "?multiple=true"
-    args = [thisMesh, parameters, guideCurves, progress, cancelToken]
-    if multiple: args = zip(thisMesh, parameters, guideCurves, progress, cancelToken)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/quadremeshasync-mesh_intarray_quadremeshparameters_curvearray_intarray_cancellationtoken")
 def QuadRemeshAsync2(thisMesh, faceBlocks, parameters, guideCurves, progress, cancelToken, multiple=False):
     """
     Quad remesh this mesh async
@@ -1845,14 +1341,9 @@ def QuadRemeshAsync2(thisMesh, faceBlocks, parameters, guideCurves, progress, ca
             The curves should touch the input mesh
             Set Guide Curve Influence by using QuadRemeshParameters.GuideCurveInfluence
     """
-    url = "rhino/geometry/mesh/quadremeshasync-mesh_intarray_quadremeshparameters_curvearray_intarray_cancellationtoken"
-    if multiple: url += "?multiple=true"
-    args = [thisMesh, faceBlocks, parameters, guideCurves, progress, cancelToken]
-    if multiple: args = zip(thisMesh, faceBlocks, parameters, guideCurves, progress, cancelToken)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/reduce-mesh_int_bool_int_bool")
 def Reduce(thisMesh, desiredPolygonCount, allowDistortion, accuracy, normalizeSize, multiple=False):
     """
     Reduce polygon count
@@ -1867,14 +1358,9 @@ def Reduce(thisMesh, desiredPolygonCount, allowDistortion, accuracy, normalizeSi
     Returns:
         bool: True if mesh is successfully reduced and False if mesh could not be reduced for some reason.
     """
-    url = "rhino/geometry/mesh/reduce-mesh_int_bool_int_bool"
-    if multiple: url += "?multiple=true"
-    args = [thisMesh, desiredPolygonCount, allowDistortion, accuracy, normalizeSize]
-    if multiple: args = zip(thisMesh, desiredPolygonCount, allowDistortion, accuracy, normalizeSize)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/reduce-mesh_int_bool_int_bool_bool")
 def Reduce1(thisMesh, desiredPolygonCount, allowDistortion, accuracy, normalizeSize, threaded, multiple=False):
     """
     Reduce polygon count
@@ -1891,14 +1377,9 @@ def Reduce1(thisMesh, desiredPolygonCount, allowDistortion, accuracy, normalizeS
     Returns:
         bool: True if mesh is successfully reduced and False if mesh could not be reduced for some reason.
     """
-    url = "rhino/geometry/mesh/reduce-mesh_int_bool_int_bool_bool"
-    if multiple: url += "?multiple=true"
-    args = [thisMesh, desiredPolygonCount, allowDistortion, accuracy, normalizeSize, threaded]
-    if multiple: args = zip(thisMesh, desiredPolygonCount, allowDistortion, accuracy, normalizeSize, threaded)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/reduce-mesh_int_bool_int_bool_cancellationtoken_doublearray_string")
 def Reduce2(thisMesh, desiredPolygonCount, allowDistortion, accuracy, normalizeSize, cancelToken, progress, multiple=False):
     """
     Reduce polygon count
@@ -1913,14 +1394,9 @@ def Reduce2(thisMesh, desiredPolygonCount, allowDistortion, accuracy, normalizeS
     Returns:
         bool: True if mesh is successfully reduced and False if mesh could not be reduced for some reason.
     """
-    url = "rhino/geometry/mesh/reduce-mesh_int_bool_int_bool_cancellationtoken_doublearray_string"
-    if multiple: url += "?multiple=true"
-    args = [thisMesh, desiredPolygonCount, allowDistortion, accuracy, normalizeSize, cancelToken, progress]
-    if multiple: args = zip(thisMesh, desiredPolygonCount, allowDistortion, accuracy, normalizeSize, cancelToken, progress)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/reduce-mesh_int_bool_int_bool_cancellationtoken_doublearray_string_bool")
 def Reduce3(thisMesh, desiredPolygonCount, allowDistortion, accuracy, normalizeSize, cancelToken, progress, threaded, multiple=False):
     """
     Reduce polygon count
@@ -1937,14 +1413,9 @@ def Reduce3(thisMesh, desiredPolygonCount, allowDistortion, accuracy, normalizeS
     Returns:
         bool: True if mesh is successfully reduced and False if mesh could not be reduced for some reason.
     """
-    url = "rhino/geometry/mesh/reduce-mesh_int_bool_int_bool_cancellationtoken_doublearray_string_bool"
-    if multiple: url += "?multiple=true"
-    args = [thisMesh, desiredPolygonCount, allowDistortion, accuracy, normalizeSize, cancelToken, progress, threaded]
-    if multiple: args = zip(thisMesh, desiredPolygonCount, allowDistortion, accuracy, normalizeSize, cancelToken, progress, threaded)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/reduce-mesh_reducemeshparameters")
 def Reduce4(thisMesh, parameters, multiple=False):
     """
     Reduce polygon count
@@ -1955,14 +1426,9 @@ def Reduce4(thisMesh, parameters, multiple=False):
     Returns:
         bool: True if mesh is successfully reduced and False if mesh could not be reduced for some reason.
     """
-    url = "rhino/geometry/mesh/reduce-mesh_reducemeshparameters"
-    if multiple: url += "?multiple=true"
-    args = [thisMesh, parameters]
-    if multiple: args = zip(thisMesh, parameters)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/reduce-mesh_reducemeshparameters_bool")
 def Reduce5(thisMesh, parameters, threaded, multiple=False):
     """
     Reduce polygon count
@@ -1975,14 +1441,9 @@ def Reduce5(thisMesh, parameters, threaded, multiple=False):
     Returns:
         bool: True if mesh is successfully reduced and False if mesh could not be reduced for some reason.
     """
-    url = "rhino/geometry/mesh/reduce-mesh_reducemeshparameters_bool"
-    if multiple: url += "?multiple=true"
-    args = [thisMesh, parameters, threaded]
-    if multiple: args = zip(thisMesh, parameters, threaded)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/computethickness-mesharray_double")
 def ComputeThickness(meshes, maximumThickness, multiple=False):
     """
     Compute thickness metrics for this mesh.
@@ -1994,14 +1455,9 @@ def ComputeThickness(meshes, maximumThickness, multiple=False):
     Returns:
         MeshThicknessMeasurement[]: Array of thickness measurements.
     """
-    url = "rhino/geometry/mesh/computethickness-mesharray_double"
-    if multiple: url += "?multiple=true"
-    args = [meshes, maximumThickness]
-    if multiple: args = zip(meshes, maximumThickness)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/computethickness-mesharray_double_system.threading.cancellationtoken")
 def ComputeThickness1(meshes, maximumThickness, cancelToken, multiple=False):
     """
     Compute thickness metrics for this mesh.
@@ -2014,14 +1470,9 @@ def ComputeThickness1(meshes, maximumThickness, cancelToken, multiple=False):
     Returns:
         MeshThicknessMeasurement[]: Array of thickness measurements.
     """
-    url = "rhino/geometry/mesh/computethickness-mesharray_double_system.threading.cancellationtoken"
-    if multiple: url += "?multiple=true"
-    args = [meshes, maximumThickness, cancelToken]
-    if multiple: args = zip(meshes, maximumThickness, cancelToken)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/computethickness-mesharray_double_double_system.threading.cancellationtoken")
 def ComputeThickness2(meshes, maximumThickness, sharpAngle, cancelToken, multiple=False):
     """
     Compute thickness metrics for this mesh.
@@ -2035,14 +1486,9 @@ def ComputeThickness2(meshes, maximumThickness, sharpAngle, cancelToken, multipl
     Returns:
         MeshThicknessMeasurement[]: Array of thickness measurements.
     """
-    url = "rhino/geometry/mesh/computethickness-mesharray_double_double_system.threading.cancellationtoken"
-    if multiple: url += "?multiple=true"
-    args = [meshes, maximumThickness, sharpAngle, cancelToken]
-    if multiple: args = zip(meshes, maximumThickness, sharpAngle, cancelToken)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/createcontourcurves-mesh_point3d_point3d_double", Util.DecodeToCommonObject)
 def CreateContourCurves(meshToContour, contourStart, contourEnd, interval, multiple=False):
     """
     Constructs contour curves for a mesh, sectioned along a linear axis.
@@ -2056,15 +1502,9 @@ def CreateContourCurves(meshToContour, contourStart, contourEnd, interval, multi
     Returns:
         Curve[]: An array of curves. This array can be empty.
     """
-    url = "rhino/geometry/mesh/createcontourcurves-mesh_point3d_point3d_double"
-    if multiple: url += "?multiple=true"
-    args = [meshToContour, contourStart, contourEnd, interval]
-    if multiple: args = zip(meshToContour, contourStart, contourEnd, interval)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/mesh/createcontourcurves-mesh_plane", Util.DecodeToCommonObject)
 def CreateContourCurves1(meshToContour, sectionPlane, multiple=False):
     """
     Constructs contour curves for a mesh, sectioned at a plane.
@@ -2076,11 +1516,4 @@ def CreateContourCurves1(meshToContour, sectionPlane, multiple=False):
     Returns:
         Curve[]: An array of curves. This array can be empty.
     """
-    url = "rhino/geometry/mesh/createcontourcurves-mesh_plane"
-    if multiple: url += "?multiple=true"
-    args = [meshToContour, sectionPlane]
-    if multiple: args = zip(meshToContour, sectionPlane)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
@@ -0,0 +1,75 @@
+"""
+Binary msgpack wire format. Requires the msgpack package.
+
+    >>> Util.wireFormat = 'msgpack'
+    >>> client = ComputeClient(wire_format='msgpack')
+
+Requests are then sent as application/msgpack and servers that understand it
+answer in kind; JSON responses are still accepted. A server answering a
+msgpack request with 415, 400 or 500 before it accepted any is sent the call
+again as JSON, and is sent JSON from then on (per base url, see
+Util._jsonServers). Compared to JSON the format carries
+
+- the opennurbs archives of encoded rhino3dm objects as raw bytes instead of
+  base64 text, in the 'data' entry of the usual archive map
+- (N, 3) NumPy arrays of points and vectors as extension type 1, the
+  coordinates packed as little-endian float64 x, y, z values
+- lists of lines as extension type 2, packed as x, y, z of the start point
+  followed by x, y, z of the end point
+
+Everything else maps to msgpack the way it maps to JSON.
+"""
+import base64
+from . import Util
+
+contentType = 'application/msgpack'
+
+_extPoints = 1
+_extLines = 2
+
+
+def _Default(o):
+    if isinstance(o, Util.PackedPoints):
+        code = _extLines if o.isLine else _extPoints
+        return _msgpack().ExtType(code, o.data)
+    if hasattr(o, 'Encode'):
+        data = Util._Encode(o)
+        if isinstance(data, dict) and isinstance(data.get('data'), str) and 'archive3dm' in data:
+            data = dict(data, data=base64.b64decode(data['data']))
+        return data
+    if isinstance(o, Util.BatchArgs):
+        return list(o)
+    if Util._IsNumpy(o):
+        shape = getattr(o, 'shape', ())
+        if len(shape) == 2 and shape[1] == 3 and o.dtype.kind in 'fiu':
+            return _msgpack().ExtType(_extPoints, o.astype('<f8', copy=False).tobytes())
+        return Util._EncodeNumpy(o)
+    raise TypeError('Object of type {} is not msgpack serializable'.format(type(o).__name__))
+
+
+def _ExtHook(code, data):
+    if code == _extPoints:
+        return Util.PackedPoints(data)
+    if code == _extLines:
+        return Util.PackedPoints(data, True)
+    return _msgpack().ExtType(code, data)
+
+
+def _msgpack():
+    import msgpack
+    return msgpack
+
+
+def Dumps(obj):
+    """
+    Encode an object, including rhino3dm objects and NumPy arrays, as msgpack
+    """
+    return _msgpack().packb(obj, default=_Default, use_bin_type=True)
+
+
+def Loads(data):
+    """
+    Parse a msgpack document. Packed points and lines become
+    Util.PackedPoints
+    """
+    return _msgpack().unpackb(data, raw=False, strict_map_key=False, ext_hook=_ExtHook)
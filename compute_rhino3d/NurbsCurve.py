@@ -1,6 +1,7 @@
 from . import Util
 
 
+@Util.Endpoint("rhino/geometry/nurbscurve/makecompatible-curvearray_point3d_point3d_int_int_double_double", Util.DecodeToCommonObject)
 def MakeCompatible(curves, startPt, endPt, simplifyMethod, numPoints, refitTolerance, angleTolerance, multiple=False):
     """
     For expert use only. From the input curves, make an array of compatible NURBS curves.
@@ -17,15 +18,9 @@ def MakeCompatible(curves, startPt, endPt, simplifyMethod, numPoints, refitToler
     Returns:
         NurbsCurve[]: The output NURBS surfaces if successful.
     """
-    url = "rhino/geometry/nurbscurve/makecompatible-curvearray_point3d_point3d_int_int_double_double"
-    if multiple: url += "?multiple=true"
-    args = [curves, startPt, endPt, simplifyMethod, numPoints, refitTolerance, angleTolerance]
-    if multiple: args = zip(curves, startPt, endPt, simplifyMethod, numPoints, refitTolerance, angleTolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/nurbscurve/createparabolafromvertex-point3d_point3d_point3d", Util.DecodeToCommonObject)
 def CreateParabolaFromVertex(vertex, startPoint, endPoint, multiple=False):
     """
     Createsa a parabola from vertex and end points.
@@ -38,15 +33,9 @@ def CreateParabolaFromVertex(vertex, startPoint, endPoint, multiple=False):
     Returns:
         NurbsCurve: A 2 degree NURBS curve if successful, False otherwise.
     """
-    url = "rhino/geometry/nurbscurve/createparabolafromvertex-point3d_point3d_point3d"
-    if multiple: url += "?multiple=true"
-    args = [vertex, startPoint, endPoint]
-    if multiple: args = zip(vertex, startPoint, endPoint)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/nurbscurve/createparabolafromfocus-point3d_point3d_point3d", Util.DecodeToCommonObject)
 def CreateParabolaFromFocus(focus, startPoint, endPoint, multiple=False):
     """
     Creates a parabola from focus and end points.
@@ -59,15 +48,9 @@ def CreateParabolaFromFocus(focus, startPoint, endPoint, multiple=False):
     Returns:
         NurbsCurve: A 2 degree NURBS curve if successful, False otherwise.
     """
-    url = "rhino/geometry/nurbscurve/createparabolafromfocus-point3d_point3d_point3d"
-    if multiple: url += "?multiple=true"
-    args = [focus, startPoint, endPoint]
-    if multiple: args = zip(focus, startPoint, endPoint)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/nurbscurve/createfromarc-arc_int_int", Util.DecodeToCommonObject)
 def CreateFromArc(arc, degree, cvCount, multiple=False):
     """
     Create a uniform non-ratonal cubic NURBS approximation of an arc.
@@ -79,15 +62,9 @@ def CreateFromArc(arc, degree, cvCount, multiple=False):
     Returns:
         NurbsCurve: NURBS curve approximation of an arc on success
     """
-    url = "rhino/geometry/nurbscurve/createfromarc-arc_int_int"
-    if multiple: url += "?multiple=true"
-    args = [arc, degree, cvCount]
-    if multiple: args = zip(arc, degree, cvCount)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/nurbscurve/createhspline-point3darray", Util.DecodeToCommonObject)
 def CreateHSpline(points, multiple=False):
     """
     Construct an H-spline from a sequence of interpolation points
@@ -95,15 +72,9 @@ def CreateHSpline(points, multiple=False):
     Args:
         points (IEnumerable<Point3d>): Points to interpolate
     """
-    url = "rhino/geometry/nurbscurve/createhspline-point3darray"
-    if multiple: url += "?multiple=true"
-    args = [points]
-    if multiple: args = [[item] for item in points]
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/nurbscurve/createhspline-point3darray_vector3d_vector3d", Util.DecodeToCommonObject)
 def CreateHSpline1(points, startTangent, endTangent, multiple=False):
     """
     Construct an H-spline from a sequence of interpolation points and
@@ -114,15 +85,9 @@ def CreateHSpline1(points, startTangent, endTangent, multiple=False):
         startTangent (Vector3d): Unit tangent vector or Unset
         endTangent (Vector3d): Unit tangent vector or Unset
     """
-    url = "rhino/geometry/nurbscurve/createhspline-point3darray_vector3d_vector3d"
-    if multiple: url += "?multiple=true"
-    args = [points, startTangent, endTangent]
-    if multiple: args = zip(points, startTangent, endTangent)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/nurbscurve/createfromcircle-circle_int_int", Util.DecodeToCommonObject)
 def CreateFromCircle(circle, degree, cvCount, multiple=False):
     """
     Create a uniform non-ratonal cubic NURBS approximation of a circle.
@@ -134,15 +99,9 @@ def CreateFromCircle(circle, degree, cvCount, multiple=False):
     Returns:
         NurbsCurve: NURBS curve approximation of a circle on success
     """
-    url = "rhino/geometry/nurbscurve/createfromcircle-circle_int_int"
-    if multiple: url += "?multiple=true"
-    args = [circle, degree, cvCount]
-    if multiple: args = zip(circle, degree, cvCount)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/nurbscurve/setendcondition-nurbscurve_bool_nurbscurveendconditiontype_point3d_vector3d")
 def SetEndCondition(thisNurbsCurve, bSetEnd, continuity, point, tangent, multiple=False):
     """
     Set end condition of a nurbs curve to point, tangent and curvature.
@@ -156,14 +115,9 @@ def SetEndCondition(thisNurbsCurve, bSetEnd, continuity, point, tangent, multipl
     Returns:
         bool: True on success, False on failure.
     """
-    url = "rhino/geometry/nurbscurve/setendcondition-nurbscurve_bool_nurbscurveendconditiontype_point3d_vector3d"
-    if multiple: url += "?multiple=true"
-    args = [thisNurbsCurve, bSetEnd, continuity, point, tangent]
-    if multiple: args = zip(thisNurbsCurve, bSetEnd, continuity, point, tangent)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/nurbscurve/setendcondition-nurbscurve_bool_nurbscurveendconditiontype_point3d_vector3d_vector3d")
 def SetEndCondition1(thisNurbsCurve, bSetEnd, continuity, point, tangent, curvature, multiple=False):
     """
     Set end condition of a nurbs curve to point, tangent and curvature.
@@ -178,14 +132,9 @@ def SetEndCondition1(thisNurbsCurve, bSetEnd, continuity, point, tangent, curvat
     Returns:
         bool: True on success, False on failure.
     """
-    url = "rhino/geometry/nurbscurve/setendcondition-nurbscurve_bool_nurbscurveendconditiontype_point3d_vector3d_vector3d"
-    if multiple: url += "?multiple=true"
-    args = [thisNurbsCurve, bSetEnd, continuity, point, tangent, curvature]
-    if multiple: args = zip(thisNurbsCurve, bSetEnd, continuity, point, tangent, curvature)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/nurbscurve/grevillepoints-nurbscurve_bool")
 def GrevillePoints(thisNurbsCurve, all, multiple=False):
     """
     Gets Greville points for this curve.
@@ -196,14 +145,9 @@ def GrevillePoints(thisNurbsCurve, all, multiple=False):
     Returns:
         Point3dList: A list of points if successful, None otherwise.
     """
-    url = "rhino/geometry/nurbscurve/grevillepoints-nurbscurve_bool"
-    if multiple: url += "?multiple=true"
-    args = [thisNurbsCurve, all]
-    if multiple: args = zip(thisNurbsCurve, all)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/nurbscurve/setgrevillepoints-nurbscurve_point3darray")
 def SetGrevillePoints(thisNurbsCurve, points, multiple=False):
     """
     Sets all Greville edit points for this curve.
@@ -215,14 +159,9 @@ def SetGrevillePoints(thisNurbsCurve, points, multiple=False):
     Returns:
         bool: True if successful, False otherwise.
     """
-    url = "rhino/geometry/nurbscurve/setgrevillepoints-nurbscurve_point3darray"
-    if multiple: url += "?multiple=true"
-    args = [thisNurbsCurve, points]
-    if multiple: args = zip(thisNurbsCurve, points)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/nurbscurve/createspiral-point3d_vector3d_point3d_double_double_double_double", Util.DecodeToCommonObject)
 def CreateSpiral(axisStart, axisDir, radiusPoint, pitch, turnCount, radius0, radius1, multiple=False):
     """
     Creates a C1 cubic NURBS approximation of a helix or spiral. For a helix,
@@ -246,15 +185,9 @@ def CreateSpiral(axisStart, axisDir, radiusPoint, pitch, turnCount, radius0, rad
     Returns:
         NurbsCurve: NurbsCurve on success, None on failure.
     """
-    url = "rhino/geometry/nurbscurve/createspiral-point3d_vector3d_point3d_double_double_double_double"
-    if multiple: url += "?multiple=true"
-    args = [axisStart, axisDir, radiusPoint, pitch, turnCount, radius0, radius1]
-    if multiple: args = zip(axisStart, axisDir, radiusPoint, pitch, turnCount, radius0, radius1)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/nurbscurve/createspiral-curve_double_double_point3d_double_double_double_double_int", Util.DecodeToCommonObject)
 def CreateSpiral1(railCurve, t0, t1, radiusPoint, pitch, turnCount, radius0, radius1, pointsPerTurn, multiple=False):
     """
     Create a C2 non-rational uniform cubic NURBS approximation of a swept helix or spiral.
@@ -281,11 +214,4 @@ def CreateSpiral1(railCurve, t0, t1, radiusPoint, pitch, turnCount, radius0, rad
     Returns:
         NurbsCurve: NurbsCurve on success, None on failure.
     """
-    url = "rhino/geometry/nurbscurve/createspiral-curve_double_double_point3d_double_double_double_double_int"
-    if multiple: url += "?multiple=true"
-    args = [railCurve, t0, t1, radiusPoint, pitch, turnCount, radius0, radius1, pointsPerTurn]
-    if multiple: args = zip(railCurve, t0, t1, radiusPoint, pitch, turnCount, radius0, radius1, pointsPerTurn)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
@@ -1,6 +1,7 @@
 from . import Util
 
 
+@Util.Endpoint("rhino/geometry/nurbssurface/createcurveonsurfacepoints-surface_point2darray_double_bool_int_int")
 def CreateCurveOnSurfacePoints(surface, fixedPoints, tolerance, periodic, initCount, levels, multiple=False):
     """
     Computes a discrete spline curve on the surface. In other words, computes a sequence
@@ -20,14 +21,9 @@ def CreateCurveOnSurfacePoints(surface, fixedPoints, tolerance, periodic, initCo
         Point2d[]: A sequence of surface points, given by surface parameters, if successful.
         The number of output points is approximatelely: 2 ^ (level-1) * initCount * fixedPoints.Count.
     """
-    url = "rhino/geometry/nurbssurface/createcurveonsurfacepoints-surface_point2darray_double_bool_int_int"
-    if multiple: url += "?multiple=true"
-    args = [surface, fixedPoints, tolerance, periodic, initCount, levels]
-    if multiple: args = zip(surface, fixedPoints, tolerance, periodic, initCount, levels)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/nurbssurface/createcurveonsurface-surface_point2darray_double_bool", Util.DecodeToCommonObject)
 def CreateCurveOnSurface(surface, points, tolerance, periodic, multiple=False):
     """
     Fit a sequence of 2d points on a surface to make a curve on the surface.
@@ -41,15 +37,9 @@ def CreateCurveOnSurface(surface, points, tolerance, periodic, multiple=False):
     Returns:
         NurbsCurve: A curve interpolating the points if successful, None on error.
     """
-    url = "rhino/geometry/nurbssurface/createcurveonsurface-surface_point2darray_double_bool"
-    if multiple: url += "?multiple=true"
-    args = [surface, points, tolerance, periodic]
-    if multiple: args = zip(surface, points, tolerance, periodic)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/nurbssurface/makecompatible-surface_surface_nurbssurface_nurbssurface")
 def MakeCompatible(surface0, surface1, multiple=False):
     """
     For expert use only. Makes a pair of compatible NURBS surfaces based on two input surfaces.
@@ -63,14 +53,9 @@ def MakeCompatible(surface0, surface1, multiple=False):
         nurb0 (NurbsSurface): The first output NURBS surface.
         nurb1 (NurbsSurface): The second output NURBS surface.
     """
-    url = "rhino/geometry/nurbssurface/makecompatible-surface_surface_nurbssurface_nurbssurface"
-    if multiple: url += "?multiple=true"
-    args = [surface0, surface1]
-    if multiple: args = zip(surface0, surface1)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/nurbssurface/createfrompoints-point3darray_int_int_int_int", Util.DecodeToCommonObject)
 def CreateFromPoints(points, uCount, vCount, uDegree, vDegree, multiple=False):
     """
     Constructs a NURBS surface from a 2D grid of control points.
@@ -85,15 +70,9 @@ def CreateFromPoints(points, uCount, vCount, uDegree, vDegree, multiple=False):
     Returns:
         NurbsSurface: A NurbsSurface on success or None on failure.
     """
-    url = "rhino/geometry/nurbssurface/createfrompoints-point3darray_int_int_int_int"
-    if multiple: url += "?multiple=true"
-    args = [points, uCount, vCount, uDegree, vDegree]
-    if multiple: args = zip(points, uCount, vCount, uDegree, vDegree)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/nurbssurface/createthroughpoints-point3darray_int_int_int_int_bool_bool", Util.DecodeToCommonObject)
 def CreateThroughPoints(points, uCount, vCount, uDegree, vDegree, uClosed, vClosed, multiple=False):
     """
     Constructs a NURBS surface from a 2D grid of points.
@@ -110,15 +89,9 @@ def CreateThroughPoints(points, uCount, vCount, uDegree, vDegree, uClosed, vClos
     Returns:
         NurbsSurface: A NurbsSurface on success or None on failure.
     """
-    url = "rhino/geometry/nurbssurface/createthroughpoints-point3darray_int_int_int_int_bool_bool"
-    if multiple: url += "?multiple=true"
-    args = [points, uCount, vCount, uDegree, vDegree, uClosed, vClosed]
-    if multiple: args = zip(points, uCount, vCount, uDegree, vDegree, uClosed, vClosed)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/nurbssurface/createfromcorners-point3d_point3d_point3d_point3d", Util.DecodeToCommonObject)
 def CreateFromCorners(corner1, corner2, corner3, corner4, multiple=False):
     """
     Makes a surface from 4 corner points.
@@ -133,15 +106,9 @@ def CreateFromCorners(corner1, corner2, corner3, corner4, multiple=False):
     Returns:
         NurbsSurface: the resulting surface or None on error.
     """
-    url = "rhino/geometry/nurbssurface/createfromcorners-point3d_point3d_point3d_point3d"
-    if multiple: url += "?multiple=true"
-    args = [corner1, corner2, corner3, corner4]
-    if multiple: args = zip(corner1, corner2, corner3, corner4)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/nurbssurface/createfromcorners-point3d_point3d_point3d_point3d_double", Util.DecodeToCommonObject)
 def CreateFromCorners1(corner1, corner2, corner3, corner4, tolerance, multiple=False):
     """
     Makes a surface from 4 corner points.
@@ -156,15 +123,9 @@ def CreateFromCorners1(corner1, corner2, corner3, corner4, tolerance, multiple=F
     Returns:
         NurbsSurface: The resulting surface or None on error.
     """
-    url = "rhino/geometry/nurbssurface/createfromcorners-point3d_point3d_point3d_point3d_double"
-    if multiple: url += "?multiple=true"
-    args = [corner1, corner2, corner3, corner4, tolerance]
-    if multiple: args = zip(corner1, corner2, corner3, corner4, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/nurbssurface/createfromcorners-point3d_point3d_point3d", Util.DecodeToCommonObject)
 def CreateFromCorners2(corner1, corner2, corner3, multiple=False):
     """
     Makes a surface from 3 corner points.
@@ -177,15 +138,9 @@ def CreateFromCorners2(corner1, corner2, corner3, multiple=False):
     Returns:
         NurbsSurface: The resulting surface or None on error.
     """
-    url = "rhino/geometry/nurbssurface/createfromcorners-point3d_point3d_point3d"
-    if multiple: url += "?multiple=true"
-    args = [corner1, corner2, corner3]
-    if multiple: args = zip(corner1, corner2, corner3)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/nurbssurface/createrailrevolvedsurface-curve_curve_line_bool", Util.DecodeToCommonObject)
 def CreateRailRevolvedSurface(profile, rail, axis, scaleHeight, multiple=False):
     """
     Constructs a railed Surface-of-Revolution.
@@ -199,15 +154,9 @@ def CreateRailRevolvedSurface(profile, rail, axis, scaleHeight, multiple=False):
     Returns:
         NurbsSurface: A NurbsSurface or None on failure.
     """
-    url = "rhino/geometry/nurbssurface/createrailrevolvedsurface-curve_curve_line_bool"
-    if multiple: url += "?multiple=true"
-    args = [profile, rail, axis, scaleHeight]
-    if multiple: args = zip(profile, rail, axis, scaleHeight)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/nurbssurface/createnetworksurface-curvearray_int_int_curvearray_int_int_double_double_double_int")
 def CreateNetworkSurface(uCurves, uContinuityStart, uContinuityEnd, vCurves, vContinuityStart, vContinuityEnd, edgeTolerance, interiorTolerance, angleTolerance, multiple=False):
     """
     Builds a surface from an ordered network of curves/edges.
@@ -229,14 +178,9 @@ def CreateNetworkSurface(uCurves, uContinuityStart, uContinuityEnd, vCurves, vCo
             the failure occured.  0 = success,  1 = curve sorter failed, 2 = network initializing failed,
             3 = failed to build surface, 4 = network surface is not valid.
     """
-    url = "rhino/geometry/nurbssurface/createnetworksurface-curvearray_int_int_curvearray_int_int_double_double_double_int"
-    if multiple: url += "?multiple=true"
-    args = [uCurves, uContinuityStart, uContinuityEnd, vCurves, vContinuityStart, vContinuityEnd, edgeTolerance, interiorTolerance, angleTolerance]
-    if multiple: args = zip(uCurves, uContinuityStart, uContinuityEnd, vCurves, vContinuityStart, vContinuityEnd, edgeTolerance, interiorTolerance, angleTolerance)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/nurbssurface/createnetworksurface-curvearray_int_double_double_double_int")
 def CreateNetworkSurface1(curves, continuity, edgeTolerance, interiorTolerance, angleTolerance, multiple=False):
     """
     Builds a surface from an autosorted network of curves/edges.
@@ -254,10 +198,4 @@ def CreateNetworkSurface1(curves, continuity, edgeTolerance, interiorTolerance,
             the failure occured.  0 = success,  1 = curve sorter failed, 2 = network initializing failed,
             3 = failed to build surface, 4 = network surface is not valid.
     """
-    url = "rhino/geometry/nurbssurface/createnetworksurface-curvearray_int_double_double_double_int"
-    if multiple: url += "?multiple=true"
-    args = [curves, continuity, edgeTolerance, interiorTolerance, angleTolerance]
-    if multiple: args = zip(curves, continuity, edgeTolerance, interiorTolerance, angleTolerance)
-    response = Util.ComputeFetch(url, args)
-    return response
 
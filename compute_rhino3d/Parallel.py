@@ -0,0 +1,140 @@
+"""
+Concurrent calls of a wrapper function over many inputs.
+
+    >>> import compute_rhino3d
+    >>> for meshes in compute_rhino3d.map(Mesh.CreateFromBrep, breps, concurrency=16):
+    ...     process(meshes)
+"""
+import collections
+import concurrent.futures
+import contextvars
+import inspect
+import itertools
+from . import Util
+
+# calls with encoded arguments smaller than this many bytes are grouped into
+# multiple=true requests when no chunk_size is given
+batchThreshold = 64 * 1024
+# maximum number of calls grouped into one multiple=true request
+maxChunkSize = 100
+
+
+def Map(func, iterable, concurrency=8, chunk_size=None, return_exceptions=False):
+    """
+    Call a wrapper function for every item of an iterable, running up to
+    `concurrency` requests at a time over the pooled connections.
+
+    Results are yielded in the order of the input, each as soon as it and all
+    results before it are available. Items that are tuples are unpacked into
+    the arguments of the function; wrap a tuple argument in a 1-tuple to pass
+    it as is. The iterable is consumed lazily.
+
+    Args:
+        func (function): a generated wrapper function, e.g. Mesh.CreateFromBrep
+        iterable (iter): the arguments of each call
+        concurrency (int): maximum number of requests in flight. Raise
+                           Util.poolMaxsize to keep that many connections
+                           alive
+        chunk_size (int): number of calls sent together as one multiple=true
+                          request. 1 sends every call on its own. None picks a
+                          size from the encoded size of the first call: small
+                          calls are grouped, large calls are sent on their own
+        return_exceptions (bool): yield the exception of a failed call in its
+                                  place instead of raising it. The calls of
+                                  a failed multiple=true request are sent
+                                  again one at a time, so only the calls
+                                  that fail on their own get an exception
+    Returns:
+        generator: results of the calls
+    """
+    calls = (item if isinstance(item, tuple) else (item,) for item in iterable)
+    if chunk_size is None:
+        first = next(calls, None)
+        if first is None:
+            return iter(())
+        chunk_size = _ChunkSize(func, first)
+        calls = itertools.chain([first], calls)
+    return _Map(func, calls, concurrency, max(1, chunk_size), return_exceptions)
+
+
+def _ChunkSize(func, call):
+    try:
+        if 'multiple' not in inspect.signature(func).parameters:
+            return 1
+    except (TypeError, ValueError):
+        return 1
+    size = len(Util.EncodeArgs(list(call)))
+    if size >= batchThreshold:
+        return 1
+    return max(1, min(maxChunkSize, batchThreshold // max(size, 1)))
+
+
+def _Call(func, chunk, multiple, return_exceptions):
+    if not multiple:
+        return [func(*chunk[0])]
+    try:
+        return _CallMultiple(func, chunk)
+    except Util.ComputeConnectionError:
+        # the server is not reachable; sending the calls again would not help
+        raise
+    except Exception:
+        if len(chunk) == 1: raise
+    # one bad call fails the whole request: send every call on its own so
+    # each error belongs to its item
+    results = []
+    for call in chunk:
+        try:
+            results.append(func(*call))
+        except Exception as e:
+            if not return_exceptions: raise
+            results.append(e)
+    return results
+
+
+def _CallMultiple(func, chunk):
+    columns = [list(column) for column in zip(*chunk)]
+    results = func(*columns, multiple=True)
+    # a list, or with Util.decodeToNumpy an array with a row per call
+    count = len(results) if _IsSequence(results) else None
+    if count != len(chunk):
+        raise Util.ComputeResponseError('multiple=true call returned {} results for {} calls'.format(
+            'no' if count is None else count, len(chunk)))
+    return list(results)
+
+
+def _IsSequence(results):
+    return (hasattr(results, '__len__') and hasattr(results, '__getitem__')
+            and not isinstance(results, (str, bytes, dict)))
+
+
+def _Map(func, calls, concurrency, chunk_size, return_exceptions):
+    multiple = chunk_size > 1
+    chunks = iter(lambda: list(itertools.islice(calls, chunk_size)), [])
+    executor = concurrent.futures.ThreadPoolExecutor(concurrency)
+    pending = collections.deque()
+
+    def submit(chunk):
+        # run in a copy of the caller's context so Util.UseClient applies
+        context = contextvars.copy_context()
+        future = executor.submit(context.run, _Call, func, chunk, multiple,
+                                 return_exceptions)
+        pending.append((future, len(chunk)))
+
+    try:
+        for chunk in itertools.islice(chunks, concurrency * 2):
+            submit(chunk)
+        while pending:
+            future, count = pending.popleft()
+            try:
+                results = future.result()
+            except Exception as e:
+                if not return_exceptions: raise
+                results = [e] * count
+            chunk = next(chunks, None)
+            if chunk is not None: submit(chunk)
+            for result in results:
+                yield result
+    finally:
+        for future, _ in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
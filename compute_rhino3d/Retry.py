@@ -0,0 +1,96 @@
+"""
+Retry policy for failed compute calls.
+
+    >>> Util.retry = RetryPolicy(max_retries=3, backoff=0.25)
+"""
+import random
+import threading
+import time
+from . import Util
+
+
+class RetryPolicy:
+    """
+    Decides whether and when a failed call is sent again.
+
+    Calls are retried with exponential backoff and full jitter. Failures where
+    the server never saw the request (connection refused, connect timeouts)
+    and responses telling the client to come back later (429, 503) are
+    retried for every endpoint. Failures after the request was sent (read
+    timeouts, dropped connections, 502, 504) are only retried for idempotent
+    endpoints, which by default are the pure rhino/geometry/ functions.
+
+    A retry budget limits retries to a fraction of the calls made, so a
+    failing server is not hit with a multiple of the normal load.
+    """
+    def __init__(self, max_retries=3, backoff=0.25, max_backoff=10.0,
+                 statuses=(429, 502, 503, 504), idempotent=('rhino/geometry/',),
+                 budget_ratio=0.2, budget_min=10, max_elapsed=None):
+        """
+        Args:
+            max_retries (int): maximum number of retries of one call
+            backoff (float): base delay in seconds, doubled with every retry
+            max_backoff (float): maximum delay in seconds between attempts
+            statuses (iter): HTTP status codes that are retried
+            idempotent (iter): prefixes of endpoints that are safe to send
+                               again after the server may have processed them
+            budget_ratio (float): number of retries allowed per call made
+            budget_min (int): retries allowed before any calls were made
+            max_elapsed (float): give up once this many seconds have passed
+                                 since the first attempt. None has no limit
+        """
+        self.maxRetries = max_retries
+        self.backoff = backoff
+        self.maxBackoff = max_backoff
+        self.statuses = frozenset(statuses)
+        self.idempotent = tuple(idempotent)
+        self.budgetRatio = budget_ratio
+        self.budgetMin = budget_min
+        self.maxElapsed = max_elapsed
+        self.retryCount = 0
+        self._tokens = float(budget_min)
+        self._lock = threading.Lock()
+
+    def IsIdempotent(self, endpoint):
+        return endpoint.startswith(self.idempotent)
+
+    def Started(self):
+        """Record a new call, adding to the retry budget"""
+        with self._lock:
+            self._tokens = min(self._tokens + self.budgetRatio,
+                               self.budgetMin + self.budgetRatio * 100)
+
+    def Delay(self, endpoint, error, attempt, started):
+        """
+        Get the seconds to wait before retrying a failed call, or None if it
+        should not be retried.
+
+        Args:
+            endpoint (str): endpoint of the call
+            error (Util.ComputeError): the failure
+            attempt (int): number of retries made so far
+            started (float): time.monotonic() of the first attempt
+        """
+        if attempt >= self.maxRetries or not self._Retryable(endpoint, error):
+            return None
+        delay = random.uniform(0, min(self.maxBackoff, self.backoff * 2 ** attempt))
+        retryAfter = getattr(error, 'retryAfter', None)
+        if retryAfter is not None:
+            delay = min(self.maxBackoff, max(delay, retryAfter))
+        if self.maxElapsed is not None and time.monotonic() + delay - started > self.maxElapsed:
+            return None
+        with self._lock:
+            if self._tokens < 1:
+                return None
+            self._tokens -= 1
+            self.retryCount += 1
+        return delay
+
+    def _Retryable(self, endpoint, error):
+        if isinstance(error, Util.ComputeHTTPError):
+            if error.status not in self.statuses:
+                return False
+            return error.status in (429, 503) or self.IsIdempotent(endpoint)
+        if isinstance(error, (Util.ComputeConnectionError, Util.ComputeTimeoutError)):
+            return not error.requestSent or self.IsIdempotent(endpoint)
+        return False
@@ -1,6 +1,7 @@
 from . import Util
 
 
+@Util.Endpoint("rhino/geometry/surface/createrollingballfillet-surface_surface_double_double", Util.DecodeToCommonObject)
 def CreateRollingBallFillet(surfaceA, surfaceB, radius, tolerance, multiple=False):
     """
     Constructs a rolling ball fillet between two surfaces.
@@ -14,15 +15,9 @@ def CreateRollingBallFillet(surfaceA, surfaceB, radius, tolerance, multiple=Fals
     Returns:
         Surface[]: A new array of rolling ball fillet surfaces; this array can be empty on failure.
     """
-    url = "rhino/geometry/surface/createrollingballfillet-surface_surface_double_double"
-    if multiple: url += "?multiple=true"
-    args = [surfaceA, surfaceB, radius, tolerance]
-    if multiple: args = zip(surfaceA, surfaceB, radius, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/surface/createrollingballfillet-surface_bool_surface_bool_double_double", Util.DecodeToCommonObject)
 def CreateRollingBallFillet1(surfaceA, flipA, surfaceB, flipB, radius, tolerance, multiple=False):
     """
     Constructs a rolling ball fillet between two surfaces.
@@ -38,15 +33,9 @@ def CreateRollingBallFillet1(surfaceA, flipA, surfaceB, flipB, radius, tolerance
     Returns:
         Surface[]: A new array of rolling ball fillet surfaces; this array can be empty on failure.
     """
-    url = "rhino/geometry/surface/createrollingballfillet-surface_bool_surface_bool_double_double"
-    if multiple: url += "?multiple=true"
-    args = [surfaceA, flipA, surfaceB, flipB, radius, tolerance]
-    if multiple: args = zip(surfaceA, flipA, surfaceB, flipB, radius, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/surface/createrollingballfillet-surface_point2d_surface_point2d_double_double", Util.DecodeToCommonObject)
 def CreateRollingBallFillet2(surfaceA, uvA, surfaceB, uvB, radius, tolerance, multiple=False):
     """
     Constructs a rolling ball fillet between two surfaces.
@@ -62,15 +51,9 @@ def CreateRollingBallFillet2(surfaceA, uvA, surfaceB, uvB, radius, tolerance, mu
     Returns:
         Surface[]: A new array of rolling ball fillet surfaces; this array can be empty on failure.
     """
-    url = "rhino/geometry/surface/createrollingballfillet-surface_point2d_surface_point2d_double_double"
-    if multiple: url += "?multiple=true"
-    args = [surfaceA, uvA, surfaceB, uvB, radius, tolerance]
-    if multiple: args = zip(surfaceA, uvA, surfaceB, uvB, radius, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/surface/createextrusion-curve_vector3d", Util.DecodeToCommonObject)
 def CreateExtrusion(profile, direction, multiple=False):
     """
     Constructs a surface by extruding a curve along a vector.
@@ -82,15 +65,9 @@ def CreateExtrusion(profile, direction, multiple=False):
     Returns:
         Surface: A surface on success or None on failure.
     """
-    url = "rhino/geometry/surface/createextrusion-curve_vector3d"
-    if multiple: url += "?multiple=true"
-    args = [profile, direction]
-    if multiple: args = zip(profile, direction)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/surface/createextrusiontopoint-curve_point3d", Util.DecodeToCommonObject)
 def CreateExtrusionToPoint(profile, apexPoint, multiple=False):
     """
     Constructs a surface by extruding a curve to a point.
@@ -102,15 +79,9 @@ def CreateExtrusionToPoint(profile, apexPoint, multiple=False):
     Returns:
         Surface: A Surface on success or None on failure.
     """
-    url = "rhino/geometry/surface/createextrusiontopoint-curve_point3d"
-    if multiple: url += "?multiple=true"
-    args = [profile, apexPoint]
-    if multiple: args = zip(profile, apexPoint)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/surface/createperiodicsurface-surface_int", Util.DecodeToCommonObject)
 def CreatePeriodicSurface(surface, direction, multiple=False):
     """
     Constructs a periodic surface from a base surface and a direction.
@@ -122,15 +93,9 @@ def CreatePeriodicSurface(surface, direction, multiple=False):
     Returns:
         Surface: A Surface on success or None on failure.
     """
-    url = "rhino/geometry/surface/createperiodicsurface-surface_int"
-    if multiple: url += "?multiple=true"
-    args = [surface, direction]
-    if multiple: args = zip(surface, direction)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/surface/createperiodicsurface-surface_int_bool", Util.DecodeToCommonObject)
 def CreatePeriodicSurface1(surface, direction, bSmooth, multiple=False):
     """
     Constructs a periodic surface from a base surface and a direction.
@@ -145,15 +110,9 @@ def CreatePeriodicSurface1(surface, direction, bSmooth, multiple=False):
     Returns:
         Surface: A periodic surface if successful, None on failure.
     """
-    url = "rhino/geometry/surface/createperiodicsurface-surface_int_bool"
-    if multiple: url += "?multiple=true"
-    args = [surface, direction, bSmooth]
-    if multiple: args = zip(surface, direction, bSmooth)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/surface/createsofteditsurface-surface_point2d_vector3d_double_double_double_bool", Util.DecodeToCommonObject)
 def CreateSoftEditSurface(surface, uv, delta, uLength, vLength, tolerance, fixEnds, multiple=False):
     """
     Creates a soft edited surface from an exising surface using a smooth field of influence.
@@ -174,15 +133,9 @@ def CreateSoftEditSurface(surface, uv, delta, uLength, vLength, tolerance, fixEn
     Returns:
         Surface: The soft edited surface if successful. None on failure.
     """
-    url = "rhino/geometry/surface/createsofteditsurface-surface_point2d_vector3d_double_double_double_bool"
-    if multiple: url += "?multiple=true"
-    args = [surface, uv, delta, uLength, vLength, tolerance, fixEnds]
-    if multiple: args = zip(surface, uv, delta, uLength, vLength, tolerance, fixEnds)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/surface/smooth-surface_double_bool_bool_bool_bool_smoothingcoordinatesystem", Util.DecodeToCommonObject)
 def Smooth(thisSurface, smoothFactor, bXSmooth, bYSmooth, bZSmooth, bFixBoundaries, coordinateSystem, multiple=False):
     """
     Smooths a surface by averaging the positions of control points in a specified region.
@@ -198,15 +151,9 @@ def Smooth(thisSurface, smoothFactor, bXSmooth, bYSmooth, bZSmooth, bFixBoundari
     Returns:
         Surface: The smoothed surface if successful, None otherwise.
     """
-    url = "rhino/geometry/surface/smooth-surface_double_bool_bool_bool_bool_smoothingcoordinatesystem"
-    if multiple: url += "?multiple=true"
-    args = [thisSurface, smoothFactor, bXSmooth, bYSmooth, bZSmooth, bFixBoundaries, coordinateSystem]
-    if multiple: args = zip(thisSurface, smoothFactor, bXSmooth, bYSmooth, bZSmooth, bFixBoundaries, coordinateSystem)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/surface/smooth-surface_double_bool_bool_bool_bool_smoothingcoordinatesystem_plane", Util.DecodeToCommonObject)
 def Smooth1(thisSurface, smoothFactor, bXSmooth, bYSmooth, bZSmooth, bFixBoundaries, coordinateSystem, plane, multiple=False):
     """
     Smooths a surface by averaging the positions of control points in a specified region.
@@ -223,15 +170,9 @@ def Smooth1(thisSurface, smoothFactor, bXSmooth, bYSmooth, bZSmooth, bFixBoundar
     Returns:
         Surface: The smoothed surface if successful, None otherwise.
     """
-    url = "rhino/geometry/surface/smooth-surface_double_bool_bool_bool_bool_smoothingcoordinatesystem_plane"
-    if multiple: url += "?multiple=true"
-    args = [thisSurface, smoothFactor, bXSmooth, bYSmooth, bZSmooth, bFixBoundaries, coordinateSystem, plane]
-    if multiple: args = zip(thisSurface, smoothFactor, bXSmooth, bYSmooth, bZSmooth, bFixBoundaries, coordinateSystem, plane)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/surface/variableoffset-surface_double_double_double_double_double", Util.DecodeToCommonObject)
 def VariableOffset(thisSurface, uMinvMin, uMinvMax, uMaxvMin, uMaxvMax, tolerance, multiple=False):
     """
     Copies a surface so that all locations at the corners of the copied surface are specified distances from the original surface.
@@ -246,15 +187,9 @@ def VariableOffset(thisSurface, uMinvMin, uMinvMax, uMaxvMin, uMaxvMax, toleranc
     Returns:
         Surface: The offset surface if successful, None otherwise.
     """
-    url = "rhino/geometry/surface/variableoffset-surface_double_double_double_double_double"
-    if multiple: url += "?multiple=true"
-    args = [thisSurface, uMinvMin, uMinvMax, uMaxvMin, uMaxvMax, tolerance]
-    if multiple: args = zip(thisSurface, uMinvMin, uMinvMax, uMaxvMin, uMaxvMax, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/surface/variableoffset-surface_double_double_double_double_point2darray_doublearray_double", Util.DecodeToCommonObject)
 def VariableOffset1(thisSurface, uMinvMin, uMinvMax, uMaxvMin, uMaxvMax, interiorParameters, interiorDistances, tolerance, multiple=False):
     """
     Copies a surface so that all locations at the corners, and from specified interior locations, of the copied surface are specified distances from the original surface.
@@ -271,15 +206,9 @@ def VariableOffset1(thisSurface, uMinvMin, uMinvMax, uMaxvMin, uMaxvMax, interio
     Returns:
         Surface: The offset surface if successful, None otherwise.
     """
-    url = "rhino/geometry/surface/variableoffset-surface_double_double_double_double_point2darray_doublearray_double"
-    if multiple: url += "?multiple=true"
-    args = [thisSurface, uMinvMin, uMinvMax, uMaxvMin, uMaxvMax, interiorParameters, interiorDistances, tolerance]
-    if multiple: args = zip(thisSurface, uMinvMin, uMinvMax, uMaxvMin, uMaxvMax, interiorParameters, interiorDistances, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/surface/getsurfacesize-surface_double_double")
 def GetSurfaceSize(thisSurface, multiple=False):
     """
     Gets an estimate of the size of the rectangle that would be created
@@ -290,14 +219,9 @@ def GetSurfaceSize(thisSurface, multiple=False):
         width (double): corresponds to the first surface parameter.
         height (double): corresponds to the second surface parameter.
     """
-    url = "rhino/geometry/surface/getsurfacesize-surface_double_double"
-    if multiple: url += "?multiple=true"
-    args = [thisSurface]
-    if multiple: args = [[item] for item in thisSurface]
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/surface/closestside-surface_double_double")
 def ClosestSide(thisSurface, u, v, multiple=False):
     """
     Gets the side that is closest, in terms of 3D-distance, to a U and V parameter.
@@ -309,14 +233,9 @@ def ClosestSide(thisSurface, u, v, multiple=False):
     Returns:
         IsoStatus: A side.
     """
-    url = "rhino/geometry/surface/closestside-surface_double_double"
-    if multiple: url += "?multiple=true"
-    args = [thisSurface, u, v]
-    if multiple: args = zip(thisSurface, u, v)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/surface/extend-surface_isostatus_double_bool", Util.DecodeToCommonObject)
 def Extend(thisSurface, edge, extensionLength, smooth, multiple=False):
     """
     Extends an untrimmed surface along one edge.
@@ -330,15 +249,9 @@ def Extend(thisSurface, edge, extensionLength, smooth, multiple=False):
     Returns:
         Surface: New extended surface on success.
     """
-    url = "rhino/geometry/surface/extend-surface_isostatus_double_bool"
-    if multiple: url += "?multiple=true"
-    args = [thisSurface, edge, extensionLength, smooth]
-    if multiple: args = zip(thisSurface, edge, extensionLength, smooth)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/surface/rebuild-surface_int_int_int_int", Util.DecodeToCommonObject)
 def Rebuild(thisSurface, uDegree, vDegree, uPointCount, vPointCount, multiple=False):
     """
     Rebuilds an existing surface to a given degree and point count.
@@ -354,15 +267,9 @@ def Rebuild(thisSurface, uDegree, vDegree, uPointCount, vPointCount, multiple=Fa
     Returns:
         NurbsSurface: new rebuilt surface on success. None on failure.
     """
-    url = "rhino/geometry/surface/rebuild-surface_int_int_int_int"
-    if multiple: url += "?multiple=true"
-    args = [thisSurface, uDegree, vDegree, uPointCount, vPointCount]
-    if multiple: args = zip(thisSurface, uDegree, vDegree, uPointCount, vPointCount)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/surface/rebuildonedirection-surface_int_int_lofttype_double", Util.DecodeToCommonObject)
 def RebuildOneDirection(thisSurface, direction, pointCount, loftType, refitTolerance, multiple=False):
     """
     Rebuilds an existing surface with a new surface to a given point count in either the u or v directions independently.
@@ -376,15 +283,9 @@ def RebuildOneDirection(thisSurface, direction, pointCount, loftType, refitToler
     Returns:
         NurbsSurface: new rebuilt surface on success. None on failure.
     """
-    url = "rhino/geometry/surface/rebuildonedirection-surface_int_int_lofttype_double"
-    if multiple: url += "?multiple=true"
-    args = [thisSurface, direction, pointCount, loftType, refitTolerance]
-    if multiple: args = zip(thisSurface, direction, pointCount, loftType, refitTolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/surface/closestpoint-surface_point3d_double_double")
 def ClosestPoint(thisSurface, testPoint, multiple=False):
     """
     Input the parameters of the point on the surface that is closest to testPoint.
@@ -397,14 +298,9 @@ def ClosestPoint(thisSurface, testPoint, multiple=False):
         u (double): U parameter of the surface that is closest to testPoint.
         v (double): V parameter of the surface that is closest to testPoint.
     """
-    url = "rhino/geometry/surface/closestpoint-surface_point3d_double_double"
-    if multiple: url += "?multiple=true"
-    args = [thisSurface, testPoint]
-    if multiple: args = zip(thisSurface, testPoint)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/surface/localclosestpoint-surface_point3d_double_double_double_double")
 def LocalClosestPoint(thisSurface, testPoint, seedU, seedV, multiple=False):
     """
     Find parameters of the point on a surface that is locally closest to
@@ -420,14 +316,9 @@ def LocalClosestPoint(thisSurface, testPoint, seedU, seedV, multiple=False):
         u (double): U parameter of the surface that is closest to testPoint.
         v (double): V parameter of the surface that is closest to testPoint.
     """
-    url = "rhino/geometry/surface/localclosestpoint-surface_point3d_double_double_double_double"
-    if multiple: url += "?multiple=true"
-    args = [thisSurface, testPoint, seedU, seedV]
-    if multiple: args = zip(thisSurface, testPoint, seedU, seedV)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/surface/offset-surface_double_double", Util.DecodeToCommonObject)
 def Offset(thisSurface, distance, tolerance, multiple=False):
     """
     Constructs a new surface which is offset from the current surface.
@@ -439,15 +330,9 @@ def Offset(thisSurface, distance, tolerance, multiple=False):
     Returns:
         Surface: The offsetted surface or None on failure.
     """
-    url = "rhino/geometry/surface/offset-surface_double_double"
-    if multiple: url += "?multiple=true"
-    args = [thisSurface, distance, tolerance]
-    if multiple: args = zip(thisSurface, distance, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/surface/fit-surface_int_int_double", Util.DecodeToCommonObject)
 def Fit(thisSurface, uDegree, vDegree, fitTolerance, multiple=False):
     """
     Fits a new surface through an existing surface.
@@ -460,15 +345,9 @@ def Fit(thisSurface, uDegree, vDegree, fitTolerance, multiple=False):
     Returns:
         Surface: A surface, or None on error.
     """
-    url = "rhino/geometry/surface/fit-surface_int_int_double"
-    if multiple: url += "?multiple=true"
-    args = [thisSurface, uDegree, vDegree, fitTolerance]
-    if multiple: args = zip(thisSurface, uDegree, vDegree, fitTolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/surface/interpolatedcurveonsurfaceuv-surface_point2darray_double", Util.DecodeToCommonObject)
 def InterpolatedCurveOnSurfaceUV(thisSurface, points, tolerance, multiple=False):
     """
     Returns a curve that interpolates points on a surface. The interpolant lies on the surface.
@@ -480,15 +359,9 @@ def InterpolatedCurveOnSurfaceUV(thisSurface, points, tolerance, multiple=False)
     Returns:
         NurbsCurve: A new NURBS curve if successful, or None on error.
     """
-    url = "rhino/geometry/surface/interpolatedcurveonsurfaceuv-surface_point2darray_double"
-    if multiple: url += "?multiple=true"
-    args = [thisSurface, points, tolerance]
-    if multiple: args = zip(thisSurface, points, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/surface/interpolatedcurveonsurfaceuv-surface_point2darray_double_bool_int", Util.DecodeToCommonObject)
 def InterpolatedCurveOnSurfaceUV1(thisSurface, points, tolerance, closed, closedSurfaceHandling, multiple=False):
     """
     Returns a curve that interpolates points on a surface. The interpolant lies on the surface.
@@ -510,15 +383,9 @@ def InterpolatedCurveOnSurfaceUV1(thisSurface, points, tolerance, closed, closed
     Returns:
         NurbsCurve: A new NURBS curve if successful, or None on error.
     """
-    url = "rhino/geometry/surface/interpolatedcurveonsurfaceuv-surface_point2darray_double_bool_int"
-    if multiple: url += "?multiple=true"
-    args = [thisSurface, points, tolerance, closed, closedSurfaceHandling]
-    if multiple: args = zip(thisSurface, points, tolerance, closed, closedSurfaceHandling)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/surface/interpolatedcurveonsurface-surface_point3darray_double", Util.DecodeToCommonObject)
 def InterpolatedCurveOnSurface(thisSurface, points, tolerance, multiple=False):
     """
     Constructs an interpolated curve on a surface, using 3D points.
@@ -530,15 +397,9 @@ def InterpolatedCurveOnSurface(thisSurface, points, tolerance, multiple=False):
     Returns:
         NurbsCurve: A new nurbs curve, or None on error.
     """
-    url = "rhino/geometry/surface/interpolatedcurveonsurface-surface_point3darray_double"
-    if multiple: url += "?multiple=true"
-    args = [thisSurface, points, tolerance]
-    if multiple: args = zip(thisSurface, points, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/surface/shortpath-surface_point2d_point2d_double", Util.DecodeToCommonObject)
 def ShortPath(thisSurface, start, end, tolerance, multiple=False):
     """
     Constructs a geodesic between 2 points, used by ShortPath command in Rhino.
@@ -551,15 +412,9 @@ def ShortPath(thisSurface, start, end, tolerance, multiple=False):
     Returns:
         Curve: a geodesic curve on the surface on success. None on failure.
     """
-    url = "rhino/geometry/surface/shortpath-surface_point2d_point2d_double"
-    if multiple: url += "?multiple=true"
-    args = [thisSurface, start, end, tolerance]
-    if multiple: args = zip(thisSurface, start, end, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/surface/pushup-surface_curve_double_interval", Util.DecodeToCommonObject)
 def Pushup(thisSurface, curve2d, tolerance, curve2dSubdomain, multiple=False):
     """
     Computes a 3d curve that is the composite of a 2d curve and the surface map.
@@ -572,15 +427,9 @@ def Pushup(thisSurface, curve2d, tolerance, curve2dSubdomain, multiple=False):
     Returns:
         Curve: 3d curve.
     """
-    url = "rhino/geometry/surface/pushup-surface_curve_double_interval"
-    if multiple: url += "?multiple=true"
-    args = [thisSurface, curve2d, tolerance, curve2dSubdomain]
-    if multiple: args = zip(thisSurface, curve2d, tolerance, curve2dSubdomain)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/surface/pushup-surface_curve_double", Util.DecodeToCommonObject)
 def Pushup1(thisSurface, curve2d, tolerance, multiple=False):
     """
     Computes a 3d curve that is the composite of a 2d curve and the surface map.
@@ -592,15 +441,9 @@ def Pushup1(thisSurface, curve2d, tolerance, multiple=False):
     Returns:
         Curve: 3d curve.
     """
-    url = "rhino/geometry/surface/pushup-surface_curve_double"
-    if multiple: url += "?multiple=true"
-    args = [thisSurface, curve2d, tolerance]
-    if multiple: args = zip(thisSurface, curve2d, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/surface/pullback-surface_curve_double", Util.DecodeToCommonObject)
 def Pullback(thisSurface, curve3d, tolerance, multiple=False):
     """
     Pulls a 3d curve back to the surface's parameter space.
@@ -613,15 +456,9 @@ def Pullback(thisSurface, curve3d, tolerance, multiple=False):
     Returns:
         Curve: 2d curve.
     """
-    url = "rhino/geometry/surface/pullback-surface_curve_double"
-    if multiple: url += "?multiple=true"
-    args = [thisSurface, curve3d, tolerance]
-    if multiple: args = zip(thisSurface, curve3d, tolerance)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/surface/pullback-surface_curve_double_interval", Util.DecodeToCommonObject)
 def Pullback1(thisSurface, curve3d, tolerance, curve3dSubdomain, multiple=False):
     """
     Pulls a 3d curve back to the surface's parameter space.
@@ -635,11 +472,4 @@ def Pullback1(thisSurface, curve3d, tolerance, curve3dSubdomain, multiple=False)
     Returns:
         Curve: 2d curve.
     """
-    url = "rhino/geometry/surface/pullback-surface_curve_double_interval"
-    if multiple: url += "?multiple=true"
-    args = [thisSurface, curve3d, tolerance, curve3dSubdomain]
-    if multiple: args = zip(thisSurface, curve3d, tolerance, curve3dSubdomain)
-    response = Util.ComputeFetch(url, args)
-    response = Util.DecodeToCommonObject(response)
-    return response
 
@@ -1,35 +1,1492 @@
-import rhino3dm
+# requests, rhino3dm and asyncio are imported on first use to keep importing
+# the package cheap
+import base64
+import contextlib
+import contextvars
+import functools
+import importlib.util
+import itertools
 import json
-import requests
+import logging
+import operator
+import re
+import threading
+import time
+import weakref
+import zlib
 
 __version__ = '0.9.0'
 
+# base url of the compute server, or a Balancer.NodePool spreading calls over
+# several servers
 url = 'https://compute.rhino3d.com/'
 authToken = ''
 stopat = 0
+# seconds to wait for the server. Either one number or a (connect, read)
+# tuple. None waits forever
+timeout = None
+# a Retry.RetryPolicy deciding which failed calls are sent again. None raises
+# on the first failure
+retry = None
+# a Batching.RequestBatcher that coalesces single calls into multiple=true
+# requests. None sends every call on its own
+batcher = None
+# a Cache.MemoryCache or Cache.SqliteCache holding responses of deterministic
+# calls. None disables caching
+cache = None
+# send request bodies with chunked transfer encoding while they are being
+# encoded instead of building the whole body in memory first
+streamRequests = False
+streamChunkSize = 1024 * 1024
+# compression of request bodies: None, 'gzip', 'deflate' or 'br' (requires the
+# brotli package). Bodies smaller than compressionThreshold bytes are sent
+# uncompressed
+compression = None
+compressionLevel = 6
+compressionThreshold = 16 * 1024
+# decode points, vectors and lines to float64 NumPy arrays instead of rhino3dm
+# objects. See DecodeToNumpy
+decodeToNumpy = False
+# encode every rhino3dm object only once while it is alive and reuse the
+# encoding when it is sent again. Objects edited in place without changing
+# their number of vertices, faces, edges or control points or their bounding
+# box must be passed to InvalidateEncoding
+memoizeEncoding = False
+# format of request bodies and preferred format of responses: 'json' or
+# 'msgpack' (requires the msgpack package and a server that supports it, see
+# the Msgpack module)
+wireFormat = 'json'
 
+# a callable receiving an Instrumentation.CallEvent with the timings and sizes
+# of every call, e.g. Instrumentation.LogHook(). None disables instrumentation
+instrumentation = None
 
-def ComputeFetch(endpoint, arglist):
-    class __Rhino3dmEncoder(json.JSONEncoder):
-        def default(self, o):
-            if hasattr(o, "Encode"):
-                return o.Encode()
-            return json.JSONEncoder.default(self, o)
-    global authToken
-    global url
-    global stopat
-    posturl = url + endpoint
-    if(stopat>0):
+# connection pool settings for the shared session. poolConnections is the
+# number of hosts to keep pools for, poolMaxsize the number of keep-alive
+# connections kept per host
+poolConnections = 10
+poolMaxsize = 10
+poolBlock = False
+
+_session = None
+_sessionLock = threading.Lock()
+
+
+class ComputeError(Exception):
+    """Base class of the errors raised for failed compute calls"""
+    def __init__(self, message, url=None):
+        Exception.__init__(self, message)
+        self.url = url
+
+
+class ComputeHTTPError(ComputeError):
+    """
+    The server answered with an error status. `status` is the HTTP status
+    code and `body` the start of the response text.
+    """
+    def __init__(self, status, url, body, retryAfter=None):
+        message = 'compute server returned {} for {}'.format(status, url)
+        if body: message += ': ' + body
+        ComputeError.__init__(self, message, url)
+        self.status = status
+        self.body = body
+        self.retryAfter = retryAfter
+
+
+class ComputeConnectionError(ComputeError):
+    """
+    The connection to the server failed. `requestSent` is False when the
+    server cannot have seen the request.
+    """
+    def __init__(self, message, url, requestSent):
+        ComputeError.__init__(self, message, url)
+        self.requestSent = requestSent
+
+
+class ComputeTimeoutError(ComputeConnectionError):
+    """The server did not answer in time"""
+
+
+class ComputeMissingHandlesError(ComputeHTTPError):
+    """
+    The server does not hold the geometry of some handles passed to a call,
+    listed in `handles`. See Upload
+    """
+    def __init__(self, status, url, body, handles):
+        ComputeHTTPError.__init__(self, status, url, body)
+        self.handles = handles
+
+
+class ComputeResponseError(ComputeError):
+    """The server answered with something that cannot be parsed"""
+
+
+def CreateSession(pool_connections=None, pool_maxsize=None, pool_block=None):
+    """
+    Create a requests.Session that keeps connections alive and pools them
+    per host.
+
+    Args:
+        pool_connections (int): number of per-host pools to cache. Defaults to
+                                the module level poolConnections
+        pool_maxsize (int): maximum number of connections kept per host.
+                            Defaults to the module level poolMaxsize
+        pool_block (bool): if True, block when all connections of a host are
+                           in use instead of opening a throw away connection
+    Returns:
+        requests.Session: a new session
+    """
+    if pool_connections is None: pool_connections = poolConnections
+    if pool_maxsize is None: pool_maxsize = poolMaxsize
+    if pool_block is None: pool_block = poolBlock
+    import requests
+    import requests.adapters
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=pool_connections,
+                                            pool_maxsize=pool_maxsize,
+                                            pool_block=pool_block)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers['Connection'] = 'keep-alive'
+    return session
+
+
+def GetSession():
+    """
+    Get the session shared by all calls made through ComputeFetch. The session
+    is created on first use from the module level pool settings.
+    """
+    global _session
+    session = _session
+    if session is None:
+        with _sessionLock:
+            if _session is None:
+                _session = CreateSession()
+            session = _session
+    return session
+
+
+def SetSession(session):
+    """
+    Replace the session shared by all calls made through ComputeFetch. Pass
+    None to close the current session; a new one is created on the next call
+    using the current pool settings.
+
+    Args:
+        session (requests.Session): session to use, or None
+    """
+    global _session
+    with _sessionLock:
+        old = _session
+        _session = session
+    if old is not None and old is not session:
+        old.close()
+
+
+class BatchArgs:
+    """
+    Arguments of a multiple=true call. Parameters given as lists (or other
+    sequences) hold one value per item and must all have the same length; any
+    other parameter, like a single tolerance, is used for every item. Rows
+    are produced lazily while the request body is encoded.
+
+    To use the same list for every item, pass it repeated once per item.
+    """
+    def __init__(self, *params):
+        count = None
+        columns = []
+        for param in params:
+            if _IsBatchColumn(param):
+                if not hasattr(param, '__len__'): param = list(param)
+                if _IsNumpy(param) and param.ndim == 2 and param.shape[1] == 3:
+                    param = _PointRows(param)
+                if count is None: count = len(param)
+                elif len(param) != count:
+                    raise ValueError('multiple=True requires list parameters of equal length')
+                columns.append(param)
+            else:
+                columns.append(None)
+        if count is None:
+            raise ValueError('multiple=True requires at least one list parameter')
+        self.params = params
+        self.columns = columns
+        self.count = count
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        params, columns = self.params, self.columns
+        if all(column is not None for column in columns):
+            return zip(*columns)
+        return (tuple(param if column is None else column[i]
+                      for param, column in zip(params, columns))
+                for i in range(self.count))
+
+
+class _PointRows:
+    # an (N, 3) NumPy array in BatchArgs, a point per item. Its rows alone
+    # would encode as lists of 3 numbers
+    def __init__(self, array):
+        self.array = array
+
+    def __len__(self):
+        return len(self.array)
+
+    def __getitem__(self, index):
+        x, y, z = self.array[index].tolist()
+        return {'X': x, 'Y': y, 'Z': z}
+
+    def __iter__(self):
+        for start in range(0, len(self.array), _numpyBlock):
+            for x, y, z in self.array[start:start + _numpyBlock].tolist():
+                yield {'X': x, 'Y': y, 'Z': z}
+
+
+def _IsBatchColumn(param):
+    if isinstance(param, (str, bytes, dict)) or hasattr(param, 'Encode'):
+        return False
+    return hasattr(param, '__iter__')
+
+
+def _EncodeObject(o):
+    if hasattr(o, "Encode"):
+        return _Encode(o)
+    if _IsNumpy(o):
+        return _EncodeNumpy(o)
+    raise TypeError('Object of type {} is not JSON serializable'.format(type(o).__name__))
+
+
+class _Rhino3dmEncoder(json.JSONEncoder):
+    def default(self, o):
+        if hasattr(o, "Encode"):
+            return _Encode(o)
+        if _IsNumpy(o):
+            return _EncodeNumpy(o)
+        return json.JSONEncoder.default(self, o)
+
+
+# rhino3dm objects and their encodings while memoizeEncoding is set. Entries
+# go away with their object
+_encodings = weakref.WeakKeyDictionary()
+_encodingsLock = threading.Lock()
+# types whose encodings are not memoized: not weakly referenceable or not
+# encoded as an opennurbs archive
+_unmemoizedTypes = set()
+
+
+def _Encode(o):
+    if not memoizeEncoding or type(o) in _unmemoizedTypes:
+        return o.Encode()
+    stamp = _EncodingStamp(o)
+    try:
+        with _encodingsLock:
+            entry = _encodings.get(o)
+    except TypeError:
+        _unmemoizedTypes.add(type(o))
+        return o.Encode()
+    if entry is not None and entry[0] == stamp:
+        return entry[1]
+    data = o.Encode()
+    if not (isinstance(data, dict) and 'archive3dm' in data):
+        _unmemoizedTypes.add(type(o))
+        return data
+    with _encodingsLock:
+        _encodings[o] = (stamp, data)
+    return data
+
+
+def _EncodingStamp(o):
+    # cheap values that change with most edits, so an edited object is
+    # encoded again: the sizes of its parts, and its bounding box, which
+    # Transform, Translate, Scale and control point edits move
+    stamp = []
+    for name in ('Vertices', 'Faces', 'Edges', 'Points'):
+        part = getattr(o, name, None)
+        if part is not None:
+            stamp.append(len(part))
+    box = getattr(o, 'GetBoundingBox', None)
+    if box is not None:
+        box = box()
+        stamp.extend((box.Min.X, box.Min.Y, box.Min.Z, box.Max.X, box.Max.Y, box.Max.Z))
+    return tuple(stamp)
+
+
+def InvalidateEncoding(obj):
+    """
+    Forget the memoized encoding of a rhino3dm object after editing it in
+    place, so the next call sending it encodes it again. Only needed with
+    memoizeEncoding set, for edits that keep the number of vertices, faces,
+    edges or control points and the bounding box, like setting a vertex of
+    a mesh, whose bounding box rhino3dm does not update.
+    """
+    with _encodingsLock:
+        _encodings.pop(obj, None)
+
+
+def _IsNumpy(o):
+    # checked by type so numpy is never imported here
+    return type(o).__module__ == 'numpy' and hasattr(o, 'tolist')
+
+
+def _EncodeNumpy(o):
+    """
+    Encode a NumPy array or scalar. Arrays of at least two axes whose last
+    axis has length 3 are points: one of shape (N, 3) encodes like a list of
+    Point3d. Other arrays, including 1-D arrays of length 3, encode as
+    nested lists of numbers.
+    """
+    shape = getattr(o, 'shape', ())
+    if len(shape) == 2 and shape[1] == 3:
+        # tolist converts all values in one pass; only the dicts are built
+        # per point
+        return [{'X': x, 'Y': y, 'Z': z} for x, y, z in o.tolist()]
+    if len(shape) > 2 and shape[-1] == 3:
+        return [_EncodeNumpy(item) for item in o]
+    return o.tolist()
+
+
+def _JsonBackend(name):
+    if name == 'json':
+        encoder = _Rhino3dmEncoder(separators=(',', ':'))
+        return encoder.encode, json.loads
+    if name == 'orjson':
+        import orjson
+        option = orjson.OPT_NON_STR_KEYS
+        return (lambda obj: orjson.dumps(obj, default=_EncodeObject, option=option),
+                orjson.loads)
+    if name == 'ujson':
+        import ujson
+        return (lambda obj: ujson.dumps(obj, default=_EncodeObject, ensure_ascii=False),
+                ujson.loads)
+    raise ValueError('unknown JSON backend {}'.format(name))
+
+
+def _Installed(name):
+    # check without importing, which is deferred to the first call
+    return importlib.util.find_spec(name) is not None
+
+
+def _DefaultJsonBackend():
+    for name in ('orjson', 'ujson'):
+        if _Installed(name):
+            return name
+    return 'json'
+
+
+# JSON library used to encode request bodies and parse responses: 'orjson',
+# 'ujson' or 'json'. Defaults to the fastest one installed
+jsonBackend = _DefaultJsonBackend()
+
+_jsonBackends = {}
+
+
+def _GetJsonBackend():
+    backend = _jsonBackends.get(jsonBackend)
+    if backend is None:
+        backend = _jsonBackends.setdefault(jsonBackend, _JsonBackend(jsonBackend))
+    return backend
+
+
+def JsonDumps(obj):
+    """
+    Encode an object, including rhino3dm objects, with the current JSON
+    backend. Returns str or bytes depending on the backend.
+    """
+    return _GetJsonBackend()[0](obj)
+
+
+def JsonLoads(data):
+    """
+    Parse a JSON document (str or bytes) with the current JSON backend
+    """
+    return _GetJsonBackend()[1](data)
+
+
+def EncodeArgs(arglist):
+    """
+    Encode the arguments of a call as the JSON request body
+    """
+    dumps = _GetJsonBackend()[0]
+    if isinstance(arglist, BatchArgs):
+        rows = [dumps(row) for row in arglist]
+        if rows and isinstance(rows[0], bytes):
+            return b'[' + b','.join(rows) + b']'
+        return '[' + ','.join(rows) + ']'
+    return dumps(arglist)
+
+
+def _EncodeBody(arglist, client, binary=None):
+    event = _callEvent.get()
+    if event is not None:
+        started = time.perf_counter()
+    if binary is None:
+        binary = _Binary(client, _Setting(client, 'url'))
+    if binary:
+        from . import Msgpack
+        body = Msgpack.Dumps(arglist)
+    else:
+        body = EncodeArgs(arglist)
+    if event is not None:
+        event.encodeTime = time.perf_counter() - started
+    return body
+
+
+def _DumpResponse(response, client):
+    if _Setting(client, 'wireFormat') == 'msgpack':
+        from . import Msgpack
+        return Msgpack.Dumps(response)
+    return _ToBytes(JsonDumps(response))
+
+
+def _LoadResponse(content, client):
+    if _Setting(client, 'wireFormat') == 'msgpack':
+        from . import Msgpack
+        return Msgpack.Loads(content)
+    return JsonLoads(content)
+
+
+def IterEncodeArgs(arglist, chunk_size=None):
+    """
+    Encode the arguments of a call as the JSON request body, incrementally.
+    Lists are walked item by item so only one encoded item is held in memory
+    at a time.
+
+    Args:
+        arglist (list): arguments to encode
+        chunk_size (int): approximate size of the yielded chunks. Defaults to
+                          streamChunkSize
+    Returns:
+        generator: bytes chunks of the body
+    """
+    if chunk_size is None: chunk_size = streamChunkSize
+    dumps = _GetJsonBackend()[0]
+    buffer = bytearray()
+    for piece in _IterEncode(arglist, dumps):
+        buffer += _ToBytes(piece)
+        if len(buffer) >= chunk_size:
+            yield bytes(buffer)
+            del buffer[:]
+    if buffer:
+        yield bytes(buffer)
+
+
+def _IterEncode(obj, dumps):
+    if isinstance(obj, dict):
+        yield b'{'
+        for i, (key, value) in enumerate(obj.items()):
+            if i > 0: yield b','
+            yield dumps(str(key))
+            yield b':'
+            yield from _IterEncode(value, dumps)
+        yield b'}'
+    elif isinstance(obj, BatchArgs) or (isinstance(obj, (list, tuple)) and
+                                         any(_IsLargeItem(item) for item in obj)):
+        yield b'['
+        for i, item in enumerate(obj):
+            if i > 0: yield b','
+            yield from _IterEncode(item, dumps)
+        yield b']'
+    elif _IsNumpy(obj) and len(getattr(obj, 'shape', ())) >= 2 and len(obj) > _numpyBlock:
+        # encode large arrays a block of rows at a time
+        yield b'['
+        for start in range(0, len(obj), _numpyBlock):
+            if start > 0: yield b','
+            yield _ToBytes(dumps(obj[start:start + _numpyBlock]))[1:-1]
+        yield b']'
+    else:
+        yield dumps(obj)
+
+
+# rows of a NumPy array encoded at a time when streaming
+_numpyBlock = 16 * 1024
+
+
+def _IsLargeItem(item):
+    return (isinstance(item, (list, tuple, dict)) or hasattr(item, 'Encode') or
+            (_IsNumpy(item) and getattr(item, 'ndim', 0) > 0))
+
+
+def _ToBytes(data):
+    return data if isinstance(data, bytes) else data.encode('utf-8')
+
+
+def _Setting(client, name):
+    # ComputeClient attributes mirror the module level settings of Util
+    return globals()[name] if client is None else getattr(client, name)
+
+
+def _CompressionEncodings():
+    encodings = ['gzip', 'deflate']
+    if _Installed('brotli'):
+        encodings.append('br')
+    return encodings
+
+
+_acceptEncoding = ', '.join(_CompressionEncodings())
+
+
+def _Compressor(encoding, level):
+    if encoding == 'gzip':
+        return zlib.compressobj(level, zlib.DEFLATED, 31)
+    if encoding == 'deflate':
+        return zlib.compressobj(level)
+    if encoding == 'br':
+        import brotli
+        return brotli.Compressor(quality=min(level, 11))
+    raise ValueError('unknown compression {}'.format(encoding))
+
+
+def Compress(data, encoding, level=6):
+    """
+    Compress a request body
+
+    Args:
+        data (str or bytes): the body
+        encoding (str): 'gzip', 'deflate' or 'br'
+        level (int): compression level, 0-9 for gzip and deflate, 0-11 for br
+    Returns:
+        bytes: the compressed body
+    """
+    data = _ToBytes(data)
+    if encoding == 'gzip':
+        import gzip
+        return gzip.compress(data, level)
+    if encoding == 'deflate':
+        return zlib.compress(data, level)
+    if encoding == 'br':
+        import brotli
+        return brotli.compress(data, quality=min(level, 11))
+    raise ValueError('unknown compression {}'.format(encoding))
+
+
+def _CompressChunks(chunks, encoding, level):
+    compressor = _Compressor(encoding, level)
+    for chunk in chunks:
+        if hasattr(compressor, 'compress'):
+            chunk = compressor.compress(chunk)
+        else:
+            chunk = compressor.process(chunk)
+        if chunk: yield chunk
+    yield compressor.flush() if hasattr(compressor, 'compress') else compressor.finish()
+
+
+def _PrepareFetch(endpoint, arglist, client=None, postdata=None):
+    posturl = endpoint
+    stop = _Setting(client, 'stopat')
+    if(stop>0):
         if(posturl.find('?')>0): posturl += '&stopat='
         else: posturl += '?stopat='
-        posturl += str(stopat)
-    postdata = json.dumps(arglist, cls=__Rhino3dmEncoder)
+        posturl += str(stop)
     headers = {
-        'Authorization': 'Bearer ' + authToken,
-        'User-Agent': 'compute.rhino3d.py/' + __version__
+        'Authorization': 'Bearer ' + _Setting(client, 'authToken'),
+        'User-Agent': 'compute.rhino3d.py/' + __version__,
+        'Content-Type': 'application/json',
+        'Accept-Encoding': _acceptEncoding
     }
-    r = requests.post(posturl, data=postdata, headers=headers)
-    return r.json()
+    baseurl = _Setting(client, 'url')
+    binary = _Binary(client, baseurl)
+    postdata = _RequestBody(arglist, client, postdata, binary, headers)
+    node = None
+    if not isinstance(baseurl, str):
+        # a Balancer.NodePool
+        node = baseurl.Acquire(postdata)
+        baseurl = node.url
+        if binary and baseurl in _jsonServers:
+            # the body was encoded before the node was picked
+            headers['Content-Type'] = 'application/json'
+            headers.pop('Accept')
+            headers.pop('Content-Encoding', None)
+            postdata = _RequestBody(arglist, client, postdata, False, headers)
+    event = _callEvent.get()
+    if event is not None:
+        event.attempts += 1
+        if isinstance(postdata, (str, bytes)):
+            event.requestBytes = len(postdata)
+    return baseurl + posturl, postdata, headers, node
+
+
+def _RequestBody(arglist, client, postdata, binary, headers):
+    if not binary and postdata is not None and _Setting(client, 'wireFormat') == 'msgpack':
+        # encoded as msgpack for a server that turned out not to take it
+        postdata = None
+    if binary:
+        headers['Content-Type'] = 'application/msgpack'
+        headers['Accept'] = 'application/msgpack, application/json;q=0.5'
+    encoding = _Setting(client, 'compression')
+    level = _Setting(client, 'compressionLevel')
+    if postdata is None and _Setting(client, 'streamRequests') and not binary:
+        postdata = IterEncodeArgs(arglist)
+        if encoding is not None:
+            postdata = _CompressChunks(postdata, encoding, level)
+            headers['Content-Encoding'] = encoding
+    else:
+        if postdata is None:
+            postdata = _EncodeBody(arglist, client, binary)
+        if encoding is not None and len(postdata) >= _Setting(client, 'compressionThreshold'):
+            postdata = Compress(postdata, encoding, level)
+            headers['Content-Encoding'] = encoding
+    return postdata
+
+
+# base urls of servers that rejected a msgpack request, and of servers that
+# accepted one. Requests to the first are sent as JSON
+_jsonServers = set()
+_msgpackServers = set()
+# answers of a server unable to read a msgpack body: 415 Unsupported Media
+# Type, or the error of parsing it as JSON
+_msgpackRejectedStatuses = (400, 415, 500)
+
+
+def _Binary(client, baseurl):
+    # send msgpack unless the server is known not to take it. Each node of a
+    # NodePool is checked once it is picked
+    return (_Setting(client, 'wireFormat') == 'msgpack' and
+            not (isinstance(baseurl, str) and baseurl in _jsonServers))
+
+
+class _MsgpackRejected(Exception):
+    # raised for a server answering a msgpack request with an error before
+    # it was seen accepting one; the request is sent again as JSON
+    def __init__(self, baseurl, status):
+        Exception.__init__(self, baseurl)
+        self.baseurl = baseurl
+        self.status = status
+
+
+def _CheckWireFormat(headers, node, client, status):
+    if headers.get('Content-Type') != 'application/msgpack':
+        return
+    baseurl = node.url if node is not None else _Setting(client, 'url')
+    if status < 400:
+        _msgpackServers.add(baseurl)
+    elif status in _msgpackRejectedStatuses and baseurl not in _msgpackServers:
+        _jsonServers.add(baseurl)
+        raise _MsgpackRejected(baseurl, status)
+
+
+def _JsonAfterRejected(rejected, e):
+    # the JSON request failed the same way: the server's error was about the
+    # call, not the format, so msgpack is tried again next time
+    if isinstance(e, ComputeHTTPError) and e.status == rejected.status:
+        _jsonServers.discard(rejected.baseurl)
+
+
+def _SyncSession(client):
+    if client is None:
+        return GetSession(), timeout
+    return client.session, client.timeout
+
+
+def _AsyncSession(client):
+    import aiohttp
+    if client is None:
+        session = GetAsyncSession()
+    else:
+        session = client.GetAsyncSession()
+    t = _Setting(client, 'timeout')
+    if isinstance(t, tuple):
+        t = aiohttp.ClientTimeout(sock_connect=t[0], sock_read=t[1])
+    else:
+        t = aiohttp.ClientTimeout(total=t)
+    return session, t
+
+
+def _AsyncBody(postdata):
+    if isinstance(postdata, (str, bytes)):
+        return postdata
+    return _AsyncChunks(postdata)
+
+
+# the ComputeClient a call is made through. None uses the module level
+# settings of Util
+_client = contextvars.ContextVar('compute_rhino3d_client', default=None)
+
+# the Instrumentation.CallEvent of the call being made, while instrumentation
+# is enabled
+_callEvent = contextvars.ContextVar('compute_rhino3d_call_event', default=None)
+
+
+@contextlib.contextmanager
+def _Instrument(endpoint, hook):
+    from . import Instrumentation
+    event = Instrumentation.CallEvent(endpoint)
+    token = _callEvent.set(event)
+    error = None
+    try:
+        yield event
+    except Exception as e:
+        error = e
+        raise
+    finally:
+        _callEvent.reset(token)
+        event.Finish(error)
+        try:
+            hook(event)
+        except Exception:
+            # a broken hook must not replace the result or error of the call
+            logging.getLogger('compute_rhino3d').exception(
+                'instrumentation hook failed for %s', endpoint)
+
+
+def _RecordResponse(event, status, headers, timeToFirstByte, size):
+    event.status = status
+    event.timeToFirstByte = timeToFirstByte
+    event.responseBytes = size
+    timing = headers.get('Server-Timing')
+    if timing:
+        durations = re.findall(r'dur=([0-9.]+)', timing)
+        if durations:
+            event.serverTime = sum(float(d) for d in durations) / 1000
+
+
+def _TimedParse(event, content, posturl, contentType):
+    if event is None:
+        return _ParseResponse(content, posturl, contentType)
+    started = time.perf_counter()
+    response = _ParseResponse(content, posturl, contentType)
+    event.parseTime = time.perf_counter() - started
+    return response
+
+
+@contextlib.contextmanager
+def UseClient(client):
+    """
+    Route all calls made in the body of a with statement through a
+    ComputeClient. Only affects the current thread or asyncio task.
+
+        >>> with Util.UseClient(client):
+        ...     meshes = Mesh.CreateFromBrep(brep)
+    """
+    token = _client.set(client)
+    try:
+        yield client
+    finally:
+        _client.reset(token)
+
+
+def ComputeFetch(endpoint, arglist):
+    client = _client.get()
+    if _deferred.get():
+        return PendingFetch(endpoint, arglist, client)
+    hook = _Setting(client, 'instrumentation')
+    if hook is not None and _callEvent.get() is None:
+        with _Instrument(endpoint, hook):
+            return _CachedFetch(endpoint, arglist, client)
+    return _CachedFetch(endpoint, arglist, client)
+
+
+def _Cached():
+    event = _callEvent.get()
+    if event is not None:
+        event.cached = True
+
+
+def _CachedFetch(endpoint, arglist, client):
+    c = _Setting(client, 'cache')
+    if c is not None and c.Accepts(endpoint, arglist):
+        postdata = _EncodeBody(arglist, client)
+        key = c.Key(endpoint, postdata)
+        content = c.Get(key)
+        if content is not None:
+            _Cached()
+            return _LoadResponse(content, client)
+        response = _ComputeFetch(endpoint, arglist, client, postdata)
+        c.Set(key, _DumpResponse(response, client))
+        return response
+    return _ComputeFetch(endpoint, arglist, client)
+
+
+def _ComputeFetch(endpoint, arglist, client, postdata=None):
+    b = _Setting(client, 'batcher')
+    if b is not None and b.Accepts(endpoint, arglist):
+        return b.ComputeFetch(endpoint, arglist, client)
+    try:
+        return _PostWithRetry(endpoint, arglist, client, postdata)
+    except ComputeMissingHandlesError as e:
+        for handle in _MissingHandles(e):
+            _ComputeFetch('handles', handle.geometry, client)
+    try:
+        return _PostWithRetry(endpoint, arglist, client, postdata)
+    except ComputeMissingHandlesError:
+        # uploaded to another node of a NodePool; send the geometry along
+        return _PostWithRetry(endpoint, _InlineHandles(arglist), client, None)
+
+
+def _PostWithRetry(endpoint, arglist, client, postdata):
+    policy = _Setting(client, 'retry')
+    if policy is None:
+        return _Post(endpoint, arglist, client, postdata)
+    policy.Started()
+    started = time.monotonic()
+    attempt = 0
+    while True:
+        try:
+            return _Post(endpoint, arglist, client, postdata)
+        except ComputeError as e:
+            delay = policy.Delay(endpoint, e, attempt, started)
+            if delay is None: raise
+        time.sleep(delay)
+        attempt += 1
+
+
+def _Post(endpoint, arglist, client, postdata):
+    try:
+        return _PostOnce(endpoint, arglist, client, postdata)
+    except _MsgpackRejected as rejected:
+        try:
+            return _PostOnce(endpoint, arglist, client, None)
+        except ComputeError as e:
+            _JsonAfterRejected(rejected, e)
+            raise
+
+
+def _PostOnce(endpoint, arglist, client, postdata):
+    import requests
+    posturl, postdata, headers, node = _PrepareFetch(endpoint, arglist, client, postdata)
+    session, t = _SyncSession(client)
+    event = _callEvent.get()
+    started = time.monotonic()
+    error = None
+    try:
+        try:
+            r = session.post(posturl, data=postdata, headers=headers, timeout=t)
+        except requests.exceptions.RequestException as e:
+            raise _RequestsError(e, posturl)
+        if event is not None:
+            _RecordResponse(event, r.status_code, r.headers, r.elapsed.total_seconds(),
+                            len(r.content))
+        _CheckWireFormat(headers, node, client, r.status_code)
+        _CheckStatus(r.status_code, posturl, r.headers, r.text)
+    except ComputeError as e:
+        error = e
+        raise
+    finally:
+        if node is not None: node.Done(started, error)
+    return _TimedParse(event, r.content, posturl, r.headers.get('Content-Type'))
+
+
+def _RequestsError(e, posturl):
+    import requests
+    import urllib3.exceptions
+    if isinstance(e, requests.exceptions.ConnectTimeout):
+        return ComputeTimeoutError(str(e), posturl, False)
+    if isinstance(e, requests.exceptions.Timeout):
+        return ComputeTimeoutError(str(e), posturl, True)
+    if isinstance(e, requests.exceptions.ConnectionError):
+        reason = getattr(e.args[0], 'reason', None) if e.args else None
+        sent = not isinstance(reason, urllib3.exceptions.NewConnectionError)
+        return ComputeConnectionError(str(e), posturl, sent)
+    return ComputeError(str(e), posturl)
+
+
+def _CheckStatus(status, posturl, headers, text):
+    if status < 400:
+        return
+    missing = headers.get('Compute-Missing-Handles')
+    if status == 409 and missing:
+        raise ComputeMissingHandlesError(status, posturl, text[:1000], missing.split(','))
+    retryAfter = headers.get('Retry-After')
+    try:
+        retryAfter = float(retryAfter) if retryAfter is not None else None
+    except ValueError:
+        retryAfter = None
+    raise ComputeHTTPError(status, posturl, text[:1000], retryAfter)
+
+
+def _ParseResponse(content, posturl, contentType=None):
+    if contentType is not None and contentType.startswith('application/msgpack'):
+        from . import Msgpack
+        try:
+            return Msgpack.Loads(content)
+        except ValueError:
+            raise ComputeResponseError('invalid msgpack response from {}'.format(posturl), posturl)
+    try:
+        return JsonLoads(content)
+    except ValueError:
+        raise ComputeResponseError('invalid JSON response from {}: {}'.format(
+            posturl, content[:200]), posturl)
+
+
+# maximum number of simultaneous connections (in total and per host) used by
+# ComputeFetchAsync. 0 means no limit
+asyncLimit = 100
+asyncLimitPerHost = 0
+
+_asyncSessions = weakref.WeakKeyDictionary()
+
+# set while a generated wrapper is run on behalf of an async call. ComputeFetch
+# then returns a PendingFetch instead of posting
+_deferred = contextvars.ContextVar('compute_rhino3d_deferred', default=False)
+
+
+class PendingFetch:
+    """
+    A request captured from a generated wrapper that has not been sent yet,
+    along with the decode functions the wrapper applies to the response.
+    """
+    def __init__(self, endpoint, arglist, client=None):
+        self.endpoint = endpoint
+        self.arglist = arglist
+        self.client = client
+        self.decoders = []
+        self.fallback = None
+
+    def Then(self, decoder):
+        self.decoders.append(decoder)
+        return self
+
+    def Otherwise(self, fallback):
+        """
+        Set a function called with the ComputeError of a failed fetch. It
+        returns the arguments to send instead, or None to raise the error.
+        Used by FetchAsync; StreamResults raises the error
+        """
+        self.fallback = fallback
+        return self
+
+    def Resolve(self, response):
+        with UseClient(self.client):
+            for decoder in self.decoders:
+                response = decoder(response)
+        return response
+
+    async def FetchAsync(self):
+        hook = _Setting(self.client, 'instrumentation')
+        if hook is None or _callEvent.get() is not None:
+            response = await self._FetchAsync()
+            return self.Resolve(response)
+        with _Instrument(self.endpoint, hook) as event:
+            response = await self._FetchAsync()
+            started = time.perf_counter()
+            response = self.Resolve(response)
+            event.decodeTime = time.perf_counter() - started
+            return response
+
+    async def _FetchAsync(self):
+        try:
+            return await ComputeFetchAsync(self.endpoint, self.arglist, self.client)
+        except ComputeError as e:
+            if self.fallback is None: raise
+            with UseClient(self.client):
+                arglist = self.fallback(e)
+            if arglist is None: raise
+        return await ComputeFetchAsync(self.endpoint, arglist, self.client)
+
+
+def Deferred(func, *args, **kwargs):
+    """
+    Call a generated wrapper without sending its request.
+
+    Returns:
+        PendingFetch: the captured request
+    """
+    token = _deferred.set(True)
+    try:
+        pending = func(*args, **kwargs)
+    finally:
+        _deferred.reset(token)
+    if not isinstance(pending, PendingFetch):
+        raise TypeError('{} does not call ComputeFetch'.format(func.__name__))
+    return pending
+
+
+def _GetAsyncSession(sessions, limit, limit_per_host):
+    import asyncio
+    import aiohttp
+    loop = asyncio.get_running_loop()
+    session = sessions.get(loop)
+    if session is None or session.closed:
+        connector = aiohttp.TCPConnector(limit=limit,
+                                         limit_per_host=limit_per_host)
+        session = aiohttp.ClientSession(connector=connector)
+        sessions[loop] = session
+    return session
+
+
+def GetAsyncSession():
+    """
+    Get the aiohttp.ClientSession used by ComputeFetchAsync on the running
+    event loop. A session is created for each event loop on first use.
+    """
+    return _GetAsyncSession(_asyncSessions, asyncLimit, asyncLimitPerHost)
+
+
+async def _AsyncChunks(chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+async def CloseAsyncSession():
+    """
+    Close the aiohttp.ClientSession of the running event loop. Call this before
+    the loop shuts down to release its connections cleanly.
+    """
+    import asyncio
+    session = _asyncSessions.pop(asyncio.get_running_loop(), None)
+    if session is not None:
+        await session.close()
+
+
+async def ComputeFetchAsync(endpoint, arglist, client=None):
+    """
+    Asynchronous version of ComputeFetch. Requires the aiohttp package.
+
+    Args:
+        endpoint (str): endpoint to post to, relative to the base url
+        arglist (list): arguments to encode as the request body
+        client (ComputeClient): client to send the request through. Defaults
+                                to the client set with UseClient, if any
+    """
+    if client is None: client = _client.get()
+    hook = _Setting(client, 'instrumentation')
+    if hook is not None and _callEvent.get() is None:
+        with _Instrument(endpoint, hook):
+            return await _CachedFetchAsync(endpoint, arglist, client)
+    return await _CachedFetchAsync(endpoint, arglist, client)
+
+
+async def _CachedFetchAsync(endpoint, arglist, client):
+    c = _Setting(client, 'cache')
+    if c is not None and c.Accepts(endpoint, arglist):
+        postdata = _EncodeBody(arglist, client)
+        key = c.Key(endpoint, postdata)
+        content = c.Get(key)
+        if content is not None:
+            _Cached()
+            return _LoadResponse(content, client)
+        response = await _ComputeFetchAsync(endpoint, arglist, client, postdata)
+        c.Set(key, _DumpResponse(response, client))
+        return response
+    return await _ComputeFetchAsync(endpoint, arglist, client)
+
+
+async def _ComputeFetchAsync(endpoint, arglist, client, postdata=None):
+    b = _Setting(client, 'batcher')
+    if b is not None and b.Accepts(endpoint, arglist):
+        return await b.ComputeFetchAsync(endpoint, arglist, client)
+    try:
+        return await _PostWithRetryAsync(endpoint, arglist, client, postdata)
+    except ComputeMissingHandlesError as e:
+        for handle in _MissingHandles(e):
+            await _ComputeFetchAsync('handles', handle.geometry, client)
+    try:
+        return await _PostWithRetryAsync(endpoint, arglist, client, postdata)
+    except ComputeMissingHandlesError:
+        return await _PostWithRetryAsync(endpoint, _InlineHandles(arglist), client, None)
+
+
+async def _PostWithRetryAsync(endpoint, arglist, client, postdata):
+    policy = _Setting(client, 'retry')
+    if policy is None:
+        return await _PostAsync(endpoint, arglist, client, postdata)
+    policy.Started()
+    started = time.monotonic()
+    attempt = 0
+    while True:
+        try:
+            return await _PostAsync(endpoint, arglist, client, postdata)
+        except ComputeError as e:
+            delay = policy.Delay(endpoint, e, attempt, started)
+            if delay is None: raise
+        import asyncio
+        await asyncio.sleep(delay)
+        attempt += 1
+
+
+async def _PostAsync(endpoint, arglist, client, postdata):
+    try:
+        return await _PostOnceAsync(endpoint, arglist, client, postdata)
+    except _MsgpackRejected as rejected:
+        try:
+            return await _PostOnceAsync(endpoint, arglist, client, None)
+        except ComputeError as e:
+            _JsonAfterRejected(rejected, e)
+            raise
+
+
+async def _PostOnceAsync(endpoint, arglist, client, postdata):
+    posturl, postdata, headers, node = _PrepareFetch(endpoint, arglist, client, postdata)
+    session, t = _AsyncSession(client)
+    event = _callEvent.get()
+    started = time.monotonic()
+    error = None
+    try:
+        async with session.post(posturl, data=_AsyncBody(postdata), headers=headers, timeout=t) as r:
+            firstByte = time.monotonic()
+            content = await r.read()
+            contentType = r.headers.get('Content-Type')
+            if event is not None:
+                _RecordResponse(event, r.status, r.headers, firstByte - started, len(content))
+            _CheckWireFormat(headers, node, client, r.status)
+            _CheckStatus(r.status, posturl, r.headers, content.decode('utf-8', 'replace'))
+    except ComputeError as e:
+        error = e
+        raise
+    except Exception as e:
+        error = _AiohttpError(e, posturl)
+        if error is None: raise
+        raise error
+    finally:
+        if node is not None: node.Done(started, error)
+    return _TimedParse(event, content, posturl, contentType)
+
+
+def _AiohttpError(e, posturl):
+    import asyncio
+    import aiohttp
+    if isinstance(e, aiohttp.ClientConnectorError):
+        return ComputeConnectionError(str(e), posturl, False)
+    connectTimeout = getattr(aiohttp, 'ConnectionTimeoutError', ())
+    if isinstance(e, connectTimeout):
+        return ComputeTimeoutError(str(e), posturl, False)
+    if isinstance(e, asyncio.TimeoutError):
+        return ComputeTimeoutError(str(e) or 'timeout', posturl, True)
+    if isinstance(e, aiohttp.ClientError):
+        return ComputeConnectionError(str(e), posturl, True)
+    return None
+
+
+_jsonStructure = re.compile(rb'["\[\]{},]')
+_jsonStringEnd = re.compile(rb'["\\]')
+
+
+class _JsonArraySplitter:
+    """
+    Splits a JSON array arriving in chunks into the encoded bytes of its
+    elements. A document that is not an array is returned whole by Close.
+    """
+    def __init__(self):
+        self.buffer = bytearray()
+        self.pos = 0
+        self.start = 0
+        self.depth = 0
+        self.inString = False
+        self.isArray = None
+
+    def Feed(self, data):
+        buffer = self.buffer
+        buffer += data
+        if self.isArray is None:
+            text = buffer.lstrip()
+            if not text: return []
+            self.isArray = text[:1] == b'['
+        if not self.isArray: return []
+        elements = []
+        i = self.pos
+        while i < len(buffer):
+            if self.inString:
+                m = _jsonStringEnd.search(buffer, i)
+                if m is None:
+                    i = len(buffer)
+                elif buffer[m.start()] == 0x5c:
+                    i = m.start() + 2
+                else:
+                    self.inString = False
+                    i = m.start() + 1
+                continue
+            m = _jsonStructure.search(buffer, i)
+            if m is None:
+                i = len(buffer)
+                continue
+            j = m.start()
+            c = buffer[j]
+            if c == 0x22:
+                self.inString = True
+            elif c == 0x5b or c == 0x7b:
+                self.depth += 1
+                if self.depth == 1: self.start = j + 1
+            elif c == 0x5d or c == 0x7d:
+                self.depth -= 1
+                if self.depth == 0: self._Emit(elements, j)
+            elif self.depth == 1:
+                self._Emit(elements, j)
+                self.start = j + 1
+            i = j + 1
+        del buffer[:self.start]
+        self.pos = i - self.start
+        self.start = 0
+        return elements
+
+    def _Emit(self, elements, end):
+        element = bytes(self.buffer[self.start:end]).strip()
+        if element: elements.append(element)
+
+    def Close(self):
+        if self.isArray: return None
+        return bytes(self.buffer)
+
+
+def StreamResults(func, *args, **kwargs):
+    """
+    Call a generated wrapper whose result is a list and yield the decoded
+    items one at a time while the response is received, instead of waiting
+    for and holding the whole response.
+
+        >>> for curve in Util.StreamResults(Brep.CreateContourCurves, brep, a, b, 1.0):
+        ...     process(curve)
+
+    Responses that are not a list produce one item. Calls made this way
+    bypass the batcher and the response cache.
+
+    Returns:
+        generator: decoded result items
+    """
+    pending = Deferred(func, *args, **kwargs)
+    client = pending.client
+
+    def results():
+        import requests
+        posturl, postdata, headers, node = _PrepareFetch(pending.endpoint, pending.arglist, client)
+        # the response is split as it arrives, which needs JSON
+        headers['Accept'] = 'application/json'
+        session, t = _SyncSession(client)
+        splitter = _JsonArraySplitter()
+        started = time.monotonic()
+        error = None
+        try:
+            try:
+                r = session.post(posturl, data=postdata, headers=headers, timeout=t, stream=True)
+            except requests.exceptions.RequestException as e:
+                raise _RequestsError(e, posturl)
+            with r:
+                _CheckStatus(r.status_code, posturl, r.headers, r.text if r.status_code >= 400 else '')
+                try:
+                    for chunk in r.iter_content(chunk_size=streamChunkSize):
+                        for element in splitter.Feed(chunk):
+                            yield pending.Resolve(JsonLoads(element))
+                except requests.exceptions.RequestException as e:
+                    raise _RequestsError(e, posturl)
+        except ComputeError as e:
+            error = e
+            raise
+        finally:
+            if node is not None: node.Done(started, error)
+        whole = splitter.Close()
+        if whole is not None:
+            yield pending.Resolve(_ParseResponse(whole, posturl))
+    return results()
+
+
+def StreamResultsAsync(func, *args, **kwargs):
+    """
+    Asynchronous version of StreamResults. Requires the aiohttp package.
+
+        >>> async for curve in Util.StreamResultsAsync(Brep.CreateContourCurves, brep, a, b, 1.0):
+        ...     process(curve)
+
+    Returns:
+        async generator: decoded result items
+    """
+    pending = Deferred(func, *args, **kwargs)
+
+    async def results():
+        client = pending.client
+        posturl, postdata, headers, node = _PrepareFetch(pending.endpoint, pending.arglist, client)
+        # the response is split as it arrives, which needs JSON
+        headers['Accept'] = 'application/json'
+        session, t = _AsyncSession(client)
+        splitter = _JsonArraySplitter()
+        started = time.monotonic()
+        error = None
+        try:
+            async with session.post(posturl, data=_AsyncBody(postdata), headers=headers, timeout=t) as r:
+                if r.status >= 400:
+                    _CheckStatus(r.status, posturl, r.headers, await r.text())
+                async for chunk in r.content.iter_chunked(streamChunkSize):
+                    for element in splitter.Feed(chunk):
+                        yield pending.Resolve(JsonLoads(element))
+        except ComputeError as e:
+            error = e
+            raise
+        except Exception as e:
+            error = _AiohttpError(e, posturl)
+            if error is None: raise
+            raise error
+        finally:
+            if node is not None: node.Done(started, error)
+        whole = splitter.Close()
+        if whole is not None:
+            yield pending.Resolve(_ParseResponse(whole, posturl))
+    return results()
+
+
+class GeometryHandle:
+    """
+    Geometry uploaded to the compute server, passed to wrapper functions in
+    place of the object so it is not sent again. `handle` is the content
+    hash the server stores the geometry under.
+    """
+    __slots__ = ('handle', 'geometry', '__weakref__')
+
+    def __init__(self, handle, geometry):
+        self.handle = handle
+        self.geometry = geometry
+
+    def __repr__(self):
+        return 'GeometryHandle({!r})'.format(self.handle)
+
+    def Encode(self):
+        return {'handle': self.handle}
+
+
+# uploaded handles by their hash, to upload the geometry again when a server
+# no longer holds it
+_handles = weakref.WeakValueDictionary()
+
+
+def Upload(geometry):
+    """
+    Store a rhino3dm object on the compute server and get a handle to pass
+    in its place in later calls, so large inputs are sent only once.
+
+        >>> handle = Util.Upload(mesh)
+        >>> for point in points:
+        ...     Mesh.ClosestPoint(handle, point)
+
+    Calls made with a handle the server does not hold (e.g. after a restart,
+    or on another node of a NodePool) upload the geometry again and are
+    repeated. Requires a server supporting the 'handles' endpoint.
+
+    Returns:
+        GeometryHandle: handle of the uploaded geometry
+    """
+    response = _ComputeFetch('handles', geometry, _client.get())
+    return _NewHandle(response, geometry)
+
+
+async def UploadAsync(geometry, client=None):
+    """
+    Asynchronous version of Upload. Requires the aiohttp package.
+    """
+    if client is None: client = _client.get()
+    response = await _ComputeFetchAsync('handles', geometry, client)
+    return _NewHandle(response, geometry)
+
+
+def _NewHandle(response, geometry):
+    handle = GeometryHandle(response['handle'], geometry)
+    _handles[handle.handle] = handle
+    return handle
+
+
+def _MissingHandles(e):
+    handles = [_handles.get(h) for h in e.handles]
+    if None in handles:
+        raise e
+    return handles
+
+
+def _InlineHandles(obj):
+    # replace handles by their geometry
+    if isinstance(obj, GeometryHandle):
+        return obj.geometry
+    if isinstance(obj, (list, tuple, BatchArgs)):
+        return [_InlineHandles(item) for item in obj]
+    if isinstance(obj, dict):
+        return {key: _InlineHandles(value) for key, value in obj.items()}
+    return obj
+
+
+class EndpointInfo:
+    """
+    Registry entry of a generated wrapper function: the endpoint it posts to,
+    the names of its parameters and the function decoding its response.
+    """
+    __slots__ = ('name', 'url', 'params', 'decoder')
+
+    def __init__(self, name, url, params, decoder):
+        self.name = name
+        self.url = url
+        self.params = params
+        self.decoder = decoder
+
+    def __repr__(self):
+        return 'EndpointInfo({!r}, {!r})'.format(self.name, self.url)
+
+    def BindArgs(self, args, kwargs):
+        """
+        Get the argument values in parameter order and the multiple flag from
+        the arguments of a call
+        """
+        count = len(self.params)
+        multiple = kwargs.pop('multiple', None)
+        if len(args) > count:
+            if len(args) > count + 1 or multiple is not None:
+                raise TypeError('{}() takes {} positional arguments but {} were given'.format(
+                    self.name, count + 1, len(args)))
+            multiple = args[count]
+            args = args[:count]
+        values = list(args)
+        for name in self.params[len(args):]:
+            if name not in kwargs:
+                raise TypeError('{}() missing required argument: {!r}'.format(self.name, name))
+            values.append(kwargs.pop(name))
+        if kwargs:
+            raise TypeError('{}() got an unexpected or repeated argument {!r}'.format(
+                self.name, next(iter(kwargs))))
+        return values, bool(multiple)
+
+    def Call(self, args, multiple=False):
+        """
+        Send a call with argument values in parameter order and decode the
+        response
+        """
+        hook = _Setting(_client.get(), 'instrumentation')
+        if hook is not None and not _deferred.get() and _callEvent.get() is None:
+            with _Instrument(self.url, hook) as event:
+                return self._Call(args, multiple, event)
+        return self._Call(args, multiple, None)
+
+    def _Call(self, args, multiple, event):
+        if multiple:
+            response = ComputeFetch(self.url + '?multiple=true', BatchArgs(*args))
+        else:
+            response = ComputeFetch(self.url, list(args))
+        if self.decoder is not None:
+            if event is None:
+                return self.decoder(response)
+            started = time.perf_counter()
+            response = self.decoder(response)
+            event.decodeTime = time.perf_counter() - started
+        return response
+
+
+# EndpointInfo of every generated wrapper function, keyed by 'Module.Function'
+endpoints = {}
+
+
+def Endpoint(url, decoder=None):
+    """
+    Decorator turning a stub, whose signature and docstring describe an
+    endpoint, into the function calling it. The stub's parameters, except the
+    trailing `multiple`, are posted in order.
+
+        >>> @Util.Endpoint("rhino/geometry/mesh/createfrombrep-brep", Util.DecodeToCommonObject)
+        ... def CreateFromBrep(brep, multiple=False):
+        ...     \"\"\"Constructs a mesh from a brep\"\"\"
+
+    Args:
+        url (str): the endpoint, relative to the server url
+        decoder (function): applied to the response, e.g. DecodeToCommonObject
+    """
+    def register(stub):
+        code = stub.__code__
+        params = code.co_varnames[:code.co_argcount - 1]
+        name = stub.__module__.rpartition('.')[2] + '.' + stub.__name__
+        info = EndpointInfo(name, url, params, decoder)
+        count = len(params)
+
+        def call(*args, **kwargs):
+            if kwargs or len(args) != count:
+                args, multiple = info.BindArgs(args, kwargs)
+                return info.Call(args, multiple)
+            return info.Call(args)
+        functools.update_wrapper(call, stub)
+        call.endpoint = info
+        endpoints[name] = info
+        return call
+    return register
 
 
 def PythonEvaluate(script, inputs, output_names):
@@ -49,6 +1506,7 @@ def PythonEvaluate(script, inputs, output_names):
               fill with values. This information is returned from the server
               to the client.
     """
+    import rhino3dm
     encodedInput = rhino3dm.ArchivableDictionary.EncodeDict(inputs)
     url = 'rhino/python/evaluate'
     args = [script, json.dumps(encodedInput), output_names]
@@ -57,36 +1515,165 @@ def PythonEvaluate(script, inputs, output_names):
     return output
 
 
+class PackedPoints:
+    """
+    Points, vectors or lines of a msgpack response, kept as packed
+    little-endian float64 coordinates until they are decoded. Indexing gives
+    the same dicts a JSON response holds.
+    """
+    __slots__ = ('data', 'isLine')
+
+    def __init__(self, data, isLine=False):
+        self.data = data
+        self.isLine = isLine
+
+    def __len__(self):
+        return len(self.data) // (48 if self.isLine else 24)
+
+    def __getitem__(self, index):
+        import struct
+        size = 48 if self.isLine else 24
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return self.Encode()[index]
+            return PackedPoints(self.data[start * size:max(start, stop) * size], self.isLine)
+        if index < 0: index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('PackedPoints index out of range')
+        if self.isLine:
+            x0, y0, z0, x1, y1, z1 = struct.unpack_from('<6d', self.data, index * size)
+            return {'From': {'X': x0, 'Y': y0, 'Z': z0}, 'To': {'X': x1, 'Y': y1, 'Z': z1}}
+        x, y, z = struct.unpack_from('<3d', self.data, index * size)
+        return {'X': x, 'Y': y, 'Z': z}
+
+    def __iter__(self):
+        return iter(self.Encode())
+
+    def Tuples(self):
+        """Get the coordinates as tuples of 3 (points) or 6 (lines) floats"""
+        import struct
+        return struct.iter_unpack('<6d' if self.isLine else '<3d', self.data)
+
+    def ToNumpy(self):
+        """Get the coordinates as an (N, 3) or (N, 2, 3) float64 array"""
+        import numpy
+        array = numpy.frombuffer(self.data, dtype='<f8').astype(numpy.float64)
+        return array.reshape((-1, 2, 3) if self.isLine else (-1, 3))
+
+    def Encode(self):
+        if self.isLine:
+            return [{'From': {'X': x0, 'Y': y0, 'Z': z0}, 'To': {'X': x1, 'Y': y1, 'Z': z1}}
+                    for x0, y0, z0, x1, y1, z1 in self.Tuples()]
+        return [{'X': x, 'Y': y, 'Z': z} for x, y, z in self.Tuples()]
+
+
 def DecodeToCommonObject(item):
     if item is None:
         return None
+    if isinstance(item, PendingFetch):
+        return item.Then(DecodeToCommonObject)
+    import rhino3dm
     if isinstance(item, list):
-        return [rhino3dm.CommonObject.Decode(x) for x in item]
+        return [DecodeToCommonObject(x) for x in item]
+    if isinstance(item.get('data'), bytes):
+        # raw archive of a msgpack response
+        item = dict(item, data=base64.b64encode(item['data']).decode('ascii'))
     return rhino3dm.CommonObject.Decode(item)
 
 
 def DecodeToPoint3d(item):
     if item is None:
         return None
-    if isinstance(item, list):
-        return [DecodeToPoint3d(x) for x in item]
-    return rhino3dm.Point3d(item['X'], item['Y'], item['Z'])
+    if isinstance(item, PendingFetch):
+        return item.Then(DecodeToPoint3d)
+    if _Setting(_client.get(), 'decodeToNumpy'):
+        return DecodeToNumpy(item)
+    import rhino3dm
+    return _DecodeXYZ(item, rhino3dm.Point3d)
 
 
 def DecodeToVector3d(item):
     if item is None:
         return None
+    if isinstance(item, PendingFetch):
+        return item.Then(DecodeToVector3d)
+    if _Setting(_client.get(), 'decodeToNumpy'):
+        return DecodeToNumpy(item)
+    import rhino3dm
+    return _DecodeXYZ(item, rhino3dm.Vector3d)
+
+
+def _DecodeXYZ(item, cls):
+    if item is None:
+        return None
+    if isinstance(item, PackedPoints):
+        return [cls(x, y, z) for x, y, z in item.Tuples()]
     if isinstance(item, list):
-        return [DecodeToVector3d(x) for x in item]
-    return rhino3dm.Vector3d(item['X'], item['Y'], item['Z'])
+        return [_DecodeXYZ(x, cls) for x in item]
+    return cls(item['X'], item['Y'], item['Z'])
 
 
 def DecodeToLine(item):
     if item is None:
         return None
+    if isinstance(item, PendingFetch):
+        return item.Then(DecodeToLine)
+    if _Setting(_client.get(), 'decodeToNumpy'):
+        return DecodeToNumpy(item)
+    import rhino3dm
+    return _DecodeLine(item, rhino3dm)
+
+
+def _DecodeLine(item, rhino3dm):
+    if item is None:
+        return None
+    if isinstance(item, PackedPoints):
+        Point3d = rhino3dm.Point3d
+        return [rhino3dm.Line(Point3d(x0, y0, z0), Point3d(x1, y1, z1))
+                for x0, y0, z0, x1, y1, z1 in item.Tuples()]
     if isinstance(item, list):
-        return [DecodeToLine(x) for x in item]
-    start = DecodeToPoint3d(item['From'])
-    end = DecodeToPoint3d(item['To'])
+        return [_DecodeLine(x, rhino3dm) for x in item]
+    start = _DecodeXYZ(item['From'], rhino3dm.Point3d)
+    end = _DecodeXYZ(item['To'], rhino3dm.Point3d)
     return rhino3dm.Line(start,end)
 
+
+_xyz = operator.itemgetter('X', 'Y', 'Z')
+
+
+def _LineXYZ(line):
+    return _xyz(line['From']) + _xyz(line['To'])
+
+
+def DecodeToNumpy(item):
+    """
+    Decode points, vectors or lines to float64 NumPy arrays in one pass
+    without creating rhino3dm objects. A list of points or vectors becomes
+    an (N, 3) array, a list of lines an (N, 2, 3) array and a single item an
+    array of shape (3,) or (2, 3). Nested lists become lists of arrays and
+    None items rows of NaN. Requires the numpy package.
+    """
+    import numpy
+    if item is None:
+        return None
+    if isinstance(item, PackedPoints):
+        return item.ToNumpy()
+    if isinstance(item, dict):
+        return DecodeToNumpy([item])[0]
+    if not item:
+        return numpy.empty((0, 3))
+    first = next((x for x in item if x is not None), None)
+    if first is not None and not isinstance(first, dict):
+        return [DecodeToNumpy(x) for x in item]
+    isLine = first is not None and 'From' in first
+    getter = _LineXYZ if isLine else _xyz
+    width = 6 if isLine else 3
+    if None in item:
+        nan = (float('nan'),) * width
+        values = (nan if x is None else getter(x) for x in item)
+    else:
+        values = map(getter, item)
+    values = itertools.chain.from_iterable(values)
+    array = numpy.fromiter(values, dtype=numpy.float64, count=width * len(item))
+    return array.reshape((len(item), 2, 3) if isLine else (len(item), 3))
@@ -1,6 +1,7 @@
 from . import Util
 
 
+@Util.Endpoint("rhino/geometry/volumemassproperties/compute-mesh")
 def Compute(mesh, multiple=False):
     """
     Compute the VolumeMassProperties for a single Mesh.
@@ -11,14 +12,9 @@ def Compute(mesh, multiple=False):
     Returns:
         VolumeMassProperties: The VolumeMassProperties for the given Mesh or None on failure.
     """
-    url = "rhino/geometry/volumemassproperties/compute-mesh"
-    if multiple: url += "?multiple=true"
-    args = [mesh]
-    if multiple: args = [[item] for item in mesh]
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/volumemassproperties/compute-mesh_bool_bool_bool_bool")
 def Compute1(mesh, volume, firstMoments, secondMoments, productMoments, multiple=False):
     """
     Compute the VolumeMassProperties for a single Mesh.
@@ -33,14 +29,9 @@ def Compute1(mesh, volume, firstMoments, secondMoments, productMoments, multiple
     Returns:
         VolumeMassProperties: The VolumeMassProperties for the given Mesh or None on failure.
     """
-    url = "rhino/geometry/volumemassproperties/compute-mesh_bool_bool_bool_bool"
-    if multiple: url += "?multiple=true"
-    args = [mesh, volume, firstMoments, secondMoments, productMoments]
-    if multiple: args = zip(mesh, volume, firstMoments, secondMoments, productMoments)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/volumemassproperties/compute-brep")
 def Compute2(brep, multiple=False):
     """
     Compute the VolumeMassProperties for a single Brep.
@@ -51,14 +42,9 @@ def Compute2(brep, multiple=False):
     Returns:
         VolumeMassProperties: The VolumeMassProperties for the given Brep or None on failure.
     """
-    url = "rhino/geometry/volumemassproperties/compute-brep"
-    if multiple: url += "?multiple=true"
-    args = [brep]
-    if multiple: args = [[item] for item in brep]
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/volumemassproperties/compute-brep_bool_bool_bool_bool")
 def Compute3(brep, volume, firstMoments, secondMoments, productMoments, multiple=False):
     """
     Compute the VolumeMassProperties for a single Brep.
@@ -73,14 +59,9 @@ def Compute3(brep, volume, firstMoments, secondMoments, productMoments, multiple
     Returns:
         VolumeMassProperties: The VolumeMassProperties for the given Brep or None on failure.
     """
-    url = "rhino/geometry/volumemassproperties/compute-brep_bool_bool_bool_bool"
-    if multiple: url += "?multiple=true"
-    args = [brep, volume, firstMoments, secondMoments, productMoments]
-    if multiple: args = zip(brep, volume, firstMoments, secondMoments, productMoments)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/volumemassproperties/compute-surface")
 def Compute4(surface, multiple=False):
     """
     Compute the VolumeMassProperties for a single Surface.
@@ -91,14 +72,9 @@ def Compute4(surface, multiple=False):
     Returns:
         VolumeMassProperties: The VolumeMassProperties for the given Surface or None on failure.
     """
-    url = "rhino/geometry/volumemassproperties/compute-surface"
-    if multiple: url += "?multiple=true"
-    args = [surface]
-    if multiple: args = [[item] for item in surface]
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/volumemassproperties/compute-surface_bool_bool_bool_bool")
 def Compute5(surface, volume, firstMoments, secondMoments, productMoments, multiple=False):
     """
     Compute the VolumeMassProperties for a single Surface.
@@ -113,14 +89,9 @@ def Compute5(surface, volume, firstMoments, secondMoments, productMoments, multi
     Returns:
         VolumeMassProperties: The VolumeMassProperties for the given Surface or None on failure.
     """
-    url = "rhino/geometry/volumemassproperties/compute-surface_bool_bool_bool_bool"
-    if multiple: url += "?multiple=true"
-    args = [surface, volume, firstMoments, secondMoments, productMoments]
-    if multiple: args = zip(surface, volume, firstMoments, secondMoments, productMoments)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/volumemassproperties/compute-geometrybasearray")
 def Compute6(geometry, multiple=False):
     """
     Computes the VolumeMassProperties for a collection of geometric objects.
@@ -132,14 +103,9 @@ def Compute6(geometry, multiple=False):
     Returns:
         VolumeMassProperties: The VolumeMassProperties for the entire collection or None on failure.
     """
-    url = "rhino/geometry/volumemassproperties/compute-geometrybasearray"
-    if multiple: url += "?multiple=true"
-    args = [geometry]
-    if multiple: args = [[item] for item in geometry]
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/volumemassproperties/compute-geometrybasearray_bool_bool_bool_bool")
 def Compute7(geometry, volume, firstMoments, secondMoments, productMoments, multiple=False):
     """
     Computes the VolumeMassProperties for a collection of geometric objects.
@@ -155,14 +121,9 @@ def Compute7(geometry, volume, firstMoments, secondMoments, productMoments, mult
     Returns:
         VolumeMassProperties: The VolumeMassProperties for the entire collection or None on failure.
     """
-    url = "rhino/geometry/volumemassproperties/compute-geometrybasearray_bool_bool_bool_bool"
-    if multiple: url += "?multiple=true"
-    args = [geometry, volume, firstMoments, secondMoments, productMoments]
-    if multiple: args = zip(geometry, volume, firstMoments, secondMoments, productMoments)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
+@Util.Endpoint("rhino/geometry/volumemassproperties/sum-volumemassproperties_volumemassproperties")
 def Sum(thisVolumeMassProperties, summand, multiple=False):
     """
     Sum mass properties together to get an aggregate mass.
@@ -173,11 +134,5 @@ def Sum(thisVolumeMassProperties, summand, multiple=False):
     Returns:
         bool: True if successful.
     """
-    url = "rhino/geometry/volumemassproperties/sum-volumemassproperties_volumemassproperties"
-    if multiple: url += "?multiple=true"
-    args = [thisVolumeMassProperties, summand]
-    if multiple: args = zip(thisVolumeMassProperties, summand)
-    response = Util.ComputeFetch(url, args)
-    return response
 
 
@@ -0,0 +1,33 @@
+# Submodules are imported on first access, so `import compute_rhino3d` is
+# cheap and only the modules a program uses are loaded:
+#
+#     import compute_rhino3d
+#     meshes = compute_rhino3d.Mesh.CreateFromBrep(brep)
+import importlib
+
+_submodules = (
+    'AreaMassProperties', 'Async', 'Balancer', 'Batching', 'BezierCurve',
+    'Brep', 'BrepFace', 'Cache', 'Client', 'Curve', 'Extrusion',
+    'Grasshopper', 'Instrumentation', 'Intersection', 'Mesh', 'Msgpack',
+    'NurbsCurve', 'NurbsSurface', 'Parallel', 'Retry', 'SubD', 'Surface',
+    'Util', 'VolumeMassProperties'
+)
+
+
+def __getattr__(name):
+    if name in _submodules:
+        return importlib.import_module('.' + name, __name__)
+    raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_submodules))
+
+
+def map(func, iterable, concurrency=8, chunk_size=None, return_exceptions=False):
+    """
+    Call a wrapper function for every item of an iterable concurrently.
+    See Parallel.Map.
+    """
+    from .Parallel import Map
+    return Map(func, iterable, concurrency, chunk_size, return_exceptions)
@@ -39,6 +39,15 @@ setuptools.setup(
     long_description_content_type="text/markdown",
     url="https://github.com/mcneel/compute.rhino3d",
     install_requires=['requests', 'rhino3dm'],
+    extras_require={
+        'async': ['aiohttp'],
+        'fast': ['orjson'],
+        'brotli': ['brotli'],
+        'numpy': ['numpy'],
+        'msgpack': ['msgpack'],
+        'prometheus': ['prometheus_client'],
+        'opentelemetry': ['opentelemetry-api'],
+    },
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
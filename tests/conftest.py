@@ -0,0 +1,36 @@
+import os
+import sys
+
+import pytest
+
+root = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, root)
+sys.path.insert(0, os.path.join(root, 'benchmarks'))
+
+from compute_rhino3d import Util  # noqa: E402
+from server import StandInServer  # noqa: E402
+
+# module level settings the tests change
+_settings = ('url', 'timeout', 'retry', 'batcher', 'cache', 'streamRequests', 'compression',
+             'compressionThreshold', 'decodeToNumpy', 'memoizeEncoding', 'wireFormat',
+             'instrumentation')
+
+
+@pytest.fixture(autouse=True)
+def settings():
+    saved = {name: getattr(Util, name) for name in _settings}
+    yield
+    for name, value in saved.items():
+        setattr(Util, name, value)
+    Util.SetSession(None)
+    Util._jsonServers.clear()
+    Util._msgpackServers.clear()
+
+
+@pytest.fixture
+def server():
+    """A stand-in compute server that Util.url points at"""
+    standIn = StandInServer().Start()
+    Util.url = standIn.url
+    yield standIn
+    standIn.Stop()
@@ -0,0 +1,62 @@
+import rhino3dm
+
+from compute_rhino3d import Mesh, Util
+from compute_rhino3d.Balancer import NodePool
+from server import StandInServer
+
+
+def _Call():
+    return Mesh.ClosestPoint(rhino3dm.Mesh(), rhino3dm.Point3d(1, 2, 3))
+
+
+def test_pool_spreads_calls(server):
+    other = StandInServer().Start()
+    try:
+        Util.url = NodePool([server.url, other.url])
+        for _ in range(20):
+            assert _Call().Z == 3
+        assert server.requestCount + other.requestCount == 20
+        assert server.requestCount > 0 and other.requestCount > 0
+        assert all(node.outstanding == 0 for node in Util.url.nodes)
+    finally:
+        other.Stop()
+
+
+def test_pool_ejects_failing_node(server):
+    dead = StandInServer().Start()
+    dead.Stop()
+    pool = NodePool([server.url, dead.url], eject_after=2, eject_time=60.0)
+    Util.url = pool
+    failures = 0
+    for _ in range(20):
+        try:
+            _Call()
+        except Util.ComputeConnectionError:
+            failures += 1
+    assert failures == 2
+    assert pool.Healthy() == [pool.nodes[0]]
+    assert pool.nodes[1].failureCount == 2
+
+
+def test_pool_affinity(server):
+    other = StandInServer().Start()
+    try:
+        pool = NodePool([server.url, other.url], affinity_threshold=10)
+        body = b'x' * 100
+        nodes = set()
+        for _ in range(10):
+            node = pool.Acquire(body)
+            nodes.add(node)
+            node.Done(0.0)
+        assert len(nodes) == 1
+    finally:
+        other.Stop()
+
+
+def test_pool_latency_strategy():
+    pool = NodePool(['http://a/', 'http://b/'], strategy='latency')
+    pool.nodes[0].latency = 0.01
+    pool.nodes[1].latency = 0.025
+    assert pool.Acquire() is pool.nodes[0]
+    assert pool.Acquire() is pool.nodes[0]
+    assert pool.Acquire() is pool.nodes[1]
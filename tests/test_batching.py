@@ -0,0 +1,93 @@
+import concurrent.futures
+
+import pytest
+import rhino3dm
+import server as standIn
+
+import compute_rhino3d
+from compute_rhino3d import Mesh, Util
+from compute_rhino3d.Batching import RequestBatcher
+
+
+def _Mesh():
+    mesh = rhino3dm.Mesh()
+    for x, y in ((0, 0), (1, 0), (1, 1)):
+        mesh.Vertices.Add(x, y, 0)
+    mesh.Faces.AddFace(0, 1, 2)
+    return mesh
+
+
+def test_batcher_coalesces_calls(server):
+    Util.batcher = RequestBatcher(window=0.2, max_size=4)
+    mesh = _Mesh()
+    points = [rhino3dm.Point3d(i, 0, 0) for i in range(8)]
+    with concurrent.futures.ThreadPoolExecutor(8) as executor:
+        results = list(executor.map(lambda p: Mesh.ClosestPoint(mesh, p), points))
+    assert [p.X for p in results] == list(range(8))
+    assert Util.batcher.callCount == 8
+    assert Util.batcher.requestCount == 2
+    assert server.requestCount == 2
+
+
+def test_batcher_single_call(server):
+    Util.batcher = RequestBatcher(window=0.001)
+    assert Mesh.ClosestPoint(_Mesh(), rhino3dm.Point3d(1, 2, 3)).Z == 3
+    assert Util.batcher.requestCount == 1
+
+
+def test_batcher_skips_other_endpoints(server):
+    Util.batcher = RequestBatcher(endpoints=('rhino/geometry/brep/',))
+    Mesh.ClosestPoint(_Mesh(), rhino3dm.Point3d(1, 2, 3))
+    assert Util.batcher.requestCount == 0
+
+
+def test_map(server):
+    items = [(_Mesh(), rhino3dm.Point3d(i, 0, 0)) for i in range(10)]
+    for chunk_size in (None, 1, 3):
+        results = list(compute_rhino3d.map(Mesh.ClosestPoint, items, chunk_size=chunk_size))
+        assert [p.X for p in results] == list(range(10))
+
+
+def test_map_failed_chunk(server, monkeypatch):
+    # the multiple=true request of a chunk with one bad call fails; the calls
+    # are sent again one at a time so only that call gets the error
+    def closest(args):
+        if args[1]['X'] == 4:
+            raise standIn._HTTPError(500, 'bad point')
+        return args[1]
+    monkeypatch.setitem(standIn.handlers, 'rhino/geometry/mesh/closestpoint-mesh_point3d', closest)
+    items = [(_Mesh(), rhino3dm.Point3d(i, 0, 0)) for i in range(10)]
+    results = list(compute_rhino3d.map(Mesh.ClosestPoint, items, chunk_size=3,
+                                       return_exceptions=True))
+    assert isinstance(results[4], Util.ComputeHTTPError)
+    assert [p.X for i, p in enumerate(results) if i != 4] == [0, 1, 2, 3, 5, 6, 7, 8, 9]
+    with pytest.raises(Util.ComputeHTTPError):
+        list(compute_rhino3d.map(Mesh.ClosestPoint, items, chunk_size=3))
+
+
+def test_map_numpy_results(server):
+    # multiple=true results decoded to one (N, 3) array are split per call
+    Util.decodeToNumpy = True
+    items = [(_Mesh(), rhino3dm.Point3d(i, 0, 0)) for i in range(10)]
+    for chunk_size in (None, 1, 3):
+        results = list(compute_rhino3d.map(Mesh.ClosestPoint, items, chunk_size=chunk_size))
+        assert [p.tolist() for p in results] == [[i, 0, 0] for i in range(10)]
+
+
+def test_batcher_msgpack_points(server):
+    # the points of all calls arrive as one Util.PackedPoints
+    Util.wireFormat = 'msgpack'
+    Util.batcher = RequestBatcher(window=0.2, max_size=4)
+    mesh = _Mesh()
+    points = [rhino3dm.Point3d(i, 0, 0) for i in range(4)]
+    with concurrent.futures.ThreadPoolExecutor(4) as executor:
+        results = list(executor.map(lambda p: Mesh.ClosestPoint(mesh, p), points))
+    assert [p.X for p in results] == list(range(4))
+    assert Util.batcher.requestCount == 1
+
+
+def test_map_msgpack_points(server):
+    Util.wireFormat = 'msgpack'
+    items = [(_Mesh(), rhino3dm.Point3d(i, 0, 0)) for i in range(10)]
+    results = list(compute_rhino3d.map(Mesh.ClosestPoint, items, chunk_size=5))
+    assert [p.X for p in results] == list(range(10))
@@ -0,0 +1,95 @@
+import time
+
+import pytest
+import rhino3dm
+
+from compute_rhino3d import Mesh, Msgpack, Util
+from compute_rhino3d.Cache import MemoryCache, SqliteCache
+
+
+def _Call(x=1.0):
+    return Mesh.ClosestPoint(rhino3dm.Mesh(), rhino3dm.Point3d(x, 2, 3))
+
+
+@pytest.fixture(params=['memory', 'sqlite'])
+def cache(request, tmp_path):
+    if request.param == 'memory':
+        c = MemoryCache()
+    else:
+        c = SqliteCache(str(tmp_path / 'cache.db'))
+    yield c
+    if request.param == 'sqlite': c.Close()
+
+
+def test_hit_sends_no_request(server, cache):
+    Util.cache = cache
+    assert _Call().X == 1
+    assert _Call().X == 1
+    assert server.requestCount == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert _Call(2.0).X == 2
+    assert server.requestCount == 2
+
+
+def test_uncached_endpoints(server, cache):
+    cache.endpoints = ('rhino/geometry/brep/',)
+    Util.cache = cache
+    _Call()
+    _Call()
+    assert server.requestCount == 2
+
+
+def test_msgpack_entries(server, cache):
+    Util.cache = cache
+    Util.wireFormat = 'msgpack'
+    assert _Call().Z == 3
+    assert _Call().Z == 3
+    assert server.requestCount == 1
+    # stored as msgpack, not JSON
+    assert Msgpack.Loads(_Stored(cache)) == {'X': 1.0, 'Y': 2.0, 'Z': 3.0}
+
+
+def _Stored(cache):
+    if isinstance(cache, MemoryCache):
+        (value, _), = cache._entries.values()
+        return value
+    (value,), = cache._db.execute('SELECT value FROM responses').fetchall()
+    return bytes(value)
+
+
+def test_ttl(cache):
+    cache.Set('a', b'value', ttl=0.05)
+    cache.Set('b', b'value')
+    assert cache.Get('a') == b'value'
+    time.sleep(0.1)
+    assert cache.Get('a') is None
+    assert cache.Get('b') == b'value'
+
+
+def test_memory_lru_eviction():
+    cache = MemoryCache(max_bytes=10)
+    cache.Set('a', b'1234')
+    cache.Set('b', b'1234')
+    cache.Get('a')
+    cache.Set('c', b'1234')
+    # b was used least recently
+    assert cache.Get('b') is None
+    assert cache.Get('a') == cache.Get('c') == b'1234'
+    assert (len(cache), cache.size, cache.evictions) == (2, 8, 1)
+    cache.Set('d', b'x' * 11)
+    assert cache.Get('d') is None and len(cache) == 2
+    cache.Clear()
+    assert (len(cache), cache.size, cache.hits) == (0, 0, 0)
+
+
+def test_sqlite_persists(server, tmp_path):
+    path = str(tmp_path / 'cache.db')
+    Util.cache = SqliteCache(path)
+    _Call()
+    Util.cache.Close()
+    Util.cache = SqliteCache(path)
+    try:
+        assert _Call().X == 1
+        assert server.requestCount == 1 and Util.cache.hits == 1
+    finally:
+        Util.cache.Close()
@@ -0,0 +1,37 @@
+import asyncio
+
+import rhino3dm
+
+from compute_rhino3d import Grasshopper, Util
+from compute_rhino3d.Client import ComputeClient
+
+
+def test_client_calls(server):
+    Util.url = 'http://127.0.0.1:1/'
+    client = ComputeClient(server.url)
+    try:
+        assert client.Mesh.ClosestPoint(rhino3dm.Mesh(), rhino3dm.Point3d(1, 2, 3)).Z == 3
+        assert server.requestCount == 1
+    finally:
+        client.Close()
+
+
+def test_client_module_classes(server):
+    client = ComputeClient(server.url)
+    try:
+        # classes of a module are not wrapped
+        assert client.Grasshopper.DataTree is Grasshopper.DataTree
+        tree = client.Grasshopper.DataTree.FromLists('RH_IN:x', [1, 2])
+        assert client.Async.Grasshopper.DataTree is Grasshopper.DataTree
+        result = client.Grasshopper.EvaluateDefinition('definition', [tree])
+        assert result.names == ['RH_OUT:mesh']
+
+        async def evaluate():
+            try:
+                tree = client.Async.Grasshopper.DataTree('RH_IN:x')
+                return await client.Async.Grasshopper.EvaluateDefinition('definition', [tree])
+            finally:
+                await client.CloseAsync()
+        assert asyncio.run(evaluate()).names == ['RH_OUT:mesh']
+    finally:
+        client.Close()
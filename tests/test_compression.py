@@ -0,0 +1,34 @@
+import gzip
+
+import rhino3dm
+
+from compute_rhino3d import Intersection, Util
+
+
+def _Args(count):
+    return [[rhino3dm.Point3d(i, 0, 0) for i in range(count)]]
+
+
+def test_content_encoding_above_threshold(server):
+    Util.compression = 'gzip'
+    Util.compressionThreshold = 1024
+    _, body, headers, _ = Util._PrepareFetch('rhino/geometry/x', _Args(1000))
+    assert headers['Content-Encoding'] == 'gzip'
+    assert len(gzip.decompress(body)) >= Util.compressionThreshold
+
+
+def test_no_content_encoding_below_threshold(server):
+    Util.compression = 'gzip'
+    Util.compressionThreshold = 1024
+    _, body, headers, _ = Util._PrepareFetch('rhino/geometry/x', _Args(1))
+    assert 'Content-Encoding' not in headers
+    assert len(body) < Util.compressionThreshold
+
+
+def test_compressed_round_trip(server):
+    Util.compression = 'gzip'
+    Util.compressionThreshold = 1024
+    points = [rhino3dm.Point3d(i, 0, 0) for i in range(1000)]
+    results = Intersection.ProjectPointsToMeshes([rhino3dm.Mesh()], points,
+                                                 rhino3dm.Vector3d(0, 0, 1), 0.01)
+    assert [p.X for p in results] == list(range(1000))
@@ -0,0 +1,193 @@
+import asyncio
+import json
+
+import pytest
+import rhino3dm
+
+import server as standIn
+from compute_rhino3d import Grasshopper, Util
+from compute_rhino3d.Client import ComputeClient
+
+
+@pytest.fixture
+def received(server, monkeypatch):
+    """Arguments of every grasshopper request the server received"""
+    received = []
+    evaluate = standIn.handlers['grasshopper']
+
+    def handler(args):
+        received.append(args)
+        return evaluate(args)
+    monkeypatch.setitem(standIn.handlers, 'grasshopper', handler)
+    Grasshopper.ClearDefinitionCache()
+    yield received
+    Grasshopper.ClearDefinitionCache()
+
+
+def _Evaluate(definition='definition'):
+    tree = Grasshopper.DataTree.FromLists('RH_IN:x', [1, 2])
+    return Grasshopper.EvaluateDefinition(definition, [tree])
+
+
+def test_pointer_reused(received):
+    _Evaluate()
+    _Evaluate()
+    assert received[0]['algo'] and not received[0]['pointer']
+    assert received[1]['pointer'] and not received[1]['algo']
+
+
+def test_cache_miss_resends_definition(received):
+    _Evaluate()
+    standIn._definitions.clear()
+    assert _Evaluate().names == ['RH_OUT:mesh']
+    assert [bool(args['algo']) for args in received] == [True, False, True]
+
+
+def test_evaluation_error_is_not_a_cache_miss(received, monkeypatch):
+    _Evaluate()
+
+    def fail(args):
+        received.append(args)
+        raise standIn._HTTPError(500, 'Solution failed: input out of range')
+    monkeypatch.setitem(standIn.handlers, 'grasshopper', fail)
+    with pytest.raises(Util.ComputeHTTPError):
+        _Evaluate()
+    # not sent again with the definition, and the pointer is kept
+    assert [bool(args['algo']) for args in received] == [True, False]
+    assert len(Grasshopper._pointers) == 1
+
+
+def test_pointers_per_server(received):
+    other = standIn.StandInServer().Start()
+    client = None
+    try:
+        client = ComputeClient(other.url)
+        for _ in range(2):
+            _Evaluate()
+            client.Grasshopper.EvaluateDefinition(
+                'definition', [Grasshopper.DataTree.FromLists('RH_IN:x', [1])])
+        assert len(Grasshopper._pointers) == 2
+        # one full definition per server, pointers after that
+        assert [bool(args['algo']) for args in received] == [True, True, False, False]
+    finally:
+        if client is not None: client.Close()
+        other.Stop()
+
+
+def test_async_pointer(received):
+    from compute_rhino3d import Async
+
+    async def evaluate():
+        tree = Grasshopper.DataTree.FromLists('RH_IN:x', [1, 2])
+        return await Async.Grasshopper.EvaluateDefinition('definition', [tree])
+
+    async def main():
+        try:
+            await evaluate()
+            await evaluate()
+            standIn._definitions.clear()
+            return await evaluate()
+        finally:
+            await Util.CloseAsyncSession()
+    assert asyncio.run(main()).names == ['RH_OUT:mesh']
+    # the pointer is used, and the definition sent again after a miss
+    assert [bool(args['algo']) for args in received] == [True, False, False, True]
+
+
+def test_data_tree_encoding():
+    import numpy
+    tree = Grasshopper.DataTree.FromNumpy('RH_IN:p', numpy.arange(12.0).reshape(2, 2, 3), points=True)
+    encoded = json.loads(Util.EncodeArgs([tree.data]))[0]
+    assert encoded['ParamName'] == 'RH_IN:p'
+    assert sorted(encoded['InnerTree']) == ['0', '1']
+    assert json.loads(encoded['InnerTree']['1'][0]['data']) == {'X': 6, 'Y': 7, 'Z': 8}
+    lists = Grasshopper.DataTree.FromLists('RH_IN:x', [[1, 2], [[3], [4, 5]]])
+    assert lists.branches == {'0': [1, 2], '1;0': [3], '1;1': [4, 5]}
+
+
+def test_data_tree_data_is_mutable():
+    # code written against the plain dict of earlier versions
+    tree = Grasshopper.DataTree('RH_IN:x')
+    tree.Append([0], [1, 2])
+    tree.data['ParamName'] = 'RH_IN:y'
+    tree.data['InnerTree']['0'].append({'data': 3})
+    tree.data['InnerTree']['1'] = [{'data': 4}]
+    encoded = json.loads(Util.EncodeArgs([tree.data]))[0]
+    assert tree.name == 'RH_IN:y' and encoded['ParamName'] == 'RH_IN:y'
+    assert encoded['InnerTree'] == {'0': [{'data': 1}, {'data': 2}, {'data': 3}], '1': [{'data': 4}]}
+    del tree.data['InnerTree']['1']
+    assert list(tree.data['InnerTree']) == ['0']
+
+
+@pytest.mark.parametrize('backend', ['json', 'orjson'])
+def test_data_tree_data_is_a_dict(backend):
+    import numpy
+    Util.jsonBackend = backend
+
+    def Tree():
+        tree = Grasshopper.DataTree.FromNumpy('RH_IN:p', numpy.arange(6.0).reshape(2, 3), points=True)
+        tree.Append([1], [1.5])
+        return tree
+    expected = {'ParamName': 'RH_IN:p', 'InnerTree': {
+        '0': [{'data': '{"X":0.0,"Y":1.0,"Z":2.0}'}, {'data': '{"X":3.0,"Y":4.0,"Z":5.0}'}],
+        '1': [{'data': 1.5}]}}
+    assert json.loads(Util.EncodeArgs([Tree().data]))[0] == expected
+    assert json.loads(json.dumps(Tree().data)) == expected
+    assert dict(Tree().data['InnerTree']) == expected['InnerTree']
+    tree = Tree()
+    assert isinstance(tree.data['InnerTree'], dict)
+    assert tree.data['InnerTree'] == expected['InnerTree']
+    assert repr(tree.data['InnerTree']) == repr(expected['InnerTree'])
+
+
+def test_data_tree_rejects_nan_points():
+    import numpy
+    for value in (numpy.nan, numpy.inf):
+        with pytest.raises(ValueError):
+            Grasshopper.DataTree.FromNumpy('RH_IN:p', numpy.array([[value, 0, 0]]), points=True)
+
+
+def _Item(itemType, value):
+    return {'type': 'Rhino.Geometry.' + itemType, 'data': json.dumps(value)}
+
+
+def test_output_decoding():
+    plane = rhino3dm.Plane.WorldXY().Encode()
+    circle = rhino3dm.Circle(3).Encode()
+    mesh = rhino3dm.Mesh()
+    mesh.Vertices.Add(0, 0, 0)
+    output = Grasshopper.Output('RH_OUT:x', {'{0}': [
+        _Item('Point3d', {'X': 1, 'Y': 2, 'Z': 3}),
+        _Item('Plane', plane),
+        _Item('Interval', {'T0': 0.5, 'T1': 2.0}),
+        _Item('Circle', circle),
+        _Item('Mesh', mesh.Encode()),
+        {'type': 'System.Double', 'data': '1.5'},
+        {'type': 'System.String', 'data': '"text"'},
+    ]})
+    point, plane, interval, circleValue, decoded, number, text = output['0']
+    assert point.Z == 3
+    assert isinstance(plane, rhino3dm.Plane) and plane.ZAxis.Z == 1
+    assert (interval.T0, interval.T1) == (0.5, 2.0)
+    assert circleValue == circle
+    assert isinstance(decoded, rhino3dm.Mesh) and len(decoded.Vertices) == 1
+    assert (number, text) == (1.5, 'text')
+    assert output['0'] is output[[0]]
+
+
+def test_output_numpy():
+    numbers = Grasshopper.Output('n', {'{0}': [{'type': 'System.Double', 'data': '1.5'}],
+                                       '{1}': [{'type': 'System.Int32', 'data': '2'}]})
+    assert numbers.ToNumpy().tolist() == [1.5, 2.0]
+    assert numbers.ToNumpy('1').tolist() == [2.0]
+    points = Grasshopper.Output('p', {'{0}': [_Item('Point3d', {'X': 1, 'Y': 2, 'Z': 3})] * 2})
+    assert points.ToNumpy().shape == (2, 3)
+
+
+def test_result(received):
+    result = _Evaluate()
+    assert result['pointer'] and result.names == ['RH_OUT:mesh']
+    assert result.Output('mesh') is result.Output('RH_OUT:mesh')
+    assert isinstance(result.Output('mesh')['0'][0], rhino3dm.Mesh)
+    with pytest.raises(KeyError):
+        result.Output('missing')
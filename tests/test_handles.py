@@ -0,0 +1,57 @@
+import asyncio
+
+import rhino3dm
+
+from compute_rhino3d import Async, Mesh, Util
+
+
+def _Mesh():
+    mesh = rhino3dm.Mesh()
+    for x, y in ((0, 0), (1, 0), (1, 1)):
+        mesh.Vertices.Add(x, y, 0)
+    mesh.Faces.AddFace(0, 1, 2)
+    return mesh
+
+
+class _Forgetful(dict):
+    # handles of a server that loses every upload, like the other nodes of a
+    # NodePool
+    def __setitem__(self, key, value):
+        pass
+
+
+def test_upload(server):
+    handle = Util.Upload(_Mesh())
+    assert server.uploadCount == 1
+    assert handle.handle in server.handles
+    for i in range(3):
+        assert Mesh.ClosestPoint(handle, rhino3dm.Point3d(i, 2, 3)).X == i
+    assert server.uploadCount == 1
+
+
+def test_upload_async(server):
+    async def main():
+        try:
+            handle = await Util.UploadAsync(_Mesh())
+            return await Async.Mesh.ClosestPoint(handle, rhino3dm.Point3d(1, 2, 3))
+        finally:
+            await Util.CloseAsyncSession()
+    assert asyncio.run(main()).X == 1
+    assert server.uploadCount == 1
+
+
+def test_upload_again_after_restart(server):
+    handle = Util.Upload(_Mesh())
+    server.handles.clear()
+    assert Mesh.ClosestPoint(handle, rhino3dm.Point3d(1, 2, 3)).X == 1
+    assert server.uploadCount == 2
+    assert handle.handle in server.handles
+
+
+def test_inline_after_second_miss(server):
+    handle = Util.Upload(_Mesh())
+    server.handles = _Forgetful()
+    assert Mesh.ClosestPoint(handle, rhino3dm.Point3d(1, 2, 3)).X == 1
+    # uploaded again, then sent along with the call
+    assert server.uploadCount == 2
+    assert server.requestCount == 1
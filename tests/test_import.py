@@ -0,0 +1,33 @@
+import subprocess
+import sys
+
+from conftest import root
+
+
+def _ImportTime(module):
+    # cumulative microseconds of every module imported, from -X importtime
+    output = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import ' + module],
+                            cwd=root, stderr=subprocess.PIPE, universal_newlines=True,
+                            check=True).stderr
+    times = {}
+    for line in output.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_import_loads_no_dependencies():
+    times = _ImportTime('compute_rhino3d.Mesh')
+    assert 'compute_rhino3d.Mesh' in times
+    for name in ('requests', 'rhino3dm', 'asyncio', 'aiohttp', 'numpy'):
+        assert name not in times
+    assert 'compute_rhino3d.Curve' not in times
+
+
+def test_import_time():
+    # about 30ms on a developer machine; the bound only catches eager imports
+    # of requests or of all generated modules coming back
+    times = _ImportTime('compute_rhino3d.Mesh')
+    assert times['compute_rhino3d.Mesh'] + times['compute_rhino3d'] < 500000
@@ -0,0 +1,55 @@
+import asyncio
+import logging
+
+import pytest
+import rhino3dm
+
+from compute_rhino3d import Async, Mesh, Util
+
+_endpoint = 'rhino/geometry/mesh/closestpoint-mesh_point3d'
+
+
+def _CheckEvent(event):
+    assert event.endpoint == _endpoint
+    assert event.error is None
+    assert event.status == 200
+    assert event.attempts == 1
+    assert event.requestBytes > 0
+    assert event.responseBytes > 0
+    assert event.encodeTime >= 0
+    assert event.timeToFirstByte > 0
+    assert event.totalTime >= event.timeToFirstByte
+
+
+def test_sync_call_event(server):
+    events = []
+    Util.instrumentation = events.append
+    assert Mesh.ClosestPoint(rhino3dm.Mesh(), rhino3dm.Point3d(1, 2, 3)).Z == 3
+    assert len(events) == 1
+    _CheckEvent(events[0])
+
+
+def test_async_call_event(server):
+    events = []
+    Util.instrumentation = events.append
+
+    async def main():
+        try:
+            return await Async.Mesh.ClosestPoint(rhino3dm.Mesh(), rhino3dm.Point3d(1, 2, 3))
+        finally:
+            await Util.CloseAsyncSession()
+    assert asyncio.run(main()).Z == 3
+    assert len(events) == 1
+    _CheckEvent(events[0])
+
+
+def test_failing_hook(server, caplog):
+    def hook(event):
+        raise RuntimeError('broken hook')
+    Util.instrumentation = hook
+    with caplog.at_level(logging.ERROR, logger='compute_rhino3d'):
+        assert Mesh.ClosestPoint(rhino3dm.Mesh(), rhino3dm.Point3d(1, 2, 3)).Z == 3
+    assert 'instrumentation hook failed' in caplog.text
+    with caplog.at_level(logging.ERROR, logger='compute_rhino3d'):
+        with pytest.raises(Util.ComputeHTTPError):
+            Util.ComputeFetch('rhino/geometry/unknown', [])
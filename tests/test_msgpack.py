@@ -0,0 +1,64 @@
+import asyncio
+
+import numpy
+import pytest
+import rhino3dm
+
+from compute_rhino3d import Async, Grasshopper, Mesh, Msgpack, Util
+from server import StandInServer
+
+
+@pytest.fixture
+def jsonServer():
+    """A stand-in server answering msgpack requests with 415"""
+    standIn = StandInServer(msgpack=False).Start()
+    Util.url = standIn.url
+    yield standIn
+    standIn.Stop()
+
+
+def test_roundtrip():
+    points = numpy.arange(6, dtype=numpy.float64).reshape(2, 3)
+    decoded = Msgpack.Loads(Msgpack.Dumps([points, 'text', 1.5]))
+    assert isinstance(decoded[0], Util.PackedPoints)
+    assert decoded[0].ToNumpy().tolist() == points.tolist()
+    assert decoded[1:] == ['text', 1.5]
+
+
+def test_msgpack_calls(server):
+    Util.wireFormat = 'msgpack'
+    points = Mesh.PullPointsToMesh(rhino3dm.Mesh(), numpy.ones((5, 3)))
+    assert [p.X for p in points] == [1] * 5
+    assert Util.url in Util._msgpackServers
+
+
+def test_json_only_server(jsonServer):
+    Util.wireFormat = 'msgpack'
+    for i in range(3):
+        assert Mesh.ClosestPoint(rhino3dm.Mesh(), rhino3dm.Point3d(i, 2, 3)).X == i
+    # only the first call was sent as msgpack
+    assert jsonServer.rejectedCount == 1
+    assert jsonServer.requestCount == 3
+    assert Util.url in Util._jsonServers
+
+
+def test_json_only_server_async(jsonServer):
+    Util.wireFormat = 'msgpack'
+
+    async def main():
+        try:
+            return await Async.Mesh.ClosestPoint(rhino3dm.Mesh(), rhino3dm.Point3d(1, 2, 3))
+        finally:
+            await Util.CloseAsyncSession()
+    assert asyncio.run(main()).Z == 3
+    assert jsonServer.rejectedCount == 1
+
+
+def test_genuine_error_keeps_msgpack(server):
+    # the server fails the call for msgpack and JSON alike, so it is not
+    # taken for one that only speaks JSON
+    Util.wireFormat = 'msgpack'
+    Grasshopper.ClearDefinitionCache()
+    with pytest.raises(Util.ComputeHTTPError):
+        Util.ComputeFetch('grasshopper', {'algo': None, 'pointer': 'md5_unknown', 'values': []})
+    assert Util.url not in Util._jsonServers
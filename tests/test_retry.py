@@ -0,0 +1,64 @@
+import time
+
+import pytest
+
+from compute_rhino3d import Util
+from compute_rhino3d.Retry import RetryPolicy
+
+_geometry = 'rhino/geometry/mesh/closestpoint-mesh_point3d'
+
+
+def _HTTPError(status, retryAfter=None):
+    return Util.ComputeHTTPError(status, 'http://server/', '', retryAfter)
+
+
+@pytest.mark.parametrize('error, endpoint, retried', [
+    (_HTTPError(503), 'grasshopper', True),
+    (_HTTPError(429), 'grasshopper', True),
+    (_HTTPError(502), _geometry, True),
+    (_HTTPError(502), 'grasshopper', False),
+    (_HTTPError(500), _geometry, False),
+    (_HTTPError(400), _geometry, False),
+    (Util.ComputeConnectionError('refused', 'http://server/', False), 'grasshopper', True),
+    (Util.ComputeConnectionError('reset', 'http://server/', True), 'grasshopper', False),
+    (Util.ComputeTimeoutError('read', 'http://server/', True), _geometry, True),
+    (Util.ComputeResponseError('bad json'), _geometry, False),
+])
+def test_delay_retryable(error, endpoint, retried):
+    policy = RetryPolicy()
+    delay = policy.Delay(endpoint, error, 0, time.monotonic())
+    assert (delay is not None) == retried
+
+
+def test_delay_backoff():
+    policy = RetryPolicy(backoff=0.5, max_backoff=1.5, budget_min=100)
+    started = time.monotonic()
+    for attempt, limit in enumerate((0.5, 1.0, 1.5, 1.5)):
+        policy.maxRetries = attempt + 1
+        for _ in range(20):
+            assert 0 <= policy.Delay(_geometry, _HTTPError(503), attempt, started) <= limit
+
+
+def test_delay_max_retries():
+    policy = RetryPolicy(max_retries=2)
+    assert policy.Delay(_geometry, _HTTPError(503), 2, time.monotonic()) is None
+
+
+def test_delay_retry_after():
+    policy = RetryPolicy(backoff=0.01, max_backoff=5.0)
+    assert policy.Delay(_geometry, _HTTPError(503, 3.0), 0, time.monotonic()) == 3.0
+    assert policy.Delay(_geometry, _HTTPError(503, 60.0), 0, time.monotonic()) == 5.0
+
+
+def test_delay_max_elapsed():
+    policy = RetryPolicy(backoff=0.01, max_elapsed=1.0)
+    assert policy.Delay(_geometry, _HTTPError(503), 0, time.monotonic() - 2.0) is None
+
+
+def test_delay_budget():
+    policy = RetryPolicy(budget_ratio=0.5, budget_min=2)
+    delays = [policy.Delay(_geometry, _HTTPError(503), 0, time.monotonic()) for _ in range(3)]
+    assert delays[2] is None and policy.retryCount == 2
+    policy.Started()
+    policy.Started()
+    assert policy.Delay(_geometry, _HTTPError(503), 0, time.monotonic()) is not None
@@ -0,0 +1,27 @@
+import rhino3dm
+
+from compute_rhino3d import Intersection, Util
+
+
+def _Project(count):
+    points = [rhino3dm.Point3d(i, 0, 0) for i in range(count)]
+    return Intersection.ProjectPointsToMeshes([rhino3dm.Mesh()], points,
+                                              rhino3dm.Vector3d(0, 0, 1), 0.01)
+
+
+def test_streamed_request_body(server):
+    Util.streamRequests = True
+    Util.streamChunkSize = 1024
+    try:
+        assert [p.X for p in _Project(1000)] == list(range(1000))
+        Util.compression = 'gzip'
+        assert len(_Project(1000)) == 1000
+    finally:
+        Util.streamChunkSize = 1024 * 1024
+
+
+def test_stream_results(server):
+    points = [rhino3dm.Point3d(i, 0, 0) for i in range(100)]
+    results = Util.StreamResults(Intersection.ProjectPointsToMeshes, [rhino3dm.Mesh()], points,
+                                 rhino3dm.Vector3d(0, 0, 1), 0.01)
+    assert [p.X for p in results] == list(range(100))
@@ -0,0 +1,126 @@
+import json
+
+import pytest
+import rhino3dm
+
+from compute_rhino3d import Mesh, Util
+
+
+def _Split(document, size):
+    splitter = Util._JsonArraySplitter()
+    elements = []
+    for i in range(0, len(document), size):
+        elements.extend(splitter.Feed(document[i:i + size]))
+    return elements, splitter.Close()
+
+
+@pytest.mark.parametrize('size', [1, 2, 7, 1000])
+def test_splitter_elements(size):
+    items = [1, 'a,b', {'X': 1, 'Y': [2, 3]}, [[]], 'quote \\" ] }', None, -2.5e10]
+    elements, whole = _Split(json.dumps(items).encode('utf-8'), size)
+    assert whole is None
+    assert [json.loads(element) for element in elements] == items
+
+
+def test_splitter_empty_array():
+    assert _Split(b' [ ] ', 1) == ([], None)
+
+
+def test_splitter_not_an_array():
+    document = json.dumps({'values': [1, 2]}).encode('utf-8')
+    assert _Split(document, 3) == ([], document)
+
+
+def test_batch_args_columns():
+    args = Util.BatchArgs([1, 2, 3], 0.5, ('a', 'b', 'c'))
+    assert len(args) == 3
+    assert list(args) == [(1, 0.5, 'a'), (2, 0.5, 'b'), (3, 0.5, 'c')]
+
+
+def test_batch_args_all_columns():
+    assert list(Util.BatchArgs([1, 2], [3, 4])) == [(1, 3), (2, 4)]
+
+
+def test_batch_args_scalars_are_not_columns():
+    point = rhino3dm.Point3d(1, 2, 3)
+    args = Util.BatchArgs(['x', 'y'], 'text', {'a': 1}, point)
+    rows = list(args)
+    assert rows[1][:3] == ('y', 'text', {'a': 1})
+    assert rows[1][3] is point
+
+
+def test_batch_args_generator():
+    assert list(Util.BatchArgs((i for i in range(2)), 1)) == [(0, 1), (1, 1)]
+
+
+def test_batch_args_errors():
+    with pytest.raises(ValueError):
+        Util.BatchArgs([1, 2], [1])
+    with pytest.raises(ValueError):
+        Util.BatchArgs(1, 'a')
+
+
+def test_batch_args_encoding():
+    assert json.loads(Util.EncodeArgs(Util.BatchArgs([1, 2], 3))) == [[1, 3], [2, 3]]
+
+
+def test_encode_numpy():
+    import numpy
+    points = numpy.array([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+    assert json.loads(Util.EncodeArgs([points])) == [[{'X': 1, 'Y': 2, 'Z': 3},
+                                                      {'X': 4, 'Y': 5, 'Z': 6}]]
+    # parameters of a doublearray endpoint, not a point
+    assert json.loads(Util.EncodeArgs([None, numpy.array([0.1, 0.5, 0.9])])) == [None, [0.1, 0.5, 0.9]]
+    assert json.loads(Util.EncodeArgs([numpy.float64(2.5), numpy.arange(2)])) == [2.5, [0, 1]]
+
+
+def test_batch_args_numpy_points():
+    import numpy
+    args = Util.BatchArgs(numpy.array([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]]), 0.5)
+    assert json.loads(Util.EncodeArgs(args)) == [[{'X': 1, 'Y': 2, 'Z': 3}, 0.5],
+                                                 [{'X': 4, 'Y': 5, 'Z': 6}, 0.5]]
+    assert len(Util.BatchArgs(numpy.array([0.1, 0.5, 0.9]))) == 3
+
+
+def test_packed_points_indexing():
+    import struct
+    points = Util.PackedPoints(struct.pack('<9d', *range(9)))
+    assert len(points) == 3
+    assert points[1] == {'X': 3, 'Y': 4, 'Z': 5}
+    assert points[-1] == points[2] == {'X': 6, 'Y': 7, 'Z': 8}
+    assert list(points[1:]) == [points[1], points[2]]
+    assert points[::2] == [points[0], points[2]]
+    with pytest.raises(IndexError):
+        points[3]
+    lines = Util.PackedPoints(struct.pack('<6d', *range(6)), True)
+    assert lines[0] == {'From': {'X': 0, 'Y': 1, 'Z': 2}, 'To': {'X': 3, 'Y': 4, 'Z': 5}}
+
+
+def test_session_reuses_connections(server):
+    point = rhino3dm.Point3d(1, 2, 3)
+    for _ in range(5):
+        Mesh.ClosestPoint(rhino3dm.Mesh(), point)
+    assert server.connectionCount == 1
+    for _ in range(3):
+        Util.SetSession(None)
+        Mesh.ClosestPoint(rhino3dm.Mesh(), point)
+    assert server.connectionCount == 4
+
+
+def test_memoized_encoding_of_edited_objects():
+    Util.memoizeEncoding = True
+    curve = rhino3dm.NurbsCurve.Create(False, 3, [rhino3dm.Point3d(i, 0, 0) for i in range(5)])
+    body = Util.EncodeArgs([curve])
+    assert Util._Encode(curve) is Util._Encode(curve)
+    edits = (lambda: curve.Translate(rhino3dm.Vector3d(0, 0, 1)),
+             lambda: curve.Scale(2),
+             lambda: curve.Transform(rhino3dm.Transform.Rotation(0.5, rhino3dm.Vector3d(0, 0, 1),
+                                                                 rhino3dm.Point3d(0, 0, 0))),
+             lambda: curve.Points.__setitem__(2, rhino3dm.Point4d(2, 7, 0, 1)))
+    for edit in edits:
+        edit()
+        edited = Util.EncodeArgs([curve])
+        assert edited != body
+        body = edited
+    Util.memoizeEncoding = False
+    assert Util.EncodeArgs([curve]) == body